@@ -0,0 +1,130 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark the merge of incoming action chunks into the action queue of the robot client.
+
+Two variants are compared:
+- `queue`: the queue is rebuilt action by action, aggregating the overlapping timesteps one at a time
+  (the behavior before the ring buffer).
+- `ring_buffer`: the chunk is merged in an `ActionRingBuffer` with a single vectorized aggregation.
+
+Every merge happens in the steady state of a run: half of the previous chunk has been performed, so half
+of the incoming chunk overlaps with the actions left in the queue.
+
+Example:
+    python benchmarks/async_inference/benchmark_action_buffer.py --chunk-sizes 10 50 100 200
+"""
+
+import argparse
+import time
+from queue import Queue
+
+import torch
+
+from lerobot.async_inference.action_buffer import ActionRingBuffer
+from lerobot.async_inference.configs import AGGREGATE_FUNCTIONS
+from lerobot.async_inference.helpers import TimedAction, TimedActionChunk
+
+
+def merge_queue(action_queue: Queue, incoming_actions: TimedActionChunk, latest_action: int, aggregate_fn):
+    future_action_queue = Queue()
+    current_action_queue = {action.get_timestep(): action.get_action() for action in action_queue.queue}
+    for new_action in incoming_actions:
+        if new_action.get_timestep() <= latest_action:
+            continue
+        elif new_action.get_timestep() not in current_action_queue:
+            future_action_queue.put(new_action)
+            continue
+        future_action_queue.put(
+            TimedAction(
+                timestamp=new_action.get_timestamp(),
+                timestep=new_action.get_timestep(),
+                action=aggregate_fn(current_action_queue[new_action.get_timestep()], new_action.get_action()),
+            )
+        )
+    return future_action_queue
+
+
+def benchmark(chunk_sizes: list[int], action_dim: int, num_iterations: int, aggregate_fn_name: str):
+    aggregate_fn = AGGREGATE_FUNCTIONS[aggregate_fn_name]
+    print(f"{'variant':<12} {'chunk':>6} {'merge [ms]':>11} {'pop [us]':>9}")
+    for chunk_size in chunk_sizes:
+        step = chunk_size // 2
+        chunks = [
+            TimedActionChunk(
+                timestamp=i * step / 30,
+                timestep=i * step,
+                actions=torch.randn(chunk_size, action_dim),
+                dt=1 / 30,
+            )
+            for i in range(num_iterations)
+        ]
+
+        # Old implementation
+        action_queue = Queue()
+        merge_time = pop_time = 0.0
+        latest_action = -1
+        for chunk in chunks:
+            start_time = time.perf_counter()
+            action_queue = merge_queue(action_queue, chunk, latest_action, aggregate_fn)
+            merge_time += time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            for _ in range(step):
+                latest_action = action_queue.get_nowait().get_timestep()
+            pop_time += time.perf_counter() - start_time
+        print(
+            f"{'queue':<12} {chunk_size:>6} {merge_time / num_iterations * 1000:>11.3f} "
+            f"{pop_time / (num_iterations * step) * 1e6:>9.2f}"
+        )
+
+        buffer = ActionRingBuffer(capacity=chunk_size)
+        merge_time = pop_time = 0.0
+        latest_action = -1
+        for chunk in chunks:
+            start_time = time.perf_counter()
+            buffer.merge(chunk, latest_action, aggregate_fn)
+            merge_time += time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            for _ in range(step):
+                latest_action = buffer.get().get_timestep()
+            pop_time += time.perf_counter() - start_time
+        print(
+            f"{'ring_buffer':<12} {chunk_size:>6} {merge_time / num_iterations * 1000:>11.3f} "
+            f"{pop_time / (num_iterations * step) * 1e6:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the merge of action chunks in the action queue.")
+    parser.add_argument(
+        "--chunk-sizes", type=int, nargs="+", default=[10, 50, 100, 200], help="Actions per chunk."
+    )
+    parser.add_argument("--action-dim", type=int, default=6, help="Dimension of every action.")
+    parser.add_argument("--num-iterations", type=int, default=200, help="Chunks merged per measurement.")
+    parser.add_argument(
+        "--aggregate-fn-name",
+        type=str,
+        default="weighted_average",
+        choices=list(AGGREGATE_FUNCTIONS),
+        help="Aggregate function for the overlapping actions.",
+    )
+    args = parser.parse_args()
+
+    benchmark(
+        chunk_sizes=args.chunk_sizes,
+        action_dim=args.action_dim,
+        num_iterations=args.num_iterations,
+        aggregate_fn_name=args.aggregate_fn_name,
+    )
@@ -0,0 +1,114 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark the postprocessing and serialization of the action chunks sent by the policy server.
+
+Two variants are compared:
+- `per_action`: every action of the chunk goes through the postprocessor, and the chunk is sent as a
+  pickled list of `TimedAction`s (the behavior before whole-chunk postprocessing).
+- `chunk`: the whole chunk goes through the postprocessor at once, and is sent as a single tensor with
+  `encode_action_chunk`.
+
+The postprocessor is the one of the supported policies: unnormalization followed by a move to the CPU.
+
+Example:
+    python benchmarks/async_inference/benchmark_action_chunks.py --chunk-sizes 10 50 100 200
+"""
+
+import argparse
+import pickle  # nosec
+import time
+
+import torch
+
+from lerobot.async_inference.encoding import decode_action_chunk, encode_action_chunk
+from lerobot.async_inference.helpers import TimedAction, TimedActionChunk
+from lerobot.configs.types import FeatureType, NormalizationMode, PolicyFeature
+from lerobot.processor import DeviceProcessorStep, PolicyProcessorPipeline, UnnormalizerProcessorStep
+from lerobot.processor.converters import policy_action_to_transition, transition_to_policy_action
+from lerobot.utils.constants import ACTION
+
+
+def make_postprocessor(action_dim: int) -> PolicyProcessorPipeline:
+    return PolicyProcessorPipeline(
+        steps=[
+            UnnormalizerProcessorStep(
+                features={ACTION: PolicyFeature(type=FeatureType.ACTION, shape=(action_dim,))},
+                norm_map={FeatureType.ACTION: NormalizationMode.MEAN_STD},
+                stats={ACTION: {"mean": torch.randn(action_dim), "std": torch.rand(action_dim) + 0.5}},
+            ),
+            DeviceProcessorStep(device="cpu"),
+        ],
+        to_transition=policy_action_to_transition,
+        to_output=transition_to_policy_action,
+    )
+
+
+def run_per_action(postprocessor, action_tensor: torch.Tensor, dt: float) -> tuple[float, float, bytes]:
+    start_time = time.perf_counter()
+    actions = torch.stack(
+        [postprocessor(action_tensor[:, i, :]) for i in range(action_tensor.shape[1])], dim=1
+    )
+    postprocess_done = time.perf_counter()
+    timed_actions = [
+        TimedAction(timestamp=i * dt, timestep=i, action=action)
+        for i, action in enumerate(actions[0].clone())
+    ]
+    data = pickle.dumps(timed_actions)  # nosec
+    return postprocess_done - start_time, time.perf_counter() - postprocess_done, data
+
+
+def run_chunk(postprocessor, action_tensor: torch.Tensor, dt: float) -> tuple[float, float, bytes]:
+    start_time = time.perf_counter()
+    actions = postprocessor(action_tensor)
+    postprocess_done = time.perf_counter()
+    data = encode_action_chunk(TimedActionChunk(timestamp=0.0, timestep=0, actions=actions[0].clone(), dt=dt))
+    return postprocess_done - start_time, time.perf_counter() - postprocess_done, data
+
+
+def benchmark(chunk_sizes: list[int], action_dim: int, num_iterations: int):
+    postprocessor = make_postprocessor(action_dim)
+    dt = 1 / 30
+    print(
+        f"{'variant':<11} {'chunk':>6} {'postprocess [ms]':>17} {'serialize [ms]':>15} "
+        f"{'client decode [ms]':>19} {'size [B]':>9}"
+    )
+    for chunk_size in chunk_sizes:
+        action_tensor = torch.randn(1, chunk_size, action_dim)
+        for name, run in [("per_action", run_per_action), ("chunk", run_chunk)]:
+            postprocess_time = serialize_time = decode_time = 0.0
+            for _ in range(num_iterations):
+                postprocess, serialize, data = run(postprocessor, action_tensor, dt)
+                start_time = time.perf_counter()
+                decode_action_chunk(data)
+                decode_time += time.perf_counter() - start_time
+                postprocess_time += postprocess
+                serialize_time += serialize
+
+            print(
+                f"{name:<11} {chunk_size:>6} {postprocess_time / num_iterations * 1000:>17.3f} "
+                f"{serialize_time / num_iterations * 1000:>15.3f} "
+                f"{decode_time / num_iterations * 1000:>19.3f} {len(data):>9}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark action chunk postprocessing and serialization.")
+    parser.add_argument(
+        "--chunk-sizes", type=int, nargs="+", default=[10, 50, 100, 200], help="Actions per chunk."
+    )
+    parser.add_argument("--action-dim", type=int, default=6, help="Dimension of every action.")
+    parser.add_argument("--num-iterations", type=int, default=100, help="Chunks per measurement.")
+    args = parser.parse_args()
+
+    benchmark(chunk_sizes=args.chunk_sizes, action_dim=args.action_dim, num_iterations=args.num_iterations)
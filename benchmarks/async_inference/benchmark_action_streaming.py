@@ -0,0 +1,195 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark the observation to action chunk round-trip of the two ways actions reach the robot client.
+
+- `polling`: the client calls the unary `GetActions` RPC in a loop.
+- `streaming`: the client keeps a single `StreamActions` server-streaming RPC open.
+
+A `PolicyServer` with a policy returning zeros runs on a loopback port, so that the measured latency is
+dominated by the transport and not by inference. For every observation, the round-trip goes from sending
+the observation to receiving its action chunk.
+
+Example:
+    python benchmarks/async_inference/benchmark_action_streaming.py --num-observations 200
+"""
+
+import argparse
+import pickle  # nosec
+import threading
+import time
+from concurrent import futures
+from queue import Empty, Queue
+from types import SimpleNamespace
+
+import grpc
+import torch
+
+from lerobot.async_inference.configs import PolicyServerConfig
+from lerobot.async_inference.helpers import LatencyTracker, TimedObservation
+from lerobot.async_inference.policy_server import PolicyServer
+from lerobot.configs.types import PolicyFeature
+from lerobot.datasets.utils import hw_to_dataset_features
+from lerobot.transport import (
+    services_pb2,  # type: ignore
+    services_pb2_grpc,  # type: ignore
+)
+from lerobot.transport.utils import grpc_channel_options, send_bytes_in_chunks
+from lerobot.utils.constants import OBS_STATE, OBS_STR
+
+
+class ZeroPolicy:
+    """Policy that predicts chunks of zeros"""
+
+    def __init__(
+        self, chunk_size: int, action_dim: int, image_features: dict[str, PolicyFeature] | None = None
+    ):
+        self.config = SimpleNamespace(image_features=image_features or {})
+        self.chunk_size = chunk_size
+        self.action_dim = action_dim
+
+    def predict_action_chunk(self, observation: dict[str, torch.Tensor]) -> torch.Tensor:
+        return torch.zeros(len(observation[OBS_STATE]), self.chunk_size, self.action_dim)
+
+
+def make_policy_server(
+    port: int,
+    actions_per_chunk: int,
+    robot_features: dict[str, type | tuple],
+    image_features: dict[str, PolicyFeature] | None = None,
+) -> PolicyServer:
+    """PolicyServer running a `ZeroPolicy`, for a robot with the given observation features"""
+    config = PolicyServerConfig(host="localhost", port=port, inference_latency=0.0)
+    policy_server = PolicyServer(config)
+    action_dim = sum(feature is float for feature in robot_features.values())
+    policy_server.policy = ZeroPolicy(actions_per_chunk, action_dim, image_features)
+    policy_server.policy_type = "act"
+    policy_server.device = "cpu"
+    policy_server.actions_per_chunk = actions_per_chunk
+    policy_server.lerobot_features = hw_to_dataset_features(robot_features, OBS_STR, use_video=False)
+    policy_server.preprocessor = lambda observation: observation
+    policy_server.postprocessor = lambda action: action
+    return policy_server
+
+
+def receive_polled_actions(stub, chunks: Queue, stop_event: threading.Event):
+    try:
+        while not stop_event.is_set():
+            actions = stub.GetActions(services_pb2.Empty())
+            if len(actions.data) > 0:
+                chunks.put(pickle.loads(actions.data))  # nosec
+    except grpc.RpcError as e:
+        # Closing the channel cancels the pending poll
+        if e.code() != grpc.StatusCode.CANCELLED:
+            raise
+
+
+def receive_streamed_actions(stream, chunks: Queue):
+    try:
+        for actions in stream:
+            chunks.put(pickle.loads(actions.data))  # nosec
+    except grpc.RpcError as e:
+        if e.code() != grpc.StatusCode.CANCELLED:
+            raise
+
+
+def benchmark_mode(
+    mode: str, server_address: str, joint_names: list[str], num_observations: int, num_warmup: int
+) -> dict[str, float]:
+    channel = grpc.insecure_channel(server_address, grpc_channel_options())
+    stub = services_pb2_grpc.AsyncInferenceStub(channel)
+    stub.Ready(services_pb2.Empty())
+
+    chunks: Queue = Queue()
+    stop_event = threading.Event()
+    stream = None
+    if mode == "streaming":
+        stream = stub.StreamActions(services_pb2.Empty())
+        receiver = threading.Thread(target=receive_streamed_actions, args=(stream, chunks), daemon=True)
+    else:
+        receiver = threading.Thread(
+            target=receive_polled_actions, args=(stub, chunks, stop_event), daemon=True
+        )
+    receiver.start()
+
+    latency_tracker = LatencyTracker()
+    for timestep in range(num_warmup + num_observations):
+        observation = TimedObservation(
+            timestamp=time.time(),
+            timestep=timestep,
+            observation={f"{joint}.pos": float(timestep) for joint in joint_names},
+            must_go=True,
+        )
+        start_time = time.perf_counter()
+        stub.SendObservations(
+            send_bytes_in_chunks(pickle.dumps(observation), services_pb2.Observation, silent=True)  # nosec
+        )
+        try:
+            chunk = chunks.get(timeout=5.0)
+        except Empty as e:
+            raise RuntimeError(f"No action chunk received for observation #{timestep} ({mode})") from e
+
+        if timestep >= num_warmup:
+            latency_tracker.record(time.perf_counter() - start_time)
+        assert chunk[0].get_timestep() == timestep
+
+    stop_event.set()
+    if stream is not None:
+        stream.cancel()
+    channel.close()
+    receiver.join()
+    return latency_tracker.calculate_latency_metrics()
+
+
+def benchmark(modes: list[str], num_observations: int, num_warmup: int, actions_per_chunk: int, port: int):
+    joint_names = [f"joint_{i}" for i in range(6)]
+    policy_server = make_policy_server(
+        port, actions_per_chunk, {f"{joint}.pos": float for joint in joint_names}
+    )
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    services_pb2_grpc.add_AsyncInferenceServicer_to_server(policy_server, server)
+    server_address = f"localhost:{port}"
+    server.add_insecure_port(server_address)
+    server.start()
+
+    print(f"{'mode':<10} {'count':>6} {'mean [ms]':>10} {'p50 [ms]':>9} {'p90 [ms]':>9} {'max [ms]':>9}")
+    try:
+        for mode in modes:
+            metrics = benchmark_mode(mode, server_address, joint_names, num_observations, num_warmup)
+            print(
+                f"{mode:<10} {metrics['count']:>6} {metrics['mean_ms']:>10.3f} {metrics['p50_ms']:>9.3f} "
+                f"{metrics['p90_ms']:>9.3f} {metrics['max_ms']:>9.3f}"
+            )
+    finally:
+        policy_server.stop()
+        server.stop(grace=None)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark polled and streamed action chunk delivery.")
+    parser.add_argument(
+        "--modes", type=str, nargs="+", default=["polling", "streaming"], choices=["polling", "streaming"]
+    )
+    parser.add_argument("--num-observations", type=int, default=200, help="Measured round-trips per mode.")
+    parser.add_argument("--num-warmup", type=int, default=10, help="Round-trips ignored at the start.")
+    parser.add_argument("--actions-per-chunk", type=int, default=50, help="Actions in every chunk.")
+    parser.add_argument("--port", type=int, default=8090, help="Loopback port of the policy server.")
+    args = parser.parse_args()
+
+    benchmark(
+        modes=args.modes,
+        num_observations=args.num_observations,
+        num_warmup=args.num_warmup,
+        actions_per_chunk=args.actions_per_chunk,
+        port=args.port,
+    )
@@ -0,0 +1,155 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Simulate the control loop of the robot client, to compare observation scheduling strategies.
+
+The simulation runs in virtual time: every control step performs the next action of the queue, if any, and
+sends an observation when the scheduler says so. The server runs inference on the latest observation
+it received, one at a time, with a round-trip latency that drifts linearly from `--start-latency` to
+`--end-latency` over the run, with Gaussian jitter. This mimics a GPU shared with other jobs or a degrading
+Wi-Fi link.
+
+Two strategies are compared:
+- `threshold=<g>`: observations are sent when the queue fill drops under the `chunk_size_threshold` g.
+- `adaptive`: observations are sent when the queue lasts less than the measured round-trip latency.
+
+The primary metrics are the queue underruns and the time the actuators are idle. The number of inferences
+shows the cost of sending observations earlier.
+
+Example:
+    python benchmarks/async_inference/benchmark_chunk_scheduling.py --start-latency 0.1 --end-latency 0.6
+"""
+
+import argparse
+
+import numpy as np
+
+from lerobot.async_inference.scheduling import AdaptiveChunkScheduler
+
+
+def simulate(
+    scheduler: AdaptiveChunkScheduler,
+    chunk_size: int,
+    num_steps: int,
+    start_latency: float,
+    end_latency: float,
+    jitter: float,
+    seed: int,
+) -> dict:
+    rng = np.random.default_rng(seed)
+    dt = scheduler.environment_dt
+
+    latest_action = -1
+    end_timestep = 0  # actions of timesteps (latest_action, end_timestep) are in queue
+    predicted_timesteps = set()
+    pending_observation = None  # (timestep, timestamp) of the latest observation waiting for the server
+    in_flight = None  # (arrival time, timestep, timestamp) of the chunk being predicted
+    num_inferences = 0
+
+    for step in range(num_steps):
+        now = step * dt
+
+        # The chunk predicted by the server arrives
+        if in_flight is not None and in_flight[0] <= now:
+            _, timestep, timestamp = in_flight
+            end_timestep = max(end_timestep, timestep + chunk_size)
+            scheduler.record_chunk(timestamp, in_flight[0], server_time=0.0)
+            in_flight = None
+
+        # The server starts predicting from the latest observation
+        if in_flight is None and pending_observation is not None:
+            timestep, timestamp = pending_observation
+            latency = start_latency + (end_latency - start_latency) * step / num_steps
+            latency = max(dt, latency + rng.normal(0, jitter))
+            in_flight = (now + latency, timestep, timestamp)
+            pending_observation = None
+            num_inferences += 1
+
+        queue_size = max(0, end_timestep - latest_action - 1)
+        action_performed = queue_size > 0
+        if action_performed:
+            latest_action += 1
+        scheduler.underrun_tracker.record_step(action_performed, now)
+
+        queue_size = max(0, end_timestep - latest_action - 1)
+        observation_timestep = max(latest_action, 0)
+        # The server skips the observations of timesteps it already predicted
+        if (
+            scheduler.ready_to_send(queue_size, chunk_size)
+            and observation_timestep not in predicted_timesteps
+        ):
+            predicted_timesteps.add(observation_timestep)
+            pending_observation = (observation_timestep, now)
+
+    return {**scheduler.underrun_tracker.calculate_underrun_metrics(), "num_inferences": num_inferences}
+
+
+def benchmark(
+    fps: int,
+    chunk_size: int,
+    chunk_size_thresholds: list[float],
+    latency_quantile: float,
+    duration_s: float,
+    start_latency: float,
+    end_latency: float,
+    jitter: float,
+    seed: int,
+):
+    num_steps = int(duration_s * fps)
+    schedulers = {
+        f"threshold={threshold}": AdaptiveChunkScheduler(
+            environment_dt=1 / fps, chunk_size_threshold=threshold, adaptive=False
+        )
+        for threshold in chunk_size_thresholds
+    }
+    schedulers["adaptive"] = AdaptiveChunkScheduler(environment_dt=1 / fps, latency_quantile=latency_quantile)
+
+    print(f"{'strategy':<15} {'underruns':>10} {'idle [s]':>9} {'idle [%]':>9} {'inferences':>11}")
+    for strategy, scheduler in schedulers.items():
+        metrics = simulate(scheduler, chunk_size, num_steps, start_latency, end_latency, jitter, seed)
+        print(
+            f"{strategy:<15} {metrics['underrun_count']:>10} {metrics['idle_time_s']:>9.2f} "
+            f"{metrics['idle_fraction'] * 100:>9.1f} {metrics['num_inferences']:>11}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulate observation scheduling strategies.")
+    parser.add_argument("--fps", type=int, default=30, help="Control frequency of the robot.")
+    parser.add_argument("--chunk-size", type=int, default=50, help="Actions per chunk.")
+    parser.add_argument(
+        "--chunk-size-thresholds",
+        type=float,
+        nargs="+",
+        default=[0.2, 0.5, 0.8],
+        help="Queue fill thresholds of the fixed strategies.",
+    )
+    parser.add_argument("--latency-quantile", type=float, default=0.9, help="Latency quantile to cover.")
+    parser.add_argument("--duration-s", type=float, default=600, help="Simulated duration, in seconds.")
+    parser.add_argument("--start-latency", type=float, default=0.1, help="Initial round trip, in seconds.")
+    parser.add_argument("--end-latency", type=float, default=0.6, help="Final round trip, in seconds.")
+    parser.add_argument("--jitter", type=float, default=0.05, help="Round-trip jitter, in seconds.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the latency jitter.")
+    args = parser.parse_args()
+
+    benchmark(
+        fps=args.fps,
+        chunk_size=args.chunk_size,
+        chunk_size_thresholds=args.chunk_size_thresholds,
+        latency_quantile=args.latency_quantile,
+        duration_s=args.duration_s,
+        start_latency=args.start_latency,
+        end_latency=args.end_latency,
+        jitter=args.jitter,
+        seed=args.seed,
+    )
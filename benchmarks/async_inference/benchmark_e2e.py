@@ -0,0 +1,358 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark the end-to-end latency of asynchronous inference on a single machine.
+
+A `PolicyServer` runs on a loopback port, serving a small randomly initialized ACT policy saved to a
+temporary directory, so that it goes through the same loading, warmup and processors as a trained one. A
+`RobotClient` drives a synthetic robot producing camera frames and joint states, and runs its control loop
+at `--fps` for `--duration-s` seconds.
+
+Every stage an observation and its action chunk go through is timed:
+- `serialize`: encoding of the observation on the client.
+- `deserialize`: decoding of the observation on the server.
+- `preprocess`, `inference`, `postprocess`: the policy processors and the policy itself, on the server.
+- `encode actions`, `decode actions`: the action chunk, on the server and on the client.
+- `queue merge`: merging the action chunk in the action queue of the client.
+- `round trip`: from the capture of the observation to the reception of its action chunk.
+- `network + wait`: what the round trip spends outside of the timed stages (gRPC, observation queues and
+  conversions), computed from the mean times.
+
+The action queue underruns and the time the robot spent idle waiting for actions are reported last.
+
+Example:
+    python benchmarks/async_inference/benchmark_e2e.py --fps 30 --duration-s 20 --camera-height 480
+"""
+
+import argparse
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from concurrent import futures
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any
+from unittest.mock import patch
+
+import grpc
+import numpy as np
+import torch
+from benchmark_observation_encoding import make_camera_frame
+
+from lerobot.async_inference import policy_server as policy_server_module, robot_client as robot_client_module
+from lerobot.async_inference.configs import PolicyServerConfig, RobotClientConfig
+from lerobot.async_inference.constants import SUPPORTED_IMAGE_CODECS
+from lerobot.async_inference.helpers import LatencyTracker
+from lerobot.async_inference.policy_server import PolicyServer
+from lerobot.async_inference.robot_client import RobotClient
+from lerobot.configs.types import FeatureType, PolicyFeature
+from lerobot.policies.act.configuration_act import ACTConfig
+from lerobot.policies.act.modeling_act import ACTPolicy
+from lerobot.policies.factory import make_pre_post_processors
+from lerobot.robots import Robot, RobotConfig
+from lerobot.transport import services_pb2_grpc  # type: ignore
+from lerobot.utils.constants import ACTION, OBS_IMAGES, OBS_STATE
+
+
+@RobotConfig.register_subclass("synthetic_robot")
+@dataclass
+class SyntheticRobotConfig(RobotConfig):
+    n_motors: int = 6
+    # Camera name -> (height, width)
+    camera_sizes: dict[str, tuple[int, int]] = field(default_factory=lambda: {"front": (480, 640)})
+    seed: int = 0
+
+
+class SyntheticRobot(Robot):
+    """Robot producing smooth random camera frames and sinusoidal joint states, performing any action"""
+
+    config_class = SyntheticRobotConfig
+    name = "synthetic_robot"
+
+    def __init__(self, config: SyntheticRobotConfig):
+        super().__init__(config)
+        self.config = config
+        self.motors = [f"motor_{i + 1}" for i in range(config.n_motors)]
+        self._rng = np.random.default_rng(config.seed)
+        # A few frames per camera, cycled through so that consecutive observations differ
+        self._frames = {
+            camera: [make_camera_frame(height, width, self._rng) for _ in range(8)]
+            for camera, (height, width) in config.camera_sizes.items()
+        }
+        self._num_observations = 0
+        self._is_connected = False
+
+    @cached_property
+    def observation_features(self) -> dict[str, type | tuple]:
+        return {
+            **{f"{motor}.pos": float for motor in self.motors},
+            **{camera: (height, width, 3) for camera, (height, width) in self.config.camera_sizes.items()},
+        }
+
+    @cached_property
+    def action_features(self) -> dict[str, type]:
+        return {f"{motor}.pos": float for motor in self.motors}
+
+    @property
+    def is_connected(self) -> bool:
+        return self._is_connected
+
+    def connect(self, calibrate: bool = True) -> None:
+        self._is_connected = True
+
+    @property
+    def is_calibrated(self) -> bool:
+        return True
+
+    def calibrate(self) -> None:
+        pass
+
+    def configure(self) -> None:
+        pass
+
+    def get_observation(self) -> dict[str, Any]:
+        step = self._num_observations
+        self._num_observations += 1
+        observation: dict[str, Any] = {
+            f"{motor}.pos": 50.0 * np.sin(0.05 * step + i) for i, motor in enumerate(self.motors)
+        }
+        for camera, frames in self._frames.items():
+            observation[camera] = frames[step % len(frames)]
+        return observation
+
+    def send_action(self, action: dict[str, Any]) -> dict[str, Any]:
+        return action
+
+    def disconnect(self) -> None:
+        self._is_connected = False
+
+
+def save_random_act_policy(
+    save_directory: str,
+    n_motors: int,
+    camera_names: list[str],
+    image_size: tuple[int, int],
+    chunk_size: int,
+):
+    """Save a randomly initialized ACT policy and its processors, loadable by the policy server"""
+    image_features = {
+        f"{OBS_IMAGES}.{camera}": PolicyFeature(type=FeatureType.VISUAL, shape=(3, *image_size))
+        for camera in camera_names
+    }
+    config = ACTConfig(
+        input_features={
+            OBS_STATE: PolicyFeature(type=FeatureType.STATE, shape=(n_motors,)),
+            **image_features,
+        },
+        output_features={ACTION: PolicyFeature(type=FeatureType.ACTION, shape=(n_motors,))},
+        chunk_size=chunk_size,
+        n_action_steps=chunk_size,
+        pretrained_backbone_weights=None,
+        device="cpu",
+    )
+    dataset_stats = {
+        OBS_STATE: {"mean": torch.zeros(n_motors), "std": torch.full((n_motors,), 50.0)},
+        ACTION: {"mean": torch.zeros(n_motors), "std": torch.full((n_motors,), 50.0)},
+        **{
+            key: {"mean": torch.full((3, 1, 1), 0.5), "std": torch.full((3, 1, 1), 0.25)}
+            for key in image_features
+        },
+    }
+    policy = ACTPolicy(config)
+    preprocessor, postprocessor = make_pre_post_processors(config, dataset_stats=dataset_stats)
+    policy.save_pretrained(save_directory)
+    preprocessor.save_pretrained(save_directory)
+    postprocessor.save_pretrained(save_directory)
+
+
+def timed(fn: Callable, tracker: LatencyTracker) -> Callable:
+    """Wrap `fn` so that the duration of every call is recorded in `tracker`"""
+
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        result = fn(*args, **kwargs)
+        tracker.record(time.perf_counter() - start)
+        return result
+
+    return wrapper
+
+
+def print_breakdown(trackers: dict[str, LatencyTracker], round_trip: LatencyTracker):
+    metrics = {stage: tracker.calculate_latency_metrics() for stage, tracker in trackers.items()}
+    metrics["round trip"] = round_trip.calculate_latency_metrics()
+
+    print(f"{'stage':<16} {'count':>6} {'mean [ms]':>10} {'p50 [ms]':>9} {'p90 [ms]':>9} {'max [ms]':>9}")
+    for stage, stage_metrics in metrics.items():
+        if "mean_ms" not in stage_metrics:
+            print(f"{stage:<16} {stage_metrics['count']:>6}")
+            continue
+        print(
+            f"{stage:<16} {stage_metrics['count']:>6} {stage_metrics['mean_ms']:>10.3f} "
+            f"{stage_metrics['p50_ms']:>9.3f} {stage_metrics['p90_ms']:>9.3f} {stage_metrics['max_ms']:>9.3f}"
+        )
+
+    # The round trip starts at the capture of the observation and stops before decoding the chunk
+    in_round_trip = ["serialize", "deserialize", "preprocess", "inference", "postprocess", "encode actions"]
+    if "mean_ms" in metrics["round trip"]:
+        timed_ms = sum(metrics[stage].get("mean_ms", 0.0) for stage in in_round_trip)
+        print(f"{'network + wait':<16} {'':>6} {metrics['round trip']['mean_ms'] - timed_ms:>10.3f}")
+
+
+def benchmark(
+    fps: int,
+    duration_s: float,
+    warmup_s: float,
+    n_motors: int,
+    num_cameras: int,
+    camera_height: int,
+    camera_width: int,
+    policy_image_size: int,
+    actions_per_chunk: int,
+    image_codec: str,
+    port: int,
+):
+    server_address = f"localhost:{port}"
+    camera_names = [f"camera_{i}" for i in range(num_cameras)]
+    robot_config = SyntheticRobotConfig(
+        n_motors=n_motors, camera_sizes=dict.fromkeys(camera_names, (camera_height, camera_width))
+    )
+
+    stages = [
+        "serialize",
+        "deserialize",
+        "preprocess",
+        "inference",
+        "postprocess",
+        "encode actions",
+        "decode actions",
+        "queue merge",
+    ]
+    trackers = {stage: LatencyTracker() for stage in stages}
+
+    with tempfile.TemporaryDirectory() as policy_directory, ExitStack() as patches:
+        save_random_act_policy(
+            policy_directory,
+            n_motors,
+            camera_names,
+            (policy_image_size, policy_image_size),
+            actions_per_chunk,
+        )
+
+        # Timing the encoding functions where the client and the server look them up
+        for module, name, stage in [
+            (robot_client_module, "encode_observation", "serialize"),
+            (policy_server_module, "decode_observation", "deserialize"),
+            (policy_server_module, "encode_action_chunk", "encode actions"),
+            (robot_client_module, "decode_action_chunk", "decode actions"),
+        ]:
+            patches.enter_context(patch.object(module, name, timed(getattr(module, name), trackers[stage])))
+        # The synthetic robot is not part of the robots `make_robot_from_config` knows about
+        patches.enter_context(patch.object(robot_client_module, "make_robot_from_config", SyntheticRobot))
+
+        policy_server = PolicyServer(
+            PolicyServerConfig(host="localhost", port=port, fps=fps, inference_latency=0.0)
+        )
+        server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+        services_pb2_grpc.add_AsyncInferenceServicer_to_server(policy_server, server)
+        server.add_insecure_port(server_address)
+        server.start()
+
+        client = RobotClient(
+            RobotClientConfig(
+                server_address=server_address,
+                robot=robot_config,
+                policy_type="act",
+                pretrained_name_or_path=policy_directory,
+                actions_per_chunk=actions_per_chunk,
+                policy_device="cpu",
+                fps=fps,
+                image_codec=image_codec,
+            )
+        )
+        threads = []
+        try:
+            if not client.start():
+                raise RuntimeError(f"Could not connect to the policy server at {server_address}")
+
+            # The policy is loaded and warmed up once the client is started
+            policy_server.preprocessor = timed(policy_server.preprocessor, trackers["preprocess"])
+            policy_server.postprocessor = timed(policy_server.postprocessor, trackers["postprocess"])
+            policy_server._get_action_chunk = timed(policy_server._get_action_chunk, trackers["inference"])
+            client._aggregate_action_queues = timed(client._aggregate_action_queues, trackers["queue merge"])
+
+            threads = [
+                threading.Thread(target=client.receive_actions, daemon=True),
+                threading.Thread(target=client.control_loop, kwargs={"task": ""}, daemon=True),
+            ]
+            for thread in threads:
+                thread.start()
+
+            time.sleep(warmup_s)
+            for tracker in trackers.values():
+                tracker.reset()
+            client.scheduler.round_trip_tracker.reset()
+            client.scheduler.underrun_tracker.reset()
+            time.sleep(duration_s)
+        finally:
+            client.stop()
+            for thread in threads:
+                thread.join()
+            policy_server.stop()
+            server.stop(grace=None)
+
+    print(
+        f"{n_motors} motors, {num_cameras} x {camera_height}x{camera_width} cameras -> "
+        f"{policy_image_size}x{policy_image_size}, {actions_per_chunk} actions per chunk, {fps} fps, "
+        f"{image_codec} images"
+    )
+    print_breakdown(trackers, client.scheduler.round_trip_tracker)
+
+    underrun_metrics = client.scheduler.underrun_tracker.calculate_underrun_metrics()
+    print(
+        f"\nunderruns: {underrun_metrics['underrun_count']} | "
+        f"idle: {underrun_metrics['idle_time_s']:.2f}s ({underrun_metrics['idle_fraction'] * 100:.1f}%)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark async inference end to end, on loopback.")
+    parser.add_argument("--fps", type=int, default=30, help="Control frequency of the robot.")
+    parser.add_argument("--duration-s", type=float, default=20, help="Measured duration, in seconds.")
+    parser.add_argument("--warmup-s", type=float, default=3, help="Duration ignored at the start.")
+    parser.add_argument("--n-motors", type=int, default=6, help="Joints of the synthetic robot.")
+    parser.add_argument("--num-cameras", type=int, default=1, help="Cameras of the synthetic robot.")
+    parser.add_argument("--camera-height", type=int, default=480, help="Height of the camera frames.")
+    parser.add_argument("--camera-width", type=int, default=640, help="Width of the camera frames.")
+    parser.add_argument("--policy-image-size", type=int, default=96, help="Image size the policy expects.")
+    parser.add_argument("--actions-per-chunk", type=int, default=50, help="Actions in every chunk.")
+    parser.add_argument(
+        "--image-codec", type=str, default="raw", choices=SUPPORTED_IMAGE_CODECS, help="Camera frames codec."
+    )
+    parser.add_argument("--port", type=int, default=8091, help="Loopback port of the policy server.")
+    args = parser.parse_args()
+
+    benchmark(
+        fps=args.fps,
+        duration_s=args.duration_s,
+        warmup_s=args.warmup_s,
+        n_motors=args.n_motors,
+        num_cameras=args.num_cameras,
+        camera_height=args.camera_height,
+        camera_width=args.camera_width,
+        policy_image_size=args.policy_image_size,
+        actions_per_chunk=args.actions_per_chunk,
+        image_codec=args.image_codec,
+        port=args.port,
+    )
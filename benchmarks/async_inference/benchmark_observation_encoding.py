@@ -0,0 +1,169 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark the size and latency of the observations sent by the robot client to the policy server.
+
+Four variants are compared:
+- `pickle`: full resolution camera frames, pickled (the format used before client-side resizing).
+- `raw`: camera frames resized to the policy resolution on the client, in the compact binary format.
+- `jpeg` / `webp`: same as `raw`, with compressed camera frames.
+
+For every variant, the script reports the bytes per observation and the latency of every stage of the
+observation path: client (resizing and encoding), transfer (`SendObservations` to a loopback
+`PolicyServer`, which decodes the observation) and server preparation (conversion to the policy inputs).
+
+Example:
+    python benchmarks/async_inference/benchmark_observation_encoding.py --num-cameras 2 --image-quality 90
+"""
+
+import argparse
+import pickle  # nosec
+import time
+from concurrent import futures
+
+import cv2
+import grpc
+import numpy as np
+from benchmark_action_streaming import make_policy_server
+
+from lerobot.async_inference.encoding import decode_observation, encode_observation, resize_observation_images
+from lerobot.async_inference.helpers import LatencyTracker, TimedObservation, raw_observation_to_observation
+from lerobot.configs.types import FeatureType, PolicyFeature
+from lerobot.transport import (
+    services_pb2,  # type: ignore
+    services_pb2_grpc,  # type: ignore
+)
+from lerobot.transport.utils import grpc_channel_options, send_bytes_in_chunks
+from lerobot.utils.constants import OBS_IMAGES
+
+VARIANTS = ["pickle", "raw", "jpeg", "webp"]
+
+
+def make_camera_frame(height: int, width: int, rng: np.random.Generator) -> np.ndarray:
+    """Smooth RGB frame with some sensor noise, to compress roughly like a real camera frame"""
+    coarse = rng.integers(0, 256, size=(12, 16, 3), dtype=np.uint8)
+    frame = cv2.resize(coarse, (width, height), interpolation=cv2.INTER_CUBIC).astype(np.int16)
+    frame += rng.normal(0, 3, size=frame.shape).astype(np.int16)
+    return frame.clip(0, 255).astype(np.uint8)
+
+
+def benchmark(
+    num_cameras: int,
+    camera_height: int,
+    camera_width: int,
+    policy_image_size: int,
+    image_quality: int,
+    num_observations: int,
+    port: int,
+):
+    rng = np.random.default_rng(0)
+    joint_names = [f"joint_{i}" for i in range(6)]
+    camera_names = [f"camera_{i}" for i in range(num_cameras)]
+    robot_features = {
+        **{f"{joint}.pos": float for joint in joint_names},
+        **dict.fromkeys(camera_names, (camera_height, camera_width, 3)),
+    }
+    image_features = {
+        f"{OBS_IMAGES}.{camera}": PolicyFeature(
+            type=FeatureType.VISUAL, shape=(3, policy_image_size, policy_image_size)
+        )
+        for camera in camera_names
+    }
+    image_sizes = dict.fromkeys(camera_names, (policy_image_size, policy_image_size))
+    frames = {camera: make_camera_frame(camera_height, camera_width, rng) for camera in camera_names}
+
+    policy_server = make_policy_server(port, 50, robot_features, image_features)
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    services_pb2_grpc.add_AsyncInferenceServicer_to_server(policy_server, server)
+    server.add_insecure_port(f"localhost:{port}")
+    server.start()
+    channel = grpc.insecure_channel(f"localhost:{port}", grpc_channel_options())
+    stub = services_pb2_grpc.AsyncInferenceStub(channel)
+    stub.Ready(services_pb2.Empty())
+
+    print(
+        f"{'variant':<8} {'size [kB]':>10} {'client [ms]':>12} {'transfer [ms]':>14} "
+        f"{'server [ms]':>12} {'total [ms]':>11}"
+    )
+    try:
+        for variant in VARIANTS:
+            trackers = {stage: LatencyTracker() for stage in ["client", "transfer", "server", "total"]}
+            sizes = []
+            for timestep in range(num_observations):
+                raw_observation = {f"{joint}.pos": float(timestep) for joint in joint_names}
+                raw_observation.update(frames)
+                raw_observation["task"] = "pick the cube"
+
+                start_time = time.perf_counter()
+                if variant != "pickle":
+                    raw_observation = resize_observation_images(raw_observation, image_sizes)
+                observation = TimedObservation(
+                    timestamp=time.time(), timestep=timestep, observation=raw_observation, must_go=True
+                )
+                if variant == "pickle":
+                    data = pickle.dumps(observation)
+                else:
+                    data = encode_observation(observation, variant, image_quality)
+                client_done = time.perf_counter()
+
+                stub.SendObservations(send_bytes_in_chunks(data, services_pb2.Observation, silent=True))
+                transfer_done = time.perf_counter()
+
+                # The server decodes the observation during the transfer, and only then prepares it
+                decoded_observation = decode_observation(data).get_observation()
+                prepare_start = time.perf_counter()
+                raw_observation_to_observation(
+                    decoded_observation, policy_server.lerobot_features, image_features
+                )
+                server_prepare_time = time.perf_counter() - prepare_start
+
+                sizes.append(len(data))
+                trackers["client"].record(client_done - start_time)
+                trackers["transfer"].record(transfer_done - client_done)
+                trackers["server"].record(server_prepare_time)
+                trackers["total"].record(transfer_done - start_time + server_prepare_time)
+
+            metrics = {stage: tracker.calculate_latency_metrics() for stage, tracker in trackers.items()}
+            print(
+                f"{variant:<8} {np.mean(sizes) / 1024:>10.1f} {metrics['client']['p50_ms']:>12.2f} "
+                f"{metrics['transfer']['p50_ms']:>14.2f} {metrics['server']['p50_ms']:>12.2f} "
+                f"{metrics['total']['p50_ms']:>11.2f}"
+            )
+    finally:
+        channel.close()
+        policy_server.stop()
+        server.stop(grace=None)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the encoding of the observations sent to the server."
+    )
+    parser.add_argument("--num-cameras", type=int, default=2, help="Number of cameras of the robot.")
+    parser.add_argument("--camera-height", type=int, default=480, help="Height of the camera frames.")
+    parser.add_argument("--camera-width", type=int, default=640, help="Width of the camera frames.")
+    parser.add_argument("--policy-image-size", type=int, default=224, help="Image resolution of the policy.")
+    parser.add_argument("--image-quality", type=int, default=90, help="JPEG and WebP quality.")
+    parser.add_argument("--num-observations", type=int, default=50, help="Observations sent per variant.")
+    parser.add_argument("--port", type=int, default=8091, help="Loopback port of the policy server.")
+    args = parser.parse_args()
+
+    benchmark(
+        num_cameras=args.num_cameras,
+        camera_height=args.camera_height,
+        camera_width=args.camera_width,
+        policy_image_size=args.policy_image_size,
+        image_quality=args.image_quality,
+        num_observations=args.num_observations,
+        port=args.port,
+    )
@@ -0,0 +1,198 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark the observation to action chunk round-trip over gRPC loopback and over shared memory.
+
+A `PolicyServer` with a policy returning zeros runs on a loopback port, and a `RobotClient` drives the
+synthetic robot of `benchmark_e2e` with full resolution raw camera frames, so that the measured latency is
+dominated by the transport. For every observation:
+- `send`: the `SendObservations` call of the client, from encoding the observation to the server having
+  decoded it.
+- `round trip`: from sending the observation to merging its action chunk in the action queue.
+
+Example:
+    python benchmarks/async_inference/benchmark_shared_memory.py --num-cameras 2 --camera-height 720
+"""
+
+import argparse
+import threading
+import time
+from concurrent import futures
+from unittest.mock import patch
+
+import grpc
+from benchmark_action_streaming import make_policy_server
+from benchmark_e2e import SyntheticRobot, SyntheticRobotConfig
+
+from lerobot.async_inference import robot_client as robot_client_module
+from lerobot.async_inference.configs import RobotClientConfig
+from lerobot.async_inference.helpers import LatencyTracker, TimedObservation
+from lerobot.async_inference.policy_server import PolicyServer
+from lerobot.async_inference.robot_client import RobotClient
+from lerobot.configs.types import FeatureType, PolicyFeature
+from lerobot.transport import services_pb2_grpc  # type: ignore
+from lerobot.utils.constants import OBS_IMAGES
+
+TRANSPORTS = ["grpc", "shared_memory"]
+
+
+def benchmark_transport(
+    transport: str,
+    policy_server: PolicyServer,
+    server_address: str,
+    robot_config: SyntheticRobotConfig,
+    actions_per_chunk: int,
+    num_observations: int,
+    num_warmup: int,
+) -> dict[str, dict[str, float]]:
+    # The synthetic robot is not part of the robots `make_robot_from_config` knows about
+    with patch.object(robot_client_module, "make_robot_from_config", SyntheticRobot):
+        client = RobotClient(
+            RobotClientConfig(
+                server_address=server_address,
+                robot=robot_config,
+                policy_type="act",
+                pretrained_name_or_path="zeros",
+                actions_per_chunk=actions_per_chunk,
+                resize_images_on_client=False,
+                shared_memory_transport=transport == "shared_memory",
+            )
+        )
+    # The server keeps its policy, it only attaches to the shared memory of the client
+    policy_server.policy_specs = client.policy_config
+
+    chunk_received = threading.Event()
+    aggregate_action_queues = client._aggregate_action_queues
+
+    def aggregate_and_notify(*args, **kwargs):
+        aggregate_action_queues(*args, **kwargs)
+        chunk_received.set()
+
+    client._aggregate_action_queues = aggregate_and_notify
+    # Observations are sent from here, the action receiver does not wait for the control loop
+    client.start_barrier = threading.Barrier(1)
+
+    trackers = {"send": LatencyTracker(), "round trip": LatencyTracker()}
+    receiver = threading.Thread(target=client.receive_actions, daemon=True)
+    try:
+        if not client.start():
+            raise RuntimeError(f"Could not connect to the policy server at {server_address}")
+        if transport == "shared_memory" and client.observation_ring is None:
+            raise RuntimeError("The server did not attach to the shared memory of the client")
+        receiver.start()
+
+        for timestep in range(num_warmup + num_observations):
+            raw_observation = client.robot.get_observation()
+            raw_observation["task"] = ""
+            observation = TimedObservation(
+                timestamp=time.time(), timestep=timestep, observation=raw_observation, must_go=True
+            )
+            chunk_received.clear()
+            start_time = time.perf_counter()
+            client.send_observation(observation)
+            send_time = time.perf_counter() - start_time
+            if not chunk_received.wait(timeout=5.0):
+                raise RuntimeError(f"No action chunk received for observation #{timestep} ({transport})")
+
+            if timestep >= num_warmup:
+                trackers["send"].record(send_time)
+                trackers["round trip"].record(time.perf_counter() - start_time)
+    finally:
+        client.stop()
+        if receiver.is_alive():
+            receiver.join()
+
+    return {stage: tracker.calculate_latency_metrics() for stage, tracker in trackers.items()}
+
+
+def benchmark(
+    num_cameras: int,
+    camera_height: int,
+    camera_width: int,
+    actions_per_chunk: int,
+    num_observations: int,
+    num_warmup: int,
+    port: int,
+):
+    n_motors = 6
+    camera_names = [f"camera_{i}" for i in range(num_cameras)]
+    robot_config = SyntheticRobotConfig(
+        n_motors=n_motors, camera_sizes=dict.fromkeys(camera_names, (camera_height, camera_width))
+    )
+    robot_features = SyntheticRobot(robot_config).observation_features
+    # Images reach the policy at full resolution
+    image_features = {
+        f"{OBS_IMAGES}.{camera}": PolicyFeature(
+            type=FeatureType.VISUAL, shape=(3, camera_height, camera_width)
+        )
+        for camera in camera_names
+    }
+
+    policy_server = make_policy_server(port, actions_per_chunk, robot_features, image_features)
+    # Off by default on the server, the gRPC transport is compared by the clients not asking for it
+    policy_server.config.shared_memory_transport = True
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    services_pb2_grpc.add_AsyncInferenceServicer_to_server(policy_server, server)
+    server_address = f"localhost:{port}"
+    server.add_insecure_port(server_address)
+    server.start()
+
+    print(f"{num_cameras} x {camera_height}x{camera_width} raw camera frames, {actions_per_chunk} actions")
+    print(
+        f"{'transport':<14} {'stage':<11} {'count':>6} {'mean [ms]':>10} {'p50 [ms]':>9} {'p90 [ms]':>9} "
+        f"{'max [ms]':>9}"
+    )
+    try:
+        for transport in TRANSPORTS:
+            metrics = benchmark_transport(
+                transport,
+                policy_server,
+                server_address,
+                robot_config,
+                actions_per_chunk,
+                num_observations,
+                num_warmup,
+            )
+            for stage, stage_metrics in metrics.items():
+                print(
+                    f"{transport:<14} {stage:<11} {stage_metrics['count']:>6} {stage_metrics['mean_ms']:>10.3f} "
+                    f"{stage_metrics['p50_ms']:>9.3f} {stage_metrics['p90_ms']:>9.3f} "
+                    f"{stage_metrics['max_ms']:>9.3f}"
+                )
+    finally:
+        policy_server.stop()
+        server.stop(grace=None)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark gRPC loopback and shared memory transports.")
+    parser.add_argument("--num-cameras", type=int, default=1, help="Cameras of the synthetic robot.")
+    parser.add_argument("--camera-height", type=int, default=480, help="Height of the camera frames.")
+    parser.add_argument("--camera-width", type=int, default=640, help="Width of the camera frames.")
+    parser.add_argument("--actions-per-chunk", type=int, default=50, help="Actions in every chunk.")
+    parser.add_argument(
+        "--num-observations", type=int, default=200, help="Measured round-trips per transport."
+    )
+    parser.add_argument("--num-warmup", type=int, default=10, help="Round-trips ignored at the start.")
+    parser.add_argument("--port", type=int, default=8092, help="Loopback port of the policy server.")
+    args = parser.parse_args()
+
+    benchmark(
+        num_cameras=args.num_cameras,
+        camera_height=args.camera_height,
+        camera_width=args.camera_width,
+        actions_per_chunk=args.actions_per_chunk,
+        num_observations=args.num_observations,
+        num_warmup=args.num_warmup,
+        port=args.port,
+    )
@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark the time and allocations of the inference pre- and postprocessors of policies.
+
+An observation (camera images, state and task) goes through the preprocessor of `make_pre_post_processors`,
+and an action through its postprocessor, as in the control loop. For every call:
+- `time`: the mean wall time.
+- `py peak`: the peak of the Python memory allocated during the call, traced with `tracemalloc`. It covers the
+  dictionaries and objects built by the converters and steps, not the memory of the tensors.
+- `new buffers`: the tensors and arrays of the output which don't share the memory of the input.
+
+The `converters` rows measure the conversions at the boundaries of the pipelines alone.
+
+Example:
+    python benchmarks/processor/benchmark_converters.py --policies act pi0 --batch-size 1
+"""
+
+import argparse
+import time
+import tracemalloc
+from collections.abc import Callable
+
+import numpy as np
+import torch
+
+from lerobot.configs.types import FeatureType, NormalizationMode, PolicyFeature
+from lerobot.policies.factory import make_pre_post_processors
+from lerobot.processor.converters import batch_to_transition, to_tensor, transition_to_batch
+from lerobot.processor.profiler import _transition_buffers
+from lerobot.utils.constants import ACTION, OBS_IMAGES, OBS_STATE
+
+
+def measure(function: Callable, data, num_iterations: int) -> dict[str, float]:
+    """Return the mean time in microseconds, Python peak bytes and new buffers of `function(data)`."""
+    for _ in range(3):
+        function(data)
+    start_time = time.perf_counter()
+    for _ in range(num_iterations):
+        function(data)
+    time_us = (time.perf_counter() - start_time) / num_iterations * 1e6
+
+    input_buffers = _transition_buffers(data if isinstance(data, dict) else {"data": data})
+    peaks = []
+    tracemalloc.start()
+    try:
+        for _ in range(num_iterations):
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            output = function(data)
+            peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+    output_buffers = _transition_buffers(output if isinstance(output, dict) else {"output": output})
+    return {
+        "time_us": time_us,
+        "peak_bytes": float(np.mean(peaks)),
+        "new_buffers": sum(address not in input_buffers for address in output_buffers),
+    }
+
+
+def make_policy_config(policy: str, features: dict[str, dict[str, PolicyFeature]], device: str):
+    if policy == "act":
+        from lerobot.policies.act.configuration_act import ACTConfig
+
+        return ACTConfig(**features, device=device)
+    if policy == "pi0":
+        from lerobot.policies.pi0.configuration_pi0 import PI0Config
+
+        return PI0Config(**features, device=device)
+    raise ValueError(f"Unknown policy '{policy}'")
+
+
+def benchmark(
+    policies: list[str],
+    batch_size: int,
+    num_cameras: int,
+    image_size: int,
+    state_dim: int,
+    device: str,
+    num_iterations: int,
+):
+    image_features = {
+        f"{OBS_IMAGES}.camera_{i}": PolicyFeature(type=FeatureType.VISUAL, shape=(3, image_size, image_size))
+        for i in range(num_cameras)
+    }
+    input_features = {OBS_STATE: PolicyFeature(type=FeatureType.STATE, shape=(state_dim,)), **image_features}
+    output_features = {ACTION: PolicyFeature(type=FeatureType.ACTION, shape=(state_dim,))}
+    stats = {
+        key: {
+            "mean": np.zeros(feature.shape[:1] + (1,) * (len(feature.shape) - 1)),
+            "std": np.ones(feature.shape[:1] + (1,) * (len(feature.shape) - 1)),
+        }
+        for key, feature in {**input_features, **output_features}.items()
+    }
+    observation = {
+        OBS_STATE: torch.randn(batch_size, state_dim),
+        **{key: torch.rand(batch_size, 3, image_size, image_size) for key in image_features},
+        "task": ["Pick up the cube"] * batch_size,
+    }
+    action = torch.randn(batch_size, state_dim)
+
+    print(f"{'pipeline':<22} {'time [us]':>10} {'py peak [KB]':>13} {'new buffers':>12}")
+
+    def print_row(name: str, metrics: dict[str, float]):
+        print(
+            f"{name:<22} {metrics['time_us']:>10.1f} {metrics['peak_bytes'] / 1024:>13.2f} "
+            f"{metrics['new_buffers']:>12}"
+        )
+
+    transition = batch_to_transition(observation)
+    print_row("converters/to_trans", measure(batch_to_transition, observation, num_iterations))
+    print_row("converters/to_batch", measure(transition_to_batch, transition, num_iterations))
+    print_row("converters/to_tensor", measure(to_tensor, observation[OBS_STATE], num_iterations))
+
+    for policy in policies:
+        try:
+            config = make_policy_config(
+                policy,
+                {"input_features": input_features, "output_features": output_features},
+                device,
+            )
+            config.normalization_mapping = dict.fromkeys(
+                ("VISUAL", "STATE", "ACTION"), NormalizationMode.MEAN_STD
+            )
+            preprocessor, postprocessor = make_pre_post_processors(config, dataset_stats=stats)
+        except ImportError as e:
+            print(f"{policy:<22} skipped: {e}")
+            continue
+        print_row(f"{policy}/preprocessor", measure(preprocessor, observation, num_iterations))
+        print_row(f"{policy}/postprocessor", measure(postprocessor, action.to(device), num_iterations))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the allocations of policy processors.")
+    parser.add_argument(
+        "--policies", type=str, nargs="+", default=["act", "pi0"], help="Policies of the processors."
+    )
+    parser.add_argument("--batch-size", type=int, default=1, help="Observations in every call.")
+    parser.add_argument("--num-cameras", type=int, default=2, help="Camera images in every observation.")
+    parser.add_argument("--image-size", type=int, default=224, help="Height and width of the images.")
+    parser.add_argument("--state-dim", type=int, default=14, help="Dimension of the state and actions.")
+    parser.add_argument("--device", type=str, default="cpu", help="Device of the policy.")
+    parser.add_argument("--num-iterations", type=int, default=500, help="Calls measured per pipeline.")
+    args = parser.parse_args()
+
+    benchmark(
+        policies=args.policies,
+        batch_size=args.batch_size,
+        num_cameras=args.num_cameras,
+        image_size=args.image_size,
+        state_dim=args.state_dim,
+        device=args.device,
+        num_iterations=args.num_iterations,
+    )
@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark the normalization of the train-time preprocessor of a policy.
+
+A batch shaped like the ones of the training loop (camera images, state and action chunk) goes through:
+- `normalizer`: the `NormalizerProcessorStep` alone.
+- `preprocessor`: the whole preprocessor of an ACT policy (renaming, batching, device, normalization).
+- `unnormalizer`: the `UnnormalizerProcessorStep` of the postprocessor, on the action chunk.
+
+Every normalization mode is benchmarked, applied to all the features.
+
+Example:
+    python benchmarks/processor/benchmark_normalize.py --device cuda --batch-sizes 8 64
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+
+import torch
+
+from lerobot.configs.types import FeatureType, NormalizationMode, PolicyFeature
+from lerobot.policies.act.configuration_act import ACTConfig
+from lerobot.policies.factory import make_pre_post_processors
+from lerobot.processor import (
+    NormalizerProcessorStep,
+    UnnormalizerProcessorStep,
+    create_transition,
+)
+from lerobot.utils.constants import ACTION, OBS_IMAGES, OBS_STATE
+
+MODES = [
+    NormalizationMode.MEAN_STD,
+    NormalizationMode.MIN_MAX,
+    NormalizationMode.QUANTILES,
+    NormalizationMode.QUANTILE10,
+]
+
+
+def synchronize(device: torch.device):
+    if device.type == "cuda":
+        torch.cuda.synchronize(device)
+
+
+def time_function(function: Callable, data, device: torch.device, num_iterations: int) -> float:
+    """Return the average time in microseconds of `function(data)`, after a few warmup calls."""
+    for _ in range(3):
+        function(data)
+    synchronize(device)
+    start_time = time.perf_counter()
+    for _ in range(num_iterations):
+        function(data)
+    synchronize(device)
+    return (time.perf_counter() - start_time) / num_iterations * 1e6
+
+
+def make_stats(shape: tuple[int, ...]) -> dict[str, torch.Tensor]:
+    stats_shape = (shape[0], 1, 1) if len(shape) == 3 else shape
+    low = -torch.rand(stats_shape) - 0.5
+    high = torch.rand(stats_shape) + 0.5
+    return {
+        "mean": torch.rand(stats_shape),
+        "std": torch.rand(stats_shape) + 0.1,
+        "min": low,
+        "max": high,
+        "q01": low / 2,
+        "q99": high / 2,
+        "q10": low / 4,
+        "q90": high / 4,
+    }
+
+
+def benchmark(
+    batch_sizes: list[int],
+    num_cameras: int,
+    image_size: int,
+    state_dim: int,
+    chunk_size: int,
+    device: torch.device,
+    num_iterations: int,
+):
+    image_features = {
+        f"{OBS_IMAGES}.camera_{i}": PolicyFeature(type=FeatureType.VISUAL, shape=(3, image_size, image_size))
+        for i in range(num_cameras)
+    }
+    input_features = {OBS_STATE: PolicyFeature(type=FeatureType.STATE, shape=(state_dim,)), **image_features}
+    output_features = {ACTION: PolicyFeature(type=FeatureType.ACTION, shape=(state_dim,))}
+    features = {**input_features, **output_features}
+    stats = {key: make_stats(feature.shape) for key, feature in features.items()}
+
+    print(
+        f"{'mode':<12} {'batch':>6} {'normalizer [us]':>16} {'preprocessor [us]':>18} {'unnormalizer [us]':>18}"
+    )
+    for mode in MODES:
+        norm_map = dict.fromkeys([FeatureType.VISUAL, FeatureType.STATE, FeatureType.ACTION], mode)
+        config = ACTConfig(
+            input_features=input_features,
+            output_features=output_features,
+            normalization_mapping={feature_type.value: mode for feature_type in norm_map},
+            chunk_size=chunk_size,
+            n_action_steps=chunk_size,
+            device=str(device),
+        )
+        preprocessor, _ = make_pre_post_processors(config, dataset_stats=stats)
+        normalizer = NormalizerProcessorStep(features=features, norm_map=norm_map, stats=stats, device=device)
+        unnormalizer = UnnormalizerProcessorStep(
+            features=output_features, norm_map=norm_map, stats=stats, device=device
+        )
+
+        for batch_size in batch_sizes:
+            batch = {
+                OBS_STATE: torch.randn(batch_size, state_dim),
+                **{key: torch.rand(batch_size, 3, image_size, image_size) for key in image_features},
+                ACTION: torch.randn(batch_size, chunk_size, state_dim),
+            }
+            device_batch = {key: value.to(device) for key, value in batch.items()}
+            transition = create_transition(
+                observation={key: value for key, value in device_batch.items() if key != ACTION},
+                action=device_batch[ACTION],
+            )
+            action_transition = create_transition(action=device_batch[ACTION])
+
+            normalizer_time = time_function(normalizer, transition, device, num_iterations)
+            preprocessor_time = time_function(preprocessor, batch, device, num_iterations)
+            unnormalizer_time = time_function(unnormalizer, action_transition, device, num_iterations)
+            print(
+                f"{mode.value:<12} {batch_size:>6} {normalizer_time:>16.1f} {preprocessor_time:>18.1f} "
+                f"{unnormalizer_time:>18.1f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the normalization of the preprocessor.")
+    parser.add_argument(
+        "--batch-sizes", type=int, nargs="+", default=[8, 64], help="Training batch sizes to benchmark."
+    )
+    parser.add_argument("--num-cameras", type=int, default=2, help="Camera images in every sample.")
+    parser.add_argument("--image-size", type=int, default=96, help="Height and width of the images.")
+    parser.add_argument("--state-dim", type=int, default=14, help="Dimension of the state and actions.")
+    parser.add_argument("--chunk-size", type=int, default=50, help="Actions in every sample.")
+    parser.add_argument("--device", type=str, default="cpu", help="Device the batches are normalized on.")
+    parser.add_argument("--num-iterations", type=int, default=200, help="Calls timed per measurement.")
+    args = parser.parse_args()
+
+    benchmark(
+        batch_sizes=args.batch_sizes,
+        num_cameras=args.num_cameras,
+        image_size=args.image_size,
+        state_dim=args.state_dim,
+        chunk_size=args.chunk_size,
+        device=torch.device(args.device),
+        num_iterations=args.num_iterations,
+    )
@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark robot action pipelines on the actions of several robots, as dicts and as a `RobotActionBatch`.
+
+For a batch of B robots, every pipeline is timed two ways:
+- `dicts`: one pipeline per robot, each called on the `RobotAction` of its robot, as in a loop over the robots.
+- `batch`: a single pipeline called on the `RobotActionBatch` of all the robots.
+
+The pipelines are:
+- `delta`: the mapping of teleoperator deltas to end-effector targets.
+- `ee_safety`: the end-effector bounds and the gripper velocity to joint steps.
+- `ee_full`: the whole end-effector pipeline, from deltas to joints, with forward and inverse kinematics. Only
+  run when a URDF is given, as it needs `placo`. The kinematics run one robot at a time in both modes.
+
+Example:
+    python benchmarks/processor/benchmark_robot_action_batch.py --batch-sizes 1 64
+    python benchmarks/processor/benchmark_robot_action_batch.py --urdf-path ./SO101/so101_new_calib.urdf
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from functools import partial
+
+import numpy as np
+import torch
+
+from lerobot.processor import (
+    DataProcessorPipeline,
+    ProcessorStep,
+    RobotAction,
+    RobotActionBatch,
+    TransitionKey,
+)
+from lerobot.processor.converters import create_transition, identity_transition
+from lerobot.processor.delta_action_processor import MapDeltaActionToRobotActionStep
+from lerobot.robots.so_follower.robot_kinematic_processor import (
+    EEBoundsAndSafety,
+    EEReferenceAndDelta,
+    GripperVelocityToJoint,
+    InverseKinematicsEEToJoints,
+)
+
+MOTOR_NAMES = ["shoulder_pan", "shoulder_lift", "elbow_flex", "wrist_flex", "wrist_roll", "gripper"]
+
+
+def make_pipeline(steps: list[ProcessorStep]) -> DataProcessorPipeline:
+    return DataProcessorPipeline(steps, to_transition=identity_transition, to_output=identity_transition)
+
+
+def make_ee_safety_steps() -> list[ProcessorStep]:
+    return [
+        EEBoundsAndSafety(end_effector_bounds={"min": [-1.0] * 3, "max": [1.0] * 3}, max_ee_step_m=10.0),
+        GripperVelocityToJoint(speed_factor=5.0),
+    ]
+
+
+def make_ee_full_steps(urdf_path: str) -> list[ProcessorStep]:
+    from lerobot.model.kinematics import RobotKinematics
+
+    kinematics = RobotKinematics(urdf_path, joint_names=MOTOR_NAMES)
+    return [
+        MapDeltaActionToRobotActionStep(),
+        EEReferenceAndDelta(
+            kinematics=kinematics,
+            end_effector_step_sizes={"x": 0.01, "y": 0.01, "z": 0.01},
+            motor_names=MOTOR_NAMES,
+        ),
+        EEBoundsAndSafety(end_effector_bounds={"min": [-1.0] * 3, "max": [1.0] * 3}, max_ee_step_m=10.0),
+        GripperVelocityToJoint(speed_factor=5.0),
+        InverseKinematicsEEToJoints(kinematics=kinematics, motor_names=MOTOR_NAMES),
+    ]
+
+
+def run_dicts(
+    pipelines: list[DataProcessorPipeline], observations: list[dict], actions: list[RobotAction]
+) -> list[RobotAction]:
+    """Call the pipeline of every robot on its action, like a loop over the robots."""
+    return [
+        pipeline(create_transition(observation=observation, action=dict(action)))[TransitionKey.ACTION]
+        for pipeline, observation, action in zip(pipelines, observations, actions, strict=True)
+    ]
+
+
+def run_batch(
+    pipeline: DataProcessorPipeline, observation: dict[str, torch.Tensor], action: RobotActionBatch
+) -> RobotActionBatch:
+    """Call the pipeline once on the actions of all the robots."""
+    return pipeline(create_transition(observation=observation, action=action))[TransitionKey.ACTION]
+
+
+def measure(function: Callable[[], object], num_iterations: int) -> float:
+    """Return the mean time of `function()` in microseconds."""
+    for _ in range(3):
+        function()
+    start_time = time.perf_counter()
+    for _ in range(num_iterations):
+        function()
+    return (time.perf_counter() - start_time) / num_iterations * 1e6
+
+
+def benchmark(batch_sizes: list[int], urdf_path: str | None, num_iterations: int):
+    rng = np.random.default_rng(0)
+    actions = {
+        "delta": lambda: {
+            "delta_x": rng.normal(),
+            "delta_y": rng.normal(),
+            "delta_z": rng.normal(),
+            "gripper": 1.0,
+        },
+        "ee_safety": lambda: {
+            **{key: rng.uniform(-0.1, 0.1) for key in ("ee.x", "ee.y", "ee.z", "ee.wx", "ee.wy", "ee.wz")},
+            "ee.gripper_vel": rng.normal(),
+        },
+    }
+    make_steps = {"delta": lambda: [MapDeltaActionToRobotActionStep()], "ee_safety": make_ee_safety_steps}
+    if urdf_path is not None:
+        actions["ee_full"] = actions["delta"]
+        make_steps["ee_full"] = lambda: make_ee_full_steps(urdf_path)
+
+    print(f"{'pipeline':<12} {'B':>5} {'dicts [us]':>12} {'batch [us]':>12} {'speedup':>9}")
+    for name, make_action in actions.items():
+        for batch_size in batch_sizes:
+            robot_actions = [make_action() for _ in range(batch_size)]
+            observations = [
+                {f"{motor}.pos": rng.uniform(-10, 10) for motor in MOTOR_NAMES} for _ in robot_actions
+            ]
+            try:
+                robot_pipelines = [make_pipeline(make_steps[name]()) for _ in range(batch_size)]
+                batch_pipeline = make_pipeline(make_steps[name]())
+            except ImportError as e:
+                print(f"{name:<12} skipped: {e}")
+                break
+
+            batch_observation = {
+                key: torch.tensor([observation[key] for observation in observations])
+                for key in observations[0]
+            }
+            batch_action = RobotActionBatch.from_dicts(robot_actions)
+
+            dicts_us = measure(
+                partial(run_dicts, robot_pipelines, observations, robot_actions), num_iterations
+            )
+            batch_us = measure(
+                partial(run_batch, batch_pipeline, batch_observation, batch_action), num_iterations
+            )
+            print(
+                f"{name:<12} {batch_size:>5} {dicts_us:>12.1f} {batch_us:>12.1f} {dicts_us / batch_us:>8.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark batched robot action pipelines.")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 64], help="Robots in every call.")
+    parser.add_argument(
+        "--urdf-path", type=str, default=None, help="URDF of the robot, to benchmark the whole EE pipeline."
+    )
+    parser.add_argument("--num-iterations", type=int, default=200, help="Calls measured per pipeline.")
+    args = parser.parse_args()
+
+    benchmark(batch_sizes=args.batch_sizes, urdf_path=args.urdf_path, num_iterations=args.num_iterations)
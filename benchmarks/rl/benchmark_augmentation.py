@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark the DrQ image augmentation applied when sampling from the replay buffer.
+
+Three variants are compared:
+- `eager`: replicate padding followed by a random crop (`random_shift`).
+- `compiled`: the same function wrapped in `torch.compile`.
+- `fused`: `DrQAugmentation`, a single gather compiled per batch size bucket after a warmup.
+
+For every variant, the script reports the steady state time per batch and the total time of a "fill" run,
+where the batch size grows like it does while the replay buffer fills up (compilation included).
+
+Example:
+    python benchmarks/rl/benchmark_augmentation.py --device cuda --batch-sizes 64 256 512
+"""
+
+import argparse
+import functools
+import time
+from collections.abc import Callable
+
+import torch
+
+from lerobot.rl.augmentation import DrQAugmentation
+from lerobot.rl.buffer import random_shift
+
+
+def synchronize(device: torch.device):
+    if device.type == "cuda":
+        torch.cuda.synchronize(device)
+
+
+def time_function(function: Callable, images: torch.Tensor, num_iterations: int) -> float:
+    """Return the average time in milliseconds of `function(images)`."""
+    synchronize(images.device)
+    start_time = time.perf_counter()
+    for _ in range(num_iterations):
+        function(images)
+    synchronize(images.device)
+    return (time.perf_counter() - start_time) / num_iterations * 1000
+
+
+def time_fill(function: Callable, images: torch.Tensor, num_steps: int) -> float:
+    """Return the total time in seconds of `num_steps` calls with a growing batch size."""
+    batch_size = images.shape[0]
+    synchronize(images.device)
+    start_time = time.perf_counter()
+    for step in range(num_steps):
+        function(images[: 1 + step * (batch_size - 1) // max(num_steps - 1, 1)])
+    synchronize(images.device)
+    return time.perf_counter() - start_time
+
+
+def make_variants(pad: int) -> dict[str, Callable]:
+    torch._dynamo.reset()
+    return {
+        "eager": functools.partial(random_shift, pad=pad),
+        "compiled": torch.compile(functools.partial(random_shift, pad=pad)),
+        "fused": DrQAugmentation(pad=pad),
+    }
+
+
+def benchmark(
+    batch_sizes: list[int],
+    image_size: int,
+    num_image_keys: int,
+    pad: int,
+    device: torch.device,
+    num_iterations: int,
+    num_fill_steps: int,
+):
+    print(
+        f"{'variant':<10} {'batch':>6} {'images':>7} {'warmup [s]':>11} {'fill [s]':>9} "
+        f"{'steady [ms]':>12} {'images/s':>10}"
+    )
+    for batch_size in batch_sizes:
+        # `sample` augments the state and next state images of every image key at once
+        num_images = 2 * num_image_keys * batch_size
+        images = torch.rand(num_images, 3, image_size, image_size, device=device)
+
+        for name, function in make_variants(pad).items():
+            start_time = time.perf_counter()
+            if isinstance(function, DrQAugmentation):
+                function.warmup(image_shape=images.shape[1:], max_batch_size=num_images, device=device)
+            else:
+                function(images)
+            synchronize(device)
+            warmup_time = time.perf_counter() - start_time
+
+            fill_time = time_fill(function, images, num_fill_steps)
+            steady_time = time_function(function, images, num_iterations)
+            print(
+                f"{name:<10} {batch_size:>6} {num_images:>7} {warmup_time:>11.2f} {fill_time:>9.2f} "
+                f"{steady_time:>12.3f} {num_images / steady_time * 1000:>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the DrQ image augmentation variants.")
+    parser.add_argument(
+        "--batch-sizes",
+        type=int,
+        nargs="+",
+        default=[64, 256, 512],
+        help="Replay buffer batch sizes to benchmark.",
+    )
+    parser.add_argument("--image-size", type=int, default=128, help="Height and width of the images.")
+    parser.add_argument("--num-image-keys", type=int, default=2, help="Number of cameras in the state.")
+    parser.add_argument("--pad", type=int, default=4, help="Maximum shift in pixels.")
+    parser.add_argument("--device", type=str, default="cuda" if torch.cuda.is_available() else "cpu")
+    parser.add_argument("--num-iterations", type=int, default=50, help="Iterations of the steady state run.")
+    parser.add_argument("--num-fill-steps", type=int, default=20, help="Batch sizes of the fill run.")
+    args = parser.parse_args()
+
+    benchmark(
+        batch_sizes=args.batch_sizes,
+        image_size=args.image_size,
+        num_image_keys=args.num_image_keys,
+        pad=args.pad,
+        device=torch.device(args.device),
+        num_iterations=args.num_iterations,
+        num_fill_steps=args.num_fill_steps,
+    )
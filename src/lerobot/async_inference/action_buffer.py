@@ -0,0 +1,191 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Ring buffer holding the actions the robot client still has to perform."""
+
+from collections.abc import Callable
+from threading import Lock
+
+import numpy as np
+import torch
+from torch import Tensor
+
+from .helpers import TimedAction, TimedActionChunk
+
+
+def _stack_timed_actions(timed_actions: list[TimedAction]) -> TimedActionChunk:
+    if not timed_actions:
+        return TimedActionChunk(timestamp=0.0, timestep=0, actions=torch.empty(0), dt=0.0)
+
+    first = timed_actions[0]
+    dt = timed_actions[1].get_timestamp() - first.get_timestamp() if len(timed_actions) > 1 else 0.0
+    return TimedActionChunk(
+        timestamp=first.get_timestamp(),
+        timestep=first.get_timestep(),
+        actions=torch.stack([action.get_action() for action in timed_actions]),
+        dt=dt,
+    )
+
+
+class ActionRingBuffer:
+    """Thread-safe store of the actions to perform, indexed by timestep.
+
+    The action of timestep `t` lives in slot `t % capacity` of a preallocated (capacity, action_dim)
+    tensor, and a validity mask tells which slots hold an action. The buffer always holds the actions of
+    the consecutive timesteps `[start_timestep, end_timestep)`.
+
+    Merging a chunk is a handful of tensor operations: the actions of the timesteps already in the buffer
+    are combined with the incoming ones by `aggregate_fn` in one vectorized call, and the buffer then
+    holds exactly the timesteps of the chunk that are still to perform. Popping the next action is O(1).
+
+    Args:
+        capacity (int): Initial number of slots. The buffer grows if a larger chunk is merged.
+    """
+
+    def __init__(self, capacity: int = 64):
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
+
+        self.capacity = capacity
+        self.actions: Tensor | None = None  # allocated on the first merge, once the action shape is known
+        # Scalar reads of NumPy arrays are much cheaper than of tensors, which keeps popping fast
+        self.timestamps = np.zeros(capacity, dtype=np.float64)
+        self.valid = np.zeros(capacity, dtype=bool)
+        self.start_timestep = 0
+        self.end_timestep = 0
+        self.last_timestep = -1  # timestep of the last popped action
+        self._size = 0
+        self.lock = Lock()
+
+    def qsize(self) -> int:
+        """Number of actions left to perform"""
+        return self._size
+
+    def empty(self) -> bool:
+        return self._size == 0
+
+    def timesteps(self) -> list[int]:
+        """Timesteps of the actions left to perform, in order"""
+        with self.lock:
+            timesteps = np.arange(self.start_timestep, self.end_timestep)
+            return timesteps[self.valid[timesteps % self.capacity]].tolist()
+
+    def clear(self):
+        with self.lock:
+            self._clear()
+
+    def _clear(self):
+        self.valid[:] = False
+        self.start_timestep = self.end_timestep
+        self._size = 0
+
+    def _allocate(self, capacity: int, actions: Tensor):
+        """(Re)allocate the slots, keeping the buffered actions"""
+        old_timesteps = np.arange(self.start_timestep, self.end_timestep)
+        old_slots = old_timesteps % self.capacity
+        old_valid = self.valid[old_slots]
+
+        new_actions = actions.new_zeros((capacity, *actions.shape[1:]))
+        new_timestamps = np.zeros(capacity, dtype=np.float64)
+        new_valid = np.zeros(capacity, dtype=bool)
+        if self.actions is not None and self.actions.shape[1:] == actions.shape[1:] and len(old_timesteps):
+            new_slots = old_timesteps % capacity
+            new_actions[torch.from_numpy(new_slots)] = self.actions[torch.from_numpy(old_slots)].to(
+                actions.dtype
+            )
+            new_timestamps[new_slots] = self.timestamps[old_slots]
+            new_valid[new_slots] = old_valid
+        else:
+            self.start_timestep = self.end_timestep
+            self._size = 0
+
+        self.capacity = capacity
+        self.actions = new_actions
+        self.timestamps = new_timestamps
+        self.valid = new_valid
+
+    def merge(
+        self,
+        chunk: TimedActionChunk | list[TimedAction],
+        latest_timestep: int,
+        aggregate_fn: Callable[[Tensor, Tensor], Tensor] | None = None,
+    ):
+        """Merge an incoming chunk of actions into the buffer.
+
+        Actions of the chunk with a timestep lower or equal to `latest_timestep`, or to the timestep of the
+        last popped action, are discarded. The actions
+        of the timesteps already in the buffer are combined with `aggregate_fn(old, new)` (by default, the
+        incoming action is kept). Afterwards, the buffer holds exactly the remaining actions of the chunk.
+
+        Args:
+            chunk: Incoming actions. A list of consecutive `TimedAction`s, as sent by older servers, is
+                stacked into a chunk.
+            latest_timestep: Timestep of the last action performed.
+            aggregate_fn: Elementwise function combining (N, action_dim) tensors of old and new actions.
+        """
+        if isinstance(chunk, list):
+            chunk = _stack_timed_actions(chunk)
+
+        with self.lock:
+            first = max(chunk.get_timestep(), latest_timestep + 1, self.last_timestep + 1)
+            end = chunk.get_timestep() + len(chunk)
+            if first >= end:
+                self._clear()
+                return
+
+            incoming = chunk.get_actions()[first - chunk.get_timestep() :]
+            if self.actions is None or self.actions.shape[1:] != incoming.shape[1:]:
+                self._allocate(self.capacity, incoming)
+            if end - first > self.capacity:
+                self._allocate(1 << (end - first - 1).bit_length(), incoming)
+
+            timesteps = np.arange(first, end)
+            slots = timesteps % self.capacity
+            tensor_slots = torch.from_numpy(slots)
+            incoming = incoming.to(self.actions.dtype)
+            if aggregate_fn is not None:
+                # Slots of other timesteps (ring wrap-around) do not overlap
+                overlap = (
+                    self.valid[slots] & (timesteps >= self.start_timestep) & (timesteps < self.end_timestep)
+                )
+                if overlap.any():
+                    aggregated = aggregate_fn(self.actions[tensor_slots], incoming)
+                    overlap = torch.from_numpy(overlap).view(-1, *[1] * (incoming.ndim - 1))
+                    incoming = torch.where(overlap, aggregated, incoming)
+
+            self.valid[:] = False
+            self.actions[tensor_slots] = incoming
+            self.timestamps[slots] = chunk.get_timestamp() + (timesteps - chunk.get_timestep()) * chunk.dt
+            self.valid[slots] = True
+            self.start_timestep = first
+            self.end_timestep = end
+            self._size = end - first
+
+    def get(self) -> TimedAction | None:
+        """Pop the action of the next timestep, or return None if the buffer is empty."""
+        with self.lock:
+            while self.start_timestep < self.end_timestep:
+                timestep = self.start_timestep
+                slot = timestep % self.capacity
+                self.start_timestep += 1
+                self.last_timestep = timestep
+                if self.valid[slot]:
+                    self.valid[slot] = False
+                    self._size -= 1
+                    return TimedAction(
+                        timestamp=float(self.timestamps[slot]),
+                        timestep=timestep,
+                        action=self.actions[slot].clone(),
+                    )
+            return None
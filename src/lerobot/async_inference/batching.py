@@ -0,0 +1,216 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Dynamic batching of inference requests coming from several robot clients."""
+
+import logging
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from queue import Empty, Queue
+from typing import Any
+
+import torch
+
+from .helpers import LatencyTracker, Observation
+
+
+@dataclass
+class InferenceRequest:
+    """A request waiting in the batcher, resolved through its future."""
+
+    client_id: str
+    payload: Any
+    future: Future = field(default_factory=Future)
+    submit_time: float = field(default_factory=time.perf_counter)
+
+
+class DynamicBatcher:
+    """Run the requests of several clients through a single batched call.
+
+    A worker thread waits for a first request, then keeps collecting requests for at most `max_wait_s`
+    seconds or until `max_batch_size` requests are gathered. The whole batch goes through
+    `process_batch`, which returns one result per request, and every result is sent back to the
+    future of its request. With `max_wait_s=0`, only the requests already waiting are batched together,
+    so a single client never waits for others.
+
+    The batcher keeps a histogram of the batch sizes and the latency of every client, measured from
+    the submission of a request to its result.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[list[Any]], list[Any]],
+        max_batch_size: int = 8,
+        max_wait_s: float = 0.0,
+        logger: logging.Logger | None = None,
+        stats_log_interval_s: float = 30.0,
+    ):
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be at least 1, got {max_batch_size}")
+        if max_wait_s < 0:
+            raise ValueError(f"max_wait_s must be non-negative, got {max_wait_s}")
+
+        self.process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait_s = max_wait_s
+        self.logger = logger or logging.getLogger(__name__)
+        self.stats_log_interval_s = stats_log_interval_s
+
+        self._requests: Queue[InferenceRequest] = Queue()
+        self._shutdown_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+
+        self._stats_lock = threading.Lock()
+        self.batch_size_histogram: Counter[int] = Counter()
+        self.client_latencies: dict[str, LatencyTracker] = {}
+        self._last_stats_log_time = time.perf_counter()
+
+    def submit(self, client_id: str, payload: Any) -> Future:
+        """Queue a request for the next batch. The worker thread is started on the first request."""
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._shutdown_event.clear()
+                self._thread = threading.Thread(target=self._run, name="dynamic_batcher", daemon=True)
+                self._thread.start()
+
+        request = InferenceRequest(client_id=client_id, payload=payload)
+        self._requests.put(request)
+        return request.future
+
+    def stop(self):
+        """Stop the worker thread and cancel the requests still waiting"""
+        self._shutdown_event.set()
+        with self._thread_lock:
+            if self._thread is not None:
+                self._thread.join()
+                self._thread = None
+
+        while True:
+            try:
+                self._requests.get_nowait().future.cancel()
+            except Empty:
+                break
+
+    def get_stats(self) -> dict[str, Any]:
+        """Batch size histogram and per-client latency metrics"""
+        with self._stats_lock:
+            return {
+                "batch_size_histogram": dict(sorted(self.batch_size_histogram.items())),
+                "client_latency": {
+                    client_id: tracker.calculate_latency_metrics()
+                    for client_id, tracker in self.client_latencies.items()
+                },
+            }
+
+    def _collect_batch(self) -> list[InferenceRequest]:
+        """Wait for a first request, then gather the following ones within the max-wait window"""
+        try:
+            batch = [self._requests.get(timeout=0.1)]
+        except Empty:
+            return []
+
+        deadline = time.perf_counter() + self.max_wait_s
+        while len(batch) < self.max_batch_size:
+            try:
+                remaining = deadline - time.perf_counter()
+                if remaining > 0:
+                    batch.append(self._requests.get(timeout=remaining))
+                else:
+                    batch.append(self._requests.get_nowait())
+            except Empty:
+                break
+
+        return batch
+
+    def _run(self):
+        while not self._shutdown_event.is_set():
+            batch = self._collect_batch()
+            if not batch:
+                continue
+
+            try:
+                results = self.process_batch([request.payload for request in batch])
+            except Exception as e:
+                self.logger.error(f"Batched inference failed for {len(batch)} requests: {e}")
+                for request in batch:
+                    request.future.set_exception(e)
+                continue
+
+            done_time = time.perf_counter()
+            with self._stats_lock:
+                self.batch_size_histogram[len(batch)] += 1
+                for request in batch:
+                    tracker = self.client_latencies.setdefault(request.client_id, LatencyTracker())
+                    tracker.record(done_time - request.submit_time)
+
+            for request, result in zip(batch, results, strict=True):
+                request.future.set_result(result)
+
+            self._maybe_log_stats()
+
+    def _maybe_log_stats(self):
+        if time.perf_counter() - self._last_stats_log_time < self.stats_log_interval_s:
+            return
+
+        self._last_stats_log_time = time.perf_counter()
+        stats = self.get_stats()
+        self.logger.info(f"Batch size histogram: {stats['batch_size_histogram']}")
+        for client_id, metrics in stats["client_latency"].items():
+            self.logger.info(
+                f"Client {client_id} | Requests: {metrics['count']} | "
+                f"Latency p50: {metrics.get('p50_ms', 0.0):.2f}ms | p90: {metrics.get('p90_ms', 0.0):.2f}ms"
+            )
+
+
+def group_observations(observations: list[Observation]) -> list[list[int]]:
+    """Group the indices of the preprocessed observations that can be concatenated into one batch.
+
+    Observations are grouped by the shapes (apart from the batch dimension) and dtypes of their tensors.
+    Clients of the same policy can still send tensors of different lengths, e.g. language tokens padded to
+    the longest task of every client.
+    """
+    groups: dict[tuple, list[int]] = {}
+    for i, observation in enumerate(observations):
+        signature = tuple(
+            (key, value.shape[1:], value.dtype)
+            for key, value in observation.items()
+            if isinstance(value, torch.Tensor)
+        )
+        groups.setdefault(signature, []).append(i)
+    return list(groups.values())
+
+
+def concatenate_observations(observations: list[Observation]) -> Observation:
+    """Concatenate preprocessed observations (each with a batch dimension) into one batch.
+
+    Tensors are concatenated along the batch dimension, lists (e.g. task strings) are joined, and any
+    other value is taken from the first observation.
+    """
+    if len(observations) == 1:
+        return observations[0]
+
+    batch = {}
+    for key, value in observations[0].items():
+        if isinstance(value, torch.Tensor):
+            batch[key] = torch.cat([observation[key] for observation in observations], dim=0)
+        elif isinstance(value, list):
+            batch[key] = [item for observation in observations for item in observation[key]]
+        else:
+            batch[key] = value
+    return batch
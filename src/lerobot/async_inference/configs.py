@@ -20,9 +20,12 @@ import torch
 from lerobot.robots.config import RobotConfig
 
 from .constants import (
+    DEFAULT_CLIENT_TIMEOUT,
     DEFAULT_FPS,
     DEFAULT_INFERENCE_LATENCY,
     DEFAULT_OBS_QUEUE_TIMEOUT,
+    SUPPORTED_IMAGE_CODECS,
+    SUPPORTED_OBSERVATION_FILTERS,
 )
 
 # Aggregate function registry for CLI usage
@@ -64,6 +67,85 @@ class PolicyServerConfig:
         default=DEFAULT_OBS_QUEUE_TIMEOUT, metadata={"help": "Timeout for observation queue in seconds"}
     )
 
+    # Multi-client configuration
+    client_timeout_s: float = field(
+        default=DEFAULT_CLIENT_TIMEOUT,
+        metadata={
+            "help": "Time without any call from a client after which its session is dropped. Clients "
+            "streaming actions are dropped as soon as their stream ends"
+        },
+    )
+    max_clients: int = field(
+        default=1, metadata={"help": "Number of robot clients expected to share the server concurrently"}
+    )
+    max_batch_size: int = field(
+        default=8, metadata={"help": "Maximum number of observations run through the policy in one batch"}
+    )
+    batch_max_wait_s: float = field(
+        default=0.0,
+        metadata={
+            "help": "Time the batcher waits for other clients' observations after the first one of a batch. "
+            "0 only batches observations that are already waiting"
+        },
+    )
+
+    # Postprocessing configuration
+    postprocess_whole_chunk: bool = field(
+        default=True,
+        metadata={
+            "help": "Run the whole (batch, chunk_size, action_dim) action chunk through the postprocessor at "
+            "once. Disable for postprocessors that only handle (batch, action_dim) actions"
+        },
+    )
+
+    # Policy loading configuration
+    preload_policies: list[str] = field(
+        default_factory=list,
+        metadata={"help": "Pretrained names or paths of the policies loaded and warmed up at startup"},
+    )
+    preload_device: str = field(default="cuda", metadata={"help": "Device of the preloaded policies"})
+    max_policy_memory_gb: float = field(
+        default=16.0,
+        metadata={
+            "help": "Memory budget of the resident policies. Least recently used policies are evicted beyond it"
+        },
+    )
+    warmup_iterations: int = field(
+        default=2, metadata={"help": "Dummy inferences run after loading a policy, 0 to skip the warmup"}
+    )
+
+    # Observation filtering configuration
+    observation_filter: str = field(
+        default="thumbnail",
+        metadata={
+            "help": "Filter skipping the observations similar to the last one run through the policy. "
+            f"Options: {SUPPORTED_OBSERVATION_FILTERS}. `state` compares the joint states, `thumbnail` also "
+            "compares downsampled camera frames"
+        },
+    )
+    state_similarity_atol: float = field(
+        default=1.0, metadata={"help": "Joint-space L2 distance under which two states are similar"}
+    )
+    image_similarity_atol: float = field(
+        default=2.0,
+        metadata={
+            "help": "Mean absolute pixel difference of the camera thumbnails under which two frames are similar"
+        },
+    )
+    thumbnail_size: int = field(
+        default=16, metadata={"help": "Side of the block-mean thumbnails the camera frames are compared with"}
+    )
+
+    # Transport configuration
+    shared_memory_transport: bool = field(
+        default=False,
+        metadata={
+            "help": "Read the observations and write the action chunks of the clients on the same machine "
+            "that ask for it through shared memory, instead of sending them over gRPC. Any client can then "
+            "make the server attach to the shared memory rings it names"
+        },
+    )
+
     def __post_init__(self):
         """Validate configuration after initialization."""
         if self.port < 1 or self.port > 65535:
@@ -78,6 +160,39 @@ class PolicyServerConfig:
         if self.obs_queue_timeout < 0:
             raise ValueError(f"obs_queue_timeout must be non-negative, got {self.obs_queue_timeout}")
 
+        if self.client_timeout_s <= 0:
+            raise ValueError(f"client_timeout_s must be positive, got {self.client_timeout_s}")
+
+        if self.max_clients < 1:
+            raise ValueError(f"max_clients must be at least 1, got {self.max_clients}")
+
+        if self.max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be at least 1, got {self.max_batch_size}")
+
+        if self.batch_max_wait_s < 0:
+            raise ValueError(f"batch_max_wait_s must be non-negative, got {self.batch_max_wait_s}")
+
+        if self.max_policy_memory_gb <= 0:
+            raise ValueError(f"max_policy_memory_gb must be positive, got {self.max_policy_memory_gb}")
+
+        if self.warmup_iterations < 0:
+            raise ValueError(f"warmup_iterations must be non-negative, got {self.warmup_iterations}")
+
+        if self.observation_filter not in SUPPORTED_OBSERVATION_FILTERS:
+            raise ValueError(
+                f"observation_filter must be one of {SUPPORTED_OBSERVATION_FILTERS}, "
+                f"got {self.observation_filter}"
+            )
+
+        if self.state_similarity_atol < 0 or self.image_similarity_atol < 0:
+            raise ValueError(
+                "Similarity tolerances must be non-negative, got "
+                f"{self.state_similarity_atol} and {self.image_similarity_atol}"
+            )
+
+        if self.thumbnail_size < 1:
+            raise ValueError(f"thumbnail_size must be at least 1, got {self.thumbnail_size}")
+
     @classmethod
     def from_dict(cls, config_dict: dict) -> "PolicyServerConfig":
         """Create a PolicyServerConfig from a dictionary."""
@@ -96,6 +211,20 @@ class PolicyServerConfig:
             "fps": self.fps,
             "environment_dt": self.environment_dt,
             "inference_latency": self.inference_latency,
+            "client_timeout_s": self.client_timeout_s,
+            "max_clients": self.max_clients,
+            "max_batch_size": self.max_batch_size,
+            "batch_max_wait_s": self.batch_max_wait_s,
+            "postprocess_whole_chunk": self.postprocess_whole_chunk,
+            "preload_policies": self.preload_policies,
+            "preload_device": self.preload_device,
+            "max_policy_memory_gb": self.max_policy_memory_gb,
+            "warmup_iterations": self.warmup_iterations,
+            "observation_filter": self.observation_filter,
+            "state_similarity_atol": self.state_similarity_atol,
+            "image_similarity_atol": self.image_similarity_atol,
+            "thumbnail_size": self.thumbnail_size,
+            "shared_memory_transport": self.shared_memory_transport,
         }
 
 
@@ -129,6 +258,21 @@ class RobotClientConfig:
 
     # Control behavior configuration
     chunk_size_threshold: float = field(default=0.5, metadata={"help": "Threshold for chunk size control"})
+    adaptive_chunk_scheduling: bool = field(
+        default=False,
+        metadata={
+            "help": "Send observations when the actions left in queue last less than the measured round-trip "
+            "latency of the server, instead of when the queue fill drops under `chunk_size_threshold`"
+        },
+    )
+    latency_quantile: float = field(
+        default=0.9,
+        metadata={"help": "Quantile of the round-trip latency the action queue must cover when adaptive"},
+    )
+    scheduling_margin_steps: int = field(
+        default=1,
+        metadata={"help": "Control steps sent early on top of the round-trip latency when adaptive"},
+    )
     fps: int = field(default=DEFAULT_FPS, metadata={"help": "Frames per second"})
 
     # Aggregate function configuration (CLI-compatible)
@@ -137,6 +281,37 @@ class RobotClientConfig:
         metadata={"help": f"Name of aggregate function to use. Options: {list(AGGREGATE_FUNCTIONS.keys())}"},
     )
 
+    # Transport configuration
+    use_action_streaming: bool = field(
+        default=True,
+        metadata={
+            "help": "Receive action chunks on a server-streaming StreamActions call instead of polling "
+            "GetActions. Falls back to polling if the server does not support streaming"
+        },
+    )
+    resize_images_on_client: bool = field(
+        default=True,
+        metadata={"help": "Resize camera frames to the policy image resolution before sending them"},
+    )
+    image_codec: str = field(
+        default="raw",
+        metadata={"help": f"Compression of the camera frames. Options: {SUPPORTED_IMAGE_CODECS}"},
+    )
+    image_quality: int = field(
+        default=90, metadata={"help": "Quality of the JPEG or WebP compression, from 1 to 100"}
+    )
+    shared_memory_transport: bool = field(
+        default=False,
+        metadata={
+            "help": "Pass observations and action chunks through shared memory when the server runs on the "
+            "same machine, gRPC only carrying small control messages. Falls back to gRPC otherwise"
+        },
+    )
+    shared_memory_slot_mb: float = field(
+        default=16.0,
+        metadata={"help": "Largest message passed through shared memory, larger ones are sent over gRPC"},
+    )
+
     # Debug configuration
     debug_visualize_queue_size: bool = field(
         default=False, metadata={"help": "Visualize the action queue size"}
@@ -167,9 +342,26 @@ class RobotClientConfig:
         if self.fps <= 0:
             raise ValueError(f"fps must be positive, got {self.fps}")
 
+        if not 0 <= self.latency_quantile <= 1:
+            raise ValueError(f"latency_quantile must be between 0 and 1, got {self.latency_quantile}")
+
+        if self.scheduling_margin_steps < 0:
+            raise ValueError(
+                f"scheduling_margin_steps must be non-negative, got {self.scheduling_margin_steps}"
+            )
+
         if self.actions_per_chunk <= 0:
             raise ValueError(f"actions_per_chunk must be positive, got {self.actions_per_chunk}")
 
+        if self.image_codec not in SUPPORTED_IMAGE_CODECS:
+            raise ValueError(f"image_codec must be one of {SUPPORTED_IMAGE_CODECS}, got {self.image_codec}")
+
+        if self.image_quality < 1 or self.image_quality > 100:
+            raise ValueError(f"image_quality must be between 1 and 100, got {self.image_quality}")
+
+        if self.shared_memory_slot_mb <= 0:
+            raise ValueError(f"shared_memory_slot_mb must be positive, got {self.shared_memory_slot_mb}")
+
         self.aggregate_fn = get_aggregate_function(self.aggregate_fn_name)
 
     @classmethod
@@ -185,9 +377,18 @@ class RobotClientConfig:
             "pretrained_name_or_path": self.pretrained_name_or_path,
             "policy_device": self.policy_device,
             "chunk_size_threshold": self.chunk_size_threshold,
+            "adaptive_chunk_scheduling": self.adaptive_chunk_scheduling,
+            "latency_quantile": self.latency_quantile,
+            "scheduling_margin_steps": self.scheduling_margin_steps,
             "fps": self.fps,
             "actions_per_chunk": self.actions_per_chunk,
             "task": self.task,
             "debug_visualize_queue_size": self.debug_visualize_queue_size,
             "aggregate_fn_name": self.aggregate_fn_name,
+            "use_action_streaming": self.use_action_streaming,
+            "resize_images_on_client": self.resize_images_on_client,
+            "image_codec": self.image_codec,
+            "image_quality": self.image_quality,
+            "shared_memory_transport": self.shared_memory_transport,
+            "shared_memory_slot_mb": self.shared_memory_slot_mb,
         }
@@ -22,6 +22,18 @@ DEFAULT_INFERENCE_LATENCY = 1 / DEFAULT_FPS
 """Server side: Timeout for observation queue in seconds"""
 DEFAULT_OBS_QUEUE_TIMEOUT = 2
 
+"""Server side: Time without any call from a client after which it is considered disconnected, in seconds"""
+DEFAULT_CLIENT_TIMEOUT = 10
+
+"""Client side: Compression of the camera frames sent to the server"""
+SUPPORTED_IMAGE_CODECS = ["raw", "jpeg", "webp"]
+
+"""Client side: Number of messages the shared-memory rings of the observations and action chunks hold"""
+SHARED_MEMORY_NUM_SLOTS = 4
+
+"""Server side: Filters skipping the observations similar to the last one run through the policy"""
+SUPPORTED_OBSERVATION_FILTERS = ["none", "state", "thumbnail"]
+
 # All action chunking policies
 SUPPORTED_POLICIES = ["act", "smolvla", "diffusion", "tdmpc", "vqbet", "pi0", "pi05"]
 
@@ -0,0 +1,235 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compact binary encoding of the observations and action chunks exchanged by the robot client and the
+policy server.
+
+An encoded observation is laid out as:
+- the `OBSERVATION_MAGIC` bytes,
+- the length of the header, as a little-endian uint32,
+- the header, in JSON: timestamp, timestep, must-go flag, scalar values (joint positions, task) and the
+  description (dtype, shape, codec, size) of every array,
+- the bytes of every array, one after the other.
+
+Camera frames can be compressed with JPEG or WebP. Data not starting with `OBSERVATION_MAGIC` is decoded
+as a pickled `TimedObservation`, the format of older clients.
+
+An encoded action chunk is laid out the same way, with `ACTION_CHUNK_MAGIC`, a header holding the timestamp,
+timestep, dt, server time, dtype and shape of the chunk, and the bytes of its (chunk_size, action_dim) tensor. Data not
+starting with `ACTION_CHUNK_MAGIC` is decoded as a pickled list of `TimedAction`s, the format of older
+servers.
+"""
+
+import json
+import pickle  # nosec
+import struct
+from typing import Any
+
+import cv2
+import numpy as np
+import torch
+
+from .constants import SUPPORTED_IMAGE_CODECS
+from .helpers import RawObservation, TimedAction, TimedActionChunk, TimedObservation
+
+OBSERVATION_MAGIC = b"LROB"
+ACTION_CHUNK_MAGIC = b"LRAC"
+# Codec name -> OpenCV file extension and quality flag
+_OPENCV_IMAGE_CODECS = {
+    "jpeg": (".jpg", cv2.IMWRITE_JPEG_QUALITY),
+    "webp": (".webp", cv2.IMWRITE_WEBP_QUALITY),
+}
+_HEADER_LENGTH = struct.Struct("<I")
+
+
+def is_color_image(value: np.ndarray) -> bool:
+    """Whether an array is an (H, W, 3) uint8 camera frame, the only arrays compressed by the image codecs"""
+    return value.dtype == np.uint8 and value.ndim == 3 and value.shape[2] == 3
+
+
+def resize_image(image: np.ndarray, height: int, width: int) -> np.ndarray:
+    """Resize an (H, W, C) image. Area interpolation is used to downscale, as it does not alias."""
+    if image.shape[:2] == (height, width):
+        return image
+    interpolation = cv2.INTER_AREA if height < image.shape[0] else cv2.INTER_LINEAR
+    resized = cv2.resize(image, (width, height), interpolation=interpolation)
+    # OpenCV drops the channel dimension of single channel images
+    return resized.reshape(height, width, -1)
+
+
+def resize_observation_images(
+    raw_observation: RawObservation, image_sizes: dict[str, tuple[int, int]]
+) -> RawObservation:
+    """Resize the camera frames of a raw observation.
+
+    Args:
+        raw_observation: Observation of the robot, with (H, W, C) camera frames.
+        image_sizes: Target (height, width) of every camera key to resize.
+
+    Returns:
+        The observation with the resized camera frames. Other values are left untouched.
+    """
+    resized = dict(raw_observation)
+    for key, (height, width) in image_sizes.items():
+        if key in resized:
+            resized[key] = resize_image(np.asarray(resized[key]), height, width)
+    return resized
+
+
+def _encode_image(image: np.ndarray, image_codec: str, quality: int) -> bytes:
+    extension, quality_flag = _OPENCV_IMAGE_CODECS[image_codec]
+    # OpenCV encodes BGR images, camera frames are RGB
+    success, buffer = cv2.imencode(extension, cv2.cvtColor(image, cv2.COLOR_RGB2BGR), [quality_flag, quality])
+    if not success:
+        raise ValueError(f"Failed to encode image of shape {image.shape} with {image_codec}")
+    return buffer.tobytes()
+
+
+def _decode_image(buffer: memoryview) -> np.ndarray:
+    image = cv2.imdecode(np.frombuffer(buffer, dtype=np.uint8), cv2.IMREAD_COLOR)
+    if image is None:
+        raise ValueError("Failed to decode image")
+    return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+
+
+def _pack(magic: bytes, header: dict[str, Any], buffers: list[bytes]) -> bytes:
+    header_bytes = json.dumps(header).encode()
+    return b"".join([magic, _HEADER_LENGTH.pack(len(header_bytes)), header_bytes, *buffers])
+
+
+def _unpack_header(data: memoryview, magic: bytes) -> tuple[dict[str, Any], int]:
+    """Return the header of an encoded message and the offset of its first buffer"""
+    offset = len(magic)
+    (header_length,) = _HEADER_LENGTH.unpack_from(data, offset)
+    offset += _HEADER_LENGTH.size
+    header = json.loads(bytes(data[offset : offset + header_length]))
+    return header, offset + header_length
+
+
+def encode_observation(
+    observation: TimedObservation, image_codec: str = "raw", image_quality: int = 90
+) -> bytes:
+    """Encode a timed observation in the compact binary format.
+
+    Args:
+        observation: Observation to encode. Its values are scalars, strings or arrays (NumPy or torch).
+        image_codec: Codec of the camera frames, one of `SUPPORTED_IMAGE_CODECS`.
+        image_quality: Quality of the JPEG or WebP compression, from 1 to 100.
+
+    Returns:
+        The encoded observation.
+    """
+    if image_codec not in SUPPORTED_IMAGE_CODECS:
+        raise ValueError(f"Unknown image codec {image_codec}. Options: {SUPPORTED_IMAGE_CODECS}")
+
+    values: dict[str, Any] = {}
+    arrays: list[dict[str, Any]] = []
+    buffers: list[bytes] = []
+    for key, value in observation.get_observation().items():
+        if isinstance(value, torch.Tensor):
+            value = value.numpy(force=True)
+
+        if isinstance(value, np.generic):
+            value = value.item()
+
+        if value is None or isinstance(value, (bool, int, float, str)):
+            values[key] = value
+            continue
+
+        if not isinstance(value, np.ndarray):
+            raise TypeError(f"Cannot encode observation value {key} of type {type(value)}")
+
+        codec = image_codec if is_color_image(value) else "raw"
+        buffer = (
+            np.ascontiguousarray(value).tobytes()
+            if codec == "raw"
+            else _encode_image(value, codec, image_quality)
+        )
+        arrays.append(
+            {"key": key, "dtype": value.dtype.str, "shape": value.shape, "codec": codec, "size": len(buffer)}
+        )
+        buffers.append(buffer)
+
+    header = {
+        "timestamp": observation.get_timestamp(),
+        "timestep": observation.get_timestep(),
+        "must_go": observation.must_go,
+        "values": values,
+        "arrays": arrays,
+    }
+    return _pack(OBSERVATION_MAGIC, header, buffers)
+
+
+def decode_observation(data: bytes) -> TimedObservation:
+    """Decode an observation encoded with `encode_observation`, or a pickled `TimedObservation`."""
+    if not data.startswith(OBSERVATION_MAGIC):
+        return pickle.loads(data)  # nosec
+
+    data = memoryview(data)
+    header, offset = _unpack_header(data, OBSERVATION_MAGIC)
+
+    raw_observation: RawObservation = dict(header["values"])
+    for array in header["arrays"]:
+        buffer = data[offset : offset + array["size"]]
+        offset += array["size"]
+        if array["codec"] == "raw":
+            # Copying, as arrays backed by the received bytes are read-only
+            value = np.frombuffer(buffer, dtype=np.dtype(array["dtype"])).reshape(array["shape"]).copy()
+        else:
+            value = _decode_image(buffer)
+        raw_observation[array["key"]] = value
+
+    return TimedObservation(
+        timestamp=header["timestamp"],
+        timestep=header["timestep"],
+        observation=raw_observation,
+        must_go=header["must_go"],
+    )
+
+
+def encode_action_chunk(chunk: TimedActionChunk) -> bytes:
+    """Encode an action chunk as a single contiguous buffer."""
+    actions = chunk.get_actions().detach().cpu()
+    if actions.dtype == torch.bfloat16:
+        # NumPy has no bfloat16
+        actions = actions.float()
+    actions = actions.contiguous().numpy()
+
+    header = {
+        "timestamp": chunk.get_timestamp(),
+        "timestep": chunk.get_timestep(),
+        "dt": chunk.dt,
+        "server_time": chunk.server_time,
+        "dtype": actions.dtype.str,
+        "shape": actions.shape,
+    }
+    return _pack(ACTION_CHUNK_MAGIC, header, [actions.tobytes()])
+
+
+def decode_action_chunk(data: bytes) -> TimedActionChunk | list[TimedAction]:
+    """Decode an action chunk encoded with `encode_action_chunk`, or a pickled list of `TimedAction`s."""
+    if not data.startswith(ACTION_CHUNK_MAGIC):
+        return pickle.loads(data)  # nosec
+
+    data = memoryview(data)
+    header, offset = _unpack_header(data, ACTION_CHUNK_MAGIC)
+    # Copying, as arrays backed by the received bytes are read-only
+    actions = np.frombuffer(data[offset:], dtype=np.dtype(header["dtype"])).reshape(header["shape"]).copy()
+    return TimedActionChunk(
+        timestamp=header["timestamp"],
+        timestep=header["timestep"],
+        actions=torch.from_numpy(actions),
+        dt=header["dt"],
+        server_time=header.get("server_time", 0.0),
+    )
@@ -16,6 +16,8 @@ import logging
 import logging.handlers
 import os
 import time
+from collections import deque
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -37,6 +39,8 @@ from lerobot.robots.robot import Robot
 from lerobot.utils.constants import OBS_IMAGES, OBS_STATE, OBS_STR
 from lerobot.utils.utils import init_logging
 
+from .shared_memory import SharedMemorySpec
+
 Action = torch.Tensor
 
 # observation as received from the robot
@@ -75,6 +79,9 @@ def resize_robot_observation_image(image: torch.tensor, resize_dims: tuple[int,
     # (H, W, C) -> (C, H, W) for resizing from robot obsevation resolution to policy image resolution
     image = image.permute(2, 0, 1)
     dims = (resize_dims[1], resize_dims[2])
+    if image.shape[1:] == dims:
+        # Already resized on the client side
+        return image
     # Add batch dimension for interpolate: (C, H, W) -> (1, C, H, W)
     image_batched = image.unsqueeze(0)
     # Interpolate and remove batch dimension: (1, C, H, W) -> (C, H, W)
@@ -224,6 +231,42 @@ class TimedAction(TimedData):
         return self.action
 
 
+@dataclass
+class TimedActionChunk(TimedData):
+    """A chunk of consecutive actions, stored as a single (chunk_size, action_dim) tensor.
+
+    The i-th action of the chunk is performed at timestep `timestep + i`, at time `timestamp + i * dt`.
+    Indexing or iterating over the chunk creates the corresponding `TimedAction`s on the fly.
+    `timestamp` is the timestamp of the observation the chunk was predicted from, and `server_time` the time
+    the server took to predict it, in seconds.
+    """
+
+    actions: torch.Tensor
+    dt: float
+    server_time: float = 0.0
+
+    def get_actions(self):
+        return self.actions
+
+    def __len__(self) -> int:
+        return self.actions.shape[0]
+
+    def __getitem__(self, index: int) -> TimedAction:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"Action index {index} out of range for a chunk of {len(self)} actions")
+
+        return TimedAction(
+            timestamp=self.timestamp + index * self.dt,
+            timestep=self.timestep + index,
+            action=self.actions[index],
+        )
+
+    def __iter__(self) -> Iterator[TimedAction]:
+        return (self[i] for i in range(len(self)))
+
+
 @dataclass
 class TimedObservation(TimedData):
     observation: RawObservation
@@ -261,6 +304,42 @@ class FPSTracker:
         self.total_obs_count = 0
 
 
+@dataclass
+class LatencyTracker:
+    """Utility class to track latency statistics over the most recent measurements."""
+
+    window_size: int = 1000
+    total_count: int = 0
+    latencies: deque = field(init=False)
+
+    def __post_init__(self):
+        self.latencies = deque(maxlen=self.window_size)
+
+    def record(self, latency: float) -> None:
+        """Record a latency, in seconds"""
+        self.total_count += 1
+        self.latencies.append(latency)
+
+    def calculate_latency_metrics(self) -> dict[str, float]:
+        """Calculate latency statistics (in milliseconds) over the recorded window"""
+        if not self.latencies:
+            return {"count": self.total_count}
+
+        latencies_ms = torch.tensor(self.latencies, dtype=torch.float64) * 1000
+        return {
+            "count": self.total_count,
+            "mean_ms": latencies_ms.mean().item(),
+            "p50_ms": latencies_ms.quantile(0.5).item(),
+            "p90_ms": latencies_ms.quantile(0.9).item(),
+            "max_ms": latencies_ms.max().item(),
+        }
+
+    def reset(self):
+        """Reset the latency tracker state"""
+        self.total_count = 0
+        self.latencies.clear()
+
+
 @dataclass
 class RemotePolicyConfig:
     policy_type: str
@@ -269,6 +348,8 @@ class RemotePolicyConfig:
     actions_per_chunk: int
     device: str = "cpu"
     rename_map: dict[str, str] = field(default_factory=dict)
+    # Rings of a client on the same machine as the server. Not part of the policy shared by the clients
+    shared_memory: SharedMemorySpec | None = field(default=None, compare=False)
 
 
 def _compare_observation_states(obs1_state: torch.Tensor, obs2_state: torch.Tensor, atol: float) -> bool:
@@ -282,9 +363,8 @@ def observations_similar(
     """Check if two observations are similar, under a tolerance threshold. Measures distance between
     observations as the difference in joint-space between the two observations.
 
-    NOTE(fracapuano): This is a very simple check, and it is enough for the current use case.
-    An immediate next step is to use (fast) perceptual difference metrics comparing some camera views,
-    to surpass this joint-space similarity check.
+    The policy server filters observations with `observation_filter.ThumbnailObservationFilter` instead,
+    which also compares downsampled camera views.
     """
     obs1_state = extract_state_from_raw_observation(
         make_lerobot_observation(obs1.get_observation(), lerobot_features)
@@ -0,0 +1,131 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Filters skipping the observations too similar to the last one run through the policy.
+
+The policy server compares every incoming observation with the last processed one of the same client, and
+skips the inference when nothing changed. Filters work on the raw observations: they extract cheap
+`ObservationFeatures` once per observation (the joint state and, for `ThumbnailObservationFilter`,
+block-mean thumbnails of the camera frames), so the server can cache the features of the last processed
+observation instead of converting it again for every comparison.
+"""
+
+from dataclasses import dataclass, field
+
+import cv2
+import numpy as np
+
+from lerobot.utils.constants import OBS_IMAGES, OBS_STATE
+
+from .configs import PolicyServerConfig
+from .helpers import RawObservation
+
+
+@dataclass
+class ObservationFeatures:
+    """Features of an observation compared by the observation filters"""
+
+    state: np.ndarray
+    thumbnails: dict[str, np.ndarray] = field(default_factory=dict)
+
+
+class ObservationFilter:
+    """Base filter, for which observations are never similar."""
+
+    def extract(
+        self, raw_observation: RawObservation, lerobot_features: dict[str, dict]
+    ) -> ObservationFeatures:
+        return ObservationFeatures(state=np.empty(0))
+
+    def similar(self, features: ObservationFeatures, reference: ObservationFeatures) -> bool:
+        return False
+
+
+class StateObservationFilter(ObservationFilter):
+    """Observations are similar when the L2 distance between their joint states is below `state_atol`."""
+
+    def __init__(self, state_atol: float = 1.0):
+        self.state_atol = state_atol
+
+    def extract(
+        self, raw_observation: RawObservation, lerobot_features: dict[str, dict]
+    ) -> ObservationFeatures:
+        state_names = lerobot_features[OBS_STATE]["names"]
+        return ObservationFeatures(
+            state=np.array([raw_observation[name] for name in state_names], dtype=np.float32)
+        )
+
+    def similar(self, features: ObservationFeatures, reference: ObservationFeatures) -> bool:
+        return bool(np.linalg.norm(features.state - reference.state) < self.state_atol)
+
+
+class ThumbnailObservationFilter(StateObservationFilter):
+    """Observations are similar when their joint states are, and every camera frame is.
+
+    Camera frames are compared through (thumbnail_size, thumbnail_size) block-mean thumbnails, which are
+    cheap to compute and insensitive to sensor noise. Two frames are similar when the mean absolute
+    difference of their thumbnails is below `image_atol`, in pixel values.
+    """
+
+    def __init__(self, state_atol: float = 1.0, image_atol: float = 2.0, thumbnail_size: int = 16):
+        super().__init__(state_atol)
+        self.image_atol = image_atol
+        self.thumbnail_size = thumbnail_size
+
+    def _thumbnail(self, image: np.ndarray) -> np.ndarray:
+        image = np.asarray(image)
+        if image.dtype not in (np.uint8, np.float32):
+            image = image.astype(np.float32)
+        # Area interpolation averages the pixels of every block
+        thumbnail = cv2.resize(
+            image, (self.thumbnail_size, self.thumbnail_size), interpolation=cv2.INTER_AREA
+        )
+        return thumbnail.astype(np.float32)
+
+    def extract(
+        self, raw_observation: RawObservation, lerobot_features: dict[str, dict]
+    ) -> ObservationFeatures:
+        features = super().extract(raw_observation, lerobot_features)
+        for key in lerobot_features:
+            if not key.startswith(f"{OBS_IMAGES}."):
+                continue
+            camera = key.removeprefix(f"{OBS_IMAGES}.")
+            if camera in raw_observation:
+                features.thumbnails[camera] = self._thumbnail(raw_observation[camera])
+        return features
+
+    def similar(self, features: ObservationFeatures, reference: ObservationFeatures) -> bool:
+        if not super().similar(features, reference):
+            return False
+        if features.thumbnails.keys() != reference.thumbnails.keys():
+            return False
+        return all(
+            np.abs(thumbnail - reference.thumbnails[camera]).mean() < self.image_atol
+            for camera, thumbnail in features.thumbnails.items()
+        )
+
+
+def make_observation_filter(config: PolicyServerConfig) -> ObservationFilter:
+    if config.observation_filter == "none":
+        return ObservationFilter()
+    elif config.observation_filter == "state":
+        return StateObservationFilter(state_atol=config.state_similarity_atol)
+    elif config.observation_filter == "thumbnail":
+        return ThumbnailObservationFilter(
+            state_atol=config.state_similarity_atol,
+            image_atol=config.image_similarity_atol,
+            thumbnail_size=config.thumbnail_size,
+        )
+    else:
+        raise ValueError(f"Unknown observation filter: {config.observation_filter}")
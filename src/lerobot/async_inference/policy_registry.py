@@ -0,0 +1,258 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Registry of the policies resident on the policy server.
+
+Loading a policy (downloading and deserializing the weights, moving them to the device, building the
+processors) and its first inferences (CUDA context, kernel selection, lazy compilation) take from seconds
+to tens of seconds. The registry keeps the loaded policies resident, least recently used first out once
+their parameters exceed a memory budget, and warms every policy up with dummy inferences as soon as it is
+loaded. Policies can be preloaded when the server starts, so that switching the policy of a session is
+near-instant.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import torch
+
+from lerobot.configs.policies import PreTrainedConfig
+from lerobot.policies.factory import get_policy_class, make_pre_post_processors
+from lerobot.policies.pretrained import PreTrainedPolicy
+from lerobot.processor import PolicyAction, PolicyProcessorPipeline
+from lerobot.utils.constants import OBS_IMAGES, OBS_STATE
+
+from .helpers import Observation, RawObservation, raw_observation_to_observation
+
+# (policy type, pretrained name or path, device, rename map items)
+PolicyKey = tuple[str, str, str, tuple[tuple[str, str], ...]]
+
+
+def normalize_device(device: str | torch.device) -> str:
+    """Spell a device the same way however it was requested, e.g. "cuda" and "cuda:0" as "cuda:0"."""
+    device = torch.device(device)
+    if device.type != "cpu" and device.index is None:
+        index = torch.cuda.current_device() if device.type == "cuda" and torch.cuda.is_available() else 0
+        device = torch.device(device.type, index)
+    return str(device)
+
+
+def make_policy_key(
+    policy_type: str, pretrained_name_or_path: str, device: str, rename_map: dict[str, str] | None = None
+) -> PolicyKey:
+    return (
+        policy_type,
+        str(pretrained_name_or_path),
+        normalize_device(device),
+        tuple(sorted((rename_map or {}).items())),
+    )
+
+
+@dataclass
+class LoadedPolicy:
+    """A policy resident on the server, with its processors and loading metrics"""
+
+    policy: PreTrainedPolicy
+    preprocessor: PolicyProcessorPipeline[dict[str, Any], dict[str, Any]]
+    postprocessor: PolicyProcessorPipeline[PolicyAction, PolicyAction]
+    memory_bytes: int
+    load_time: float
+    warmup_time: float = 0.0
+    hits: int = 0
+
+
+def policy_memory_bytes(policy: torch.nn.Module) -> int:
+    """Memory taken by the parameters and buffers of a policy"""
+    tensors = [*policy.parameters(), *policy.buffers()]
+    return sum(tensor.numel() * tensor.element_size() for tensor in tensors)
+
+
+def make_dummy_raw_observation(lerobot_features: dict[str, dict]) -> RawObservation:
+    """Raw robot observation of zeros, shaped like the observations of a robot with the given features"""
+    raw_observation: RawObservation = dict.fromkeys(lerobot_features[OBS_STATE]["names"], 0.0)
+    for key, feature in lerobot_features.items():
+        if key.startswith(f"{OBS_IMAGES}."):
+            raw_observation[key.removeprefix(f"{OBS_IMAGES}.")] = np.zeros(feature["shape"], dtype=np.uint8)
+    raw_observation["task"] = ""
+    return raw_observation
+
+
+def make_dummy_observation(
+    policy: PreTrainedPolicy, lerobot_features: dict[str, dict] | None = None
+) -> Observation:
+    """Observation of zeros, ready for the preprocessor of a policy.
+
+    Built from the robot `lerobot_features` when known, going through the same conversion as the received
+    observations. Otherwise built from the input features of the policy.
+    """
+    if lerobot_features is not None:
+        return raw_observation_to_observation(
+            make_dummy_raw_observation(lerobot_features), lerobot_features, policy.config.image_features
+        )
+
+    observation: Observation = {
+        key: torch.zeros(1, *feature.shape) for key, feature in policy.config.input_features.items()
+    }
+    observation["task"] = ""
+    return observation
+
+
+class PolicyRegistry:
+    """LRU cache of the policies loaded on the server, bounded by the memory of their parameters.
+
+    Args:
+        max_memory_gb: Memory budget of the resident policies. The policy in use is never evicted, even if
+            it alone exceeds the budget.
+        warmup_iterations: Dummy inferences run after loading a policy.
+        logger: Logger of the server.
+    """
+
+    def __init__(self, max_memory_gb: float, warmup_iterations: int, logger: logging.Logger | None = None):
+        self.max_memory_bytes = int(max_memory_gb * 1024**3)
+        self.warmup_iterations = warmup_iterations
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        self._policies: OrderedDict[PolicyKey, LoadedPolicy] = OrderedDict()
+
+    def __contains__(self, key: PolicyKey) -> bool:
+        with self._lock:
+            return key in self._policies
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._policies)
+
+    @property
+    def memory_bytes(self) -> int:
+        with self._lock:
+            return sum(loaded.memory_bytes for loaded in self._policies.values())
+
+    def get(
+        self,
+        policy_type: str,
+        pretrained_name_or_path: str,
+        device: str,
+        rename_map: dict[str, str] | None = None,
+        lerobot_features: dict[str, dict] | None = None,
+    ) -> LoadedPolicy:
+        """Return a resident policy, loading and warming it up first if needed.
+
+        Args:
+            policy_type: Type of the policy (act, smolvla, ...).
+            pretrained_name_or_path: Hub repository or local directory of the policy.
+            device: Device the policy runs on.
+            rename_map: Renaming of the observation keys, applied by the preprocessor.
+            lerobot_features: Features of the robot, shaping the warmup observations when known.
+        """
+        key = make_policy_key(policy_type, pretrained_name_or_path, device, rename_map)
+        # Loading under the lock, so that concurrent requests for the same policy load it once
+        with self._lock:
+            loaded = self._policies.get(key)
+            if loaded is not None:
+                self._policies.move_to_end(key)
+                loaded.hits += 1
+                self.logger.info(f"Policy {pretrained_name_or_path} already resident on {device}")
+                return loaded
+
+            loaded = self._load(policy_type, pretrained_name_or_path, device, rename_map)
+            loaded.warmup_time = self.warmup(loaded, lerobot_features)
+            self.logger.info(
+                f"Loaded policy {pretrained_name_or_path} on {device} in {loaded.load_time:.2f}s, "
+                f"warmed up in {loaded.warmup_time:.2f}s ({loaded.memory_bytes / 1024**2:.1f} MB)"
+            )
+
+            self._policies[key] = loaded
+            self._evict()
+            return loaded
+
+    def preload(self, pretrained_name_or_path: str, device: str) -> LoadedPolicy:
+        """Load and warm up a policy before any client asks for it. The type is read from its config."""
+        policy_type = PreTrainedConfig.from_pretrained(pretrained_name_or_path).type
+        return self.get(policy_type, pretrained_name_or_path, device)
+
+    def _load(
+        self,
+        policy_type: str,
+        pretrained_name_or_path: str,
+        device: str,
+        rename_map: dict[str, str] | None,
+    ) -> LoadedPolicy:
+        start = time.perf_counter()
+        policy = get_policy_class(policy_type).from_pretrained(pretrained_name_or_path)
+        policy.to(device)
+
+        # Load preprocessor and postprocessor, overriding device to match requested device
+        device_override = {"device": device}
+        preprocessor, postprocessor = make_pre_post_processors(
+            policy.config,
+            pretrained_path=pretrained_name_or_path,
+            preprocessor_overrides={
+                "device_processor": device_override,
+                "rename_observations_processor": {"rename_map": rename_map or {}},
+            },
+            postprocessor_overrides={"device_processor": device_override},
+        )
+        return LoadedPolicy(
+            policy=policy,
+            preprocessor=preprocessor.freeze(),
+            postprocessor=postprocessor.freeze(),
+            memory_bytes=policy_memory_bytes(policy),
+            load_time=time.perf_counter() - start,
+        )
+
+    def warmup(self, loaded: LoadedPolicy, lerobot_features: dict[str, dict] | None = None) -> float:
+        """Run dummy inferences through the processors and the policy, returning the time they took"""
+        start = time.perf_counter()
+        observation = make_dummy_observation(loaded.policy, lerobot_features)
+        with torch.inference_mode():
+            for _ in range(self.warmup_iterations):
+                action_chunk = loaded.policy.predict_action_chunk(loaded.preprocessor(dict(observation)))
+                loaded.postprocessor(action_chunk)
+        # Clearing the state the dummy inferences may have left
+        loaded.policy.reset()
+        return time.perf_counter() - start
+
+    def _evict(self):
+        """Evict the least recently used policies until the resident ones fit in the memory budget"""
+        evicted = False
+        while len(self._policies) > 1:
+            if sum(loaded.memory_bytes for loaded in self._policies.values()) <= self.max_memory_bytes:
+                break
+            key, loaded = self._policies.popitem(last=False)
+            self.logger.info(
+                f"Evicting policy {key[1]} from {key[2]} ({loaded.memory_bytes / 1024**2:.1f} MB)"
+            )
+            evicted = True
+
+        if evicted and torch.cuda.is_available():
+            torch.cuda.empty_cache()
+
+    def get_stats(self) -> dict[str, dict[str, float]]:
+        """Memory, load and warmup times and hits of every resident policy"""
+        with self._lock:
+            return {
+                f"{key[1]}@{key[2]}" + (f" {dict(key[3])}" if key[3] else ""): {
+                    "memory_mb": loaded.memory_bytes / 1024**2,
+                    "load_time_s": loaded.load_time,
+                    "warmup_time_s": loaded.warmup_time,
+                    "hits": loaded.hits,
+                }
+                for key, loaded in self._policies.items()
+            }
@@ -22,6 +22,18 @@ python -m lerobot.async_inference.policy_server \
      --inference_latency=0.033 \
      --obs_queue_timeout=1
 ```
+
+Several robot clients can share the same server (and policy). Their observations are batched
+together for inference, see `max_clients`, `max_batch_size` and `batch_max_wait_s` in
+`PolicyServerConfig`:
+```shell
+python -m lerobot.async_inference.policy_server \
+     --host=0.0.0.0 \
+     --port=8080 \
+     --max_clients=4 \
+     --max_batch_size=4 \
+     --batch_max_wait_s=0.005
+```
 """
 
 import logging
@@ -29,7 +41,8 @@ import pickle  # nosec
 import threading
 import time
 from concurrent import futures
-from dataclasses import asdict
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
 from pprint import pformat
 from queue import Empty, Queue
 from typing import Any
@@ -38,7 +51,6 @@ import draccus
 import grpc
 import torch
 
-from lerobot.policies.factory import get_policy_class, make_pre_post_processors
 from lerobot.processor import (
     PolicyAction,
     PolicyProcessorPipeline,
@@ -49,18 +61,56 @@ from lerobot.transport import (
 )
 from lerobot.transport.utils import receive_bytes_in_chunks
 
+from .batching import DynamicBatcher, concatenate_observations, group_observations
 from .configs import PolicyServerConfig
 from .constants import SUPPORTED_POLICIES
+from .encoding import decode_observation, encode_action_chunk
 from .helpers import (
     FPSTracker,
     Observation,
     RemotePolicyConfig,
-    TimedAction,
+    TimedActionChunk,
     TimedObservation,
     get_logger,
-    observations_similar,
     raw_observation_to_observation,
 )
+from .observation_filter import ObservationFeatures, make_observation_filter
+from .policy_registry import PolicyRegistry
+from .shared_memory import SharedMemoryRing, SharedMemorySpec, from_shared_memory, to_shared_memory
+
+
+@dataclass
+class ClientSession:
+    """State the server keeps for every connected robot client."""
+
+    client_id: str
+    fps_tracker: FPSTracker
+    # only running inference on the latest observation received from the client
+    observation_queue: Queue = field(default_factory=lambda: Queue(maxsize=1))
+    predicted_timesteps: set[int] = field(default_factory=set)
+    predicted_timesteps_lock: threading.Lock = field(default_factory=threading.Lock)
+    last_processed_obs: TimedObservation | None = None
+    # Filter features of the last enqueued and processed observations, extracted once per observation
+    enqueued_features: tuple[TimedObservation, ObservationFeatures] | None = None
+    last_processed_features: tuple[TimedObservation, ObservationFeatures] | None = None
+    # Observation filtering metrics
+    observations_received: int = 0
+    observations_skipped_predicted: int = 0
+    observations_skipped_similar: int = 0
+    # Shared-memory rings of a client on the same machine, None if it sends everything over gRPC
+    observation_ring: SharedMemoryRing | None = None
+    action_ring: SharedMemoryRing | None = None
+    # State the policy keeps between calls (e.g. its observation queues) for this client, with the policy
+    policy_state: tuple[Any, dict] | None = None
+    # Time of the last call of the client, to tell the connected clients apart from the disconnected ones
+    last_seen: float = field(default_factory=time.monotonic)
+
+    def close_shared_memory(self):
+        for ring in (self.observation_ring, self.action_ring):
+            if ring is not None:
+                ring.close()
+        self.observation_ring = None
+        self.action_ring = None
 
 
 class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
@@ -71,17 +121,32 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
         self.config = config
         self.shutdown_event = threading.Event()
 
-        # FPS measurement
-        self.fps_tracker = FPSTracker(target_fps=config.fps)
-
-        self.observation_queue = Queue(maxsize=1)
+        # One session per connected client, the policy is shared by all of them
+        self._sessions_lock = threading.Lock()
+        self.sessions: dict[str, ClientSession] = {}
+        # Shared memory of the clients, re-attached when their session is dropped and created again
+        self._shared_memory_specs: dict[str, SharedMemorySpec] = {}
+
+        # Observations of all clients are batched together for inference
+        self.batcher = DynamicBatcher(
+            process_batch=self._predict_action_chunks,
+            max_batch_size=config.max_batch_size,
+            max_wait_s=config.batch_max_wait_s,
+            logger=self.logger,
+        )
 
-        self._predicted_timesteps_lock = threading.Lock()
-        self._predicted_timesteps = set()
+        # Skips the observations too similar to the last one run through the policy
+        self.observation_filter = make_observation_filter(config)
 
-        self.last_processed_obs = None
+        # Policies resident on the server, shared by the sessions
+        self.policy_registry = PolicyRegistry(
+            max_memory_gb=config.max_policy_memory_gb,
+            warmup_iterations=config.warmup_iterations,
+            logger=self.logger,
+        )
 
         # Attributes will be set by SendPolicyInstructions
+        self.policy_specs: RemotePolicyConfig | None = None
         self.device = None
         self.policy_type = None
         self.lerobot_features = None
@@ -98,20 +163,53 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
     def policy_image_features(self):
         return self.policy.config.image_features
 
-    def _reset_server(self) -> None:
-        """Flushes server state when new client connects."""
-        # only running inference on the latest observation received by the server
-        self.shutdown_event.set()
-        self.observation_queue = Queue(maxsize=1)
-
-        with self._predicted_timesteps_lock:
-            self._predicted_timesteps = set()
+    def _reset_session(self, client_id: str) -> ClientSession:
+        """Flushes the state of a client when it (re)connects."""
+        session = ClientSession(client_id=client_id, fps_tracker=FPSTracker(target_fps=self.config.fps))
+        with self._sessions_lock:
+            previous_session = self.sessions.get(client_id)
+            self.sessions[client_id] = session
+        if previous_session is not None:
+            previous_session.close_shared_memory()
+        return session
+
+    def _get_session(self, client_id: str) -> ClientSession:
+        with self._sessions_lock:
+            session = self.sessions.get(client_id)
+        if session is None:
+            # The session was dropped while the client kept using it, e.g. after its action stream ended
+            session = self._reset_session(client_id)
+            self._attach_shared_memory(session, self._shared_memory_specs.get(client_id))
+            return session
+        session.last_seen = time.monotonic()
+        return session
+
+    def _drop_session(self, client_id: str, session: ClientSession):
+        """Forgets the state of a disconnected client, unless it reconnected with a new session since."""
+        with self._sessions_lock:
+            if self.sessions.get(client_id) is not session:
+                return
+            del self.sessions[client_id]
+        session.close_shared_memory()
+        self.logger.info(f"Client {client_id} disconnected | Connected clients: {len(self.sessions)}")
+
+    def _active_clients(self) -> list[str]:
+        """Drops the sessions of the clients without any call within `client_timeout_s`, and returns the
+        remaining ones. Clients don't say when they disconnect, and every reconnection gets a new id."""
+        now = time.monotonic()
+        with self._sessions_lock:
+            sessions = list(self.sessions.items())
+        for client_id, session in sessions:
+            if now - session.last_seen > self.config.client_timeout_s:
+                self._drop_session(client_id, session)
+        with self._sessions_lock:
+            return list(self.sessions)
 
     def Ready(self, request, context):  # noqa: N802
         client_id = context.peer()
-        self.logger.info(f"Client {client_id} connected and ready")
-        self._reset_server()
+        self._reset_session(client_id)
         self.shutdown_event.clear()
+        self.logger.info(f"Client {client_id} connected and ready | Connected clients: {len(self.sessions)}")
 
         return services_pb2.Empty()
 
@@ -120,7 +218,7 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
 
         if not self.running:
             self.logger.warning("Server is not running. Ignoring policy instructions.")
-            return services_pb2.Empty()
+            return services_pb2.PolicyFeatures()
 
         client_id = context.peer()
 
@@ -143,38 +241,68 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
             f"Device: {policy_specs.device}"
         )
 
+        self._attach_shared_memory(self._get_session(client_id), policy_specs.shared_memory)
+
+        if self.policy_specs == policy_specs and self.policy is not None:
+            self.logger.info(f"Policy already loaded, client {client_id} shares it with the other clients")
+            return self._policy_features()
+
+        other_clients = [other for other in self._active_clients() if other != client_id]
+        if self.policy is not None and other_clients:
+            raise ValueError(
+                f"Client {client_id} requested a different policy than the one shared with the connected "
+                f"clients {other_clients}. All the clients of a server must use the same policy instructions."
+            )
+
+        self.policy_specs = policy_specs
         self.device = policy_specs.device
         self.policy_type = policy_specs.policy_type  # act, pi0, etc.
         self.lerobot_features = policy_specs.lerobot_features
         self.actions_per_chunk = policy_specs.actions_per_chunk
 
-        policy_class = get_policy_class(self.policy_type)
-
-        start = time.perf_counter()
-        self.policy = policy_class.from_pretrained(policy_specs.pretrained_name_or_path)
-        self.policy.to(self.device)
-
-        # Load preprocessor and postprocessor, overriding device to match requested device
-        device_override = {"device": self.device}
-        self.preprocessor, self.postprocessor = make_pre_post_processors(
-            self.policy.config,
-            pretrained_path=policy_specs.pretrained_name_or_path,
-            preprocessor_overrides={
-                "device_processor": device_override,
-                "rename_observations_processor": {"rename_map": policy_specs.rename_map},
-            },
-            postprocessor_overrides={"device_processor": device_override},
+        # Resident policies are reused, others are loaded and warmed up with observations of this robot
+        loaded_policy = self.policy_registry.get(
+            policy_type=self.policy_type,
+            pretrained_name_or_path=policy_specs.pretrained_name_or_path,
+            device=self.device,
+            rename_map=policy_specs.rename_map,
+            lerobot_features=self.lerobot_features,
         )
+        self.policy = loaded_policy.policy
+        self.preprocessor = loaded_policy.preprocessor
+        self.postprocessor = loaded_policy.postprocessor
 
-        end = time.perf_counter()
+        return self._policy_features()
 
-        self.logger.info(f"Time taken to put policy on {self.device}: {end - start:.4f} seconds")
+    def _attach_shared_memory(self, session: ClientSession, spec: SharedMemorySpec | None):
+        """Attach to the shared-memory rings of a client that asks for it. The client falls back to gRPC if
+        the rings cannot be attached, e.g. when it runs on another machine."""
+        if spec is None or not self.config.shared_memory_transport:
+            return
 
-        return services_pb2.Empty()
+        session.close_shared_memory()
+        try:
+            session.observation_ring = SharedMemoryRing.attach(
+                spec.observation_ring, spec.num_slots, spec.slot_size
+            )
+            session.action_ring = SharedMemoryRing.attach(spec.action_ring, spec.num_slots, spec.slot_size)
+        except (FileNotFoundError, ValueError) as e:
+            session.close_shared_memory()
+            self._shared_memory_specs.pop(session.client_id, None)
+            self.logger.info(f"Client {session.client_id} cannot use shared memory, using gRPC: {e}")
+            return
+
+        self._shared_memory_specs[session.client_id] = spec
+        self.logger.info(f"Client {session.client_id} passes observations and actions through shared memory")
+
+    def _policy_features(self) -> services_pb2.PolicyFeatures:
+        """The image features of the loaded policy, sent back so that clients can resize their images"""
+        return services_pb2.PolicyFeatures(data=pickle.dumps(dict(self.policy_image_features)))
 
     def SendObservations(self, request_iterator, context):  # noqa: N802
         """Receive observations from the robot client"""
         client_id = context.peer()
+        session = self._get_session(client_id)
         self.logger.debug(f"Receiving observations from {client_id}")
 
         receive_time = time.time()  # comparing timestamps so need time.time()
@@ -182,7 +310,15 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
         received_bytes = receive_bytes_in_chunks(
             request_iterator, None, self.shutdown_event, self.logger
         )  # blocking call while looping over request_iterator
-        timed_observation = pickle.loads(received_bytes)  # nosec
+        try:
+            received_bytes = from_shared_memory(session.observation_ring, received_bytes)
+        except ValueError as e:
+            # The rings could not be attached again, the client must send its observations over gRPC
+            context.abort(grpc.StatusCode.FAILED_PRECONDITION, str(e))
+        if received_bytes is None:
+            self.logger.warning(f"Observation of {client_id} overwritten in shared memory before being read")
+            return services_pb2.Empty()
+        timed_observation = decode_observation(received_bytes)
         deserialize_time = time.perf_counter() - start_deserialize
 
         self.logger.debug(f"Received observation #{timed_observation.get_timestep()}")
@@ -191,7 +327,7 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
         obs_timestamp = timed_observation.get_timestamp()
 
         # Calculate FPS metrics
-        fps_metrics = self.fps_tracker.calculate_fps_metrics(obs_timestamp)
+        fps_metrics = session.fps_tracker.calculate_fps_metrics(obs_timestamp)
 
         self.logger.debug(
             f"Received observation #{obs_timestep} | "
@@ -207,7 +343,8 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
         )
 
         if not self._enqueue_observation(
-            timed_observation  # wrapping a RawObservation
+            session,
+            timed_observation,  # wrapping a RawObservation
         ):
             self.logger.debug(f"Observation #{obs_timestep} has been filtered out")
 
@@ -217,29 +354,59 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
         """Returns actions to the robot client. Actions are sent as a single
         chunk, containing multiple actions."""
         client_id = context.peer()
-        self.logger.debug(f"Client {client_id} connected for action streaming")
+        self.logger.debug(f"Client {client_id} polling for actions")
+
+        actions = self._generate_actions(client_id)
+        return actions if actions is not None else services_pb2.Empty()
+
+    def StreamActions(self, request, context):  # noqa: N802
+        """Streams actions to the robot client. Every chunk is pushed as soon as it is predicted, over
+        a single long-lived stream, instead of waiting for the client to poll `GetActions`."""
+        client_id = context.peer()
+        self.logger.info(f"Client {client_id} connected for action streaming")
+        # The stream lasts as long as the client is connected
+        session = self._get_session(client_id)
+        context.add_callback(lambda: self._drop_session(client_id, session))
+
+        while self.running and context.is_active():
+            actions = self._generate_actions(client_id)
+            if actions is not None:
+                yield actions
+
+        self.logger.info(f"Action streaming to client {client_id} finished")
+
+    def _generate_actions(self, client_id: str) -> services_pb2.Actions | None:
+        """Predict the action chunk of the latest observation of a client.
+
+        Returns None if the client sent no observation within `obs_queue_timeout` or inference failed."""
+        # Looking the session up on every call, as the client might have reconnected
+        session = self._get_session(client_id)
 
         # Generate action based on the most recent observation and its timestep
         try:
             getactions_starts = time.perf_counter()
-            obs = self.observation_queue.get(timeout=self.config.obs_queue_timeout)
+            obs = session.observation_queue.get(timeout=self.config.obs_queue_timeout)
             self.logger.info(
-                f"Running inference for observation #{obs.get_timestep()} (must_go: {obs.must_go})"
+                f"Running inference for observation #{obs.get_timestep()} of {client_id} (must_go: {obs.must_go})"
             )
 
-            with self._predicted_timesteps_lock:
-                self._predicted_timesteps.add(obs.get_timestep())
+            with session.predicted_timesteps_lock:
+                session.predicted_timesteps.add(obs.get_timestep())
 
             start_time = time.perf_counter()
-            action_chunk = self._predict_action_chunk(obs)
+            # The batcher may run this observation together with the ones of other clients
+            action_chunk = self.batcher.submit(client_id, (session, obs)).result()
             inference_time = time.perf_counter() - start_time
+            # Lets the client tell the inference time apart from the network latency
+            action_chunk.server_time = inference_time
 
             start_time = time.perf_counter()
-            actions_bytes = pickle.dumps(action_chunk)  # nosec
+            actions_bytes = encode_action_chunk(action_chunk)
             serialize_time = time.perf_counter() - start_time
 
             # Create and return the action chunk
-            actions = services_pb2.Actions(data=actions_bytes)
+            # Only a reference to the chunk goes over gRPC when the client reads it from shared memory
+            actions = services_pb2.Actions(data=to_shared_memory(session.action_ring, actions_bytes))
 
             self.logger.info(
                 f"Action chunk #{obs.get_timestep()} generated | "
@@ -260,66 +427,90 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
             return actions
 
         except Empty:  # no observation added to queue in obs_queue_timeout
-            return services_pb2.Empty()
+            return None
 
         except Exception as e:
-            self.logger.error(f"Error in StreamActions: {e}")
-
-            return services_pb2.Empty()
-
-    def _obs_sanity_checks(self, obs: TimedObservation, previous_obs: TimedObservation) -> bool:
+            self.logger.error(f"Error generating actions: {e}")
+
+            return None
+
+    def _observation_features(self, session: ClientSession, obs: TimedObservation) -> ObservationFeatures:
+        """Filter features of an observation, reusing the cached ones of the last enqueued/processed one"""
+        for cached in (session.last_processed_features, session.enqueued_features):
+            if cached is not None and cached[0] is obs:
+                return cached[1]
+
+        features = self.observation_filter.extract(obs.get_observation(), self.lerobot_features)
+        if obs is session.last_processed_obs:
+            session.last_processed_features = (obs, features)
+        return features
+
+    def _obs_sanity_checks(
+        self,
+        session: ClientSession,
+        obs: TimedObservation,
+        previous_obs: TimedObservation,
+        obs_features: ObservationFeatures | None = None,
+    ) -> bool:
         """Check if the observation is valid to be processed by the policy"""
-        with self._predicted_timesteps_lock:
-            predicted_timesteps = self._predicted_timesteps
+        with session.predicted_timesteps_lock:
+            predicted_timesteps = session.predicted_timesteps
 
         if obs.get_timestep() in predicted_timesteps:
             self.logger.debug(f"Skipping observation #{obs.get_timestep()} - Timestep predicted already!")
+            session.observations_skipped_predicted += 1
             return False
 
-        elif observations_similar(obs, previous_obs, lerobot_features=self.lerobot_features):
+        if obs_features is None:
+            obs_features = self._observation_features(session, obs)
+
+        if self.observation_filter.similar(obs_features, self._observation_features(session, previous_obs)):
             self.logger.debug(
                 f"Skipping observation #{obs.get_timestep()} - Observation too similar to last obs predicted!"
             )
+            session.observations_skipped_similar += 1
             return False
 
         else:
             return True
 
-    def _enqueue_observation(self, obs: TimedObservation) -> bool:
+    def _enqueue_observation(self, session: ClientSession, obs: TimedObservation) -> bool:
         """Enqueue an observation if it must go through processing, otherwise skip it.
         Observations not in queue are never run through the policy network"""
+        session.observations_received += 1
+        # Extracted once: compared now, and cached as the reference once the observation is processed
+        obs_features = self.observation_filter.extract(obs.get_observation(), self.lerobot_features)
 
         if (
             obs.must_go
-            or self.last_processed_obs is None
-            or self._obs_sanity_checks(obs, self.last_processed_obs)
+            or session.last_processed_obs is None
+            or self._obs_sanity_checks(session, obs, session.last_processed_obs, obs_features)
         ):
-            last_obs = self.last_processed_obs.get_timestep() if self.last_processed_obs else "None"
+            last_obs = session.last_processed_obs.get_timestep() if session.last_processed_obs else "None"
             self.logger.debug(
                 f"Enqueuing observation. Must go: {obs.must_go} | Last processed obs: {last_obs}"
             )
 
             # If queue is full, get the old observation to make room
-            if self.observation_queue.full():
+            if session.observation_queue.full():
                 # pops from queue
-                _ = self.observation_queue.get_nowait()
+                _ = session.observation_queue.get_nowait()
                 self.logger.debug("Observation queue was full, removed oldest observation")
 
             # Now put the new observation (never blocks as queue is non-full here)
-            self.observation_queue.put(obs)
+            session.enqueued_features = (obs, obs_features)
+            session.observation_queue.put(obs)
             return True
 
         return False
 
-    def _time_action_chunk(self, t_0: float, action_chunk: list[torch.Tensor], i_0: int) -> list[TimedAction]:
-        """Turn a chunk of actions into a list of TimedAction instances,
-        with the first action corresponding to t_0 and the rest corresponding to
-        t_0 + i*environment_dt for i in range(len(action_chunk))
+    def _time_action_chunk(self, t_0: float, action_chunk: torch.Tensor, i_0: int) -> TimedActionChunk:
+        """Turn a (chunk_size, action_dim) tensor of actions into a TimedActionChunk, with the first action
+        corresponding to t_0 and the rest corresponding to t_0 + i*environment_dt for i in range(chunk_size)
         """
-        return [
-            TimedAction(timestamp=t_0 + i * self.config.environment_dt, timestep=i_0 + i, action=action)
-            for i, action in enumerate(action_chunk)
-        ]
+        return TimedActionChunk(
+            timestamp=t_0, timestep=i_0, actions=action_chunk, dt=self.config.environment_dt
+        )
 
     def _get_action_chunk(self, observation: dict[str, torch.Tensor]) -> torch.Tensor:
         """Get an action chunk from the policy. The chunk contains only"""
@@ -329,72 +520,130 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
 
         return chunk[:, : self.actions_per_chunk, :]
 
-    def _predict_action_chunk(self, observation_t: TimedObservation) -> list[TimedAction]:
-        """Predict an action chunk based on an observation.
+    def _inference_groups(self, observations: list[Observation]) -> list[list[int]]:
+        """Indices of the preprocessed observations run through the policy in the same call.
+
+        Policies keeping state between calls (e.g. the observation queues of diffusion) run the observation
+        of one client at a time, with the state of that client."""
+        if hasattr(self.policy, "_queues"):
+            return [[i] for i in range(len(observations))]
+        return group_observations(observations)
+
+    @contextmanager
+    def _client_policy_state(self, session: ClientSession):
+        """Swaps the state the policy keeps between calls for the one of the client, if it keeps any."""
+        if not hasattr(self.policy, "_queues"):
+            yield
+            return
+
+        if session.policy_state is not None and session.policy_state[0] is self.policy:
+            self.policy._queues = session.policy_state[1]
+        else:
+            # First call of the client with this policy
+            self.policy.reset()
+        try:
+            yield
+        finally:
+            session.policy_state = (self.policy, self.policy._queues)
+
+    def _postprocess_action_chunks(self, action_tensor: torch.Tensor) -> torch.Tensor:
+        """Apply the postprocessor to a (B, chunk_size, action_dim) batch of action chunks"""
+        if self.config.postprocess_whole_chunk:
+            # Unnormalization broadcasts over the chunk dimension, so the whole
+            # (B, chunk_size, action_dim) tensor goes through the pipeline in a single pass
+            action_tensor = self.postprocessor(action_tensor)
+        else:
+            # Postprocessor expects (B, action_dim) per action, so we process each action in the chunk
+            # individually, for the whole batch at once
+            _, chunk_size, _ = action_tensor.shape
+            processed_actions = [self.postprocessor(action_tensor[:, i, :]) for i in range(chunk_size)]
+            # Stack back to (B, chunk_size, action_dim)
+            action_tensor = torch.stack(processed_actions, dim=1)
+        self.logger.debug(f"Postprocessed action shape: {action_tensor.shape}")
+        return action_tensor
+
+    def _predict_action_chunk(
+        self, session: ClientSession, observation_t: TimedObservation
+    ) -> TimedActionChunk:
+        """Predict an action chunk based on the observation of a single client."""
+        return self._predict_action_chunks([(session, observation_t)])[0]
+
+    def _predict_action_chunks(
+        self, requests: list[tuple[ClientSession, TimedObservation]]
+    ) -> list[TimedActionChunk]:
+        """Predict one action chunk per observation, running the policy once for every group of observations
+        that can be batched together (see `_inference_groups`).
 
         Pipeline:
-        1. Convert raw observation to LeRobot format
-        2. Apply preprocessor (tokenization, normalization, batching, device placement)
-        3. Run policy inference to get action chunk
-        4. Apply postprocessor (unnormalization, device movement)
-        5. Convert to TimedAction list
+        1. Convert raw observations to LeRobot format
+        2. Apply preprocessor (tokenization, normalization, batching, device placement) per observation
+        3. Run policy inference on the concatenated observations of every group to get the action chunks
+        4. Apply postprocessor (unnormalization, device movement) to the whole batch of every group
+        5. Split the batches into one TimedActionChunk per observation
         """
-        """1. Prepare observation"""
+        """1. Prepare observations"""
         start_prepare = time.perf_counter()
-        observation: Observation = raw_observation_to_observation(
-            observation_t.get_observation(),
-            self.lerobot_features,
-            self.policy_image_features,
-        )
+        observations: list[Observation] = [
+            raw_observation_to_observation(
+                observation_t.get_observation(),
+                self.lerobot_features,
+                self.policy_image_features,
+            )
+            for _, observation_t in requests
+        ]
         prepare_time = time.perf_counter() - start_prepare
 
         """2. Apply preprocessor"""
         start_preprocess = time.perf_counter()
-        observation = self.preprocessor(observation)
-        self.last_processed_obs: TimedObservation = observation_t
+        observations = [self.preprocessor(observation) for observation in observations]
+        for session, observation_t in requests:
+            session.last_processed_obs = observation_t
+            enqueued_features = session.enqueued_features
+            if enqueued_features is not None and enqueued_features[0] is observation_t:
+                session.last_processed_features = enqueued_features
         preprocessing_time = time.perf_counter() - start_preprocess
 
-        """3. Get action chunk"""
-        start_inference = time.perf_counter()
-        action_tensor = self._get_action_chunk(observation)
-        inference_time = time.perf_counter() - start_inference
-        self.logger.info(
-            f"Preprocessing and inference took {inference_time:.4f}s, action shape: {action_tensor.shape}"
-        )
-
-        """4. Apply postprocessor"""
-        # Apply postprocessor (handles unnormalization and device movement)
-        # Postprocessor expects (B, action_dim) per action, but we have (B, chunk_size, action_dim)
-        # So we process each action in the chunk individually
-        start_postprocess = time.perf_counter()
-        _, chunk_size, _ = action_tensor.shape
-
-        # Process each action in the chunk
-        processed_actions = []
-        for i in range(chunk_size):
-            # Extract action at timestep i: (B, action_dim)
-            single_action = action_tensor[:, i, :]
-            processed_action = self.postprocessor(single_action)
-            processed_actions.append(processed_action)
-
-        # Stack back to (B, chunk_size, action_dim), then remove batch dim
-        action_tensor = torch.stack(processed_actions, dim=1).squeeze(0)
-        self.logger.debug(f"Postprocessed action shape: {action_tensor.shape}")
+        action_tensors: list[torch.Tensor | None] = [None] * len(requests)
+        inference_time = postprocessing_time = 0.0
+        for group in self._inference_groups(observations):
+            """3. Get action chunks"""
+            start_inference = time.perf_counter()
+            observation = concatenate_observations([observations[i] for i in group])
+            with self._client_policy_state(requests[group[0]][0]):
+                action_tensor = self._get_action_chunk(observation)
+            group_inference_time = time.perf_counter() - start_inference
+            inference_time += group_inference_time
+            self.logger.info(
+                f"Inference took {group_inference_time:.4f}s, action shape: {action_tensor.shape}"
+            )
 
-        """5. Convert to TimedAction list"""
-        action_chunk = self._time_action_chunk(
-            observation_t.get_timestamp(), list(action_tensor), observation_t.get_timestep()
-        )
+            """4. Apply postprocessor"""
+            start_postprocess = time.perf_counter()
+            action_tensor = self._postprocess_action_chunks(action_tensor)
+            for i, tensor in zip(group, action_tensor, strict=True):
+                action_tensors[i] = tensor
+            postprocessing_time += time.perf_counter() - start_postprocess
+
+        """5. Split into TimedActionChunks"""
+        # Cloning so that every chunk holds its own contiguous actions, not a view of the whole batch
+        action_chunks = [
+            self._time_action_chunk(
+                observation_t.get_timestamp(),
+                action_tensors[i].clone(),
+                observation_t.get_timestep(),
+            )
+            for i, (_, observation_t) in enumerate(requests)
+        ]
         postprocess_stops = time.perf_counter()
-        postprocessing_time = postprocess_stops - start_postprocess
 
+        timesteps = [observation_t.get_timestep() for _, observation_t in requests]
         self.logger.info(
-            f"Observation {observation_t.get_timestep()} | "
+            f"Observations {timesteps} | Batch size: {len(requests)} | "
             f"Total time: {1000 * (postprocess_stops - start_prepare):.2f}ms"
         )
 
         self.logger.debug(
-            f"Observation {observation_t.get_timestep()} | "
+            f"Observations {timesteps} | "
             f"Prepare time: {1000 * prepare_time:.2f}ms | "
             f"Preprocessing time: {1000 * preprocessing_time:.2f}ms | "
             f"Inference time: {1000 * inference_time:.2f}ms | "
@@ -402,12 +651,48 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
             f"Total time: {1000 * (postprocess_stops - start_prepare):.2f}ms"
         )
 
-        return action_chunk
+        return action_chunks
+
+    def preload_policies(self):
+        """Load and warm up the policies of the config, before any client connects"""
+        for pretrained_name_or_path in self.config.preload_policies:
+            self.policy_registry.preload(pretrained_name_or_path, self.config.preload_device)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Batch size histogram and per-client latency of the batched inference, per-client skip rates
+        of the observation filtering, and load and warmup times of the resident policies"""
+        with self._sessions_lock:
+            sessions = list(self.sessions.values())
+
+        observation_filter_stats = {}
+        for session in sessions:
+            skipped = session.observations_skipped_predicted + session.observations_skipped_similar
+            observation_filter_stats[session.client_id] = {
+                "received": session.observations_received,
+                "skipped_predicted": session.observations_skipped_predicted,
+                "skipped_similar": session.observations_skipped_similar,
+                "skip_rate": skipped / session.observations_received
+                if session.observations_received
+                else 0.0,
+            }
+
+        return {
+            **self.batcher.get_stats(),
+            "observation_filter": observation_filter_stats,
+            "policies": self.policy_registry.get_stats(),
+        }
 
     def stop(self):
         """Stop the server"""
-        self._reset_server()
-        self.logger.info("Server stopping...")
+        self.shutdown_event.set()
+        self.batcher.stop()
+        stats = self.get_stats()
+        with self._sessions_lock:
+            for session in self.sessions.values():
+                session.close_shared_memory()
+            self.sessions.clear()
+            self._shared_memory_specs.clear()
+        self.logger.info(f"Server stopping... | Inference stats: {stats}")
 
 
 @draccus.wrap()
@@ -421,9 +706,11 @@ def serve(cfg: PolicyServerConfig):
 
     # Create the server instance first
     policy_server = PolicyServer(cfg)
+    policy_server.preload_policies()
 
     # Setup and start gRPC server
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    # Every client keeps up to 4 calls open at once
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4 * cfg.max_clients))
     services_pb2_grpc.add_AsyncInferenceServicer_to_server(policy_server, server)
     server.add_insecure_port(f"{cfg.host}:{cfg.port}")
 
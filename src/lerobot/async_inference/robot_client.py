@@ -39,7 +39,6 @@ import time
 from collections.abc import Callable
 from dataclasses import asdict
 from pprint import pformat
-from queue import Queue
 from typing import Any
 
 import draccus
@@ -62,9 +61,12 @@ from lerobot.transport import (
     services_pb2_grpc,  # type: ignore
 )
 from lerobot.transport.utils import grpc_channel_options, send_bytes_in_chunks
+from lerobot.utils.constants import OBS_IMAGES
 
+from .action_buffer import ActionRingBuffer
 from .configs import RobotClientConfig
-from .constants import SUPPORTED_ROBOTS
+from .constants import SHARED_MEMORY_NUM_SLOTS, SUPPORTED_ROBOTS
+from .encoding import decode_action_chunk, encode_observation, resize_observation_images
 from .helpers import (
     Action,
     FPSTracker,
@@ -72,11 +74,14 @@ from .helpers import (
     RawObservation,
     RemotePolicyConfig,
     TimedAction,
+    TimedActionChunk,
     TimedObservation,
     get_logger,
     map_robot_keys_to_lerobot_features,
     visualize_action_queue_size,
 )
+from .scheduling import AdaptiveChunkScheduler
+from .shared_memory import SharedMemoryRing, SharedMemorySpec, from_shared_memory, to_shared_memory
 
 
 class RobotClient:
@@ -95,6 +100,7 @@ class RobotClient:
         self.robot.connect()
 
         lerobot_features = map_robot_keys_to_lerobot_features(self.robot)
+        self.lerobot_features = lerobot_features
 
         # Use environment variable if server_address is not provided in config
         self.server_address = config.server_address
@@ -106,6 +112,20 @@ class RobotClient:
             config.actions_per_chunk,
             config.policy_device,
         )
+        # Rings passing observations and action chunks through shared memory, once the server attached to them
+        self.observation_ring: SharedMemoryRing | None = None
+        self.action_ring: SharedMemoryRing | None = None
+        if config.shared_memory_transport:
+            slot_size = int(config.shared_memory_slot_mb * 1024**2)
+            self.observation_ring = SharedMemoryRing.create(SHARED_MEMORY_NUM_SLOTS, slot_size)
+            self.action_ring = SharedMemoryRing.create(SHARED_MEMORY_NUM_SLOTS, slot_size)
+            self.policy_config.shared_memory = SharedMemorySpec(
+                observation_ring=self.observation_ring.name,
+                action_ring=self.action_ring.name,
+                num_slots=SHARED_MEMORY_NUM_SLOTS,
+                slot_size=slot_size,
+            )
+
         self.channel = grpc.insecure_channel(
             self.server_address, grpc_channel_options(initial_backoff=f"{config.environment_dt:.4f}s")
         )
@@ -119,16 +139,29 @@ class RobotClient:
         self.latest_action = -1
         self.action_chunk_size = -1
 
-        self._chunk_size_threshold = config.chunk_size_threshold
+        # Decides when to send observations, from the measured latency of the action chunks
+        self.scheduler = AdaptiveChunkScheduler(
+            environment_dt=config.environment_dt,
+            chunk_size_threshold=config.chunk_size_threshold,
+            adaptive=config.adaptive_chunk_scheduling,
+            latency_quantile=config.latency_quantile,
+            margin_steps=config.scheduling_margin_steps,
+        )
 
-        self.action_queue = Queue()
-        self.action_queue_lock = threading.Lock()  # Protect queue operations
+        # Actions to perform, indexed by timestep. Thread-safe, merging a chunk and popping need no extra lock
+        self.action_queue = ActionRingBuffer(capacity=config.actions_per_chunk)
         self.action_queue_size = []
         self.start_barrier = threading.Barrier(2)  # 2 threads: action receiver, control loop
 
         # FPS measurement
         self.fps_tracker = FPSTracker(target_fps=self.config.fps)
 
+        # Falls back to polling `GetActions` if the server does not implement `StreamActions`
+        self.use_action_streaming = config.use_action_streaming
+
+        # Camera key -> (height, width) expected by the policy, filled once the server loaded the policy
+        self.image_sizes: dict[str, tuple[int, int]] = {}
+
         self.logger.info("Robot connected and ready")
 
         # Use an event for thread-safe coordination
@@ -159,7 +192,11 @@ class RobotClient:
                 f"Device: {self.policy_config.device}"
             )
 
-            self.stub.SendPolicyInstructions(policy_setup)
+            policy_features = self.stub.SendPolicyInstructions(policy_setup)
+            if self.config.resize_images_on_client:
+                self.image_sizes = self._get_image_sizes(policy_features)
+            if self.observation_ring is not None:
+                self._check_shared_memory()
 
             self.shutdown_event.clear()
 
@@ -169,6 +206,45 @@ class RobotClient:
             self.logger.error(f"Failed to connect to policy server: {e}")
             return False
 
+    def _get_image_sizes(self, policy_features: services_pb2.PolicyFeatures) -> dict[str, tuple[int, int]]:
+        """Map the camera keys of the robot to the image resolution the policy expects"""
+        if len(policy_features.data) == 0:
+            self.logger.info("Server did not send the policy image features, sending full resolution images")
+            return {}
+
+        policy_image_features = pickle.loads(policy_features.data)  # nosec
+        image_sizes = {}
+        for key, feature in policy_image_features.items():
+            camera_key = key.removeprefix(f"{OBS_IMAGES}.")
+            # Only the robot cameras can be resized, policy image features are (C, H, W)
+            if key in self.lerobot_features and camera_key != key:
+                image_sizes[camera_key] = (feature.shape[1], feature.shape[2])
+
+        self.logger.info(f"Resizing camera images before sending them: {image_sizes}")
+        return image_sizes
+
+    def _check_shared_memory(self):
+        """Keep the shared-memory rings if the server attached to them, fall back to gRPC otherwise"""
+        if self.observation_ring.attached and self.action_ring.attached:
+            self.logger.info(
+                "Server attached to the shared memory, passing observations and actions through it"
+            )
+            return
+
+        self.logger.warning(
+            "Server did not attach to the shared memory (remote, or without shared memory support), "
+            "sending observations and actions over gRPC"
+        )
+        self._close_shared_memory()
+
+    def _close_shared_memory(self):
+        for ring in (self.observation_ring, self.action_ring):
+            if ring is not None:
+                ring.close()
+        self.observation_ring = None
+        self.action_ring = None
+        self.policy_config.shared_memory = None
+
     def stop(self):
         """Stop the robot client"""
         self.shutdown_event.set()
@@ -177,7 +253,9 @@ class RobotClient:
         self.logger.debug("Robot disconnected")
 
         self.channel.close()
+        self._close_shared_memory()
         self.logger.debug("Client stopped, channel closed")
+        self.logger.info(f"Client stopping... | Scheduling stats: {self.scheduler.get_metrics()}")
 
     def send_observation(
         self,
@@ -192,9 +270,14 @@ class RobotClient:
             raise ValueError("Input observation needs to be a TimedObservation!")
 
         start_time = time.perf_counter()
-        observation_bytes = pickle.dumps(obs)
+        observation_bytes = encode_observation(obs, self.config.image_codec, self.config.image_quality)
         serialize_time = time.perf_counter() - start_time
-        self.logger.debug(f"Observation serialization time: {serialize_time:.6f}s")
+        self.logger.debug(
+            f"Observation serialization time: {serialize_time:.6f}s | "
+            f"Size: {len(observation_bytes) / 1024:.1f}kB"
+        )
+        # Only a reference to the observation goes over gRPC when it fits in shared memory
+        observation_bytes = to_shared_memory(self.observation_ring, observation_bytes)
 
         try:
             observation_iterator = send_bytes_in_chunks(
@@ -210,60 +293,31 @@ class RobotClient:
             return True
 
         except grpc.RpcError as e:
+            if self.observation_ring is not None and e.code() == grpc.StatusCode.FAILED_PRECONDITION:
+                self.logger.warning(
+                    "Server lost the shared memory, sending observations and actions over gRPC"
+                )
+                self._close_shared_memory()
             self.logger.error(f"Error sending observation #{obs.get_timestep()}: {e}")
             return False
 
     def _inspect_action_queue(self):
-        with self.action_queue_lock:
-            queue_size = self.action_queue.qsize()
-            timestamps = sorted([action.get_timestep() for action in self.action_queue.queue])
+        timestamps = self.action_queue.timesteps()
+        queue_size = len(timestamps)
         self.logger.debug(f"Queue size: {queue_size}, Queue contents: {timestamps}")
         return queue_size, timestamps
 
     def _aggregate_action_queues(
         self,
-        incoming_actions: list[TimedAction],
+        incoming_actions: TimedActionChunk | list[TimedAction],
         aggregate_fn: Callable[[torch.Tensor, torch.Tensor], torch.Tensor] | None = None,
     ):
-        """Finds the same timestep actions in the queue and aggregates them using the aggregate_fn"""
-        if aggregate_fn is None:
-            # default aggregate function: take the latest action
-            def aggregate_fn(x1, x2):
-                return x2
-
-        future_action_queue = Queue()
-        with self.action_queue_lock:
-            internal_queue = self.action_queue.queue
-
-        current_action_queue = {action.get_timestep(): action.get_action() for action in internal_queue}
-
-        for new_action in incoming_actions:
-            with self.latest_action_lock:
-                latest_action = self.latest_action
-
-            # New action is older than the latest action in the queue, skip it
-            if new_action.get_timestep() <= latest_action:
-                continue
-
-            # If the new action's timestep is not in the current action queue, add it directly
-            elif new_action.get_timestep() not in current_action_queue:
-                future_action_queue.put(new_action)
-                continue
-
-            # If the new action's timestep is in the current action queue, aggregate it
-            # TODO: There is probably a way to do this with broadcasting of the two action tensors
-            future_action_queue.put(
-                TimedAction(
-                    timestamp=new_action.get_timestamp(),
-                    timestep=new_action.get_timestep(),
-                    action=aggregate_fn(
-                        current_action_queue[new_action.get_timestep()], new_action.get_action()
-                    ),
-                )
-            )
+        """Merges the incoming actions in the queue, aggregating the actions of the same timestep with the
+        aggregate_fn (by default, the incoming action is kept)"""
+        with self.latest_action_lock:
+            latest_action = self.latest_action
 
-        with self.action_queue_lock:
-            self.action_queue = future_action_queue
+        self.action_queue.merge(incoming_actions, latest_action, aggregate_fn)
 
     def receive_actions(self, verbose: bool = False):
         """Receive actions from the policy server"""
@@ -273,79 +327,108 @@ class RobotClient:
 
         while self.running:
             try:
-                # Use StreamActions to get a stream of actions from the server
-                actions_chunk = self.stub.GetActions(services_pb2.Empty())
-                if len(actions_chunk.data) == 0:
-                    continue  # received `Empty` from server, wait for next call
+                if self.use_action_streaming:
+                    # A single long-lived stream, the server pushes every chunk as soon as it is predicted
+                    for actions_chunk in self.stub.StreamActions(services_pb2.Empty()):
+                        self._process_actions_chunk(actions_chunk, verbose)
+                        if not self.running:
+                            break
+                    else:
+                        # The server closed the stream (e.g. it is shutting down), retry shortly
+                        self.shutdown_event.wait(self.config.environment_dt)
+                else:
+                    actions_chunk = self.stub.GetActions(services_pb2.Empty())
+                    if len(actions_chunk.data) == 0:
+                        continue  # received `Empty` from server, wait for next call
+
+                    self._process_actions_chunk(actions_chunk, verbose)
 
-                receive_time = time.time()
-
-                # Deserialize bytes back into list[TimedAction]
-                deserialize_start = time.perf_counter()
-                timed_actions = pickle.loads(actions_chunk.data)  # nosec
-                deserialize_time = time.perf_counter() - deserialize_start
-
-                self.action_chunk_size = max(self.action_chunk_size, len(timed_actions))
-
-                # Calculate network latency if we have matching observations
-                if len(timed_actions) > 0 and verbose:
-                    with self.latest_action_lock:
-                        latest_action = self.latest_action
+            except grpc.RpcError as e:
+                if self.use_action_streaming and e.code() == grpc.StatusCode.UNIMPLEMENTED:
+                    self.logger.warning(
+                        "Server does not support action streaming, polling GetActions instead"
+                    )
+                    self.use_action_streaming = False
+                elif self.running:
+                    self.logger.error(f"Error receiving actions: {e}")
+
+    def _process_actions_chunk(self, actions_chunk: services_pb2.Actions, verbose: bool = False):
+        """Deserialize a chunk of actions received from the server and merge it in the action queue"""
+        receive_time = time.time()
+
+        # Deserialize bytes back into a TimedActionChunk, expanded lazily into TimedActions
+        deserialize_start = time.perf_counter()
+        actions_data = from_shared_memory(self.action_ring, actions_chunk.data)
+        if actions_data is None:
+            self.logger.warning("Action chunk overwritten in shared memory before being read, skipping it")
+            return
+        timed_actions = decode_action_chunk(actions_data)
+        deserialize_time = time.perf_counter() - deserialize_start
+
+        self.action_chunk_size = max(self.action_chunk_size, len(timed_actions))
+        if len(timed_actions) > 0:
+            # The chunk carries the timestamp of the observation it was predicted from
+            self.scheduler.record_chunk(
+                observation_timestamp=timed_actions[0].get_timestamp(),
+                receive_timestamp=receive_time,
+                server_time=getattr(timed_actions, "server_time", 0.0),
+            )
 
-                    self.logger.debug(f"Current latest action: {latest_action}")
+        # Calculate network latency if we have matching observations
+        if len(timed_actions) > 0 and verbose:
+            with self.latest_action_lock:
+                latest_action = self.latest_action
 
-                    # Get queue state before changes
-                    old_size, old_timesteps = self._inspect_action_queue()
-                    if not old_timesteps:
-                        old_timesteps = [latest_action]  # queue was empty
+            self.logger.debug(f"Current latest action: {latest_action}")
 
-                    # Log incoming actions
-                    incoming_timesteps = [a.get_timestep() for a in timed_actions]
+            # Get queue state before changes
+            old_size, old_timesteps = self._inspect_action_queue()
+            if not old_timesteps:
+                old_timesteps = [latest_action]  # queue was empty
 
-                    first_action_timestep = timed_actions[0].get_timestep()
-                    server_to_client_latency = (receive_time - timed_actions[0].get_timestamp()) * 1000
+            # Log incoming actions
+            incoming_timesteps = [a.get_timestep() for a in timed_actions]
 
-                    self.logger.info(
-                        f"Received action chunk for step #{first_action_timestep} | "
-                        f"Latest action: #{latest_action} | "
-                        f"Incoming actions: {incoming_timesteps[0]}:{incoming_timesteps[-1]} | "
-                        f"Network latency (server->client): {server_to_client_latency:.2f}ms | "
-                        f"Deserialization time: {deserialize_time * 1000:.2f}ms"
-                    )
+            first_action_timestep = timed_actions[0].get_timestep()
+            server_to_client_latency = (receive_time - timed_actions[0].get_timestamp()) * 1000
 
-                # Update action queue
-                start_time = time.perf_counter()
-                self._aggregate_action_queues(timed_actions, self.config.aggregate_fn)
-                queue_update_time = time.perf_counter() - start_time
+            self.logger.info(
+                f"Received action chunk for step #{first_action_timestep} | "
+                f"Latest action: #{latest_action} | "
+                f"Incoming actions: {incoming_timesteps[0]}:{incoming_timesteps[-1]} | "
+                f"Network latency (server->client): {server_to_client_latency:.2f}ms | "
+                f"Deserialization time: {deserialize_time * 1000:.2f}ms"
+            )
 
-                self.must_go.set()  # after receiving actions, next empty queue triggers must-go processing!
+        # Update action queue
+        start_time = time.perf_counter()
+        self._aggregate_action_queues(timed_actions, self.config.aggregate_fn)
+        queue_update_time = time.perf_counter() - start_time
 
-                if verbose:
-                    # Get queue state after changes
-                    new_size, new_timesteps = self._inspect_action_queue()
+        self.must_go.set()  # after receiving actions, next empty queue triggers must-go processing!
 
-                    with self.latest_action_lock:
-                        latest_action = self.latest_action
+        if verbose:
+            # Get queue state after changes
+            new_size, new_timesteps = self._inspect_action_queue()
 
-                    self.logger.info(
-                        f"Latest action: {latest_action} | "
-                        f"Old action steps: {old_timesteps[0]}:{old_timesteps[-1]} | "
-                        f"Incoming action steps: {incoming_timesteps[0]}:{incoming_timesteps[-1]} | "
-                        f"Updated action steps: {new_timesteps[0]}:{new_timesteps[-1]}"
-                    )
-                    self.logger.debug(
-                        f"Queue update complete ({queue_update_time:.6f}s) | "
-                        f"Before: {old_size} items | "
-                        f"After: {new_size} items | "
-                    )
+            with self.latest_action_lock:
+                latest_action = self.latest_action
 
-            except grpc.RpcError as e:
-                self.logger.error(f"Error receiving actions: {e}")
+            self.logger.info(
+                f"Latest action: {latest_action} | "
+                f"Old action steps: {old_timesteps[0]}:{old_timesteps[-1]} | "
+                f"Incoming action steps: {incoming_timesteps[0]}:{incoming_timesteps[-1]} | "
+                f"Updated action steps: {new_timesteps[0]}:{new_timesteps[-1]}"
+            )
+            self.logger.debug(
+                f"Queue update complete ({queue_update_time:.6f}s) | "
+                f"Before: {old_size} items | "
+                f"After: {new_size} items | "
+            )
 
     def actions_available(self):
         """Check if there are actions available in the queue"""
-        with self.action_queue_lock:
-            return not self.action_queue.empty()
+        return not self.action_queue.empty()
 
     def _action_tensor_to_action_dict(self, action_tensor: torch.Tensor) -> dict[str, float]:
         action = {key: action_tensor[i].item() for i, key in enumerate(self.robot.action_features)}
@@ -354,12 +437,9 @@ class RobotClient:
     def control_loop_action(self, verbose: bool = False) -> dict[str, Any]:
         """Reading and performing actions in local queue"""
 
-        # Lock only for queue operations
         get_start = time.perf_counter()
-        with self.action_queue_lock:
-            self.action_queue_size.append(self.action_queue.qsize())
-            # Get action from queue
-            timed_action = self.action_queue.get_nowait()
+        self.action_queue_size.append(self.action_queue.qsize())
+        timed_action = self.action_queue.get()
         get_end = time.perf_counter() - get_start
 
         _performed_action = self.robot.send_action(
@@ -369,8 +449,7 @@ class RobotClient:
             self.latest_action = timed_action.get_timestep()
 
         if verbose:
-            with self.action_queue_lock:
-                current_queue_size = self.action_queue.qsize()
+            current_queue_size = self.action_queue.qsize()
 
             self.logger.debug(
                 f"Ts={timed_action.get_timestamp()} | "
@@ -386,8 +465,7 @@ class RobotClient:
 
     def _ready_to_send_observation(self):
         """Flags when the client is ready to send an observation"""
-        with self.action_queue_lock:
-            return self.action_queue.qsize() / self.action_chunk_size <= self._chunk_size_threshold
+        return self.scheduler.ready_to_send(self.action_queue.qsize(), self.action_chunk_size)
 
     def control_loop_observation(self, task: str, verbose: bool = False) -> RawObservation:
         try:
@@ -396,6 +474,8 @@ class RobotClient:
 
             raw_observation: RawObservation = self.robot.get_observation()
             raw_observation["task"] = task
+            if self.image_sizes:
+                raw_observation = resize_observation_images(raw_observation, self.image_sizes)
 
             with self.latest_action_lock:
                 latest_action = self.latest_action
@@ -409,9 +489,8 @@ class RobotClient:
             obs_capture_time = time.perf_counter() - start_time
 
             # If there are no actions left in the queue, the observation must go through processing!
-            with self.action_queue_lock:
-                observation.must_go = self.must_go.is_set() and self.action_queue.empty()
-                current_queue_size = self.action_queue.qsize()
+            current_queue_size = self.action_queue.qsize()
+            observation.must_go = self.must_go.is_set() and current_queue_size == 0
 
             _ = self.send_observation(observation)
 
@@ -451,8 +530,10 @@ class RobotClient:
         while self.running:
             control_loop_start = time.perf_counter()
             """Control loop: (1) Performing actions, when available"""
-            if self.actions_available():
+            action_available = self.actions_available()
+            if action_available:
                 _performed_action = self.control_loop_action(verbose)
+            self.scheduler.underrun_tracker.record_step(action_available, control_loop_start)
 
             """Control loop: (2) Streaming observations to the remote policy server"""
             if self._ready_to_send_observation():
@@ -0,0 +1,158 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Scheduling of the observations sent by the robot client, adapted to the measured latency of the server."""
+
+import math
+from dataclasses import dataclass, field
+
+import torch
+
+from .helpers import LatencyTracker
+
+
+@dataclass
+class UnderrunTracker:
+    """Utility class to track the action queue underruns of the control loop.
+
+    An underrun starts at the first control step without an action to perform, and ends with the next
+    performed action. The actuators are idle in between. Steps before the first performed action (the
+    robot waits for the first chunk) are not counted.
+    """
+
+    underrun_count: int = 0
+    idle_time: float = 0.0
+    first_timestamp: float | None = None
+    last_timestamp: float | None = None
+    idle_since: float | None = None
+
+    def record_step(self, action_performed: bool, timestamp: float) -> None:
+        """Record a control step, performing an action or not"""
+        if self.first_timestamp is None:
+            if action_performed:
+                self.first_timestamp = timestamp
+            return
+
+        self.last_timestamp = timestamp
+        if not action_performed:
+            if self.idle_since is None:
+                self.underrun_count += 1
+                self.idle_since = timestamp
+        elif self.idle_since is not None:
+            self.idle_time += timestamp - self.idle_since
+            self.idle_since = None
+
+    def calculate_underrun_metrics(self) -> dict[str, float]:
+        """Underrun count, idle-actuator time (in seconds) and fraction of the run spent idle"""
+        idle_time = self.idle_time
+        if self.idle_since is not None:
+            idle_time += self.last_timestamp - self.idle_since
+
+        duration = (
+            self.last_timestamp - self.first_timestamp
+            if self.first_timestamp is not None and self.last_timestamp is not None
+            else 0.0
+        )
+        return {
+            "underrun_count": self.underrun_count,
+            "idle_time_s": idle_time,
+            "idle_fraction": idle_time / duration if duration > 0 else 0.0,
+        }
+
+    def reset(self):
+        """Reset the underrun tracker state"""
+        self.underrun_count = 0
+        self.idle_time = 0.0
+        self.first_timestamp = None
+        self.last_timestamp = None
+        self.idle_since = None
+
+
+@dataclass
+class AdaptiveChunkScheduler:
+    """Decides when the robot client sends an observation, so that the next action chunk arrives right
+    before the action queue drains.
+
+    The scheduler tracks the round-trip latency of the action chunks (from the capture of the observation
+    to the reception of the chunk predicted from it), split into the server inference time and the network
+    latency. Once it has measurements, an observation is sent when the actions left in the queue last less
+    than the `latency_quantile` of the round-trip latency, plus `margin_steps` control steps. Until then, it
+    falls back to the fixed `chunk_size_threshold` on the fill of the queue.
+
+    The scheduler also tracks the underruns of the action queue, the primary metric of the scheduling.
+
+    Args:
+        environment_dt: Duration of a control step, in seconds.
+        chunk_size_threshold: Queue fill under which observations are sent before any latency measurement,
+            or always if `adaptive` is False.
+        adaptive: Whether to schedule the observations from the measured latency.
+        latency_quantile: Quantile of the round-trip latency the queue must cover, 0.9 by default.
+        margin_steps: Extra control steps covered on top of the latency, absorbing the observation capture.
+        window_size: Number of chunks the latency distributions are computed over.
+    """
+
+    environment_dt: float
+    chunk_size_threshold: float = 0.5
+    adaptive: bool = True
+    latency_quantile: float = 0.9
+    margin_steps: int = 1
+    window_size: int = 100
+    round_trip_tracker: LatencyTracker = field(init=False)
+    server_tracker: LatencyTracker = field(init=False)
+    network_tracker: LatencyTracker = field(init=False)
+    underrun_tracker: UnderrunTracker = field(init=False, default_factory=UnderrunTracker)
+    lead_steps: int | None = field(init=False, default=None)
+
+    def __post_init__(self):
+        self.round_trip_tracker = LatencyTracker(window_size=self.window_size)
+        self.server_tracker = LatencyTracker(window_size=self.window_size)
+        self.network_tracker = LatencyTracker(window_size=self.window_size)
+
+    def record_chunk(
+        self, observation_timestamp: float, receive_timestamp: float, server_time: float
+    ) -> None:
+        """Record the latency of a received chunk.
+
+        Args:
+            observation_timestamp: Timestamp of the observation the chunk was predicted from. It comes from
+                the clock of the client, like `receive_timestamp`, so no clock synchronization is needed.
+            receive_timestamp: Timestamp at which the chunk was received.
+            server_time: Time the server took to predict the chunk, in seconds (0 if not reported).
+        """
+        round_trip = max(0.0, receive_timestamp - observation_timestamp)
+        self.round_trip_tracker.record(round_trip)
+        self.server_tracker.record(server_time)
+        self.network_tracker.record(max(0.0, round_trip - server_time))
+
+        # Updated once per chunk, as the control loop checks it at every step
+        latency = torch.tensor(self.round_trip_tracker.latencies, dtype=torch.float64)
+        latency_steps = latency.quantile(self.latency_quantile).item() / self.environment_dt
+        # Rounding off floating point noise first, so that a latency of exactly 3 steps is 3 steps
+        self.lead_steps = math.ceil(round(latency_steps, 6)) + self.margin_steps
+
+    def ready_to_send(self, queue_size: int, chunk_size: int) -> bool:
+        """Whether the client should send an observation now"""
+        if not self.adaptive or self.lead_steps is None:
+            return queue_size / chunk_size <= self.chunk_size_threshold
+        return queue_size <= min(self.lead_steps, chunk_size)
+
+    def get_metrics(self) -> dict[str, object]:
+        """Underrun metrics, latency distributions and current lead of the scheduler"""
+        return {
+            **self.underrun_tracker.calculate_underrun_metrics(),
+            "lead_steps": self.lead_steps,
+            "round_trip_latency": self.round_trip_tracker.calculate_latency_metrics(),
+            "server_latency": self.server_tracker.calculate_latency_metrics(),
+            "network_latency": self.network_tracker.calculate_latency_metrics(),
+        }
@@ -0,0 +1,224 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared-memory transport between a robot client and a policy server running on the same machine.
+
+The client creates two rings of fixed-size slots in shared memory, one for its observations and one for the
+action chunks of the server, and sends their names along with the policy instructions. The server attaches
+to them and marks them as attached, which tells the client the shared memory can be used. The server only
+attaches to segments named and laid out like the rings of a client, and writes nothing to any other one.
+
+The encoded observations and action chunks are then written to the rings, and the gRPC calls only carry a
+reference to the slot they were written to: no pickling, chunking or copy through the TCP loopback of the
+camera frames. Messages larger than a slot, and all the messages of a client or a server without shared
+memory support, go through gRPC as before.
+"""
+
+import os
+import re
+import secrets
+import struct
+import threading
+from dataclasses import dataclass
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+SHARED_MEMORY_MAGIC = b"LRSM"
+SHARED_MEMORY_PREFIX = "lerobot_"
+# Names of the segments of the rings, a random token after the prefix
+_SEGMENT_NAME = re.compile(rf"{SHARED_MEMORY_PREFIX}[0-9a-f]{{16}}")
+_RING_MAGIC = b"LRRG"
+# Magic and sequence number of the message in the ring
+_REFERENCE = struct.Struct("<4sQ")
+# Magic, number of slots and slot size of the ring, written by its creator
+_RING_LAYOUT = struct.Struct("<4sIQ")
+# Attached flag, set by the process on the other end of the ring, after the layout
+_RING_ATTACHED = struct.Struct("<Q")
+# Sequence number of the message in the slot (-1 while it is written) and length of the message
+_SLOT_HEADER = struct.Struct("<qQ")
+
+# Segments created by this process, which the resource tracker must keep track of to unlink them
+_created_names: set[str] = set()
+
+
+@dataclass
+class SharedMemorySpec:
+    """Names and layout of the rings of a client, sent to the server with the policy instructions"""
+
+    observation_ring: str
+    action_ring: str
+    num_slots: int
+    slot_size: int
+
+
+def encode_shared_memory_reference(sequence_number: int) -> bytes:
+    return _REFERENCE.pack(SHARED_MEMORY_MAGIC, sequence_number)
+
+
+def decode_shared_memory_reference(data: bytes) -> int | None:
+    """Sequence number of the message a reference points to, None if `data` is not a reference"""
+    if len(data) != _REFERENCE.size or not data.startswith(SHARED_MEMORY_MAGIC):
+        return None
+    return _REFERENCE.unpack(data)[1]
+
+
+def to_shared_memory(ring: "SharedMemoryRing | None", message: bytes) -> bytes:
+    """Write a message to a ring, returning the reference to send. The message itself if it does not fit."""
+    if ring is None:
+        return message
+    sequence_number = ring.write(message)
+    return message if sequence_number is None else encode_shared_memory_reference(sequence_number)
+
+
+def from_shared_memory(ring: "SharedMemoryRing | None", data: bytes) -> bytes | None:
+    """Message a received reference points to, `data` itself if it is not a reference.
+
+    Returns None if the message was overwritten in the ring before being read.
+    """
+    sequence_number = decode_shared_memory_reference(data)
+    if sequence_number is None:
+        return data
+    if ring is None:
+        raise ValueError("Received a shared memory reference, but no shared memory is attached")
+    return ring.read(sequence_number)
+
+
+class SharedMemoryRing:
+    """Single-producer single-consumer ring of messages in a shared-memory segment.
+
+    Message `i` is written to slot `i % num_slots`, and the consumer reads it back from its sequence number,
+    received on the control channel. Slots record the sequence number of their message, so that a message
+    overwritten before being read is detected instead of returning another one.
+
+    Args:
+        shared_memory: Segment of the ring.
+        num_slots: Number of messages the ring holds.
+        slot_size: Maximum size of a message, in bytes.
+        owner: Whether this process created the segment, and unlinks it when closing the ring.
+    """
+
+    def __init__(self, shared_memory: SharedMemory, num_slots: int, slot_size: int, owner: bool):
+        self._shared_memory = shared_memory
+        self.num_slots = num_slots
+        self.slot_size = slot_size
+        self.owner = owner
+
+        self._lock = threading.Lock()
+        self._sequence_number = 0
+        self._closed = False
+
+    @staticmethod
+    def segment_size(num_slots: int, slot_size: int) -> int:
+        return _RING_LAYOUT.size + _RING_ATTACHED.size + num_slots * (_SLOT_HEADER.size + slot_size)
+
+    @classmethod
+    def create(cls, num_slots: int, slot_size: int) -> "SharedMemoryRing":
+        name = f"{SHARED_MEMORY_PREFIX}{secrets.token_hex(8)}"
+        shared_memory = SharedMemory(name=name, create=True, size=cls.segment_size(num_slots, slot_size))
+        _created_names.add(shared_memory._name)
+        ring = cls(shared_memory, num_slots, slot_size, owner=True)
+        _RING_LAYOUT.pack_into(shared_memory.buf, 0, _RING_MAGIC, num_slots, slot_size)
+        _RING_ATTACHED.pack_into(shared_memory.buf, _RING_LAYOUT.size, 0)
+        for slot in range(num_slots):
+            _SLOT_HEADER.pack_into(shared_memory.buf, ring._slot_offset(slot), -1, 0)
+        return ring
+
+    @classmethod
+    def attach(cls, name: str, num_slots: int, slot_size: int) -> "SharedMemoryRing":
+        """Attach to the ring created by another process, and mark it as attached.
+
+        Raises:
+            ValueError: If the segment is not a ring of `num_slots` slots of `slot_size` bytes created by
+                :pymeth:`create`. Nothing is written to it then.
+        """
+        if not _SEGMENT_NAME.fullmatch(name):
+            raise ValueError(f"{name} is not the name of a shared memory ring")
+
+        shared_memory = SharedMemory(name=name)
+        # Before Python 3.13, attaching registers the segment to the resource tracker of this process, which
+        # would unlink it when this process exits. The creator of the segment is the one unlinking it.
+        if os.name == "posix" and shared_memory._name not in _created_names:
+            resource_tracker.unregister(shared_memory._name, "shared_memory")
+        if shared_memory.size < cls.segment_size(num_slots, slot_size) or _RING_LAYOUT.unpack_from(
+            shared_memory.buf, 0
+        ) != (_RING_MAGIC, num_slots, slot_size):
+            shared_memory.close()
+            raise ValueError(f"Shared memory {name} is not a ring of {num_slots} slots of {slot_size} bytes")
+
+        _RING_ATTACHED.pack_into(shared_memory.buf, _RING_LAYOUT.size, 1)
+        return cls(shared_memory, num_slots, slot_size, owner=False)
+
+    @property
+    def name(self) -> str:
+        return self._shared_memory.name
+
+    @property
+    def attached(self) -> bool:
+        """Whether the process on the other end attached to the ring"""
+        with self._lock:
+            return (
+                not self._closed
+                and _RING_ATTACHED.unpack_from(self._shared_memory.buf, _RING_LAYOUT.size)[0] == 1
+            )
+
+    def _slot_offset(self, slot: int) -> int:
+        return _RING_LAYOUT.size + _RING_ATTACHED.size + slot * (_SLOT_HEADER.size + self.slot_size)
+
+    def write(self, message: bytes) -> int | None:
+        """Write a message to the next slot, returning its sequence number. None if it does not fit."""
+        if len(message) > self.slot_size:
+            return None
+
+        with self._lock:
+            if self._closed:
+                return None
+            sequence_number = self._sequence_number
+            self._sequence_number += 1
+
+            offset = self._slot_offset(sequence_number % self.num_slots)
+            buffer = self._shared_memory.buf
+            _SLOT_HEADER.pack_into(buffer, offset, -1, 0)
+            start = offset + _SLOT_HEADER.size
+            buffer[start : start + len(message)] = message
+            _SLOT_HEADER.pack_into(buffer, offset, sequence_number, len(message))
+            return sequence_number
+
+    def read(self, sequence_number: int) -> bytes | None:
+        """Copy of the message of a sequence number. None if it was overwritten by a newer message."""
+        with self._lock:
+            if self._closed:
+                return None
+            offset = self._slot_offset(sequence_number % self.num_slots)
+            buffer = self._shared_memory.buf
+            slot_sequence_number, length = _SLOT_HEADER.unpack_from(buffer, offset)
+            if slot_sequence_number != sequence_number:
+                return None
+
+            start = offset + _SLOT_HEADER.size
+            message = bytes(buffer[start : start + length])
+            # The producer may have started overwriting the slot while it was copied
+            if _SLOT_HEADER.unpack_from(buffer, offset)[0] != sequence_number:
+                return None
+            return message
+
+    def close(self):
+        """Detach from the ring, and free it if this process created it"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._shared_memory.close()
+            if self.owner:
+                self._shared_memory.unlink()
+                _created_names.discard(self._shared_memory._name)
@@ -250,6 +250,11 @@ class HILSerlRobotEnvConfig(EnvConfig):
     processor: HILSerlProcessorConfig = field(default_factory=HILSerlProcessorConfig)
 
     name: str = "real_robot"
+    # `num_envs` specifies the number of simulated environments the actor steps in a gym.vector.VectorEnv.
+    # Only the `gym_hil` simulation supports more than one environment.
+    num_envs: int = 1
+    # `use_async_envs` specifies whether to step the vectorized environments in subprocesses.
+    use_async_envs: bool = False
 
     @property
     def gym_kwargs(self) -> dict:
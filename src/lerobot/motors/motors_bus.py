@@ -22,12 +22,13 @@
 import abc
 import logging
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from functools import cached_property
 from pprint import pformat
 from typing import Protocol, TypeAlias
 
+import numpy as np
 import serial
 from deepdiff import DeepDiff
 from tqdm import tqdm
@@ -99,6 +100,28 @@ class Motor:
     norm_mode: MotorNormMode
 
 
+@dataclass
+class _CalibrationArrays:
+    """Calibration of the motors of a bus as arrays, with a column per motor in the order of `MotorsBus.motors`,
+    to normalize the values of all the motors with a few vectorized operations.
+
+    Every normalization mode and drive mode is folded into the same affine operations, with the parameters:
+    - normalize: `lo, hi, a, p, d, m, c`, as `((clip(raw, lo, hi) - a) * p / d) * m + c`
+    - unnormalize: `s, k, lo, hi, p, c, m, d, a`, as `((clip(value * s + k, lo, hi) * p + c) / m) * d + a`
+    which, operation for operation, compute the same floats as the formulas of each mode.
+    """
+
+    rows: dict[int, int]  # Column of each motor id
+    normalize_params: np.ndarray
+    unnormalize_params: np.ndarray
+    errors: list[Exception | None]  # Error raised when normalizing the values of each motor, if any
+    all_valid: bool
+    # Columns and parameters of the motor ids read or written so far, reused as the same motors are read or
+    # written at every step of the control loop
+    selected_rows: dict[tuple[int, ...], np.ndarray] = field(default_factory=dict)
+    selected_params: dict[bytes, tuple[np.ndarray, np.ndarray]] = field(default_factory=dict)
+
+
 class PortHandler(Protocol):
     def __init__(self, port_name):
         self.is_open: bool
@@ -262,6 +285,7 @@ class MotorsBus(abc.ABC):
     ):
         self.port = port
         self.motors = motors
+        self._calibration_arrays: _CalibrationArrays | None = None
         self.calibration = calibration if calibration else {}
 
         self.port_handler: PortHandler
@@ -631,6 +655,21 @@ class MotorsBus(abc.ABC):
             if self.port_handler.getBaudRate() != baudrate:
                 raise RuntimeError("Failed to write bus baud rate.")
 
+    @property
+    def calibration(self) -> dict[str, MotorCalibration]:
+        """dict[str, MotorCalibration]: Calibration used to normalize values, by motor name.
+
+        Normalization uses arrays built from it once: assign a new calibration, or write it with
+        :pymeth:`write_calibration`, rather than modifying it in place.
+        """
+        return self._calibration
+
+    @calibration.setter
+    def calibration(self, calibration: dict[str, MotorCalibration]) -> None:
+        self._calibration = calibration
+        # Rebuilt from the new calibration by the next normalization
+        self._calibration_arrays = None
+
     @property
     @abc.abstractmethod
     def is_calibrated(self) -> bool:
@@ -767,64 +806,131 @@ class MotorsBus(abc.ABC):
 
         return mins, maxes
 
-    def _normalize(self, ids_values: dict[int, int]) -> dict[int, float]:
+    def _get_calibration_arrays(self) -> _CalibrationArrays:
+        if self._calibration_arrays is not None:
+            return self._calibration_arrays
+
+        errors: list[Exception | None] = []
+        normalize_params, unnormalize_params = [], []
+        for motor, m in self.motors.items():
+            calibration = self.calibration.get(motor)
+            if calibration is None:
+                errors.append(KeyError(motor))
+            elif calibration.range_max == calibration.range_min:
+                errors.append(ValueError(f"Invalid calibration for motor '{motor}': min and max are equal."))
+            elif m.norm_mode not in (
+                MotorNormMode.RANGE_M100_100,
+                MotorNormMode.RANGE_0_100,
+                MotorNormMode.DEGREES,
+            ):
+                errors.append(NotImplementedError())
+            else:
+                errors.append(None)
+            if errors[-1] is not None:
+                # Placeholders, the values of the motor are never normalized
+                normalize_params.append((0, 1, 0, 1, 1, 1, 0))
+                unnormalize_params.append((1, 0, 0, 1, 1, 0, 1, 1, 0))
+                continue
+
+            min_, max_ = calibration.range_min, calibration.range_max
+            drive_mode = self.apply_drive_mode and calibration.drive_mode
+            if m.norm_mode is MotorNormMode.RANGE_M100_100:
+                sign = -1 if drive_mode else 1
+                normalize_params.append((min_, max_, min_, 1, max_ - min_, 200 * sign, -100 * sign))
+                unnormalize_params.append((sign, 0, -100, 100, 1, 100, 200, max_ - min_, min_))
+            elif m.norm_mode is MotorNormMode.RANGE_0_100:
+                sign, offset = (-1, 100) if drive_mode else (1, 0)
+                normalize_params.append((min_, max_, min_, 1, max_ - min_, 100 * sign, offset))
+                unnormalize_params.append((sign, offset, 0, 100, 1, 0, 100, max_ - min_, min_))
+            else:
+                mid = (min_ + max_) / 2
+                max_res = self.model_resolution_table[m.model] - 1
+                normalize_params.append((-np.inf, np.inf, mid, 360, max_res, 1, 0))
+                unnormalize_params.append((1, 0, -np.inf, np.inf, max_res, 0, 360, 1, mid))
+
+        self._calibration_arrays = _CalibrationArrays(
+            rows={m.id: row for row, m in enumerate(self.motors.values())},
+            normalize_params=np.array(normalize_params, dtype=np.float64).reshape(-1, 7).T.copy(),
+            unnormalize_params=np.array(unnormalize_params, dtype=np.float64).reshape(-1, 9).T.copy(),
+            errors=errors,
+            all_valid=all(error is None for error in errors),
+        )
+        return self._calibration_arrays
+
+    def _get_calibration_rows(self, motor_ids: list[int]) -> np.ndarray:
+        calibration = self._get_calibration_arrays()
+        key = tuple(motor_ids)
+        rows = calibration.selected_rows.get(key)
+        if rows is None:
+            rows = np.array([calibration.rows[id_] for id_ in motor_ids], dtype=np.intp)
+            rows.flags.writeable = False
+            calibration.selected_rows[key] = rows
+        return rows
+
+    def _get_calibration_params(self, rows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Parameters of `_CalibrationArrays` to normalize and unnormalize the motors at *rows*."""
         if not self.calibration:
             raise RuntimeError(f"{self} has no calibration registered.")
 
-        normalized_values = {}
-        for id_, val in ids_values.items():
-            motor = self._id_to_name(id_)
-            min_ = self.calibration[motor].range_min
-            max_ = self.calibration[motor].range_max
-            drive_mode = self.apply_drive_mode and self.calibration[motor].drive_mode
-            if max_ == min_:
-                raise ValueError(f"Invalid calibration for motor '{motor}': min and max are equal.")
-
-            bounded_val = min(max_, max(min_, val))
-            if self.motors[motor].norm_mode is MotorNormMode.RANGE_M100_100:
-                norm = (((bounded_val - min_) / (max_ - min_)) * 200) - 100
-                normalized_values[id_] = -norm if drive_mode else norm
-            elif self.motors[motor].norm_mode is MotorNormMode.RANGE_0_100:
-                norm = ((bounded_val - min_) / (max_ - min_)) * 100
-                normalized_values[id_] = 100 - norm if drive_mode else norm
-            elif self.motors[motor].norm_mode is MotorNormMode.DEGREES:
-                mid = (min_ + max_) / 2
-                max_res = self.model_resolution_table[self._id_to_model(id_)] - 1
-                normalized_values[id_] = (val - mid) * 360 / max_res
-            else:
-                raise NotImplementedError
+        calibration = self._get_calibration_arrays()
+        key = rows.tobytes()
+        params = calibration.selected_params.get(key)
+        if params is None:
+            if not calibration.all_valid:
+                error = next(
+                    (calibration.errors[row] for row in rows if calibration.errors[row] is not None), None
+                )
+                if error is not None:
+                    raise error
+            params = (calibration.normalize_params[:, rows], calibration.unnormalize_params[:, rows])
+            calibration.selected_params[key] = params
+        return params
+
+    def _normalize_array(self, rows: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """Vectorized :pymeth:`_normalize` of the raw values of the motors at *rows* of the calibration."""
+        lo, hi, a, p, d, m, c = self._get_calibration_params(rows)[0]
+        normalized = np.maximum(values, lo)
+        np.minimum(normalized, hi, out=normalized)
+        normalized -= a
+        normalized *= p
+        normalized /= d
+        normalized *= m
+        normalized += c
+        return normalized
+
+    def _unnormalize_array(self, rows: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """Vectorized :pymeth:`_unnormalize` of the values of the motors at *rows* of the calibration."""
+        s, k, lo, hi, p, c, m, d, a = self._get_calibration_params(rows)[1]
+        unnormalized = np.multiply(values, s)
+        unnormalized += k
+        np.maximum(unnormalized, lo, out=unnormalized)
+        np.minimum(unnormalized, hi, out=unnormalized)
+        unnormalized *= p
+        unnormalized += c
+        unnormalized /= m
+        unnormalized *= d
+        unnormalized += a
+        if not np.isfinite(unnormalized.sum()):  # NaNs and infinities propagate through the sum
+            raise ValueError(f"Cannot convert non-finite values to motor positions: {values}")
+        return unnormalized.astype(np.int64)
+
+    def _normalize(self, ids_values: dict[int, int]) -> dict[int, float]:
+        if not self.calibration:
+            raise RuntimeError(f"{self} has no calibration registered.")
 
-        return normalized_values
+        ids = list(ids_values)
+        values = np.fromiter(ids_values.values(), dtype=np.float64, count=len(ids))
+        normalized_values = self._normalize_array(self._get_calibration_rows(ids), values)
+        return dict(zip(ids, normalized_values.tolist(), strict=True))
 
     def _unnormalize(self, ids_values: dict[int, float]) -> dict[int, int]:
         if not self.calibration:
             raise RuntimeError(f"{self} has no calibration registered.")
 
-        unnormalized_values = {}
-        for id_, val in ids_values.items():
-            motor = self._id_to_name(id_)
-            min_ = self.calibration[motor].range_min
-            max_ = self.calibration[motor].range_max
-            drive_mode = self.apply_drive_mode and self.calibration[motor].drive_mode
-            if max_ == min_:
-                raise ValueError(f"Invalid calibration for motor '{motor}': min and max are equal.")
-
-            if self.motors[motor].norm_mode is MotorNormMode.RANGE_M100_100:
-                val = -val if drive_mode else val
-                bounded_val = min(100.0, max(-100.0, val))
-                unnormalized_values[id_] = int(((bounded_val + 100) / 200) * (max_ - min_) + min_)
-            elif self.motors[motor].norm_mode is MotorNormMode.RANGE_0_100:
-                val = 100 - val if drive_mode else val
-                bounded_val = min(100.0, max(0.0, val))
-                unnormalized_values[id_] = int((bounded_val / 100) * (max_ - min_) + min_)
-            elif self.motors[motor].norm_mode is MotorNormMode.DEGREES:
-                mid = (min_ + max_) / 2
-                max_res = self.model_resolution_table[self._id_to_model(id_)] - 1
-                unnormalized_values[id_] = int((val * max_res / 360) + mid)
-            else:
-                raise NotImplementedError
-
-        return unnormalized_values
+        ids = list(ids_values)
+        values = np.fromiter(ids_values.values(), dtype=np.float64, count=len(ids))
+        unnormalized_values = self._unnormalize_array(self._get_calibration_rows(ids), values)
+        return dict(zip(ids, unnormalized_values.tolist(), strict=True))
 
     @abc.abstractmethod
     def _encode_sign(self, data_name: str, ids_values: dict[int, int]) -> dict[int, int]:
@@ -1063,6 +1169,45 @@ class MotorsBus(abc.ABC):
         Returns:
             dict[str, Value]: Mapping *motor name → value*.
         """
+        ids_values = self._sync_read_decoded(data_name, self._get_motors_list(motors), num_retry)
+
+        if normalize and data_name in self.normalized_data:
+            ids_values = self._normalize(ids_values)
+
+        return {self._id_to_name(id_): value for id_, value in ids_values.items()}
+
+    def sync_read_array(
+        self,
+        data_name: str,
+        motors: str | list[str] | None = None,
+        *,
+        normalize: bool = True,
+        num_retry: int = 1,
+    ) -> np.ndarray:
+        """Read the same register from several motors at once, as an array.
+
+        Same as :pymeth:`sync_read`, without building a dictionary of the values, for high frequency
+        control loops. Values are normalized with a single vectorized operation for all the motors.
+
+        Args:
+            data_name (str): Register name.
+            motors (str | list[str] | None, optional): Motors to query. `None` (default) reads every motor.
+            normalize (bool, optional): Normalisation flag.  Defaults to `True`.
+            num_retry (int, optional): Retry attempts.  Defaults to `0`.
+
+        Returns:
+            np.ndarray: Values in the order of *motors*, `float64` if normalized and `int64` otherwise.
+        """
+        names = self._get_motors_list(motors)
+        ids = [self.motors[motor].id for motor in names]
+        ids_values = self._sync_read_decoded(data_name, names, num_retry)
+        values = np.fromiter((ids_values[id_] for id_ in ids), dtype=np.int64, count=len(ids))
+
+        if normalize and data_name in self.normalized_data:
+            return self._normalize_array(self._get_calibration_rows(ids), values)
+        return values
+
+    def _sync_read_decoded(self, data_name: str, names: list[str], num_retry: int) -> dict[int, int]:
         if not self.is_connected:
             raise DeviceNotConnectedError(
                 f"{self.__class__.__name__}('{self.port}') is not connected. You need to run `{self.__class__.__name__}.connect()`."
@@ -1070,7 +1215,6 @@ class MotorsBus(abc.ABC):
 
         self._assert_protocol_is_compatible("sync_read")
 
-        names = self._get_motors_list(motors)
         ids = [self.motors[motor].id for motor in names]
         models = [self.motors[motor].model for motor in names]
 
@@ -1085,12 +1229,7 @@ class MotorsBus(abc.ABC):
             addr, length, ids, num_retry=num_retry, raise_on_error=True, err_msg=err_msg
         )
 
-        ids_values = self._decode_sign(data_name, ids_values)
-
-        if normalize and data_name in self.normalized_data:
-            ids_values = self._normalize(ids_values)
-
-        return {self._id_to_name(id_): value for id_, value in ids_values.items()}
+        return self._decode_sign(data_name, ids_values)
 
     def _sync_read(
         self,
@@ -1166,12 +1305,7 @@ class MotorsBus(abc.ABC):
             )
 
         ids_values = self._get_ids_values_dict(values)
-        models = [self._id_to_model(id_) for id_ in ids_values]
-        if self._has_different_ctrl_tables:
-            assert_same_address(self.model_ctrl_table, models, data_name)
-
-        model = next(iter(models))
-        addr, length = get_address(self.model_ctrl_table, model, data_name)
+        addr, length = self._get_sync_write_address(data_name, list(ids_values))
 
         if normalize and data_name in self.normalized_data:
             ids_values = self._unnormalize(ids_values)
@@ -1181,6 +1315,56 @@ class MotorsBus(abc.ABC):
         err_msg = f"Failed to sync write '{data_name}' with {ids_values=} after {num_retry + 1} tries."
         self._sync_write(addr, length, ids_values, num_retry=num_retry, raise_on_error=True, err_msg=err_msg)
 
+    def sync_write_array(
+        self,
+        data_name: str,
+        values: np.ndarray,
+        motors: str | list[str] | None = None,
+        *,
+        normalize: bool = True,
+        num_retry: int = 1,
+    ) -> None:
+        """Write the same register on multiple motors, from an array.
+
+        Same as :pymeth:`sync_write`, without building a dictionary of the values, for high frequency
+        control loops. Values are unnormalized with a single vectorized operation for all the motors.
+
+        Args:
+            data_name (str): Register name.
+            values (np.ndarray): Values in the order of *motors*.
+            motors (str | list[str] | None, optional): Motors to write. `None` (default) writes every motor.
+            normalize (bool, optional): If `True` (default) convert values from the user range to raw units.
+            num_retry (int, optional): Retry attempts.  Defaults to `0`.
+        """
+        if not self.is_connected:
+            raise DeviceNotConnectedError(
+                f"{self.__class__.__name__}('{self.port}') is not connected. You need to run `{self.__class__.__name__}.connect()`."
+            )
+
+        names = self._get_motors_list(motors)
+        values = np.asarray(values)
+        if values.shape != (len(names),):
+            raise ValueError(f"Expected {len(names)} values for motors {names}, got shape {values.shape}.")
+
+        ids = [self.motors[motor].id for motor in names]
+        addr, length = self._get_sync_write_address(data_name, ids)
+
+        if normalize and data_name in self.normalized_data:
+            values = self._unnormalize_array(self._get_calibration_rows(ids), values)
+
+        ids_values = self._encode_sign(data_name, dict(zip(ids, values.tolist(), strict=True)))
+
+        err_msg = f"Failed to sync write '{data_name}' with {ids_values=} after {num_retry + 1} tries."
+        self._sync_write(addr, length, ids_values, num_retry=num_retry, raise_on_error=True, err_msg=err_msg)
+
+    def _get_sync_write_address(self, data_name: str, motor_ids: list[int]) -> tuple[int, int]:
+        models = [self._id_to_model(id_) for id_ in motor_ids]
+        if self._has_different_ctrl_tables:
+            assert_same_address(self.model_ctrl_table, models, data_name)
+
+        model = next(iter(models))
+        return get_address(self.model_ctrl_table, model, data_name)
+
     def _sync_write(
         self,
         addr: int,
@@ -41,10 +41,25 @@ class ConcurrencyConfig:
     Possible values are:
     - "threads": Use threads for the actor and learner.
     - "processes": Use processes for the actor and learner.
+
+    `learner_ingestion` controls where the learner writes received transitions into the replay buffer:
+    - "inline": The training loop drains the transitions queue between two optimization steps.
+    - "process": The gRPC communication process writes transitions into a shared-memory replay buffer
+      and the training process only samples from it. Requires `learner="processes"` and a CPU
+      `storage_device`.
     """
 
     actor: str = "threads"
     learner: str = "threads"
+    learner_ingestion: str = "inline"
+
+    def __post_init__(self):
+        if self.learner_ingestion not in ("inline", "process"):
+            raise ValueError(
+                f"learner_ingestion must be 'inline' or 'process', got '{self.learner_ingestion}'."
+            )
+        if self.learner_ingestion == "process" and self.learner != "processes":
+            raise ValueError("learner_ingestion='process' requires learner='processes'.")
 
 
 @dataclass
@@ -53,6 +68,12 @@ class ActorLearnerConfig:
     learner_port: int = 50051
     policy_parameters_push_frequency: int = 4
     queue_get_timeout: float = 2
+    # Identifier sent by the actor to the learner, defaults to "<hostname>-<pid>" on the actor side
+    actor_id: str | None = None
+    # Maximum number of actors streaming to the same learner, used to size the learner gRPC server
+    max_actors: int = 1
+    # Number of transition messages buffered per actor on the learner before the actor stream is throttled
+    transitions_queue_size_per_actor: int = 8
 
 
 @dataclass
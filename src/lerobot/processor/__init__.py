@@ -25,6 +25,7 @@ from .core import (
     EnvTransition,
     PolicyAction,
     RobotAction,
+    RobotActionBatch,
     RobotObservation,
     TransitionKey,
 )
@@ -50,7 +51,13 @@ from .hil_processor import (
     TimeLimitProcessorStep,
 )
 from .joint_observations_processor import JointVelocityProcessorStep, MotorCurrentProcessorStep
-from .normalize_processor import NormalizerProcessorStep, UnnormalizerProcessorStep, hotswap_stats
+from .normalize_processor import (
+    NormalizationStatsRegistry,
+    NormalizerProcessorStep,
+    UnnormalizerProcessorStep,
+    hotswap_stats,
+    select_stats,
+)
 from .observation_processor import VanillaObservationProcessorStep
 from .pipeline import (
     ActionProcessorStep,
@@ -74,6 +81,7 @@ from .policy_robot_bridge import (
     PolicyActionToRobotActionProcessorStep,
     RobotActionToPolicyActionProcessorStep,
 )
+from .profiler import ProcessorProfiler
 from .rename_processor import RenameObservationsProcessorStep
 from .tokenizer_processor import TokenizerProcessorStep
 
@@ -102,6 +110,7 @@ __all__ = [
     "MapDeltaActionToRobotActionStep",
     "MapTensorToDeltaActionDictStep",
     "MotorCurrentProcessorStep",
+    "NormalizationStatsRegistry",
     "NormalizerProcessorStep",
     "Numpy2TorchActionProcessorStep",
     "ObservationProcessorStep",
@@ -109,14 +118,17 @@ __all__ = [
     "PolicyActionProcessorStep",
     "PolicyProcessorPipeline",
     "ProcessorKwargs",
+    "ProcessorProfiler",
     "ProcessorStep",
     "ProcessorStepRegistry",
     "RobotAction",
+    "RobotActionBatch",
     "RobotActionProcessorStep",
     "RobotObservation",
     "RenameObservationsProcessorStep",
     "RewardClassifierProcessorStep",
     "RewardProcessorStep",
+    "select_stats",
     "DataProcessorPipeline",
     "TimeLimitProcessorStep",
     "AddBatchDimensionProcessorStep",
@@ -236,6 +236,20 @@ class AddBatchDimensionProcessorStep(ProcessorStep):
             transition = self.to_batch_complementary_data_processor(transition)
         return transition
 
+    def process_in_place(self, transition: EnvTransition) -> None:
+        """
+        Adds a batch dimension to all relevant parts of a transition owned by the caller, in place.
+
+        Args:
+            transition: The environment transition to update.
+        """
+        if transition[TransitionKey.ACTION] is not None:
+            self.to_batch_action_processor.process_in_place(transition)
+        if transition[TransitionKey.OBSERVATION] is not None:
+            self.to_batch_observation_processor.process_in_place(transition)
+        if transition[TransitionKey.COMPLEMENTARY_DATA] is not None:
+            self.to_batch_complementary_data_processor.process_in_place(transition)
+
     def transform_features(
         self, features: dict[PipelineFeatureType, dict[str, PolicyFeature]]
     ) -> dict[PipelineFeatureType, dict[str, PolicyFeature]]:
@@ -57,12 +57,11 @@ def to_tensor(
 
 @to_tensor.register(torch.Tensor)
 def _(value: torch.Tensor, *, dtype=torch.float32, device=None, **kwargs) -> torch.Tensor:
-    """Handle conversion for existing PyTorch tensors."""
-    if dtype is not None:
-        value = value.to(dtype=dtype)
-    if device is not None:
-        value = value.to(device=device)
-    return value
+    """Handle conversion for existing PyTorch tensors, returning them as is when they need no conversion."""
+    if (dtype is None or value.dtype == dtype) and (device is None or value.device == torch.device(device)):
+        return value
+    # A single conversion, instead of an intermediate copy in the new dtype on the current device
+    return value.to(device=device, dtype=dtype)
 
 
 @to_tensor.register(np.ndarray)
@@ -80,16 +79,11 @@ def _(
         scalar_value = value.item()
         return torch.tensor(scalar_value, dtype=dtype, device=device)
 
-    # Create tensor from numpy array.
+    # Create tensor from numpy array, sharing its memory.
     tensor = torch.from_numpy(value)
 
-    # Apply dtype and device conversion if specified.
-    if dtype is not None:
-        tensor = tensor.to(dtype=dtype)
-    if device is not None:
-        tensor = tensor.to(device=device)
-
-    return tensor
+    # Apply dtype and device conversion if specified, copying only if needed.
+    return to_tensor(tensor, dtype=dtype, device=device)
 
 
 @to_tensor.register(int)
@@ -114,27 +108,12 @@ def _(value: dict, *, device=None, **kwargs) -> dict:
     if not value:
         return {}
 
-    result = {}
-    for key, sub_value in value.items():
-        if sub_value is None:
-            continue
-
-        if isinstance(sub_value, dict):
-            # Recursively process nested dictionaries.
-            result[key] = to_tensor(
-                sub_value,
-                device=device,
-                **kwargs,
-            )
-            continue
-
-        # Convert individual values to tensors.
-        result[key] = to_tensor(
-            sub_value,
-            device=device,
-            **kwargs,
-        )
-    return result
+    # Nested dictionaries are processed recursively, other values are converted to tensors.
+    return {
+        key: to_tensor(sub_value, device=device, **kwargs)
+        for key, sub_value in value.items()
+        if sub_value is not None
+    }
 
 
 def from_tensor_to_numpy(x: torch.Tensor | Any) -> np.ndarray | float | int | Any:
@@ -154,11 +133,19 @@ def from_tensor_to_numpy(x: torch.Tensor | Any) -> np.ndarray | float | int | An
     return x
 
 
+# Keys of a batch, besides the padding flags, that are carried as complementary data
+_COMPLEMENTARY_DATA_KEYS = frozenset({"task", "index", "task_index", "episode_index", "stats_id"})
+
+
+def _is_complementary_data_key(key: str) -> bool:
+    return "_is_pad" in key or key in _COMPLEMENTARY_DATA_KEYS
+
+
 def _extract_complementary_data(batch: dict[str, Any]) -> dict[str, Any]:
     """
     Extract complementary data from a batch dictionary.
 
-    This includes padding flags, task description, and indices.
+    This includes padding flags, task description, indices, and the id of the normalization stats.
 
     Args:
         batch: The batch dictionary.
@@ -166,13 +153,7 @@ def _extract_complementary_data(batch: dict[str, Any]) -> dict[str, Any]:
     Returns:
         A dictionary with the extracted complementary data.
     """
-    pad_keys = {k: v for k, v in batch.items() if "_is_pad" in k}
-    task_key = {"task": batch["task"]} if "task" in batch else {}
-    index_key = {"index": batch["index"]} if "index" in batch else {}
-    task_index_key = {"task_index": batch["task_index"]} if "task_index" in batch else {}
-    episode_index_key = {"episode_index": batch["episode_index"]} if "episode_index" in batch else {}
-
-    return {**pad_keys, **task_key, **index_key, **task_index_key, **episode_index_key}
+    return {k: v for k, v in batch.items() if _is_complementary_data_key(k)}
 
 
 def create_transition(
@@ -349,12 +330,17 @@ def batch_to_transition(batch: dict[str, Any]) -> EnvTransition:
     if action is not None and not isinstance(action, PolicyAction):
         raise ValueError(f"Action should be a PolicyAction type got {type(action)}")
 
-    # Extract observation and complementary data keys.
-    observation_keys = {k: v for k, v in batch.items() if k.startswith(OBS_PREFIX)}
-    complementary_data = _extract_complementary_data(batch)
+    # Extract observation and complementary data keys in a single pass. The values are shared with the batch.
+    observation = {}
+    complementary_data = {}
+    for key, value in batch.items():
+        if key.startswith(OBS_PREFIX):
+            observation[key] = value
+        if _is_complementary_data_key(key):
+            complementary_data[key] = value
 
     return create_transition(
-        observation=observation_keys if observation_keys else None,
+        observation=observation if observation else None,
         action=batch.get(ACTION),
         reward=batch.get(REWARD, 0.0),
         done=batch.get(DONE, False),
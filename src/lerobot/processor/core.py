@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Mapping, Sequence
 from enum import Enum
 from typing import Any, TypeAlias, TypedDict
 
@@ -42,11 +43,130 @@ EnvAction: TypeAlias = np.ndarray
 RobotObservation: TypeAlias = dict[str, Any]
 
 
+class RobotActionBatch:
+    """
+    The actions of a batch of robots, as a `(B, D)` tensor whose columns follow a fixed key order.
+
+    It is the batched counterpart of `RobotAction`: the column of a key holds the values of the
+    `{key: value}` entries of the robot actions, e.g. `"shoulder_pan.pos"` or `"ee.x"`. The robot action steps
+    supporting it process all the robots at once with tensor operations instead of looping over dicts,
+    for multi-robot setups and vectorized simulation environments. Boolean entries such as `"enabled"` are
+    stored as 0/1 values.
+
+    Args:
+        keys: The keys of the columns.
+        values: The `(B, D)` tensor of the actions, with `D == len(keys)`.
+
+    Raises:
+        ValueError: If the values are not a 2D tensor with one column per key, or if keys are repeated.
+    """
+
+    __slots__ = ("keys", "values", "_index")
+
+    def __init__(self, keys: Sequence[str], values: torch.Tensor):
+        keys = tuple(keys)
+        if values.dim() != 2 or values.shape[1] != len(keys):
+            raise ValueError(
+                f"RobotActionBatch values should be of shape (B, {len(keys)}), got {tuple(values.shape)}"
+            )
+        index = {key: i for i, key in enumerate(keys)}
+        if len(index) != len(keys):
+            raise ValueError(f"RobotActionBatch keys should be unique, got {keys}")
+        self.keys = keys
+        self.values = values
+        self._index = index
+
+    @classmethod
+    def from_dicts(
+        cls,
+        actions: RobotAction | Sequence[RobotAction],
+        keys: Sequence[str] | None = None,
+        dtype: torch.dtype = torch.float32,
+        device: torch.device | str | None = None,
+    ) -> RobotActionBatch:
+        """
+        Stacks robot actions into a batch.
+
+        Args:
+            actions: A robot action, or the robot actions of the batch.
+            keys: The key order of the columns. Defaults to the keys of the first action.
+            dtype: The dtype of the values.
+            device: The device of the values.
+
+        Returns:
+            The batch of the actions.
+        """
+        if isinstance(actions, Mapping):
+            actions = [actions]
+        keys = tuple(actions[0]) if keys is None else tuple(keys)
+        rows = [[float(action[key]) for key in keys] for action in actions]
+        return cls(keys, torch.tensor(rows, dtype=dtype, device=device).reshape(len(rows), len(keys)))
+
+    def to_dicts(self) -> list[RobotAction]:
+        """Splits the batch into one robot action of Python floats per robot."""
+        return [dict(zip(self.keys, row, strict=True)) for row in self.values.tolist()]
+
+    @property
+    def batch_size(self) -> int:
+        return self.values.shape[0]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def __getitem__(self, key: str) -> torch.Tensor:
+        """Returns the `(B,)` column of a key, as a view of the values."""
+        try:
+            return self.values[:, self._index[key]]
+        except KeyError:
+            raise KeyError(
+                f"'{key}' is not in the actions of the batch, available keys: {self.keys}"
+            ) from None
+
+    def columns(self, keys: Sequence[str]) -> torch.Tensor:
+        """Returns the `(B, len(keys))` columns of keys, as a view of the values if they are contiguous."""
+        indices = [self._index[key] for key in keys]
+        start = indices[0] if indices else 0
+        if indices == list(range(start, start + len(indices))):
+            return self.values[:, start : start + len(indices)]
+        return self.values[:, indices]
+
+    def with_columns(
+        self, columns: Mapping[str, torch.Tensor] | None = None, drop: Iterable[str] = ()
+    ) -> RobotActionBatch:
+        """
+        Returns a new batch with columns replaced or added, and others dropped.
+
+        Args:
+            columns: `(B,)` or `(B, 1)` tensors by key. Existing keys keep their position, new keys are
+                appended in the order of the mapping.
+            drop: Keys to remove, like the `pop` of a `RobotAction`.
+
+        Returns:
+            The new batch. The values of the input batch are not modified.
+        """
+        columns = dict(columns or {})
+        dropped = set(drop) - columns.keys()
+        keys = [key for key in self.keys if key not in dropped]
+        # Indexing with a list copies the kept columns, which are then replaced in place
+        values = self.values[:, [self._index[key] for key in keys]]
+        for i, key in enumerate(keys):
+            if key in columns:
+                values[:, i] = columns[key].reshape(-1)
+        new_keys = [key for key in columns if key not in self._index]
+        if new_keys:
+            new_values = torch.stack([columns[key].reshape(-1).to(values) for key in new_keys], dim=1)
+            values = torch.cat([values, new_values], dim=1)
+        return RobotActionBatch(keys + new_keys, values)
+
+    def __repr__(self) -> str:
+        return f"RobotActionBatch(keys={self.keys}, values={self.values!r})"
+
+
 EnvTransition = TypedDict(
     "EnvTransition",
     {
         TransitionKey.OBSERVATION.value: dict[str, Any] | None,
-        TransitionKey.ACTION.value: PolicyAction | RobotAction | EnvAction | None,
+        TransitionKey.ACTION.value: PolicyAction | RobotAction | RobotActionBatch | EnvAction | None,
         TransitionKey.REWARD.value: float | torch.Tensor | None,
         TransitionKey.DONE.value: bool | torch.Tensor | None,
         TransitionKey.TRUNCATED.value: bool | torch.Tensor | None,
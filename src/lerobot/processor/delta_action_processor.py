@@ -16,9 +16,11 @@
 
 from dataclasses import dataclass
 
+import torch
+
 from lerobot.configs.types import FeatureType, PipelineFeatureType, PolicyFeature
 
-from .core import PolicyAction, RobotAction
+from .core import PolicyAction, RobotAction, RobotActionBatch
 from .pipeline import ActionProcessorStep, ProcessorStepRegistry, RobotActionProcessorStep
 
 
@@ -32,6 +34,9 @@ class MapTensorToDeltaActionDictStep(ActionProcessorStep):
     It decomposes the vector into named components for delta movements of the
     end-effector (x, y, z) and optionally the gripper.
 
+    A `(B, 3)` or `(B, 4)` tensor with several rows is mapped to a `RobotActionBatch` of the same
+    components, with a row per robot.
+
     Attributes:
         use_gripper: If True, assumes the 4th element of the tensor is the
                      gripper action.
@@ -39,10 +44,18 @@ class MapTensorToDeltaActionDictStep(ActionProcessorStep):
 
     use_gripper: bool = True
 
-    def action(self, action: PolicyAction) -> RobotAction:
+    def action(self, action: PolicyAction) -> RobotAction | RobotActionBatch:
         if not isinstance(action, PolicyAction):
             raise ValueError("Only PolicyAction is supported for this processor")
 
+        if action.dim() > 1 and action.shape[0] > 1:
+            keys = (
+                ["delta_x", "delta_y", "delta_z", "gripper"]
+                if self.use_gripper
+                else ["delta_x", "delta_y", "delta_z"]
+            )
+            return RobotActionBatch(keys, action[:, : len(keys)])
+
         if action.dim() > 1:
             action = action.squeeze(0)
 
@@ -129,6 +142,22 @@ class MapDeltaActionToRobotActionStep(RobotActionProcessorStep):
 
         return action
 
+    def batched_action(self, action: RobotActionBatch) -> RobotActionBatch:
+        deltas = action.columns(["delta_x", "delta_y", "delta_z"])
+        enabled = torch.linalg.vector_norm(deltas, dim=1, keepdim=True) > self.noise_threshold
+        values = torch.cat(
+            [
+                enabled.to(deltas.dtype),
+                deltas * self.position_scale,
+                # No rotation input from gamepads and keyboards
+                torch.zeros_like(deltas),
+                action.columns(["gripper"]),
+            ],
+            dim=1,
+        )
+        keys = ["enabled", "target_x", "target_y", "target_z", "target_wx", "target_wy", "target_wz"]
+        return RobotActionBatch([*keys, "gripper_vel"], values)
+
     def transform_features(
         self, features: dict[PipelineFeatureType, dict[str, PolicyFeature]]
     ) -> dict[PipelineFeatureType, dict[str, PolicyFeature]]:
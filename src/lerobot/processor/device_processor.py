@@ -44,10 +44,16 @@ class DeviceProcessorStep(ProcessorStep):
         device: The target device for tensors (e.g., "cpu", "cuda", "cuda:0").
         float_dtype: The target floating-point dtype as a string (e.g., "float32", "float16", "bfloat16").
                      If None, the dtype is not changed.
+        pinned_staging: Whether to move the CPU tensors of a transition to a CUDA device together, packed in a
+                        single pinned staging buffer copied asynchronously on a side stream. The float dtype
+                        cast is fused with the packing, and the tensors are returned as views of the device
+                        buffer. This saves a transfer and a cast per tensor, which matters for the many small
+                        tensors of robot observations, which unlike DataLoader batches are not pinned already.
     """
 
     device: str = "cpu"
     float_dtype: str | None = None
+    pinned_staging: bool = False
 
     DTYPE_MAPPING = {
         "float16": torch.float16,
@@ -81,6 +87,17 @@ class DeviceProcessorStep(ProcessorStep):
         else:
             self._target_float_dtype = None
 
+        # Pinned staging buffer, reused across calls, with the event of the last copy reading it
+        self._staging: torch.Tensor | None = None
+        self._staging_copied: torch.cuda.Event | None = None
+        self._copy_stream: torch.cuda.Stream | None = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        # CUDA streams and events can't be copied, copies of the step (e.g. `hotswap_stats`) create their own
+        state = self.__dict__.copy()
+        state.update(_staging=None, _staging_copied=None, _copy_stream=None)
+        return state
+
     def _process_tensor(self, tensor: torch.Tensor) -> torch.Tensor:
         """
         Moves a single tensor to the target device and casts its dtype.
@@ -133,11 +150,25 @@ class DeviceProcessorStep(ProcessorStep):
             A new `EnvTransition` object with all tensors moved to the target device and dtype.
         """
         new_transition = transition.copy()
-        action = new_transition.get(TransitionKey.ACTION)
+        self.process_in_place(new_transition)
+        return new_transition
+
+    def process_in_place(self, transition: EnvTransition) -> None:
+        """
+        Applies device and dtype conversion to all tensors of a transition owned by the caller, in place.
+
+        Args:
+            transition: The `EnvTransition` to update.
+        """
+        action = transition.get(TransitionKey.ACTION)
 
         if action is not None and not isinstance(action, PolicyAction):
             raise ValueError(f"If action is not None should be a PolicyAction type got {type(action)}")
 
+        if self.pinned_staging and self.tensor_device.type == "cuda":
+            self._process_staged(transition)
+            return
+
         simple_tensor_keys = [
             TransitionKey.ACTION,
             TransitionKey.REWARD,
@@ -154,7 +185,7 @@ class DeviceProcessorStep(ProcessorStep):
         for key in simple_tensor_keys:
             value = transition.get(key)
             if isinstance(value, torch.Tensor):
-                new_transition[key] = self._process_tensor(value)
+                transition[key] = self._process_tensor(value)
 
         # Process tensors nested within dictionaries
         for key in dict_tensor_keys:
@@ -164,18 +195,109 @@ class DeviceProcessorStep(ProcessorStep):
                     k: self._process_tensor(v) if isinstance(v, torch.Tensor) else v
                     for k, v in data_dict.items()
                 }
-                new_transition[key] = new_data_dict
+                transition[key] = new_data_dict
 
-        return new_transition
+    def _process_staged(self, transition: EnvTransition) -> None:
+        """
+        Moves the CPU tensors of a transition to the CUDA device through the pinned staging buffer, in place.
+
+        Tensors already on a CUDA device go through `_process_tensor`.
+
+        Args:
+            transition: The `EnvTransition` to update.
+        """
+        # Containers and keys of the CPU tensors, to replace with their device views
+        staged: list[tuple[dict, Any, torch.Tensor]] = []
+
+        for key in (TransitionKey.ACTION, TransitionKey.REWARD, TransitionKey.DONE, TransitionKey.TRUNCATED):
+            value = transition.get(key)
+            if isinstance(value, torch.Tensor):
+                if value.device.type == "cpu":
+                    staged.append((transition, key, value))
+                else:
+                    transition[key] = self._process_tensor(value)
+
+        for key in (TransitionKey.OBSERVATION, TransitionKey.COMPLEMENTARY_DATA):
+            data_dict = transition.get(key)
+            if data_dict is None:
+                continue
+            new_data_dict = dict(data_dict)
+            for k, v in data_dict.items():
+                if isinstance(v, torch.Tensor):
+                    if v.device.type == "cpu":
+                        staged.append((new_data_dict, k, v))
+                    else:
+                        new_data_dict[k] = self._process_tensor(v)
+            transition[key] = new_data_dict
+
+        if staged:
+            device_tensors = self._copy_through_staging([tensor for _, _, tensor in staged])
+            for (container, key, _), device_tensor in zip(staged, device_tensors, strict=True):
+                container[key] = device_tensor
+
+    def _copy_through_staging(self, tensors: list[torch.Tensor]) -> list[torch.Tensor]:
+        """
+        Copies CPU tensors to the CUDA device with a single host to device transfer.
+
+        The tensors are cast to their target dtype while being packed in the pinned staging buffer, which is
+        copied on a side stream that the current stream then waits for.
+
+        Args:
+            tensors: The CPU tensors to move.
+
+        Returns:
+            The tensors on the device, as views of a buffer allocated for this call.
+        """
+        # Element sizes are at most 16 bytes, aligning every tensor on 64 bytes allows viewing it with its dtype
+        alignment = 64
+        layout = []
+        total = 0
+        for tensor in tensors:
+            dtype = (
+                self._target_float_dtype
+                if self._target_float_dtype is not None and tensor.is_floating_point()
+                else tensor.dtype
+            )
+            num_bytes = tensor.numel() * dtype.itemsize
+            layout.append((total, num_bytes, dtype, tensor.shape))
+            total += -(-num_bytes // alignment) * alignment
+
+        # The previous transfer must be done reading the staging buffer before it is overwritten
+        if self._staging_copied is not None:
+            self._staging_copied.synchronize()
+        if self._staging is None or self._staging.numel() < total:
+            self._staging = torch.empty(total, dtype=torch.uint8, pin_memory=True)
+
+        for tensor, (offset, num_bytes, dtype, shape) in zip(tensors, layout, strict=True):
+            self._staging[offset : offset + num_bytes].view(dtype).view(shape).copy_(tensor)
+
+        if self._copy_stream is None:
+            self._copy_stream = torch.cuda.Stream(self.tensor_device)
+            self._staging_copied = torch.cuda.Event()
+        current_stream = torch.cuda.current_stream(self.tensor_device)
+        with torch.cuda.stream(self._copy_stream):
+            device_buffer = self._staging[:total].to(self.tensor_device, non_blocking=True)
+            self._staging_copied.record(self._copy_stream)
+        current_stream.wait_stream(self._copy_stream)
+        # Allocated on the side stream but used on the current one, which the allocator must wait for
+        device_buffer.record_stream(current_stream)
+
+        return [
+            device_buffer[offset : offset + num_bytes].view(dtype).view(shape)
+            for offset, num_bytes, dtype, shape in layout
+        ]
 
     def get_config(self) -> dict[str, Any]:
         """
         Returns the serializable configuration of the processor.
 
         Returns:
-            A dictionary containing the device and float_dtype settings.
+            A dictionary containing the device and float_dtype settings, and pinned_staging if enabled.
         """
-        return {"device": self.device, "float_dtype": self.float_dtype}
+        config = {"device": self.device, "float_dtype": self.float_dtype}
+        if self.pinned_staging:
+            config["pinned_staging"] = True
+        return config
 
     def transform_features(
         self, features: dict[PipelineFeatureType, dict[str, PolicyFeature]]
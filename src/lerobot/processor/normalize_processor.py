@@ -17,6 +17,7 @@
 
 from __future__ import annotations
 
+import threading
 from copy import deepcopy
 from dataclasses import dataclass, field
 from typing import Any
@@ -32,6 +33,319 @@ from .converters import from_tensor_to_numpy, to_tensor
 from .core import EnvTransition, PolicyAction, TransitionKey
 from .pipeline import PolicyProcessorPipeline, ProcessorStep, ProcessorStepRegistry
 
+# Names of the low and high stats of the normalization modes mapping a range to [-1, 1]
+_RANGE_STATS = {
+    NormalizationMode.MIN_MAX: ("min", "max"),
+    NormalizationMode.QUANTILES: ("q01", "q99"),
+    NormalizationMode.QUANTILE10: ("q10", "q90"),
+}
+
+
+def _compute_affine_params(
+    stats: dict[str, Tensor], norm_mode: NormalizationMode, inverse: bool, eps: float
+) -> tuple[Tensor, Tensor]:
+    """
+    Computes in float32 the `(scale, offset)` such that the (un)normalization of a tensor is
+    `tensor * scale + offset`.
+
+    Args:
+        stats: The stats tensors of a feature.
+        norm_mode: The normalization mode of the feature.
+        inverse: If `True`, returns the parameters of the unnormalization.
+        eps: A small epsilon value to prevent division by zero.
+
+    Raises:
+        ValueError: If the normalization mode is not supported or the stats it requires are missing.
+    """
+    if norm_mode not in _RANGE_STATS and norm_mode != NormalizationMode.MEAN_STD:
+        raise ValueError(f"Unsupported normalization mode: {norm_mode}")
+
+    if norm_mode == NormalizationMode.MEAN_STD:
+        mean = stats.get("mean")
+        std = stats.get("std")
+        if mean is None or std is None:
+            raise ValueError(
+                "MEAN_STD normalization mode requires mean and std stats, please update the dataset with the correct stats"
+            )
+
+        mean, std = mean.float(), std.float()
+        if inverse:
+            scale, offset = std, mean
+        else:
+            # Avoid division by zero by adding a small epsilon.
+            scale = 1 / (std + eps)
+            offset = -mean * scale
+    else:
+        low_name, high_name = _RANGE_STATS[norm_mode]
+        low = stats.get(low_name)
+        high = stats.get(high_name)
+        if low is None or high is None:
+            message = (
+                f"{norm_mode.name} normalization mode requires {low_name} and {high_name} stats, "
+                "please update the dataset with the correct stats"
+            )
+            if norm_mode != NormalizationMode.MIN_MAX:
+                message += " using the `augment_dataset_quantile_stats.py` script"
+            raise ValueError(message)
+
+        low = low.float()
+        denom = high.float() - low
+        # When low == high, substitute the denominator with a small epsilon to prevent division by
+        # zero. This consistently maps an input equal to low to -1, ensuring a stable transformation.
+        denom = torch.where(denom == 0, torch.full_like(denom, eps), denom)
+        if inverse:
+            # Map from [-1, 1] back to [low, high]
+            scale = denom / 2
+            offset = scale + low
+        else:
+            # Map from [low, high] to [-1, 1]
+            scale = 2 / denom
+            offset = -low * scale - 1
+    return scale, offset
+
+
+def _affine_transform(tensor: Tensor, scale: Tensor, offset: Tensor) -> Tensor:
+    """Returns `tensor * scale + offset`, in the dtype of the parameters for non floating point tensors."""
+    if not tensor.is_floating_point():
+        tensor = tensor.to(scale.dtype)
+    # A single multiply-add instead of the subtractions, divisions and additions of each mode. CUDA fuses it
+    # in one kernel, while on CPU the in-place addition to the product is the fastest
+    if tensor.is_cuda:
+        return torch.addcmul(offset, tensor, scale)
+    return tensor.mul(scale).add_(offset)
+
+
+# Marks the cache misses of the affine parameters, None being a cached value
+_NOT_CACHED = object()
+
+
+class NormalizationStatsRegistry:
+    """
+    Normalization statistics of several datasets or robots, converted once to tensors on a device.
+
+    Normalization steps given a registry (un)normalize each transition with the stats of the id found under
+    their `stats_id_key` in its complementary data, or of their `stats_id` otherwise. The `(scale, offset)`
+    tensors derived from the stats are cached by the registry for every feature, mode and dtype, so that
+    switching between stats neither copies the pipeline nor converts or moves tensors. Batches mixing
+    several ids gather the parameters of every sample from the ones of their ids stacked together.
+
+    Examples:
+        ```python
+        registry = NormalizationStatsRegistry(device="cuda")
+        registry.register("aloha", aloha_dataset.meta.stats)
+        registry.register("so100", so100_dataset.meta.stats)
+
+        preprocessor, postprocessor = make_pre_post_processors(
+            policy.config,
+            pretrained_path,
+            preprocessor_overrides={"normalizer_processor": {"stats_registry": registry}},
+            postprocessor_overrides={"unnormalizer_processor": {"stats_registry": registry}},
+        )
+        # Per request, the preprocessor reads the id from the batch, the postprocessor has it selected
+        batch = preprocessor({**observation, "stats_id": "so100"})
+        action = select_stats(postprocessor, "so100")(policy.select_action(batch))
+        ```
+
+    Args:
+        stats: The initial stats, by id.
+        device: The device the stats are stored on.
+        dtype: The floating point dtype the stats are stored in.
+    """
+
+    def __init__(
+        self,
+        stats: dict[str, dict[str, dict[str, Any]]] | None = None,
+        device: torch.device | str | None = None,
+        dtype: torch.dtype = torch.float32,
+    ):
+        self.device = device
+        self.dtype = dtype
+        self._tensor_stats: dict[str, dict[str, dict[str, Tensor]]] = {}
+        self._affine_cache: dict[tuple, tuple[Tensor, Tensor] | None] = {}
+        # Registrations and cache misses are serialized, cache hits don't take the lock
+        self._lock = threading.RLock()
+        for stats_id, id_stats in (stats or {}).items():
+            self.register(stats_id, id_stats)
+
+    @property
+    def ids(self) -> list[str]:
+        """The ids of the registered stats."""
+        return list(self._tensor_stats)
+
+    def __contains__(self, stats_id: str) -> bool:
+        return stats_id in self._tensor_stats
+
+    def __len__(self) -> int:
+        return len(self._tensor_stats)
+
+    def __deepcopy__(self, memo) -> NormalizationStatsRegistry:
+        # Copies of a pipeline (e.g. `hotswap_stats`) share the registry of its steps
+        return self
+
+    def register(self, stats_id: str, stats: dict[str, dict[str, Any]]) -> None:
+        """Adds the stats of an id, or replaces its current stats."""
+        tensor_stats = to_tensor(stats, device=self.device, dtype=self.dtype)
+        with self._lock:
+            self._tensor_stats[stats_id] = tensor_stats
+            self._affine_cache.clear()
+
+    def unregister(self, stats_id: str) -> None:
+        """Removes the stats of an id."""
+        with self._lock:
+            del self._tensor_stats[stats_id]
+            self._affine_cache.clear()
+
+    def get(self, stats_id: str) -> dict[str, dict[str, Tensor]]:
+        """Returns the stats tensors of an id, by feature and stat name.
+
+        Raises:
+            KeyError: If no stats are registered under the id.
+        """
+        try:
+            return self._tensor_stats[stats_id]
+        except KeyError:
+            raise KeyError(
+                f"No normalization stats registered under '{stats_id}', registered ids: {self.ids}"
+            ) from None
+
+    def to(
+        self, device: torch.device | str | None = None, dtype: torch.dtype | None = None
+    ) -> NormalizationStatsRegistry:
+        """
+        Moves the stats of every id to the specified device and dtype.
+
+        Returns:
+            The registry, allowing for method chaining.
+        """
+        with self._lock:
+            if device is not None:
+                self.device = device
+            if dtype is not None:
+                self.dtype = dtype
+            self._tensor_stats = {
+                stats_id: {
+                    key: {
+                        name: tensor.to(device=self.device, dtype=self.dtype) for name, tensor in sub.items()
+                    }
+                    for key, sub in id_stats.items()
+                }
+                for stats_id, id_stats in self._tensor_stats.items()
+            }
+            self._affine_cache.clear()
+        return self
+
+    def affine_params(
+        self,
+        stats_id: str,
+        key: str,
+        norm_mode: NormalizationMode,
+        inverse: bool,
+        eps: float,
+        dtype: torch.dtype,
+    ) -> tuple[Tensor, Tensor] | None:
+        """
+        Returns the `(scale, offset)` tensors of a feature for the stats of an id.
+
+        Args:
+            stats_id: The id of the stats.
+            key: The feature key.
+            norm_mode: The normalization mode of the feature.
+            inverse: If `True`, returns the parameters of the unnormalization.
+            eps: A small epsilon value to prevent division by zero.
+            dtype: The floating point dtype of the returned tensors.
+
+        Returns:
+            The `(scale, offset)` tensors, or None if the stats of the id have no entry for the feature.
+        """
+        cache_key = (stats_id, key, norm_mode, inverse, eps, dtype)
+        # A single lookup, the cache may be cleared concurrently
+        params = self._affine_cache.get(cache_key, _NOT_CACHED)
+        if params is not _NOT_CACHED:
+            return params
+
+        with self._lock:
+            stats = self.get(stats_id).get(key)
+            params = None
+            if stats:
+                scale, offset = _compute_affine_params(stats, norm_mode, inverse, eps)
+                params = (scale.to(dtype), offset.to(dtype))
+            self._affine_cache[cache_key] = params
+        return params
+
+    def gather_affine_params(
+        self,
+        stats_ids: list[str],
+        key: str,
+        norm_mode: NormalizationMode,
+        inverse: bool,
+        eps: float,
+        dtype: torch.dtype,
+    ) -> tuple[Tensor, Tensor] | None:
+        """
+        Returns the `(scale, offset)` tensors of a feature for every sample of a batch, stacked along a first
+        batch dimension.
+
+        The parameters of the distinct ids of the batch are stacked once, and the rows of the samples are
+        gathered from them with a single index. Samples whose stats have no entry for the feature are left
+        unchanged, like the transitions using these stats alone.
+
+        Args:
+            stats_ids: The id of the stats of every sample.
+            key: The feature key.
+            norm_mode: The normalization mode of the feature.
+            inverse: If `True`, returns the parameters of the unnormalization.
+            eps: A small epsilon value to prevent division by zero.
+            dtype: The floating point dtype of the returned tensors.
+
+        Returns:
+            The `(scale, offset)` tensors, or None if none of the stats have an entry for the feature.
+
+        Raises:
+            ValueError: If the stats of the ids have different shapes for the feature.
+        """
+        # Sorted, so that batches mixing the same ids in any order share their stacked parameters
+        distinct_ids = tuple(sorted(set(stats_ids)))
+        cache_key = (distinct_ids, key, norm_mode, inverse, eps, dtype)
+        stacked = self._affine_cache.get(cache_key, _NOT_CACHED)
+        if stacked is _NOT_CACHED:
+            with self._lock:
+                stacked = self._stack_affine_params(distinct_ids, key, norm_mode, inverse, eps, dtype)
+                self._affine_cache[cache_key] = stacked
+        if stacked is None:
+            return None
+
+        scale, offset = stacked
+        positions = {stats_id: position for position, stats_id in enumerate(distinct_ids)}
+        index = torch.tensor([positions[stats_id] for stats_id in stats_ids], device=scale.device)
+        return scale.index_select(0, index), offset.index_select(0, index)
+
+    def _stack_affine_params(
+        self,
+        stats_ids: tuple[str, ...],
+        key: str,
+        norm_mode: NormalizationMode,
+        inverse: bool,
+        eps: float,
+        dtype: torch.dtype,
+    ) -> tuple[Tensor, Tensor] | None:
+        id_params = [self.affine_params(i, key, norm_mode, inverse, eps, dtype) for i in stats_ids]
+        reference = next((params for params in id_params if params is not None), None)
+        if reference is None:
+            return None
+
+        shapes = {tuple(params[0].shape) for params in id_params if params is not None}
+        if len(shapes) > 1:
+            raise ValueError(
+                f"The stats of {list(stats_ids)} for '{key}' have different shapes {sorted(shapes)}, "
+                "they can't be used in the same batch"
+            )
+        # Identity rows for the ids without stats for the feature
+        id_params = [
+            params or (torch.ones_like(reference[0]), torch.zeros_like(reference[1])) for params in id_params
+        ]
+        scales, offsets = zip(*id_params, strict=True)
+        return torch.stack(scales), torch.stack(offsets)
+
 
 @dataclass
 class _NormalizationMixin:
@@ -80,10 +394,19 @@ class _NormalizationMixin:
             calculations.
         normalize_observation_keys: An optional set of keys to selectively apply
             normalization to specific observation features.
+        stats_registry: An optional `NormalizationStatsRegistry` to select the stats of each
+            transition from, instead of using `stats`.
+        stats_id: The id of the registry stats used for the transitions that don't specify one.
+            If None, these transitions use `stats`.
+        stats_id_key: The key in `complementary_data` of the id of the registry stats of a
+            transition, either a single id or one id per sample of a batch. The registry
+            settings are runtime settings, they are not saved with the processor's configuration.
         _tensor_stats: An internal dictionary holding the normalization statistics as
             PyTorch tensors.
         _stats_explicitly_provided: Internal flag tracking whether stats were explicitly
             provided during construction (used for override preservation).
+        _affine_cache: An internal cache of the `(scale, offset)` tensors each feature is
+            (un)normalized with, along with the stats tensors they were computed from.
     """
 
     features: dict[str, PolicyFeature]
@@ -93,9 +416,15 @@ class _NormalizationMixin:
     dtype: torch.dtype | None = None
     eps: float = 1e-8
     normalize_observation_keys: set[str] | None = None
+    stats_registry: NormalizationStatsRegistry | None = None
+    stats_id: str | None = None
+    stats_id_key: str = "stats_id"
 
     _tensor_stats: dict[str, dict[str, Tensor]] = field(default_factory=dict, init=False, repr=False)
     _stats_explicitly_provided: bool = field(default=False, init=False, repr=False)
+    _affine_cache: dict[tuple[str, NormalizationMode, bool], tuple[Tensor, Tensor, dict[str, Tensor]]] = (
+        field(default_factory=dict, init=False, repr=False)
+    )
 
     def __post_init__(self):
         """
@@ -239,13 +568,38 @@ class _NormalizationMixin:
             config["normalize_observation_keys"] = sorted(self.normalize_observation_keys)
         return config
 
-    def _normalize_observation(self, observation: dict[str, Any], inverse: bool) -> dict[str, Tensor]:
+    def _select_stats_id(self, transition: EnvTransition) -> str | list[str] | None:
+        """
+        Returns the id of the registry stats to (un)normalize a transition with.
+
+        Args:
+            transition: The transition to process.
+
+        Returns:
+            A single id for the whole transition, one id per sample of a batch mixing several of them, or
+            None if the transition is processed with the step's own stats.
+        """
+        if self.stats_registry is None:
+            return None
+        complementary_data = transition.get(TransitionKey.COMPLEMENTARY_DATA) or {}
+        stats_id = complementary_data.get(self.stats_id_key)
+        if stats_id is None:
+            return self.stats_id
+        if isinstance(stats_id, str):
+            return stats_id
+        stats_ids = list(stats_id)
+        return stats_ids[0] if len(set(stats_ids)) == 1 else stats_ids
+
+    def _normalize_observation(
+        self, observation: dict[str, Any], inverse: bool, stats_id: str | list[str] | None = None
+    ) -> dict[str, Tensor]:
         """
         Applies (un)normalization to all relevant features in an observation dictionary.
 
         Args:
             observation: The observation dictionary to process.
             inverse: If `True`, applies unnormalization; otherwise, applies normalization.
+            stats_id: The id of the registry stats to use, see `_select_stats_id`.
 
         Returns:
             A new observation dictionary with the transformed tensor values.
@@ -257,10 +611,14 @@ class _NormalizationMixin:
             if feature.type != FeatureType.ACTION and key in new_observation:
                 # Convert to tensor but preserve original dtype for adaptation logic
                 tensor = torch.as_tensor(new_observation[key])
-                new_observation[key] = self._apply_transform(tensor, key, feature.type, inverse=inverse)
+                new_observation[key] = self._apply_transform(
+                    tensor, key, feature.type, inverse=inverse, stats_id=stats_id
+                )
         return new_observation
 
-    def _normalize_action(self, action: Tensor, inverse: bool) -> Tensor:
+    def _normalize_action(
+        self, action: Tensor, inverse: bool, stats_id: str | list[str] | None = None
+    ) -> Tensor:
         # Convert to tensor but preserve original dtype for adaptation logic
         """
         Applies (un)normalization to an action tensor.
@@ -268,15 +626,24 @@ class _NormalizationMixin:
         Args:
             action: The action tensor to process.
             inverse: If `True`, applies unnormalization; otherwise, applies normalization.
+            stats_id: The id of the registry stats to use, see `_select_stats_id`.
 
         Returns:
             The transformed action tensor.
         """
-        processed_action = self._apply_transform(action, ACTION, FeatureType.ACTION, inverse=inverse)
+        processed_action = self._apply_transform(
+            action, ACTION, FeatureType.ACTION, inverse=inverse, stats_id=stats_id
+        )
         return processed_action
 
     def _apply_transform(
-        self, tensor: Tensor, key: str, feature_type: FeatureType, *, inverse: bool = False
+        self,
+        tensor: Tensor,
+        key: str,
+        feature_type: FeatureType,
+        *,
+        inverse: bool = False,
+        stats_id: str | list[str] | None = None,
     ) -> Tensor:
         """
         Core logic to apply a normalization or unnormalization transformation to a tensor.
@@ -295,6 +662,8 @@ class _NormalizationMixin:
             key: The feature key corresponding to the tensor.
             feature_type: The `FeatureType` of the tensor.
             inverse: If `True`, applies the inverse transformation (unnormalization).
+            stats_id: The id of the registry stats to use, see `_select_stats_id`. If None, the step's own
+                stats are used.
 
         Returns:
             The transformed tensor.
@@ -303,7 +672,11 @@ class _NormalizationMixin:
             ValueError: If an unsupported normalization mode is encountered.
         """
         norm_mode = self.norm_map.get(feature_type, NormalizationMode.IDENTITY)
-        if norm_mode == NormalizationMode.IDENTITY or key not in self._tensor_stats:
+        if norm_mode == NormalizationMode.IDENTITY:
+            return tensor
+        if stats_id is not None:
+            return self._apply_registry_transform(tensor, key, norm_mode, inverse, stats_id)
+        if key not in self._tensor_stats:
             return tensor
 
         if norm_mode not in (
@@ -320,81 +693,81 @@ class _NormalizationMixin:
             if first_stat.device != tensor.device or first_stat.dtype != tensor.dtype:
                 self.to(device=tensor.device, dtype=tensor.dtype)
 
-        stats = self._tensor_stats[key]
+        scale, offset = self._affine_params(key, norm_mode, inverse)
+        return _affine_transform(tensor, scale, offset)
 
-        if norm_mode == NormalizationMode.MEAN_STD:
-            mean = stats.get("mean", None)
-            std = stats.get("std", None)
-            if mean is None or std is None:
-                raise ValueError(
-                    "MEAN_STD normalization mode requires mean and std stats, please update the dataset with the correct stats"
-                )
+    def _apply_registry_transform(
+        self,
+        tensor: Tensor,
+        key: str,
+        norm_mode: NormalizationMode,
+        inverse: bool,
+        stats_id: str | list[str],
+    ) -> Tensor:
+        """
+        Applies the (un)normalization of a tensor with the stats of the registry.
 
-            mean, std = stats["mean"], stats["std"]
-            # Avoid division by zero by adding a small epsilon.
-            denom = std + self.eps
-            if inverse:
-                return tensor * std + mean
-            return (tensor - mean) / denom
-
-        if norm_mode == NormalizationMode.MIN_MAX:
-            min_val = stats.get("min", None)
-            max_val = stats.get("max", None)
-            if min_val is None or max_val is None:
-                raise ValueError(
-                    "MIN_MAX normalization mode requires min and max stats, please update the dataset with the correct stats"
-                )
+        Unlike the step's own stats, the registry stats are never moved: the tensor must be on the device of
+        the registry, and the `(scale, offset)` tensors of every dtype it comes in are cached by the registry.
 
-            min_val, max_val = stats["min"], stats["max"]
-            denom = max_val - min_val
-            # When min_val == max_val, substitute the denominator with a small epsilon
-            # to prevent division by zero. This consistently maps an input equal to
-            # min_val to -1, ensuring a stable transformation.
-            denom = torch.where(
-                denom == 0, torch.tensor(self.eps, device=tensor.device, dtype=tensor.dtype), denom
-            )
-            if inverse:
-                # Map from [-1, 1] back to [min, max]
-                return (tensor + 1) / 2 * denom + min_val
-            # Map from [min, max] to [-1, 1]
-            return 2 * (tensor - min_val) / denom - 1
-
-        if norm_mode == NormalizationMode.QUANTILES:
-            q01 = stats.get("q01", None)
-            q99 = stats.get("q99", None)
-            if q01 is None or q99 is None:
+        Raises:
+            ValueError: If the tensor is not on the device of the registry, or if the batch size of the tensor
+                does not match the number of ids.
+        """
+        dtype = tensor.dtype if tensor.is_floating_point() else self.stats_registry.dtype
+        if isinstance(stats_id, str):
+            params = self.stats_registry.affine_params(stats_id, key, norm_mode, inverse, self.eps, dtype)
+        else:
+            if tensor.dim() == 0 or tensor.shape[0] != len(stats_id):
                 raise ValueError(
-                    "QUANTILES normalization mode requires q01 and q99 stats, please update the dataset with the correct stats using the `augment_dataset_quantile_stats.py` script"
+                    f"'{key}' of shape {tuple(tensor.shape)} does not have a batch dimension matching "
+                    f"its {len(stats_id)} stats ids"
                 )
-
-            denom = q99 - q01
-            # Avoid division by zero by adding epsilon when quantiles are identical
-            denom = torch.where(
-                denom == 0, torch.tensor(self.eps, device=tensor.device, dtype=tensor.dtype), denom
+            params = self.stats_registry.gather_affine_params(
+                stats_id, key, norm_mode, inverse, self.eps, dtype
             )
-            if inverse:
-                return (tensor + 1.0) * denom / 2.0 + q01
-            return 2.0 * (tensor - q01) / denom - 1.0
-
-        if norm_mode == NormalizationMode.QUANTILE10:
-            q10 = stats.get("q10", None)
-            q90 = stats.get("q90", None)
-            if q10 is None or q90 is None:
-                raise ValueError(
-                    "QUANTILE10 normalization mode requires q10 and q90 stats, please update the dataset with the correct stats using the `augment_dataset_quantile_stats.py` script"
-                )
+        if params is None:
+            return tensor
 
-            denom = q90 - q10
-            # Avoid division by zero by adding epsilon when quantiles are identical
-            denom = torch.where(
-                denom == 0, torch.tensor(self.eps, device=tensor.device, dtype=tensor.dtype), denom
+        scale, offset = params
+        if scale.device != tensor.device:
+            raise ValueError(
+                f"'{key}' is on {tensor.device} while the stats registry is on {scale.device}, "
+                "move the registry with `stats_registry.to(device)`"
             )
-            if inverse:
-                return (tensor + 1.0) * denom / 2.0 + q10
-            return 2.0 * (tensor - q10) / denom - 1.0
+        if not isinstance(stats_id, str):
+            # Per-sample rows, broadcast over the dimensions between the batch and the feature ones
+            middle_dims = tensor.dim() - scale.dim()
+            scale = scale.view(scale.shape[:1] + (1,) * middle_dims + scale.shape[1:])
+            offset = offset.view(scale.shape)
+        return _affine_transform(tensor, scale, offset)
+
+    def _affine_params(self, key: str, norm_mode: NormalizationMode, inverse: bool) -> tuple[Tensor, Tensor]:
+        """
+        Returns the `(scale, offset)` such that the transformation of a tensor is `tensor * scale + offset`.
 
-        # If necessary stats are missing, return input unchanged.
-        return tensor
+        They are computed in float32 from the stats of the key, then cast to the dtype of the stats, and
+        cached until the stats tensors are replaced (moved to another device or dtype, reloaded, swapped).
+
+        Raises:
+            ValueError: If the stats required by the normalization mode are missing.
+        """
+        stats = self._tensor_stats[key]
+        cache_key = (key, norm_mode, inverse)
+        cached = self._affine_cache.get(cache_key)
+        if (
+            cached is not None
+            and len(cached[2]) == len(stats)
+            and all(stats.get(name) is tensor for name, tensor in cached[2].items())
+        ):
+            return cached[0], cached[1]
+
+        scale, offset = _compute_affine_params(stats, norm_mode, inverse, self.eps)
+        dtype = next(iter(stats.values())).dtype
+        if dtype.is_floating_point:
+            scale, offset = scale.to(dtype), offset.to(dtype)
+        self._affine_cache[cache_key] = (scale, offset, dict(stats))
+        return scale, offset
 
 
 @dataclass
@@ -444,26 +817,29 @@ class NormalizerProcessorStep(_NormalizationMixin, ProcessorStep):
 
     def __call__(self, transition: EnvTransition) -> EnvTransition:
         new_transition = transition.copy()
+        self.process_in_place(new_transition)
+        return new_transition
+
+    def process_in_place(self, transition: EnvTransition) -> None:
+        stats_id = self._select_stats_id(transition)
 
         # Handle observation normalization.
-        observation = new_transition.get(TransitionKey.OBSERVATION)
+        observation = transition.get(TransitionKey.OBSERVATION)
         if observation is not None:
-            new_transition[TransitionKey.OBSERVATION] = self._normalize_observation(
-                observation, inverse=False
+            transition[TransitionKey.OBSERVATION] = self._normalize_observation(
+                observation, inverse=False, stats_id=stats_id
             )
 
         # Handle action normalization.
-        action = new_transition.get(TransitionKey.ACTION)
+        action = transition.get(TransitionKey.ACTION)
 
         if action is None:
-            return new_transition
+            return
 
         if not isinstance(action, PolicyAction):
             raise ValueError(f"Action should be a PolicyAction type got {type(action)}")
 
-        new_transition[TransitionKey.ACTION] = self._normalize_action(action, inverse=False)
-
-        return new_transition
+        transition[TransitionKey.ACTION] = self._normalize_action(action, inverse=False, stats_id=stats_id)
 
     def transform_features(
         self, features: dict[PipelineFeatureType, dict[str, PolicyFeature]]
@@ -508,23 +884,28 @@ class UnnormalizerProcessorStep(_NormalizationMixin, ProcessorStep):
 
     def __call__(self, transition: EnvTransition) -> EnvTransition:
         new_transition = transition.copy()
+        self.process_in_place(new_transition)
+        return new_transition
+
+    def process_in_place(self, transition: EnvTransition) -> None:
+        stats_id = self._select_stats_id(transition)
 
         # Handle observation unnormalization.
-        observation = new_transition.get(TransitionKey.OBSERVATION)
+        observation = transition.get(TransitionKey.OBSERVATION)
         if observation is not None:
-            new_transition[TransitionKey.OBSERVATION] = self._normalize_observation(observation, inverse=True)
+            transition[TransitionKey.OBSERVATION] = self._normalize_observation(
+                observation, inverse=True, stats_id=stats_id
+            )
 
         # Handle action unnormalization.
-        action = new_transition.get(TransitionKey.ACTION)
+        action = transition.get(TransitionKey.ACTION)
 
         if action is None:
-            return new_transition
+            return
         if not isinstance(action, PolicyAction):
             raise ValueError(f"Action should be a PolicyAction type got {type(action)}")
 
-        new_transition[TransitionKey.ACTION] = self._normalize_action(action, inverse=True)
-
-        return new_transition
+        transition[TransitionKey.ACTION] = self._normalize_action(action, inverse=True, stats_id=stats_id)
 
     def transform_features(
         self, features: dict[PipelineFeatureType, dict[str, PolicyFeature]]
@@ -542,7 +923,8 @@ def hotswap_stats(
     statistics of any `NormalizerProcessorStep` or `UnnormalizerProcessorStep` it
     contains. This is useful for adapting a trained policy to a new environment or
     dataset with different data distributions without having to reconstruct the entire
-    pipeline.
+    pipeline. To switch between several sets of statistics while serving, register them in a
+    `NormalizationStatsRegistry` instead, which doesn't copy the pipeline.
 
     Args:
         policy_processor: The policy processor pipeline to modify.
@@ -558,3 +940,28 @@ def hotswap_stats(
             # Re-initialize tensor_stats on the correct device.
             step._tensor_stats = to_tensor(stats, device=step.device, dtype=step.dtype)  # type: ignore[assignment]
     return rp
+
+
+def select_stats(policy_processor: PolicyProcessorPipeline, stats_id: str | None) -> PolicyProcessorPipeline:
+    """
+    Selects the registry stats used by the normalization steps of a pipeline, in place.
+
+    The selected stats apply to the transitions without a stats id in their complementary data, such as the
+    actions going through a postprocessor. Only the steps with a `NormalizationStatsRegistry` are affected.
+
+    Args:
+        policy_processor: The policy processor pipeline to modify.
+        stats_id: The id of the registry stats to use, or None to use the steps' own stats.
+
+    Returns:
+        The pipeline, allowing for method chaining.
+
+    Raises:
+        KeyError: If a step's registry has no stats registered under the id.
+    """
+    for step in policy_processor.steps:
+        if isinstance(step, _NormalizationMixin) and step.stats_registry is not None:
+            if stats_id is not None:
+                step.stats_registry.get(stats_id)
+            step.stats_id = stats_id
+    return policy_processor
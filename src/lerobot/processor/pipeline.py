@@ -30,8 +30,12 @@ The core components are:
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
 import importlib
 import json
+import logging
+import operator
 import os
 import re
 from abc import ABC, abstractmethod
@@ -45,11 +49,12 @@ import torch
 from huggingface_hub import hf_hub_download
 from safetensors.torch import load_file, save_file
 
-from lerobot.configs.types import PipelineFeatureType, PolicyFeature
+from lerobot.configs.types import FeatureType, PipelineFeatureType, PolicyFeature
 from lerobot.utils.hub import HubMixin
 
 from .converters import batch_to_transition, create_transition, transition_to_batch
-from .core import EnvAction, EnvTransition, PolicyAction, RobotAction, TransitionKey
+from .core import EnvAction, EnvTransition, PolicyAction, RobotAction, RobotActionBatch, TransitionKey
+from .profiler import get_session_profiler
 
 # Generic type variables for pipeline input and output.
 TInput = TypeVar("TInput")
@@ -181,6 +186,22 @@ class ProcessorStep(ABC):
         """
         return transition
 
+    def process_in_place(self, transition: EnvTransition) -> None:
+        """Processes a transition in place, without copying it.
+
+        Steps implementing it can be fused with their neighbours by a frozen pipeline (see
+        `DataProcessorPipeline.freeze`), which copies the transition once for all of them instead of once per
+        step. It must update the transition exactly like `__call__` builds its output, and is only used if
+        the class defining it also defines the `__call__` of the step.
+
+        Args:
+            transition: A transition owned by the caller, updated with the output of the step.
+
+        Raises:
+            NotImplementedError: If the step only supports `__call__`.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support in-place processing")
+
     def get_config(self) -> dict[str, Any]:
         """Returns the configuration of the step for serialization.
 
@@ -227,6 +248,149 @@ class ProcessorStep(ABC):
         return features
 
 
+def _supports_in_place(step: ProcessorStep) -> bool:
+    """Whether a step implements `process_in_place` consistently with its `__call__`.
+
+    The first class of the MRO defining either of them must define both: a subclass overriding `__call__`
+    alone would otherwise have its own logic bypassed by the `process_in_place` of its parent.
+    """
+    for cls in type(step).__mro__:
+        defines_call = "__call__" in vars(cls)
+        defines_in_place = "process_in_place" in vars(cls)
+        if defines_call or defines_in_place:
+            return defines_call and defines_in_place and cls is not ProcessorStep
+    return False
+
+
+@dataclass
+class _FusedProcessorStep(ProcessorStep):
+    """Consecutive steps of a frozen pipeline, processing a single copy of the transition in place."""
+
+    steps: list[ProcessorStep]
+
+    def __call__(self, transition: EnvTransition) -> EnvTransition:
+        new_transition = transition.copy()
+        self.process_in_place(new_transition)
+        return new_transition
+
+    def process_in_place(self, transition: EnvTransition) -> None:
+        for step in self.steps:
+            step.process_in_place(transition)
+
+    def transform_features(
+        self, features: dict[PipelineFeatureType, dict[str, PolicyFeature]]
+    ) -> dict[PipelineFeatureType, dict[str, PolicyFeature]]:
+        for step in self.steps:
+            features = step.transform_features(features)
+        return features
+
+
+# Version of the manifest saved in pipeline configs. Manifests of newer versions are ignored on load.
+PIPELINE_MANIFEST_VERSION = 1
+
+_FEATURE_VALUE_TYPES = {value_type.__name__: value_type for value_type in (bool, int, float, str)}
+
+
+def _feature_to_json(value: Any) -> Any:
+    """Serializes a feature description: a `PolicyFeature`, a shape or a Python type such as `float`.
+
+    Raises:
+        TypeError: If the feature can't be serialized.
+    """
+    if isinstance(value, PolicyFeature):
+        # `operator.index` turns integer-like dimensions (e.g. numpy integers) into ints, and rejects the rest
+        shape = [operator.index(dim) for dim in value.shape]
+        return {"policy_feature": {"type": FeatureType(value.type).value, "shape": shape}}
+    if isinstance(value, type) and value.__name__ in _FEATURE_VALUE_TYPES:
+        return {"type": value.__name__}
+    if isinstance(value, tuple):
+        return {"tuple": [_feature_to_json(item) for item in value]}
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    raise TypeError(f"Feature {value!r} of type {type(value).__name__} can't be serialized")
+
+
+def _feature_from_json(value: Any) -> Any:
+    """Inverse of `_feature_to_json`."""
+    if not isinstance(value, dict):
+        return value
+    if "policy_feature" in value:
+        feature = value["policy_feature"]
+        return PolicyFeature(type=FeatureType(feature["type"]), shape=tuple(feature["shape"]))
+    if "type" in value:
+        return _FEATURE_VALUE_TYPES[value["type"]]
+    return tuple(_feature_from_json(item) for item in value["tuple"])
+
+
+def _features_to_json(features: dict[PipelineFeatureType, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    return {
+        PipelineFeatureType(feature_type).value: {
+            key: _feature_to_json(value) for key, value in group.items()
+        }
+        for feature_type, group in features.items()
+    }
+
+
+def _features_from_json(features: dict[str, dict[str, Any]]) -> dict[PipelineFeatureType, dict[str, Any]]:
+    return {
+        PipelineFeatureType(feature_type): {key: _feature_from_json(value) for key, value in group.items()}
+        for feature_type, group in features.items()
+    }
+
+
+def _json_digest(data: Any) -> str:
+    return hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+
+
+_SAFETENSORS_DTYPES = {
+    "F64": torch.float64,
+    "F32": torch.float32,
+    "F16": torch.float16,
+    "BF16": torch.bfloat16,
+    "I64": torch.int64,
+    "I32": torch.int32,
+    "I16": torch.int16,
+    "I8": torch.int8,
+    "U8": torch.uint8,
+    "BOOL": torch.bool,
+}
+
+
+def _mmap_state_file(path: str) -> dict[str, torch.Tensor]:
+    """Loads the tensors of a `.safetensors` file as views of a single memory map of the file.
+
+    Unlike `load_file`, which reads every tensor separately, this only maps the file. The mapping is private
+    (copy-on-write): modifying the tensors doesn't modify the file.
+    """
+    with open(path, "rb") as file:
+        header_size = int.from_bytes(file.read(8), "little")
+        header = json.loads(file.read(header_size))
+    header.pop("__metadata__", None)
+    if any(info["dtype"] not in _SAFETENSORS_DTYPES for info in header.values()):
+        return load_file(path)
+
+    storage = torch.UntypedStorage.from_file(path, shared=False, nbytes=os.path.getsize(path))
+    data_start = 8 + header_size
+    data = torch.empty(0, dtype=torch.uint8).set_(storage)
+    tensors = {}
+    for key, info in header.items():
+        dtype = _SAFETENSORS_DTYPES[info["dtype"]]
+        begin, end = (data_start + offset for offset in info["data_offsets"])
+        buffer = data[begin:end]
+        # Tensors which are not aligned to their dtype in the file can't be viewed
+        if begin % dtype.itemsize:
+            buffer = buffer.clone()
+        tensors[key] = buffer.view(dtype).reshape(info["shape"])
+    return tensors
+
+
+def _steps_signature(steps: Sequence[ProcessorStep]) -> str:
+    """Digest of the classes and configurations of steps, from which loaded pipelines are rebuilt."""
+    return _json_digest(
+        [[f"{type(step).__module__}.{type(step).__qualname__}", step.get_config()] for step in steps]
+    )
+
+
 class ProcessorKwargs(TypedDict, total=False):
     """A TypedDict for optional keyword arguments used in pipeline construction."""
 
@@ -281,6 +445,14 @@ class DataProcessorPipeline(HubMixin, Generic[TInput, TOutput]):
     before_step_hooks: list[Callable[[int, EnvTransition], None]] = field(default_factory=list, repr=False)
     after_step_hooks: list[Callable[[int, EnvTransition], None]] = field(default_factory=list, repr=False)
 
+    _frozen_steps: list[ProcessorStep] | None = field(default=None, init=False, repr=False, compare=False)
+    # Results of `transform_features` by digest of their input, saved in the manifest of the pipeline
+    _features_cache: dict[str, dict[str, Any]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Whether cached features are reused, for pipelines rebuilt from their configs by `from_pretrained`
+    _reuse_features: bool = field(default=False, init=False, repr=False, compare=False)
+
     def __call__(self, data: TInput) -> TOutput:
         """Processes input data through the full pipeline.
 
@@ -303,6 +475,12 @@ class DataProcessorPipeline(HubMixin, Generic[TInput, TOutput]):
         Returns:
             The final `EnvTransition` after all steps have been applied.
         """
+        if not self.before_step_hooks and not self.after_step_hooks:
+            # Hooks are called with the index and output of every step, so only run fused steps without them
+            for processor_step in self.steps if self._frozen_steps is None else self._frozen_steps:
+                transition = processor_step(transition)
+            return transition
+
         for idx, processor_step in enumerate(self.steps):
             # Execute pre-hooks
             for hook in self.before_step_hooks:
@@ -343,6 +521,7 @@ class DataProcessorPipeline(HubMixin, Generic[TInput, TOutput]):
         This method does the actual saving work and is called by HubMixin.save_pretrained.
         """
         config_filename = kwargs.pop("config_filename", None)
+        consolidate_state = kwargs.pop("consolidate_state", False)
 
         # Sanitize the pipeline name to create a valid filename prefix.
         sanitized_name = re.sub(r"[^a-zA-Z0-9_]", "_", self.name.lower())
@@ -354,6 +533,8 @@ class DataProcessorPipeline(HubMixin, Generic[TInput, TOutput]):
             "name": self.name,
             "steps": [],
         }
+        consolidated_state: dict[str, torch.Tensor] = {}
+        consolidated_filename = f"{sanitized_name}_state.safetensors"
 
         # Iterate through each step to build its configuration entry.
         for step_index, processor_step in enumerate(self.steps):
@@ -379,6 +560,17 @@ class DataProcessorPipeline(HubMixin, Generic[TInput, TOutput]):
                     # Clone tensors to avoid modifying the original state.
                     cloned_state = {key: tensor.clone() for key, tensor in state.items()}
 
+                    if consolidate_state:
+                        # Prefix the keys of the step in the single state file of the pipeline.
+                        state_prefix = f"step_{step_index}."
+                        consolidated_state.update(
+                            {f"{state_prefix}{key}": tensor for key, tensor in cloned_state.items()}
+                        )
+                        step_entry["state_file"] = consolidated_filename
+                        step_entry["state_prefix"] = state_prefix
+                        config["steps"].append(step_entry)
+                        continue
+
                     # Create a unique filename for the state file.
                     if registry_name:
                         state_filename = f"{sanitized_name}_step_{step_index}_{registry_name}.safetensors"
@@ -390,9 +582,15 @@ class DataProcessorPipeline(HubMixin, Generic[TInput, TOutput]):
 
             config["steps"].append(step_entry)
 
-        # Write the main configuration JSON file.
+        if consolidated_state:
+            save_file(consolidated_state, os.path.join(str(save_directory), consolidated_filename))
+
+        config["manifest"] = self._manifest()
+
+        # Write the main configuration JSON file, serialized first so that a failure leaves no partial file.
+        config_json = json.dumps(config, indent=2)
         with open(os.path.join(str(save_directory), config_filename), "w") as file_pointer:
-            json.dump(config, file_pointer, indent=2)
+            file_pointer.write(config_json)
 
     def save_pretrained(
         self,
@@ -402,6 +600,7 @@ class DataProcessorPipeline(HubMixin, Generic[TInput, TOutput]):
         push_to_hub: bool = False,
         card_kwargs: dict[str, Any] | None = None,
         config_filename: str | None = None,
+        consolidate_state: bool = False,
         **push_to_hub_kwargs,
     ):
         """Saves the pipeline's configuration and state to a directory.
@@ -410,6 +609,10 @@ class DataProcessorPipeline(HubMixin, Generic[TInput, TOutput]):
         (name and steps). For each stateful step, it also saves a `.safetensors` file
         containing its state dictionary.
 
+        The configuration also holds a versioned manifest with the signature of the steps and the
+        features computed by `transform_features` so far, which pipelines loaded with `from_pretrained`
+        reuse instead of recomputing them.
+
         Args:
             save_directory: The directory where the pipeline will be saved. If None, saves to
                 HF_LEROBOT_HOME/processors/{sanitized_pipeline_name}.
@@ -418,6 +621,10 @@ class DataProcessorPipeline(HubMixin, Generic[TInput, TOutput]):
             card_kwargs: Additional arguments passed to the card template to customize the card.
             config_filename: The name of the JSON configuration file. If None, a name is
                 generated from the pipeline's `name` attribute.
+            consolidate_state: Whether to save the states of all the steps in a single `.safetensors`
+                file, which is memory-mapped once on load instead of reading a file per step. Such
+                pipelines can't be loaded by LeRobot versions predating this option. Only used for local
+                saves.
             **push_to_hub_kwargs: Additional key word arguments passed along to the push_to_hub method.
         """
         if save_directory is None:
@@ -427,12 +634,14 @@ class DataProcessorPipeline(HubMixin, Generic[TInput, TOutput]):
             sanitized_name = re.sub(r"[^a-zA-Z0-9_]", "_", self.name.lower())
             save_directory = HF_LEROBOT_HOME / "processors" / sanitized_name
 
-        # For direct saves (not through hub), handle config_filename
-        if not push_to_hub and config_filename is not None:
-            # Call _save_pretrained directly with config_filename
+        # For direct saves (not through hub), handle config_filename and consolidate_state
+        if not push_to_hub and (config_filename is not None or consolidate_state):
+            # Call _save_pretrained directly with the options
             save_directory = Path(save_directory)
             save_directory.mkdir(parents=True, exist_ok=True)
-            self._save_pretrained(save_directory, config_filename=config_filename)
+            self._save_pretrained(
+                save_directory, config_filename=config_filename, consolidate_state=consolidate_state
+            )
             return None
 
         # Pass config_filename through kwargs for _save_pretrained when using hub
@@ -577,14 +786,65 @@ class DataProcessorPipeline(HubMixin, Generic[TInput, TOutput]):
         # 4. Validate that all overrides were used
         cls._validate_overrides_used(validated_overrides, loaded_config)
 
-        # 5. Construct and return the final pipeline instance
-        return cls(
+        # 5. Construct the final pipeline instance
+        pipeline = cls(
             steps=steps,
             name=loaded_config.get("name", "DataProcessorPipeline"),
             to_transition=to_transition or cast(Callable[[TInput], EnvTransition], batch_to_transition),
             to_output=to_output or cast(Callable[[EnvTransition], TOutput], transition_to_batch),
         )
 
+        # 6. Reuse the precomputed features of the manifest if it matches the steps
+        pipeline._load_manifest(loaded_config.get("manifest"))
+        return pipeline
+
+    def _manifest(self) -> dict[str, Any]:
+        """Builds the manifest saved in the configuration of the pipeline.
+
+        Returns:
+            The version of the manifest, the signature of the steps, and the cached `transform_features`
+            inputs and outputs computed with the current configurations of the steps.
+        """
+        steps_signature = _steps_signature(self.steps)
+        return {
+            "version": PIPELINE_MANIFEST_VERSION,
+            "steps_signature": steps_signature,
+            "features": [
+                {"input": entry["input"], "output": entry["output"]}
+                for entry in self._features_cache.values()
+                if entry["steps_signature"] == steps_signature
+            ],
+        }
+
+    def _load_manifest(self, manifest: dict[str, Any] | None) -> None:
+        """Restores the features of a saved manifest, if it was saved with the configuration of the steps.
+
+        Args:
+            manifest: The manifest of the loaded configuration, None for configurations saved without one.
+        """
+        if not manifest:
+            return
+        version = manifest.get("version")
+        if not isinstance(version, int) or version > PIPELINE_MANIFEST_VERSION:
+            logging.warning(
+                f"Ignoring the manifest of pipeline '{self.name}' of version {version}, the latest supported "
+                f"version is {PIPELINE_MANIFEST_VERSION}. Features will be recomputed."
+            )
+            return
+
+        # Overrides change the configuration of the steps, and with it their features
+        steps_signature = _steps_signature(self.steps)
+        if manifest.get("steps_signature") != steps_signature:
+            return
+
+        for entry in manifest.get("features", []):
+            self._features_cache[_json_digest(entry["input"])] = {
+                "steps_signature": steps_signature,
+                "input": entry["input"],
+                "output": entry["output"],
+            }
+        self._reuse_features = True
+
     @classmethod
     def _load_config(
         cls,
@@ -769,6 +1029,8 @@ class DataProcessorPipeline(HubMixin, Generic[TInput, TOutput]):
         """
         steps: list[ProcessorStep] = []
         override_keys = set(overrides.keys())
+        # Consolidated state files, opened once for all the steps
+        state_files: dict[str, Any] = {}
 
         for step_entry in loaded_config["steps"]:
             # 1. Get step class and key
@@ -778,7 +1040,9 @@ class DataProcessorPipeline(HubMixin, Generic[TInput, TOutput]):
             step_instance = cls._instantiate_step(step_entry, step_class, step_key, overrides)
 
             # 3. Load step state if available
-            cls._load_step_state(step_instance, step_entry, model_id, base_path, hub_download_kwargs)
+            cls._load_step_state(
+                step_instance, step_entry, model_id, base_path, hub_download_kwargs, state_files
+            )
 
             # 4. Track used overrides
             if step_key in override_keys:
@@ -919,6 +1183,7 @@ class DataProcessorPipeline(HubMixin, Generic[TInput, TOutput]):
         model_id: str,
         base_path: Path | None,
         hub_download_kwargs: dict[str, Any],
+        state_files: dict[str, Any] | None = None,
     ) -> None:
         """Load state dictionary for a processor step if available.
 
@@ -946,6 +1211,8 @@ class DataProcessorPipeline(HubMixin, Generic[TInput, TOutput]):
         - **Load tensors**: Use safetensors.torch.load_file()
         - **Apply to step**: Call step_instance.load_state_dict(tensor_dict)
         - **In-place modification**: Updates step's internal tensor state
+        - **Consolidated state**: If the step has a "state_prefix", its tensors are the keys with this prefix
+          of the state file of the whole pipeline, memory-mapped once for all the steps
 
         **Common state file examples**:
         - "normalize_step_0.safetensors" - normalization statistics
@@ -958,6 +1225,8 @@ class DataProcessorPipeline(HubMixin, Generic[TInput, TOutput]):
             model_id: The model identifier (used for Hub downloads if needed)
             base_path: Local directory path for finding state files (None for Hub-only)
             hub_download_kwargs: Parameters for hf_hub_download (tokens, cache, etc.)
+            state_files: The tensors of the consolidated state files already mapped for the pipeline, by
+                filename and step prefix. Files mapped by this call are added to it.
 
         Note:
             This method modifies step_instance in-place and returns None.
@@ -967,20 +1236,35 @@ class DataProcessorPipeline(HubMixin, Generic[TInput, TOutput]):
             return
 
         state_filename = step_entry["state_file"]
+        state_prefix = step_entry.get("state_prefix")
+        if state_files is None:
+            state_files = {}
+
+        if state_prefix is None or state_filename not in state_files:
+            # Try local file first
+            if base_path and (base_path / state_filename).exists():
+                state_path = str(base_path / state_filename)
+            else:
+                # Download from Hub
+                state_path = hf_hub_download(
+                    repo_id=model_id,
+                    filename=state_filename,
+                    repo_type="model",
+                    **hub_download_kwargs,
+                )
 
-        # Try local file first
-        if base_path and (base_path / state_filename).exists():
-            state_path = str(base_path / state_filename)
-        else:
-            # Download from Hub
-            state_path = hf_hub_download(
-                repo_id=model_id,
-                filename=state_filename,
-                repo_type="model",
-                **hub_download_kwargs,
-            )
+            if state_prefix is None:
+                step_instance.load_state_dict(load_file(state_path))
+                return
 
-        step_instance.load_state_dict(load_file(state_path))
+            # Group the tensors of the consolidated state by the "step_{index}." prefix of their step
+            state_by_prefix: dict[str, dict[str, torch.Tensor]] = {}
+            for key, tensor in _mmap_state_file(state_path).items():
+                prefix, _, name = key.partition(".")
+                state_by_prefix.setdefault(f"{prefix}.", {})[name] = tensor
+            state_files[state_filename] = state_by_prefix
+
+        step_instance.load_state_dict(state_files[state_filename].get(state_prefix, {}))
 
     @classmethod
     def _validate_overrides_used(
@@ -1285,6 +1569,50 @@ class DataProcessorPipeline(HubMixin, Generic[TInput, TOutput]):
                 f"Hook {fn} not found in after_step_hooks. Make sure to pass the exact same function reference."
             ) from None
 
+    def freeze(self) -> DataProcessorPipeline[TInput, TOutput]:
+        """Fuses the steps of the pipeline to reduce the per-call overhead of real-time control loops.
+
+        Consecutive steps supporting in-place processing (see `ProcessorStep.process_in_place`), such as
+        renaming, batching, device placement and normalization, are merged into a single step copying the
+        transition once instead of once per step. The outputs are identical to the ones of the unfused
+        pipeline. While hooks are registered, the steps run one by one so that hooks see every one of them.
+
+        The fused steps are built from the current steps: call `freeze` again after changing them.
+
+        Returns:
+            The pipeline itself, allowing for method chaining.
+        """
+        frozen_steps: list[ProcessorStep] = []
+        fusable_steps: list[ProcessorStep] = []
+        for step in [*self.steps, None]:
+            if step is not None and _supports_in_place(step):
+                fusable_steps.append(step)
+                continue
+            if len(fusable_steps) > 1:
+                frozen_steps.append(_FusedProcessorStep(steps=fusable_steps))
+            else:
+                frozen_steps.extend(fusable_steps)
+            fusable_steps = []
+            if step is not None:
+                frozen_steps.append(step)
+
+        self._frozen_steps = frozen_steps
+        return self
+
+    def unfreeze(self) -> DataProcessorPipeline[TInput, TOutput]:
+        """Runs the steps of the pipeline one by one again, undoing `freeze`.
+
+        Returns:
+            The pipeline itself, allowing for method chaining.
+        """
+        self._frozen_steps = None
+        return self
+
+    @property
+    def is_frozen(self) -> bool:
+        """Whether the steps of the pipeline are fused by `freeze`."""
+        return self._frozen_steps is not None
+
     def reset(self):
         """Resets the state of all stateful steps in the pipeline."""
         for step in self.steps:
@@ -1309,11 +1637,17 @@ class DataProcessorPipeline(HubMixin, Generic[TInput, TOutput]):
         return f"DataProcessorPipeline({', '.join(parts)})"
 
     def __post_init__(self):
-        """Validates that all provided steps are instances of `ProcessorStep`."""
+        """Validates that all provided steps are instances of `ProcessorStep`, and attaches the session
+        profiler if profiling is enabled (see `lerobot.processor.profiler`)."""
         for i, step in enumerate(self.steps):
             if not isinstance(step, ProcessorStep):
                 raise TypeError(f"Step {i} ({type(step).__name__}) must inherit from ProcessorStep")
 
+        # Profiling of every pipeline of the process, enabled by the `LEROBOT_PROFILE_PROCESSORS` variable
+        profiler = get_session_profiler()
+        if profiler is not None:
+            profiler.attach(self)
+
     def transform_features(
         self, initial_features: dict[PipelineFeatureType, dict[str, PolicyFeature]]
     ) -> dict[PipelineFeatureType, dict[str, PolicyFeature]]:
@@ -1323,17 +1657,40 @@ class DataProcessorPipeline(HubMixin, Generic[TInput, TOutput]):
         `transform_features` method, allowing the pipeline to statically determine
         the output feature specification without processing any real data.
 
+        Pipelines loaded with `from_pretrained` return the features saved in their manifest for the same
+        initial features, as long as the configurations of their steps are unchanged.
+
         Args:
             initial_features: A dictionary describing the initial features.
 
         Returns:
             The final feature description after all transformations.
         """
+        try:
+            input_json = _features_to_json(initial_features)
+        except TypeError:
+            input_json = None
+        if input_json is not None:
+            input_digest = _json_digest(input_json)
+            steps_signature = _steps_signature(self.steps)
+            cached = self._features_cache.get(input_digest)
+            if self._reuse_features and cached is not None and cached["steps_signature"] == steps_signature:
+                return _features_from_json(cached["output"])
+
         features: dict[PipelineFeatureType, dict[str, PolicyFeature]] = deepcopy(initial_features)
 
         for _, step in enumerate(self.steps):
             out = step.transform_features(features)
             features = out
+
+        # Record the features for the manifest saved with the pipeline, unless they can't be serialized
+        if input_json is not None:
+            with contextlib.suppress(TypeError):
+                self._features_cache[input_digest] = {
+                    "steps_signature": steps_signature,
+                    "input": input_json,
+                    "output": _features_to_json(features),
+                }
         return features
 
     # Convenience methods for processing individual parts of a transition.
@@ -1453,16 +1810,20 @@ class ObservationProcessorStep(ProcessorStep, ABC):
 
     def __call__(self, transition: EnvTransition) -> EnvTransition:
         """Applies the `observation` method to the transition's observation."""
-        self._current_transition = transition.copy()
-        new_transition = self._current_transition
+        new_transition = transition.copy()
+        self.process_in_place(new_transition)
+        return new_transition
 
-        observation = new_transition.get(TransitionKey.OBSERVATION)
+    def process_in_place(self, transition: EnvTransition) -> None:
+        """Same as `__call__`, updating a transition owned by the caller instead of a copy of it."""
+        self._current_transition = transition
+
+        observation = transition.get(TransitionKey.OBSERVATION)
         if observation is None or not isinstance(observation, dict):
             raise ValueError("ObservationProcessorStep requires an observation in the transition.")
 
         processed_observation = self.observation(observation.copy())
-        new_transition[TransitionKey.OBSERVATION] = processed_observation
-        return new_transition
+        transition[TransitionKey.OBSERVATION] = processed_observation
 
 
 class ActionProcessorStep(ProcessorStep, ABC):
@@ -1484,20 +1845,28 @@ class ActionProcessorStep(ProcessorStep, ABC):
 
     def __call__(self, transition: EnvTransition) -> EnvTransition:
         """Applies the `action` method to the transition's action."""
-        self._current_transition = transition.copy()
-        new_transition = self._current_transition
+        new_transition = transition.copy()
+        self.process_in_place(new_transition)
+        return new_transition
+
+    def process_in_place(self, transition: EnvTransition) -> None:
+        """Same as `__call__`, updating a transition owned by the caller instead of a copy of it."""
+        self._current_transition = transition
 
-        action = new_transition.get(TransitionKey.ACTION)
+        action = transition.get(TransitionKey.ACTION)
         if action is None:
             raise ValueError("ActionProcessorStep requires an action in the transition.")
 
         processed_action = self.action(action)
-        new_transition[TransitionKey.ACTION] = processed_action
-        return new_transition
+        transition[TransitionKey.ACTION] = processed_action
 
 
 class RobotActionProcessorStep(ProcessorStep, ABC):
-    """An abstract `ProcessorStep` for processing a `RobotAction` (a dictionary)."""
+    """An abstract `ProcessorStep` for processing a `RobotAction` (a dictionary).
+
+    Steps can also process the actions of several robots at once, as a `RobotActionBatch`, by implementing
+    `batched_action`.
+    """
 
     @abstractmethod
     def action(self, action: RobotAction) -> RobotAction:
@@ -1513,16 +1882,42 @@ class RobotActionProcessorStep(ProcessorStep, ABC):
 
     def __call__(self, transition: EnvTransition) -> EnvTransition:
         """Applies the `action` method to the transition's action, ensuring it's a `RobotAction`."""
-        self._current_transition = transition.copy()
-        new_transition = self._current_transition
+        new_transition = transition.copy()
+        self.process_in_place(new_transition)
+        return new_transition
+
+    def process_in_place(self, transition: EnvTransition) -> None:
+        """Same as `__call__`, updating a transition owned by the caller instead of a copy of it."""
+        self._current_transition = transition
 
-        action = new_transition.get(TransitionKey.ACTION)
+        action = transition.get(TransitionKey.ACTION)
+        if isinstance(action, RobotActionBatch):
+            transition[TransitionKey.ACTION] = self.batched_action(action)
+            return
         if action is None or not isinstance(action, dict):
             raise ValueError(f"Action should be a RobotAction type (dict), but got {type(action)}")
 
         processed_action = self.action(action.copy())
-        new_transition[TransitionKey.ACTION] = processed_action
-        return new_transition
+        transition[TransitionKey.ACTION] = processed_action
+
+    def batched_action(self, action: RobotActionBatch) -> RobotActionBatch:
+        """Processes the actions of a batch of robots, like `action` processes the one of a single robot.
+
+        The observations of the transition hold a `(B,)` tensor or array for each of their per-robot entries.
+
+        Args:
+            action: The input `RobotActionBatch`, which must not be modified.
+
+        Returns:
+            The processed `RobotActionBatch`.
+
+        Raises:
+            ValueError: If the step only supports single robot actions.
+        """
+        raise ValueError(
+            f"{type(self).__name__} does not support RobotActionBatch actions, "
+            "split them with `RobotActionBatch.to_dicts`"
+        )
 
 
 class PolicyActionProcessorStep(ProcessorStep, ABC):
@@ -1542,16 +1937,20 @@ class PolicyActionProcessorStep(ProcessorStep, ABC):
 
     def __call__(self, transition: EnvTransition) -> EnvTransition:
         """Applies the `action` method to the transition's action, ensuring it's a `PolicyAction`."""
-        self._current_transition = transition.copy()
-        new_transition = self._current_transition
+        new_transition = transition.copy()
+        self.process_in_place(new_transition)
+        return new_transition
 
-        action = new_transition.get(TransitionKey.ACTION)
+    def process_in_place(self, transition: EnvTransition) -> None:
+        """Same as `__call__`, updating a transition owned by the caller instead of a copy of it."""
+        self._current_transition = transition
+
+        action = transition.get(TransitionKey.ACTION)
         if not isinstance(action, PolicyAction):
             raise ValueError(f"Action should be a PolicyAction type (tensor), but got {type(action)}")
 
         processed_action = self.action(action)
-        new_transition[TransitionKey.ACTION] = processed_action
-        return new_transition
+        transition[TransitionKey.ACTION] = processed_action
 
 
 class RewardProcessorStep(ProcessorStep, ABC):
@@ -1571,16 +1970,20 @@ class RewardProcessorStep(ProcessorStep, ABC):
 
     def __call__(self, transition: EnvTransition) -> EnvTransition:
         """Applies the `reward` method to the transition's reward."""
-        self._current_transition = transition.copy()
-        new_transition = self._current_transition
+        new_transition = transition.copy()
+        self.process_in_place(new_transition)
+        return new_transition
+
+    def process_in_place(self, transition: EnvTransition) -> None:
+        """Same as `__call__`, updating a transition owned by the caller instead of a copy of it."""
+        self._current_transition = transition
 
-        reward = new_transition.get(TransitionKey.REWARD)
+        reward = transition.get(TransitionKey.REWARD)
         if reward is None:
             raise ValueError("RewardProcessorStep requires a reward in the transition.")
 
         processed_reward = self.reward(reward)
-        new_transition[TransitionKey.REWARD] = processed_reward
-        return new_transition
+        transition[TransitionKey.REWARD] = processed_reward
 
 
 class DoneProcessorStep(ProcessorStep, ABC):
@@ -1600,16 +2003,20 @@ class DoneProcessorStep(ProcessorStep, ABC):
 
     def __call__(self, transition: EnvTransition) -> EnvTransition:
         """Applies the `done` method to the transition's 'done' flag."""
-        self._current_transition = transition.copy()
-        new_transition = self._current_transition
+        new_transition = transition.copy()
+        self.process_in_place(new_transition)
+        return new_transition
+
+    def process_in_place(self, transition: EnvTransition) -> None:
+        """Same as `__call__`, updating a transition owned by the caller instead of a copy of it."""
+        self._current_transition = transition
 
-        done = new_transition.get(TransitionKey.DONE)
+        done = transition.get(TransitionKey.DONE)
         if done is None:
             raise ValueError("DoneProcessorStep requires a done flag in the transition.")
 
         processed_done = self.done(done)
-        new_transition[TransitionKey.DONE] = processed_done
-        return new_transition
+        transition[TransitionKey.DONE] = processed_done
 
 
 class TruncatedProcessorStep(ProcessorStep, ABC):
@@ -1629,16 +2036,20 @@ class TruncatedProcessorStep(ProcessorStep, ABC):
 
     def __call__(self, transition: EnvTransition) -> EnvTransition:
         """Applies the `truncated` method to the transition's 'truncated' flag."""
-        self._current_transition = transition.copy()
-        new_transition = self._current_transition
+        new_transition = transition.copy()
+        self.process_in_place(new_transition)
+        return new_transition
 
-        truncated = new_transition.get(TransitionKey.TRUNCATED)
+    def process_in_place(self, transition: EnvTransition) -> None:
+        """Same as `__call__`, updating a transition owned by the caller instead of a copy of it."""
+        self._current_transition = transition
+
+        truncated = transition.get(TransitionKey.TRUNCATED)
         if truncated is None:
             raise ValueError("TruncatedProcessorStep requires a truncated flag in the transition.")
 
         processed_truncated = self.truncated(truncated)
-        new_transition[TransitionKey.TRUNCATED] = processed_truncated
-        return new_transition
+        transition[TransitionKey.TRUNCATED] = processed_truncated
 
 
 class InfoProcessorStep(ProcessorStep, ABC):
@@ -1658,16 +2069,20 @@ class InfoProcessorStep(ProcessorStep, ABC):
 
     def __call__(self, transition: EnvTransition) -> EnvTransition:
         """Applies the `info` method to the transition's 'info' dictionary."""
-        self._current_transition = transition.copy()
-        new_transition = self._current_transition
+        new_transition = transition.copy()
+        self.process_in_place(new_transition)
+        return new_transition
+
+    def process_in_place(self, transition: EnvTransition) -> None:
+        """Same as `__call__`, updating a transition owned by the caller instead of a copy of it."""
+        self._current_transition = transition
 
-        info = new_transition.get(TransitionKey.INFO)
+        info = transition.get(TransitionKey.INFO)
         if info is None or not isinstance(info, dict):
             raise ValueError("InfoProcessorStep requires an info dictionary in the transition.")
 
         processed_info = self.info(info.copy())
-        new_transition[TransitionKey.INFO] = processed_info
-        return new_transition
+        transition[TransitionKey.INFO] = processed_info
 
 
 class ComplementaryDataProcessorStep(ProcessorStep, ABC):
@@ -1687,16 +2102,20 @@ class ComplementaryDataProcessorStep(ProcessorStep, ABC):
 
     def __call__(self, transition: EnvTransition) -> EnvTransition:
         """Applies the `complementary_data` method to the transition's data."""
-        self._current_transition = transition.copy()
-        new_transition = self._current_transition
+        new_transition = transition.copy()
+        self.process_in_place(new_transition)
+        return new_transition
 
-        complementary_data = new_transition.get(TransitionKey.COMPLEMENTARY_DATA)
+    def process_in_place(self, transition: EnvTransition) -> None:
+        """Same as `__call__`, updating a transition owned by the caller instead of a copy of it."""
+        self._current_transition = transition
+
+        complementary_data = transition.get(TransitionKey.COMPLEMENTARY_DATA)
         if complementary_data is None or not isinstance(complementary_data, dict):
             raise ValueError("ComplementaryDataProcessorStep requires complementary data in the transition.")
 
         processed_complementary_data = self.complementary_data(complementary_data.copy())
-        new_transition[TransitionKey.COMPLEMENTARY_DATA] = processed_complementary_data
-        return new_transition
+        transition[TransitionKey.COMPLEMENTARY_DATA] = processed_complementary_data
 
 
 class IdentityProcessorStep(ProcessorStep):
@@ -1709,6 +2128,10 @@ class IdentityProcessorStep(ProcessorStep):
         """Returns the transition without modification."""
         return transition
 
+    def process_in_place(self, transition: EnvTransition) -> None:
+        """Leaves the transition unmodified."""
+        return None
+
     def transform_features(
         self, features: dict[PipelineFeatureType, dict[str, PolicyFeature]]
     ) -> dict[PipelineFeatureType, dict[str, PolicyFeature]]:
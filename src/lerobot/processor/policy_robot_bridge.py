@@ -20,18 +20,29 @@ from typing import Any
 import torch
 
 from lerobot.configs.types import FeatureType, PipelineFeatureType, PolicyFeature
-from lerobot.processor import ActionProcessorStep, PolicyAction, ProcessorStepRegistry, RobotAction
+from lerobot.processor import (
+    ActionProcessorStep,
+    PolicyAction,
+    ProcessorStepRegistry,
+    RobotAction,
+    RobotActionBatch,
+)
 from lerobot.utils.constants import ACTION
 
 
 @dataclass
 @ProcessorStepRegistry.register("robot_action_to_policy_action_processor")
 class RobotActionToPolicyActionProcessorStep(ActionProcessorStep):
-    """Processor step to map a dictionary to a tensor action."""
+    """Processor step to map a dictionary to a tensor action.
+
+    A `RobotActionBatch` is mapped to a `(B, len(motor_names))` tensor.
+    """
 
     motor_names: list[str]
 
-    def action(self, action: RobotAction) -> PolicyAction:
+    def action(self, action: RobotAction | RobotActionBatch) -> PolicyAction:
+        if isinstance(action, RobotActionBatch):
+            return action.columns([f"{name}.pos" for name in self.motor_names])
         if len(self.motor_names) != len(action):
             raise ValueError(f"Action must have {len(self.motor_names)} elements, got {len(action)}")
         return torch.tensor([action[f"{name}.pos"] for name in self.motor_names])
@@ -49,11 +60,16 @@ class RobotActionToPolicyActionProcessorStep(ActionProcessorStep):
 @dataclass
 @ProcessorStepRegistry.register("policy_action_to_robot_action_processor")
 class PolicyActionToRobotActionProcessorStep(ActionProcessorStep):
-    """Processor step to map a policy action to a robot action."""
+    """Processor step to map a policy action to a robot action.
+
+    A `(B, len(motor_names))` policy action is mapped to a `RobotActionBatch`, with a row per robot.
+    """
 
     motor_names: list[str]
 
-    def action(self, action: PolicyAction) -> RobotAction:
+    def action(self, action: PolicyAction) -> RobotAction | RobotActionBatch:
+        if isinstance(action, torch.Tensor) and action.dim() == 2:
+            return RobotActionBatch([f"{name}.pos" for name in self.motor_names], action)
         if len(self.motor_names) != len(action):
             raise ValueError(f"Action must have {len(self.motor_names)} elements, got {len(action)}")
         return {f"{name}.pos": action[i] for i, name in enumerate(self.motor_names)}
@@ -0,0 +1,271 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Per-step latency profiling of processor pipelines.
+
+A `ProcessorProfiler` attached to a `DataProcessorPipeline` records, for every call of every step, its wall
+time, the bytes of tensors and arrays in its input and output transitions, and how many of its output tensors
+are new allocations rather than tensors of its input. The samples are aggregated over the session into
+percentiles, exported as a table or JSON.
+
+Setting the `LEROBOT_PROFILE_PROCESSORS` environment variable profiles every pipeline of the process without
+changes to the scripts, and reports the profile when the process exits:
+- `LEROBOT_PROFILE_PROCESSORS=1` logs the table.
+- `LEROBOT_PROFILE_PROCESSORS=profile.json` also writes the profile to this JSON file.
+- `LEROBOT_PROFILE_PROCESSORS_CUDA_SYNC=1` synchronizes CUDA around every step, so that the time of the
+  kernels it launches is attributed to it instead of to the next synchronizing step.
+
+Example:
+    LEROBOT_PROFILE_PROCESSORS=profile.json lerobot-eval --policy.path=lerobot/act_aloha_sim_insertion_human ...
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+import torch
+
+from .core import EnvTransition
+
+if TYPE_CHECKING:
+    from .pipeline import DataProcessorPipeline
+
+PROFILE_ENV = "LEROBOT_PROFILE_PROCESSORS"
+PROFILE_CUDA_SYNC_ENV = "LEROBOT_PROFILE_PROCESSORS_CUDA_SYNC"
+
+TOTAL = "total"
+
+
+def _transition_buffers(transition: EnvTransition) -> dict[int, int]:
+    """Bytes of the tensors and arrays of a transition, by address of the memory they were allocated in"""
+    buffers: dict[int, int] = {}
+    values = list(transition.values())
+    while values:
+        value = values.pop()
+        if isinstance(value, torch.Tensor):
+            # Views of the tensors of the input are not new allocations
+            buffers[value.untyped_storage().data_ptr()] = value.numel() * value.element_size()
+        elif isinstance(value, np.ndarray):
+            base = value.base if isinstance(value.base, np.ndarray) else value
+            buffers[base.__array_interface__["data"][0]] = value.nbytes
+        elif isinstance(value, dict):
+            values.extend(value.values())
+    return buffers
+
+
+class _ProfilerHook:
+    """Before or after step hook of a profiler, bound to the step names of a pipeline"""
+
+    def __init__(self, profiler: ProcessorProfiler, pipeline_name: str, step_names: list[str], after: bool):
+        self.profiler = profiler
+        self.pipeline_name = pipeline_name
+        self.step_names = step_names
+        self.after = after
+
+    def __call__(self, step_idx: int, transition: EnvTransition):
+        if self.after:
+            self.profiler._after_step(self.pipeline_name, self.step_names, step_idx, transition)
+        else:
+            self.profiler._before_step(step_idx, transition)
+
+    def __deepcopy__(self, memo) -> _ProfilerHook:
+        # Copies of a pipeline (e.g. `hotswap_stats`) keep reporting to the same profiler
+        return self
+
+
+class ProcessorProfiler:
+    """
+    Records per-step latency, tensor bytes and allocations of the pipelines it is attached to.
+
+    It relies on the step hooks of the pipelines, which also makes frozen pipelines run their steps one by one
+    while they are profiled. Pipelines with the same name are aggregated together.
+
+    Args:
+        cuda_sync: Whether to synchronize CUDA before and after every step, so that the asynchronous kernels
+            of a step are timed with it.
+    """
+
+    def __init__(self, cuda_sync: bool = False):
+        self.cuda_sync = cuda_sync
+        self._samples: dict[str, dict[str, dict[str, list[float]]]] = defaultdict(
+            lambda: defaultdict(lambda: defaultdict(list))
+        )
+        self._lock = threading.Lock()
+        # Pipelines can be called from several threads at once, each tracking its own step in progress
+        self._local = threading.local()
+
+    def attach(self, pipeline: DataProcessorPipeline) -> DataProcessorPipeline:
+        """Registers the hooks of the profiler on a pipeline, replacing the ones it had already registered.
+
+        Returns:
+            The pipeline, allowing for method chaining.
+        """
+        self.detach(pipeline)
+        step_names = [f"{idx}.{type(step).__name__}" for idx, step in enumerate(pipeline.steps)]
+        pipeline.register_before_step_hook(_ProfilerHook(self, pipeline.name, step_names, after=False))
+        pipeline.register_after_step_hook(_ProfilerHook(self, pipeline.name, step_names, after=True))
+        return pipeline
+
+    def detach(self, pipeline: DataProcessorPipeline) -> DataProcessorPipeline:
+        """Unregisters the hooks of the profiler from a pipeline.
+
+        Returns:
+            The pipeline, allowing for method chaining.
+        """
+        for hooks in (pipeline.before_step_hooks, pipeline.after_step_hooks):
+            hooks[:] = [
+                hook for hook in hooks if not (isinstance(hook, _ProfilerHook) and hook.profiler is self)
+            ]
+        return pipeline
+
+    def _synchronize(self):
+        if self.cuda_sync and torch.cuda.is_available():
+            torch.cuda.synchronize()
+
+    def _before_step(self, step_idx: int, transition: EnvTransition):
+        buffers = _transition_buffers(transition)
+        self._synchronize()
+        start = time.perf_counter()
+        if step_idx == 0:
+            self._local.call_start = start
+        self._local.step_start = start
+        self._local.input_buffers = buffers
+
+    def _after_step(
+        self, pipeline_name: str, step_names: list[str], step_idx: int, transition: EnvTransition
+    ):
+        self._synchronize()
+        end = time.perf_counter()
+        input_buffers = self._local.input_buffers
+        output_buffers = _transition_buffers(transition)
+        sample = {
+            "time_s": end - self._local.step_start,
+            "bytes_in": sum(input_buffers.values()),
+            "bytes_out": sum(output_buffers.values()),
+            "allocations": sum(address not in input_buffers for address in output_buffers),
+        }
+
+        with self._lock:
+            step_samples = self._samples[pipeline_name][step_names[step_idx]]
+            for metric, value in sample.items():
+                step_samples[metric].append(value)
+            if step_idx == len(step_names) - 1:
+                self._samples[pipeline_name][TOTAL]["time_s"].append(end - self._local.call_start)
+
+    def reset(self):
+        """Drops the samples recorded so far."""
+        with self._lock:
+            self._samples.clear()
+
+    def summary(self) -> dict[str, dict[str, dict[str, float]]]:
+        """Aggregates the samples of every step of every pipeline.
+
+        Returns:
+            For every pipeline and step, the number of calls, the mean, percentiles and maximum of the wall time
+            in milliseconds, and the mean input bytes, output bytes and allocations per call. The `total` step
+            of a pipeline is the time of its full calls, including the overhead of the profiling hooks.
+        """
+        with self._lock:
+            samples = {
+                pipeline: {
+                    step: {metric: list(values) for metric, values in metrics.items()}
+                    for step, metrics in steps.items()
+                }
+                for pipeline, steps in self._samples.items()
+            }
+
+        summary: dict[str, dict[str, dict[str, float]]] = {}
+        for pipeline, steps in samples.items():
+            summary[pipeline] = {}
+            for step, metrics in steps.items():
+                times_ms = np.asarray(metrics["time_s"]) * 1000
+                step_summary = {
+                    "count": len(times_ms),
+                    "mean_ms": float(times_ms.mean()),
+                    "p50_ms": float(np.percentile(times_ms, 50)),
+                    "p90_ms": float(np.percentile(times_ms, 90)),
+                    "p99_ms": float(np.percentile(times_ms, 99)),
+                    "max_ms": float(times_ms.max()),
+                }
+                for metric in ("bytes_in", "bytes_out", "allocations"):
+                    if metric in metrics:
+                        step_summary[f"mean_{metric}"] = float(np.mean(metrics[metric]))
+                summary[pipeline][step] = step_summary
+        return summary
+
+    def format_table(self) -> str:
+        """Formats the summary as a fixed-width table, one line per step."""
+        lines = [
+            f"{'pipeline':<24} {'step':<40} {'count':>7} {'mean [ms]':>10} {'p50 [ms]':>9} {'p90 [ms]':>9} "
+            f"{'p99 [ms]':>9} {'max [ms]':>9} {'in [KB]':>9} {'out [KB]':>9} {'allocs':>7}"
+        ]
+        for pipeline, steps in self.summary().items():
+            for step, metrics in steps.items():
+                line = (
+                    f"{pipeline:<24} {step:<40} {metrics['count']:>7} {metrics['mean_ms']:>10.3f} "
+                    f"{metrics['p50_ms']:>9.3f} {metrics['p90_ms']:>9.3f} {metrics['p99_ms']:>9.3f} "
+                    f"{metrics['max_ms']:>9.3f}"
+                )
+                if "mean_bytes_in" in metrics:
+                    line += (
+                        f" {metrics['mean_bytes_in'] / 1024:>9.1f} {metrics['mean_bytes_out'] / 1024:>9.1f} "
+                        f"{metrics['mean_allocations']:>7.1f}"
+                    )
+                lines.append(line)
+        return "\n".join(lines)
+
+    def save_json(self, path: str | Path):
+        """Writes the summary to a JSON file."""
+        with open(path, "w") as f:
+            json.dump(self.summary(), f, indent=2)
+
+
+_session_profiler: ProcessorProfiler | None = None
+
+
+def _report_session_profile(profiler: ProcessorProfiler, destination: str):
+    if not profiler.summary():
+        return
+    logging.info(f"Processor pipelines profile:\n{profiler.format_table()}")
+    if destination.endswith(".json"):
+        profiler.save_json(destination)
+        logging.info(f"Processor pipelines profile saved to {destination}")
+
+
+def get_session_profiler() -> ProcessorProfiler | None:
+    """The profiler of all the pipelines of the process, if enabled by `LEROBOT_PROFILE_PROCESSORS`.
+
+    It is created on first use, and reports its profile when the process exits.
+    """
+    global _session_profiler
+    destination = os.environ.get(PROFILE_ENV, "")
+    if destination.lower() in ("", "0", "false"):
+        return None
+
+    if _session_profiler is None:
+        cuda_sync = os.environ.get(PROFILE_CUDA_SYNC_ENV, "").lower() in ("1", "true")
+        _session_profiler = ProcessorProfiler(cuda_sync=cuda_sync)
+        atexit.register(_report_session_profile, _session_profiler, destination)
+    return _session_profiler
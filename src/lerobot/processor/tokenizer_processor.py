@@ -23,6 +23,7 @@ token IDs and attention masks, which are then added to the observation dictionar
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
@@ -62,6 +63,10 @@ class TokenizerProcessorStep(ObservationProcessorStep):
         padding_side: The side to pad on ('left' or 'right').
         padding: The padding strategy ('max_length', 'longest', etc.).
         truncation: Whether to truncate sequences longer than `max_length`.
+        cache_size: The number of tokenized task strings to keep, per device. Tasks come from a handful of
+            strings, so that the tokenizer only runs on the first occurrence of each of them. Only used with
+            'max_length' padding and truncation, where every task has `max_length` tokens that don't depend on
+            the rest of the batch. Set to 0 to tokenize every call. As a runtime setting, it is not saved with the processor's configuration.
         input_tokenizer: The internal tokenizer instance, loaded during initialization.
     """
 
@@ -72,9 +77,14 @@ class TokenizerProcessorStep(ObservationProcessorStep):
     padding_side: str = "right"
     padding: str = "max_length"
     truncation: bool = True
+    cache_size: int = 256
 
     # Internal tokenizer instance (not part of the config)
     input_tokenizer: Any = field(default=None, init=False, repr=False)
+    # Least recently used tokenized tasks, as (input_ids, attention_mask) rows
+    _token_cache: OrderedDict[tuple, tuple[torch.Tensor, torch.Tensor]] = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
 
     def __post_init__(self):
         """
@@ -149,18 +159,20 @@ class TokenizerProcessorStep(ObservationProcessorStep):
         if task is None:
             raise ValueError("Task cannot be None")
 
-        # Tokenize the task (this will create CPU tensors)
-        tokenized_prompt = self._tokenize_text(task)
-
         # Detect the device from existing tensors in the transition to ensure consistency
         target_device = self._detect_device(self.transition)
 
-        # Move new tokenized tensors to the detected device
-        if target_device is not None:
-            tokenized_prompt = {
-                k: v.to(target_device) if isinstance(v, torch.Tensor) else v
-                for k, v in tokenized_prompt.items()
-            }
+        tokenized_prompt = self._tokenize_cached(task, target_device)
+        if tokenized_prompt is None:
+            # Tokenize the task (this will create CPU tensors)
+            tokenized_prompt = self._tokenize_text(task)
+
+            # Move new tokenized tensors to the detected device
+            if target_device is not None:
+                tokenized_prompt = {
+                    k: v.to(target_device) if isinstance(v, torch.Tensor) else v
+                    for k, v in tokenized_prompt.items()
+                }
 
         # Create a new observation dict to avoid modifying the original in place
         new_observation = dict(observation)
@@ -171,6 +183,51 @@ class TokenizerProcessorStep(ObservationProcessorStep):
 
         return new_observation
 
+    def _tokenize_cached(
+        self, tasks: list[str], device: torch.device | None
+    ) -> dict[str, torch.Tensor] | None:
+        """
+        Gathers the tokens of the tasks from the cache, tokenizing the ones it does not hold yet.
+
+        Args:
+            tasks: The task strings of the batch.
+            device: The device the tokens are returned on.
+
+        Returns:
+            A dictionary with the 'input_ids' and boolean 'attention_mask' of the batch, or None if the tokens
+            can't be cached and the tasks must go through the tokenizer.
+        """
+        # Without truncation, tasks longer than `max_length` don't have the length of the others
+        if self.cache_size <= 0 or self.padding != "max_length" or not self.truncation:
+            return None
+
+        settings = (self.max_length, self.padding, self.padding_side, self.truncation)
+        cached = []
+        for task in tasks:
+            key = (task, settings, device)
+            tokenized = self._token_cache.get(key)
+            if tokenized is None:
+                tokenized = self._tokenize_text([task])
+                tokenized = {
+                    "input_ids": tokenized["input_ids"].to(device),
+                    "attention_mask": tokenized["attention_mask"].to(device=device, dtype=torch.bool),
+                }
+                self._token_cache[key] = tokenized
+            else:
+                self._token_cache.move_to_end(key)
+            cached.append(tokenized)
+        while len(self._token_cache) > self.cache_size:
+            self._token_cache.popitem(last=False)
+
+        # Copies, so that the cache can't be modified through the batch
+        if len(cached) == 1:
+            return {name: tensor.clone() for name, tensor in cached[0].items()}
+        rows = {
+            name: [tensor[0] if tensor.dim() > 1 else tensor for tensor in (c[name] for c in cached)]
+            for name in ("input_ids", "attention_mask")
+        }
+        return {name: torch.stack(name_rows) for name, name_rows in rows.items()}
+
     def _detect_device(self, transition: EnvTransition) -> torch.device | None:
         """
         Detects the torch.device from existing tensors in the transition.
@@ -48,6 +48,7 @@ https://github.com/michel-aractingi/lerobot-hilserl-guide
 
 import logging
 import os
+import socket
 import time
 from functools import lru_cache
 from queue import Empty
@@ -92,10 +93,14 @@ from lerobot.utils.utils import (
 
 from .gym_manipulator import (
     create_transition,
+    index_vector_env_data,
     make_processors,
     make_robot_env,
+    make_robot_vector_env,
     step_env_and_process_transition,
+    step_vector_env_and_process_transitions,
 )
+from .learner_service import ACTOR_ID_METADATA_KEY
 
 # Main entry point
 
@@ -122,6 +127,11 @@ def actor_cli(cfg: TrainRLServerPipelineConfig):
     is_threaded = use_threads(cfg)
     shutdown_event = ProcessSignalHandler(is_threaded, display_pid=display_pid).shutdown_event
 
+    # Set the actor ID once, before spawning, so all the communication processes share it
+    if cfg.policy.actor_learner_config.actor_id is None:
+        cfg.policy.actor_learner_config.actor_id = f"{socket.gethostname()}-{os.getpid()}"
+    logging.info(f"[ACTOR] Actor ID: {cfg.policy.actor_learner_config.actor_id}")
+
     learner_client, grpc_channel = learner_service_client(
         host=cfg.policy.actor_learner_config.learner_host,
         port=cfg.policy.actor_learner_config.learner_port,
@@ -235,6 +245,16 @@ def act_with_policy(
         init_logging(log_file=log_file, display_pid=True)
         logging.info("Actor policy process logging initialized")
 
+    if cfg.env.num_envs > 1:
+        act_with_vectorized_policy(
+            cfg=cfg,
+            shutdown_event=shutdown_event,
+            parameters_queue=parameters_queue,
+            transitions_queue=transitions_queue,
+            interactions_queue=interactions_queue,
+        )
+        return
+
     logging.info("make_env online")
 
     online_env, teleop_device = make_robot_env(cfg=cfg.env)
@@ -242,21 +262,7 @@ def act_with_policy(
 
     set_seed(cfg.seed)
     device = get_safe_torch_device(cfg.policy.device, log=True)
-
-    torch.backends.cudnn.benchmark = True
-    torch.backends.cuda.matmul.allow_tf32 = True
-
-    logging.info("make_policy")
-
-    ### Instantiate the policy in both the actor and learner processes
-    ### To avoid sending a SACPolicy object through the port, we create a policy instance
-    ### on both sides, the learner sends the updated parameters every n steps to update the actor's parameters
-    policy: SACPolicy = make_policy(
-        cfg=cfg.policy,
-        env_cfg=cfg.env,
-    )
-    policy = policy.eval()
-    assert isinstance(policy, nn.Module)
+    policy = make_actor_policy(cfg)
 
     obs, info = online_env.reset()
     env_processor.reset()
@@ -401,6 +407,201 @@ def act_with_policy(
             precise_sleep(max(1 / cfg.env.fps - dt_time, 0.0))
 
 
+def act_with_vectorized_policy(
+    cfg: TrainRLServerPipelineConfig,
+    shutdown_event: any,  # Event,
+    parameters_queue: Queue,
+    transitions_queue: Queue,
+    interactions_queue: Queue,
+):
+    """
+    Executes policy interaction within `cfg.env.num_envs` simulated environments stepped together.
+
+    The environments run in a gym vector environment and the policy selects the actions of all of them
+    in a single batched call per step. Each environment keeps its own processors and episode
+    bookkeeping; its transitions are pushed to the learner when its episode ends, exactly like in
+    `act_with_policy`. The reported frame rates are given per environment and in aggregate.
+
+    Args:
+        cfg: Configuration settings for the interaction process.
+        shutdown_event: Event to check if the process should shutdown.
+        parameters_queue: Queue to receive updated network parameters from the learner.
+        transitions_queue: Queue to send transitions to the learner.
+        interactions_queue: Queue to send interactions to the learner.
+    """
+    num_envs = cfg.env.num_envs
+    logging.info(f"make_env online with {num_envs} vectorized environments")
+
+    vector_env = make_robot_vector_env(cfg=cfg.env)
+    processors = [make_processors(vector_env, None, cfg.env, cfg.policy.device) for _ in range(num_envs)]
+    env_processors = [env_processor for env_processor, _ in processors]
+    action_processors = [action_processor for _, action_processor in processors]
+
+    set_seed(cfg.seed)
+    device = get_safe_torch_device(cfg.policy.device, log=True)
+    policy = make_actor_policy(cfg)
+
+    obs, info = vector_env.reset()
+    transitions = []
+    for i in range(num_envs):
+        env_processors[i].reset()
+        action_processors[i].reset()
+        transition = create_transition(
+            observation=index_vector_env_data(obs, i), info=index_vector_env_data(info, i)
+        )
+        transitions.append(env_processors[i](transition))
+
+    sum_reward_episode = [0.0] * num_envs
+    list_transition_to_send_to_learner = [[] for _ in range(num_envs)]
+    episode_intervention = [False] * num_envs
+    episode_intervention_steps = [0] * num_envs
+    episode_total_steps = [0] * num_envs
+
+    policy_timer = TimerManager("Policy inference", log=False)
+    step_timer = TimerManager("Vectorized env step", log=False)
+
+    for vector_step in range(cfg.policy.online_steps // num_envs):
+        start_time = time.perf_counter()
+        if shutdown_event.is_set():
+            logging.info("[ACTOR] Shutting down act_with_vectorized_policy")
+            vector_env.close()
+            return
+
+        interaction_step = vector_step * num_envs
+        observations = [
+            {k: v for k, v in transition[TransitionKey.OBSERVATION].items() if k in cfg.policy.input_features}
+            for transition in transitions
+        ]
+        batch = {
+            key: torch.cat([observation[key] for observation in observations]) for key in observations[0]
+        }
+
+        with step_timer:
+            # One policy call selects the actions of every environment
+            with policy_timer:
+                actions = policy.select_action(batch=batch)
+            policy_fps = policy_timer.fps_last
+
+            log_policy_frequency_issue(policy_fps=policy_fps, cfg=cfg, interaction_step=interaction_step)
+
+            new_transitions, reset_transitions = step_vector_env_and_process_transitions(
+                env=vector_env,
+                transitions=transitions,
+                actions=actions,
+                env_processors=env_processors,
+                action_processors=action_processors,
+            )
+
+        finished_envs = []
+        for i, new_transition in enumerate(new_transitions):
+            next_observation = {
+                k: v
+                for k, v in new_transition[TransitionKey.OBSERVATION].items()
+                if k in cfg.policy.input_features
+            }
+            reward = new_transition[TransitionKey.REWARD]
+            sum_reward_episode[i] += float(reward)
+            episode_total_steps[i] += 1
+
+            if new_transition[TransitionKey.INFO].get(TeleopEvents.IS_INTERVENTION, False):
+                episode_intervention[i] = True
+                episode_intervention_steps[i] += 1
+
+            complementary_info = {
+                "discrete_penalty": torch.tensor(
+                    [new_transition[TransitionKey.COMPLEMENTARY_DATA].get("discrete_penalty", 0.0)]
+                ),
+            }
+            list_transition_to_send_to_learner[i].append(
+                Transition(
+                    state=observations[i],
+                    action=new_transition[TransitionKey.COMPLEMENTARY_DATA]["teleop_action"],
+                    reward=reward,
+                    next_state=next_observation,
+                    done=new_transition.get(TransitionKey.DONE, False),
+                    truncated=new_transition.get(TransitionKey.TRUNCATED, False),
+                    complementary_info=complementary_info,
+                )
+            )
+
+            if reset_transitions[i] is None:
+                transitions[i] = new_transition
+            else:
+                transitions[i] = reset_transitions[i]
+                finished_envs.append(i)
+
+        if finished_envs:
+            update_policy_parameters(policy=policy, parameters_queue=parameters_queue, device=device)
+
+            stats = {
+                **get_frequency_stats(policy_timer),
+                **get_vectorized_env_frequency_stats(step_timer, num_envs),
+            }
+            policy_timer.reset()
+            step_timer.reset()
+
+            for i in finished_envs:
+                logging.info(
+                    f"[ACTOR] Global step {interaction_step}: Env {i} episode reward: {sum_reward_episode[i]}"
+                )
+
+                push_transitions_to_transport_queue(
+                    transitions=list_transition_to_send_to_learner[i],
+                    transitions_queue=transitions_queue,
+                )
+                list_transition_to_send_to_learner[i] = []
+
+                interactions_queue.put(
+                    python_object_to_bytes(
+                        {
+                            "Episodic reward": sum_reward_episode[i],
+                            "Interaction step": interaction_step,
+                            "Episode intervention": int(episode_intervention[i]),
+                            "Intervention rate": episode_intervention_steps[i] / episode_total_steps[i],
+                            "Env index": i,
+                            **stats,
+                        }
+                    )
+                )
+
+                sum_reward_episode[i] = 0.0
+                episode_intervention[i] = False
+                episode_intervention_steps[i] = 0
+                episode_total_steps[i] = 0
+
+        if cfg.env.fps is not None:
+            dt_time = time.perf_counter() - start_time
+            precise_sleep(max(1 / cfg.env.fps - dt_time, 0.0))
+
+    vector_env.close()
+
+
+def make_actor_policy(cfg: TrainRLServerPipelineConfig) -> SACPolicy:
+    """Instantiate the policy used by the actor for inference.
+
+    Args:
+        cfg: Configuration settings for the interaction process.
+
+    Returns:
+        SACPolicy: The policy in eval mode.
+    """
+    torch.backends.cudnn.benchmark = True
+    torch.backends.cuda.matmul.allow_tf32 = True
+
+    logging.info("make_policy")
+
+    ### Instantiate the policy in both the actor and learner processes
+    ### To avoid sending a SACPolicy object through the port, we create a policy instance
+    ### on both sides, the learner sends the updated parameters every n steps to update the actor's parameters
+    policy: SACPolicy = make_policy(
+        cfg=cfg.policy,
+        env_cfg=cfg.env,
+    )
+    policy = policy.eval()
+    assert isinstance(policy, nn.Module)
+    return policy
+
+
 #  Communication Functions - Group all gRPC/messaging functions
 
 
@@ -491,7 +692,7 @@ def receive_policy(
         )
 
     try:
-        iterator = learner_client.StreamParameters(services_pb2.Empty())
+        iterator = learner_client.StreamParameters(services_pb2.Empty(), metadata=actor_metadata(cfg))
         receive_bytes_in_chunks(
             iterator,
             parameters_queue,
@@ -545,7 +746,8 @@ def send_transitions(
         learner_client.SendTransitions(
             transitions_stream(
                 shutdown_event, transitions_queue, cfg.policy.actor_learner_config.queue_get_timeout
-            )
+            ),
+            metadata=actor_metadata(cfg),
         )
     except grpc.RpcError as e:
         logging.error(f"[ACTOR] gRPC error: {e}")
@@ -598,7 +800,8 @@ def send_interactions(
         learner_client.SendInteractions(
             interactions_stream(
                 shutdown_event, interactions_queue, cfg.policy.actor_learner_config.queue_get_timeout
-            )
+            ),
+            metadata=actor_metadata(cfg),
         )
     except grpc.RpcError as e:
         logging.error(f"[ACTOR] gRPC error: {e}")
@@ -723,6 +926,27 @@ def get_frequency_stats(timer: TimerManager) -> dict[str, float]:
     return stats
 
 
+def get_vectorized_env_frequency_stats(timer: TimerManager, num_envs: int) -> dict[str, float]:
+    """Get the frame rate statistics of the vectorized environments.
+
+    Args:
+        timer (TimerManager): The timer with collected metrics of the vectorized steps.
+        num_envs (int): The number of environments stepped together.
+
+    Returns:
+        dict[str, float]: The frame rate of one environment and of all the environments together.
+    """
+    stats = {}
+    if timer.count > 1:
+        env_fps = timer.fps_avg
+        logging.debug(f"[ACTOR] Average frame rate per env: {env_fps}, aggregate: {env_fps * num_envs}")
+        stats = {
+            "Env frequency [Hz]": env_fps,
+            "Aggregate env frequency [Hz]": env_fps * num_envs,
+        }
+    return stats
+
+
 def log_policy_frequency_issue(policy_fps: float, cfg: TrainRLServerPipelineConfig, interaction_step: int):
     if policy_fps < cfg.env.fps:
         logging.warning(
@@ -734,5 +958,13 @@ def use_threads(cfg: TrainRLServerPipelineConfig) -> bool:
     return cfg.policy.concurrency.actor == "threads"
 
 
+def actor_metadata(cfg: TrainRLServerPipelineConfig) -> tuple[tuple[str, str], ...]:
+    """gRPC metadata identifying this actor to the learner."""
+    actor_id = cfg.policy.actor_learner_config.actor_id
+    if actor_id is None:
+        return ()
+    return ((ACTOR_ID_METADATA_KEY, actor_id),)
+
+
 if __name__ == "__main__":
     actor_cli()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""DrQ image augmentation used when sampling from the replay buffer."""
+
+import functools
+import logging
+import time
+from collections.abc import Callable, Sequence
+
+import torch
+
+
+def shift_images(images: torch.Tensor, row_shifts: torch.Tensor, col_shifts: torch.Tensor) -> torch.Tensor:
+    """
+    Shift every image of a batch by a whole number of pixels, repeating the border pixels.
+
+    This is equivalent to a replicate padding followed by a crop, done with a single gather and without
+    materializing the padded images.
+
+    Args:
+        images: Batch of images of shape (B, C, H, W).
+        row_shifts: Vertical shift of every image, of shape (B,).
+        col_shifts: Horizontal shift of every image, of shape (B,).
+
+    Returns:
+        The shifted images, of shape (B, C, H, W).
+    """
+    b, _, h, w = images.shape
+    # Clamping the source pixel is what the replicate padding does
+    rows = (torch.arange(h, device=images.device).view(1, h, 1) + row_shifts.view(b, 1, 1)).clamp(0, h - 1)
+    cols = (torch.arange(w, device=images.device).view(1, 1, w) + col_shifts.view(b, 1, 1)).clamp(0, w - 1)
+
+    # Gather whole pixels (all channels at once) in channels last layout
+    images_hwc = images.permute(0, 2, 3, 1)  # (B, H, W, C)
+    shifted_hwc = images_hwc[torch.arange(b, device=images.device).view(b, 1, 1), rows, cols]
+    return shifted_hwc.permute(0, 3, 1, 2)  # (B, C, H, W)
+
+
+def random_shift_fused(images: torch.Tensor, pad: int = 4) -> torch.Tensor:
+    """Vectorized random shift of up to `pad` pixels in each direction, imgs: (B,C,H,W)"""
+    shifts = torch.randint(-pad, pad + 1, (2, images.shape[0]), device=images.device)
+    return shift_images(images, row_shifts=shifts[0], col_shifts=shifts[1])
+
+
+class DrQAugmentation:
+    """
+    DrQ random shift augmentation compiled for a small, fixed set of batch sizes.
+
+    The number of images to augment changes while the replay buffer fills up, which makes a compiled
+    function recompile for every new batch size. Here every batch is padded to a bucket size: the batch
+    sizes given to `warmup` or, for any other batch, the next power of two (at least `min_bucket_size`).
+    The padding images are dropped from the output. Calling `warmup` compiles every bucket up front so
+    that no compilation happens during training.
+
+    The compiled function is not pickled, it is rebuilt when the augmentation is first called in the
+    receiving process.
+    """
+
+    def __init__(self, pad: int = 4, use_torch_compile: bool = True, min_bucket_size: int = 64):
+        """
+        Args:
+            pad (int): Maximum shift, in pixels, in each direction.
+            use_torch_compile (bool): Whether to compile the augmentation with `torch.compile`.
+            min_bucket_size (int): Smallest bucket size. It bounds the number of compiled variants.
+        """
+        if min_bucket_size < 1:
+            raise ValueError(f"`min_bucket_size` must be at least 1, got {min_bucket_size}.")
+
+        self.pad = pad
+        self.use_torch_compile = use_torch_compile
+        self.min_bucket_size = min_bucket_size
+        self.bucket_sizes: set[int] = set()
+        self._function: Callable | None = None
+
+    @property
+    def function(self) -> Callable:
+        if self._function is None:
+            base_function = functools.partial(random_shift_fused, pad=self.pad)
+            self._function = (
+                torch.compile(base_function, dynamic=False) if self.use_torch_compile else base_function
+            )
+        return self._function
+
+    def bucket_size(self, batch_size: int) -> int:
+        """Return the batch size the augmentation runs with for `batch_size` images."""
+        candidates = [size for size in self.bucket_sizes if size >= batch_size]
+        candidates.append(max(self.min_bucket_size, 1 << (batch_size - 1).bit_length()))
+        return min(candidates)
+
+    def __call__(self, images: torch.Tensor) -> torch.Tensor:
+        batch_size = images.shape[0]
+        bucket_size = self.bucket_size(batch_size)
+        if bucket_size > batch_size:
+            padding = images.new_zeros((bucket_size - batch_size, *images.shape[1:]))
+            images = torch.cat([images, padding], dim=0)
+        return self.function(images)[:batch_size]
+
+    def warmup(
+        self,
+        image_shape: Sequence[int],
+        max_batch_size: int,
+        device: torch.device | str = "cpu",
+        dtype: torch.dtype = torch.float32,
+    ) -> float:
+        """
+        Compile the augmentation for every bucket up to `max_batch_size` images.
+
+        `max_batch_size` becomes a bucket itself, so full batches are never padded.
+
+        Args:
+            image_shape (Sequence[int]): Shape (C, H, W) of one image.
+            max_batch_size (int): Largest number of images augmented at once.
+            device (torch.device | str): Device of the images.
+            dtype (torch.dtype): Data type of the images.
+
+        Returns:
+            float: The warmup duration in seconds.
+        """
+        start_time = time.perf_counter()
+        self.bucket_sizes.add(max_batch_size)
+
+        bucket_sizes = sorted({self.bucket_size(size) for size in range(1, max_batch_size + 1)})
+        for bucket_size in bucket_sizes:
+            self(torch.zeros((bucket_size, *image_shape), device=device, dtype=dtype))
+
+        warmup_time = time.perf_counter() - start_time
+        logging.info(f"Image augmentation warmed up for batch sizes {bucket_sizes} in {warmup_time:.2f}s")
+        return warmup_time
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_function"] = None
+        return state
@@ -14,7 +14,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import functools
+import multiprocessing as mp
+import os
 from collections.abc import Callable, Sequence
 from contextlib import suppress
 from typing import TypedDict
@@ -24,6 +25,7 @@ import torch.nn.functional as F  # noqa: N812
 from tqdm import tqdm
 
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
+from lerobot.rl.augmentation import DrQAugmentation
 from lerobot.utils.constants import ACTION, DONE, OBS_IMAGE, REWARD
 from lerobot.utils.transition import Transition
 
@@ -77,6 +79,11 @@ def random_shift(images: torch.Tensor, pad: int = 4):
     return random_crop_vectorized(images=images, output_size=(h, w))
 
 
+def make_default_image_augmentation_function() -> Callable:
+    """Default DrQ augmentation: a compiled random shift with a padding of 4 pixels."""
+    return DrQAugmentation(pad=4)
+
+
 class ReplayBuffer:
     def __init__(
         self,
@@ -125,8 +132,7 @@ class ReplayBuffer:
         self.image_augmentation_function = image_augmentation_function
 
         if image_augmentation_function is None:
-            base_function = functools.partial(random_shift, pad=4)
-            self.image_augmentation_function = torch.compile(base_function)
+            self.image_augmentation_function = make_default_image_augmentation_function()
         self.use_drq = use_drq
 
     def _initialize_storage(
@@ -229,6 +235,78 @@ class ReplayBuffer:
         self.position = (self.position + 1) % self.capacity
         self.size = min(self.size + 1, self.capacity)
 
+    def add_batch(
+        self,
+        state: dict[str, torch.Tensor],
+        action: torch.Tensor,
+        reward: torch.Tensor,
+        next_state: dict[str, torch.Tensor],
+        done: torch.Tensor,
+        truncated: torch.Tensor,
+        complementary_info: dict[str, torch.Tensor] | None = None,
+    ):
+        """
+        Saves a chunk of transitions at once. Every argument carries a leading batch dimension N.
+
+        Instead of N per-transition copies for every key, each storage tensor receives a single slice
+        assignment (two when the chunk wraps around the end of the ring). If the chunk is larger than the
+        buffer capacity, only its last `capacity` transitions are kept, as repeated calls to `add` would.
+
+        Args:
+            state (dict[str, torch.Tensor]): Batched states, each tensor of shape (N, ...).
+            action (torch.Tensor): Batched actions of shape (N, ...).
+            reward (torch.Tensor): Rewards of shape (N,).
+            next_state (dict[str, torch.Tensor]): Batched next states, each tensor of shape (N, ...).
+            done (torch.Tensor): Done flags of shape (N,).
+            truncated (torch.Tensor): Truncated flags of shape (N,).
+            complementary_info (dict[str, torch.Tensor] | None): Batched complementary info tensors.
+        """
+        num_transitions = action.shape[0]
+        if num_transitions == 0:
+            return
+
+        if not self.initialized:
+            self._initialize_storage(
+                state={key: val[:1] for key, val in state.items()},
+                action=action[:1],
+                complementary_info=(
+                    {key: val[:1] for key, val in complementary_info.items()}
+                    if complementary_info is not None
+                    else None
+                ),
+            )
+
+        # Only the tail of an oversized chunk survives, it lands where sequential adds would have put it
+        offset = max(0, num_transitions - self.capacity)
+        start = (self.position + offset) % self.capacity
+
+        for key in self.states:
+            self._write_slice(self.states[key], state[key][offset:], start)
+
+            if not self.optimize_memory:
+                self._write_slice(self.next_states[key], next_state[key][offset:], start)
+
+        self._write_slice(self.actions, action[offset:], start)
+        self._write_slice(self.rewards, reward[offset:], start)
+        self._write_slice(self.dones, done[offset:], start)
+        self._write_slice(self.truncateds, truncated[offset:], start)
+
+        if complementary_info is not None and self.has_complementary_info:
+            for key in self.complementary_info_keys:
+                if key in complementary_info:
+                    self._write_slice(self.complementary_info[key], complementary_info[key][offset:], start)
+
+        self.position = (self.position + num_transitions) % self.capacity
+        self.size = min(self.size + num_transitions, self.capacity)
+
+    def _write_slice(self, storage: torch.Tensor, values: torch.Tensor, start: int):
+        """Copy `values` into the ring `storage` starting at `start`, wrapping around the end if needed."""
+        values = values.reshape(values.shape[0], *storage.shape[1:])
+        first_part = min(values.shape[0], self.capacity - start)
+        storage[start : start + first_part] = values[:first_part]
+        if first_part < values.shape[0]:
+            storage[: values.shape[0] - first_part] = values[first_part:]
+
     def sample(self, batch_size: int) -> BatchTransition:
         """Sample a random batch of transitions and collate them into batched tensors."""
         if not self.initialized:
@@ -303,6 +381,32 @@ class ReplayBuffer:
             complementary_info=batch_complementary_info,
         )
 
+    def warmup_image_augmentation(self, batch_size: int):
+        """
+        Prepare the image augmentation for the batches `sample` produces, up to `batch_size` transitions.
+
+        This only does something when the augmentation has a `warmup` method (like the default
+        `DrQAugmentation`) and the buffer already holds images.
+
+        Args:
+            batch_size (int): The largest batch size that will be sampled.
+        """
+        if not (self.use_drq and self.initialized) or not hasattr(self.image_augmentation_function, "warmup"):
+            return
+
+        image_keys = [k for k in self.states if k.startswith(OBS_IMAGE)]
+        if not image_keys:
+            return
+
+        # `sample` augments the state and next state images of every key at once
+        images = self.states[image_keys[0]]
+        self.image_augmentation_function.warmup(
+            image_shape=images.shape[1:],
+            max_batch_size=2 * len(image_keys) * batch_size,
+            device=self.device,
+            dtype=images.dtype,
+        )
+
     def get_iterator(
         self,
         batch_size: int,
@@ -735,6 +839,163 @@ class ReplayBuffer:
         return transitions
 
 
+# Attributes set by `ReplayBuffer._initialize_storage`, sent to the process that created a shared buffer
+_SHARED_STORAGE_ATTRIBUTES = (
+    "states",
+    "next_states",
+    "actions",
+    "rewards",
+    "dones",
+    "truncateds",
+    "has_complementary_info",
+    "complementary_info_keys",
+    "complementary_info",
+)
+
+
+class SharedMemoryReplayBuffer(ReplayBuffer):
+    def __init__(
+        self,
+        capacity: int,
+        device: str = "cuda:0",
+        state_keys: Sequence[str] | None = None,
+        image_augmentation_function: Callable | None = None,
+        use_drq: bool = True,
+        storage_device: str = "cpu",
+        optimize_memory: bool = False,
+    ):
+        """
+        Replay buffer whose storage lives in shared CPU memory, so that one process can write transitions
+        while another one samples from them.
+
+        The `position` and `size` counters are backed by `multiprocessing.Value` objects. Writers only
+        advance them once the data has been copied, so a reader never samples a slot that was not written
+        yet. Once the buffer is full, a sampled slot may be overwritten while it is read; as for the
+        asynchronous prefetching iterator, this is accepted in exchange for lock-free sampling.
+
+        The storage is moved to shared memory when it is allocated. It can be allocated before the buffer
+        is handed over to another process, with `allocate_storage` or by filling the buffer first (e.g. with
+        `from_lerobot_dataset`). Otherwise the process writing the first transitions allocates it from their
+        shapes and sends it back to the process that created the buffer, which receives it as soon as it
+        sees a non-empty buffer.
+
+        Args:
+            capacity (int): Maximum number of transitions to store in the buffer.
+            device (str): The device where the tensors will be moved when sampling ("cuda:0" or "cpu").
+            state_keys (List[str]): The list of keys that appear in `state` and `next_state`.
+            image_augmentation_function (Optional[Callable]): A function that takes a batch of images
+                and returns a batch of augmented images. If None, a default augmentation function is used.
+            use_drq (bool): Whether to use the default DRQ image augmentation style, when sampling in the buffer.
+            storage_device: Must be "cpu", shared memory is only supported for CPU tensors.
+            optimize_memory (bool): If True, optimizes memory by not storing duplicate next_states when
+                they can be derived from states.
+        """
+        if torch.device(storage_device).type != "cpu":
+            raise ValueError(
+                f"SharedMemoryReplayBuffer only supports CPU storage, got storage_device={storage_device}."
+            )
+
+        # The counters must exist before the parent constructor assigns `position` and `size`
+        self._shared_position = mp.Value("q", 0)
+        self._shared_size = mp.Value("q", 0)
+        # Storage allocated by another process is sent back to the one that created the buffer
+        self._owner_pid = os.getpid()
+        self._storage_queue = mp.Queue()
+
+        super().__init__(
+            capacity=capacity,
+            device=device,
+            state_keys=state_keys,
+            image_augmentation_function=image_augmentation_function,
+            use_drq=use_drq,
+            storage_device=storage_device,
+            optimize_memory=optimize_memory,
+        )
+        self.episode_ends.share_memory_()
+
+    @property
+    def position(self) -> int:
+        return self._shared_position.value
+
+    @position.setter
+    def position(self, value: int):
+        self._shared_position.value = value
+
+    @property
+    def size(self) -> int:
+        return self._shared_size.value
+
+    @size.setter
+    def size(self, value: int):
+        self._shared_size.value = value
+
+    @property
+    def initialized(self) -> bool:
+        if not self._initialized and self.size > 0 and os.getpid() == self._owner_pid:
+            self._receive_storage()
+        return self._initialized
+
+    @initialized.setter
+    def initialized(self, value: bool):
+        self._initialized = value
+
+    def allocate_storage(
+        self,
+        state_shapes: dict[str, Sequence[int]],
+        action_shape: Sequence[int],
+        complementary_info_shapes: dict[str, Sequence[int]] | None = None,
+    ):
+        """
+        Eagerly allocate the shared storage, instead of waiting for the first transition.
+
+        Args:
+            state_shapes (dict[str, Sequence[int]]): Shape of a single state tensor for each state key.
+            action_shape (Sequence[int]): Shape of a single action.
+            complementary_info_shapes (dict[str, Sequence[int]] | None): Shape of a single value for each
+                complementary info key, use `()` for scalars.
+        """
+        if self.initialized:
+            raise RuntimeError("The storage of the replay buffer is already allocated.")
+
+        complementary_info = None
+        if complementary_info_shapes is not None:
+            complementary_info = {
+                key: torch.empty((1, *shape)) for key, shape in complementary_info_shapes.items()
+            }
+
+        self._initialize_storage(
+            state={key: torch.empty((1, *shape)) for key, shape in state_shapes.items()},
+            action=torch.empty((1, *action_shape)),
+            complementary_info=complementary_info,
+        )
+
+    def _initialize_storage(
+        self,
+        state: dict[str, torch.Tensor],
+        action: torch.Tensor,
+        complementary_info: dict[str, torch.Tensor] | None = None,
+    ):
+        super()._initialize_storage(state=state, action=action, complementary_info=complementary_info)
+
+        storage = [self.actions, self.rewards, self.dones, self.truncateds]
+        storage += list(self.states.values())
+        if not self.optimize_memory:
+            storage += list(self.next_states.values())
+        storage += list(self.complementary_info.values())
+        for tensor in storage:
+            tensor.share_memory_()
+
+        if os.getpid() != self._owner_pid:
+            self._storage_queue.put({name: getattr(self, name) for name in _SHARED_STORAGE_ATTRIBUTES})
+
+    def _receive_storage(self):
+        """Adopt the storage allocated by the process that wrote the first transitions."""
+        storage = self._storage_queue.get()
+        for name, value in storage.items():
+            setattr(self, name, value)
+        self.initialized = True
+
+
 # Utility function to guess shapes/dtypes from a tensor
 def guess_feature_info(t, name: str):
     """
@@ -758,6 +1019,52 @@ def guess_feature_info(t, name: str):
         }
 
 
+def stack_transitions(transitions: Sequence[Transition]) -> BatchTransition:
+    """
+    Stacks a list of single transitions into one batched transition, as expected by `ReplayBuffer.add_batch`.
+
+    State, next state and action tensors may or may not carry a leading batch dimension of size 1, it is
+    squeezed the same way `ReplayBuffer.add` does. Python scalars (rewards, flags, complementary info values)
+    are gathered into 1D tensors. Only complementary info keys present in every transition are kept.
+
+    Args:
+        transitions (Sequence[Transition]): The transitions to stack, all with the same keys and shapes.
+
+    Returns:
+        BatchTransition: A transition whose values have a leading dimension of size `len(transitions)`.
+    """
+    if len(transitions) == 0:
+        raise ValueError("Cannot stack an empty list of transitions.")
+
+    def _stack(values: list) -> torch.Tensor:
+        if isinstance(values[0], torch.Tensor):
+            return torch.stack([value.squeeze(dim=0) for value in values])
+        return torch.tensor(values)
+
+    first = transitions[0]
+
+    complementary_info = None
+    if first.get("complementary_info") is not None:
+        common_keys = [
+            key
+            for key in first["complementary_info"]
+            if all(key in (t.get("complementary_info") or {}) for t in transitions)
+        ]
+        complementary_info = {
+            key: _stack([t["complementary_info"][key] for t in transitions]) for key in common_keys
+        }
+
+    return BatchTransition(
+        state={key: _stack([t["state"][key] for t in transitions]) for key in first["state"]},
+        action=_stack([t[ACTION] for t in transitions]),
+        reward=torch.tensor([float(t["reward"]) for t in transitions]),
+        next_state={key: _stack([t["next_state"][key] for t in transitions]) for key in first["next_state"]},
+        done=torch.tensor([bool(t["done"]) for t in transitions]),
+        truncated=torch.tensor([bool(t["truncated"]) for t in transitions]),
+        complementary_info=complementary_info,
+    )
+
+
 def concatenate_batch_transitions(
     left_batch_transitions: BatchTransition, right_batch_transition: BatchTransition
 ) -> BatchTransition:
@@ -309,22 +309,7 @@ def make_robot_env(cfg: HILSerlRobotEnvConfig) -> tuple[gym.Env, Any]:
     """
     # Check if this is a GymHIL simulation environment
     if cfg.name == "gym_hil":
-        assert cfg.robot is None and cfg.teleop is None, "GymHIL environment does not support robot or teleop"
-        import gym_hil  # noqa: F401
-
-        # Extract gripper settings with defaults
-        use_gripper = cfg.processor.gripper.use_gripper if cfg.processor.gripper is not None else True
-        gripper_penalty = cfg.processor.gripper.gripper_penalty if cfg.processor.gripper is not None else 0.0
-
-        env = gym.make(
-            f"gym_hil/{cfg.task}",
-            image_obs=True,
-            render_mode="human",
-            use_gripper=use_gripper,
-            gripper_penalty=gripper_penalty,
-        )
-
-        return env, None
+        return make_gym_hil_env(cfg, render_mode="human"), None
 
     # Real robot environment
     assert cfg.robot is not None, "Robot config must be provided for real robot environment"
@@ -351,6 +336,60 @@ def make_robot_env(cfg: HILSerlRobotEnvConfig) -> tuple[gym.Env, Any]:
     return env, teleop_device
 
 
+def make_gym_hil_env(cfg: HILSerlRobotEnvConfig, render_mode: str = "human") -> gym.Env:
+    """Create a GymHIL simulation environment from configuration.
+
+    Args:
+        cfg: Environment configuration.
+        render_mode: Render mode of the simulation.
+
+    Returns:
+        The gym environment.
+    """
+    assert cfg.robot is None and cfg.teleop is None, "GymHIL environment does not support robot or teleop"
+    import gym_hil  # noqa: F401
+
+    # Extract gripper settings with defaults
+    use_gripper = cfg.processor.gripper.use_gripper if cfg.processor.gripper is not None else True
+    gripper_penalty = cfg.processor.gripper.gripper_penalty if cfg.processor.gripper is not None else 0.0
+
+    return gym.make(
+        f"gym_hil/{cfg.task}",
+        image_obs=True,
+        render_mode=render_mode,
+        use_gripper=use_gripper,
+        gripper_penalty=gripper_penalty,
+    )
+
+
+def make_robot_vector_env(cfg: HILSerlRobotEnvConfig) -> gym.vector.VectorEnv:
+    """Create `cfg.num_envs` simulation environments stepped together in a gym vector environment.
+
+    Only GymHIL simulations can be vectorized. The sub-environments are rendered off-screen and
+    reset automatically in the step where their episode ends, the final observation being
+    available in the `final_obs` info (see `step_vector_env_and_process_transitions`).
+
+    Args:
+        cfg: Environment configuration.
+
+    Returns:
+        A `gym.vector.AsyncVectorEnv` if `cfg.use_async_envs` is set, a `gym.vector.SyncVectorEnv` otherwise.
+
+    Raises:
+        ValueError: If the environment is not a GymHIL simulation or `cfg.num_envs` is lower than 1.
+    """
+    if cfg.name != "gym_hil":
+        raise ValueError(f"Only the gym_hil simulation can be vectorized, got env name '{cfg.name}'.")
+    if cfg.num_envs < 1:
+        raise ValueError(f"`num_envs` must be at least 1, got {cfg.num_envs}.")
+
+    env_cls = gym.vector.AsyncVectorEnv if cfg.use_async_envs else gym.vector.SyncVectorEnv
+    return env_cls(
+        [lambda: make_gym_hil_env(cfg, render_mode="rgb_array") for _ in range(cfg.num_envs)],
+        autoreset_mode=gym.vector.AutoresetMode.SAME_STEP,
+    )
+
+
 def make_processors(
     env: gym.Env, teleop_device: Teleoperator | None, cfg: HILSerlRobotEnvConfig, device: str = "cpu"
 ) -> tuple[
@@ -557,6 +596,128 @@ def step_env_and_process_transition(
     return new_transition
 
 
+def index_vector_env_data(data: dict[str, Any], index: int) -> dict[str, Any]:
+    """Select the data of one sub-environment in the observations or infos of a vector environment.
+
+    Vector environments stack the values of every sub-environment along the first dimension. Infos
+    also come with a boolean `_<key>` mask telling which sub-environments provided `<key>`.
+
+    Args:
+        data: Observation or info dictionary returned by the vector environment.
+        index: Index of the sub-environment.
+
+    Returns:
+        The (possibly nested) dictionary of the sub-environment.
+    """
+    env_data = {}
+    for key, value in data.items():
+        if key.startswith("_"):
+            continue
+        mask = data.get(f"_{key}")
+        if mask is not None and not mask[index]:
+            continue
+        env_data[key] = index_vector_env_data(value, index) if isinstance(value, dict) else value[index]
+    return env_data
+
+
+def step_vector_env_and_process_transitions(
+    env: gym.vector.VectorEnv,
+    transitions: list[EnvTransition],
+    actions: torch.Tensor,
+    env_processors: list[DataProcessorPipeline[EnvTransition, EnvTransition]],
+    action_processors: list[DataProcessorPipeline[EnvTransition, EnvTransition]],
+) -> tuple[list[EnvTransition], list[EnvTransition | None]]:
+    """
+    Execute one step of a vector environment with one pair of processors per sub-environment.
+
+    This is the vectorized counterpart of `step_env_and_process_transition`. The vector environment
+    must reset its sub-environments in the same step their episode ends
+    (`gym.vector.AutoresetMode.SAME_STEP`). Sub-environments whose episode is ended by the action
+    processor only are reset here as well.
+
+    Args:
+        env: The vector environment
+        transitions: Current transition of every sub-environment
+        actions: Batched actions of shape (num_envs, action_dim)
+        env_processors: Environment processor of every sub-environment
+        action_processors: Action processor of every sub-environment
+
+    Returns:
+        Tuple of (processed transitions, reset transitions). The reset transition of a sub-environment
+        is the processed first transition of its next episode, or None if its episode goes on.
+    """
+    processed_action_transitions = []
+    for i, transition in enumerate(transitions):
+        transition[TransitionKey.ACTION] = actions[i : i + 1]
+        transition[TransitionKey.OBSERVATION] = {}
+        processed_action_transitions.append(action_processors[i](transition))
+
+    processed_actions = np.stack(
+        [np.asarray(t[TransitionKey.ACTION]) for t in processed_action_transitions], axis=0
+    )
+    obs, reward, terminated, truncated, info = env.step(processed_actions)
+
+    new_transitions = []
+    reset_observations = []
+    reset_infos = []
+    for i, processed_action_transition in enumerate(processed_action_transitions):
+        env_obs = index_vector_env_data(obs, i)
+        env_info = index_vector_env_data(info, i)
+        if "final_obs" in env_info:
+            # The sub-environment was already reset, the observation is the first one of the next episode
+            reset_observations.append(env_obs)
+            env_obs = env_info.pop("final_obs")
+            reset_infos.append(env_info)
+            env_info = env_info.pop("final_info")
+        else:
+            reset_observations.append(None)
+            reset_infos.append(None)
+
+        env_reward = reward[i] + processed_action_transition[TransitionKey.REWARD]
+        env_terminated = bool(terminated[i]) or processed_action_transition[TransitionKey.DONE]
+        env_truncated = bool(truncated[i]) or processed_action_transition[TransitionKey.TRUNCATED]
+        complementary_data = processed_action_transition[TransitionKey.COMPLEMENTARY_DATA].copy()
+        new_info = processed_action_transition[TransitionKey.INFO].copy()
+        new_info.update(env_info)
+
+        new_transition = create_transition(
+            observation=env_obs,
+            action=processed_action_transition[TransitionKey.ACTION],
+            reward=env_reward,
+            done=env_terminated,
+            truncated=env_truncated,
+            info=new_info,
+            complementary_data=complementary_data,
+        )
+        new_transitions.append(env_processors[i](new_transition))
+
+    # Episodes ended by the action processor (e.g. intervention success) are not reset by the vector env
+    reset_mask = np.array(
+        [
+            reset_observations[i] is None and (t[TransitionKey.DONE] or t[TransitionKey.TRUNCATED])
+            for i, t in enumerate(new_transitions)
+        ],
+        dtype=np.bool_,
+    )
+    if reset_mask.any():
+        obs, info = env.reset(options={"reset_mask": reset_mask})
+        for i in np.flatnonzero(reset_mask):
+            reset_observations[i] = index_vector_env_data(obs, i)
+            reset_infos[i] = index_vector_env_data(info, i)
+
+    reset_transitions = []
+    for i, reset_observation in enumerate(reset_observations):
+        if reset_observation is None:
+            reset_transitions.append(None)
+            continue
+        env_processors[i].reset()
+        action_processors[i].reset()
+        reset_transition = create_transition(observation=reset_observation, info=reset_infos[i])
+        reset_transitions.append(env_processors[i](reset_transition))
+
+    return new_transitions, reset_transitions
+
+
 def control_loop(
     env: gym.Env,
     env_processor: DataProcessorPipeline[EnvTransition, EnvTransition],
@@ -66,7 +66,13 @@ from lerobot.datasets.factory import make_dataset
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
 from lerobot.policies.factory import make_policy
 from lerobot.policies.sac.modeling_sac import SACPolicy
-from lerobot.rl.buffer import ReplayBuffer, concatenate_batch_transitions
+from lerobot.rl.buffer import (
+    BatchTransition,
+    ReplayBuffer,
+    SharedMemoryReplayBuffer,
+    concatenate_batch_transitions,
+    stack_transitions,
+)
 from lerobot.rl.process import ProcessSignalHandler
 from lerobot.rl.wandb_utils import WandBLogger
 from lerobot.robots import so_follower  # noqa: F401
@@ -93,7 +99,7 @@ from lerobot.utils.train_utils import (
     save_checkpoint,
     update_last_checkpoint,
 )
-from lerobot.utils.transition import move_state_dict_to_device, move_transition_to_device
+from lerobot.utils.transition import move_state_dict_to_device
 from lerobot.utils.utils import (
     format_big_number,
     get_safe_torch_device,
@@ -102,6 +108,9 @@ from lerobot.utils.utils import (
 
 from .learner_service import MAX_WORKERS, SHUTDOWN_TIMEOUT, LearnerService
 
+INGESTION_IDLE_WAIT_S = 0.001
+INGESTION_LOG_INTERVAL_S = 10.0
+
 
 @parser.wrap()
 def train_cli(cfg: TrainRLServerPipelineConfig):
@@ -206,6 +215,19 @@ def start_learner_threads(
 
         concurrency_entity = Process
 
+    # With a dedicated ingestion process, the replay buffers must be created before the communication
+    # process is spawned so both processes see the same shared storage
+    replay_buffer = None
+    offline_replay_buffer = None
+    if use_ingestion_process(cfg):
+        device = get_safe_torch_device(try_device=cfg.policy.device)
+        storage_device = get_safe_torch_device(try_device=cfg.policy.storage_device)
+        replay_buffer = initialize_replay_buffer(cfg, device, storage_device, shared_memory=True)
+        if cfg.dataset is not None:
+            offline_replay_buffer = initialize_offline_replay_buffer(
+                cfg=cfg, device=device, storage_device=storage_device, shared_memory=True
+            )
+
     communication_process = concurrency_entity(
         target=start_learner,
         args=(
@@ -214,6 +236,8 @@ def start_learner_threads(
             interaction_message_queue,
             shutdown_event,
             cfg,
+            replay_buffer,
+            offline_replay_buffer,
         ),
         daemon=True,
     )
@@ -226,6 +250,8 @@ def start_learner_threads(
         transition_queue=transition_queue,
         interaction_message_queue=interaction_message_queue,
         parameters_queue=parameters_queue,
+        replay_buffer=replay_buffer,
+        offline_replay_buffer=offline_replay_buffer,
     )
     logging.info("[LEARNER] Training process stopped")
 
@@ -255,6 +281,8 @@ def add_actor_information_and_train(
     transition_queue: Queue,
     interaction_message_queue: Queue,
     parameters_queue: Queue,
+    replay_buffer: ReplayBuffer | None = None,
+    offline_replay_buffer: ReplayBuffer | None = None,
 ):
     """
     Handles data transfer from the actor to the learner, manages training updates,
@@ -271,6 +299,8 @@ def add_actor_information_and_train(
     NOTE: This function doesn't have a single responsibility, it should be split into multiple functions
     in the future. The reason why we did that is the  GIL in Python. It's super slow the performance
     are divided by 200. So we need to have a single thread that does all the work.
+    With `concurrency.learner_ingestion="process"`, transitions are written into shared-memory replay buffers
+    by the communication process instead, and this function only samples from them.
 
     Args:
         cfg (TrainRLServerPipelineConfig): Configuration object containing hyperparameters.
@@ -279,6 +309,10 @@ def add_actor_information_and_train(
         transition_queue (Queue): Queue for receiving transitions from the actor.
         interaction_message_queue (Queue): Queue for receiving interaction messages from the actor.
         parameters_queue (Queue): Queue for sending policy parameters to the actor.
+        replay_buffer (ReplayBuffer | None): Online replay buffer, filled by the ingestion process. If None,
+            it is created here and filled by this function.
+        offline_replay_buffer (ReplayBuffer | None): Offline replay buffer, shared with the ingestion process.
+            If None and a dataset is configured, it is created here.
     """
     # Extract all configuration variables at the beginning, it improve the speed performance
     # of 7%
@@ -295,6 +329,7 @@ def add_actor_information_and_train(
     saving_checkpoint = cfg.save_checkpoint
     online_steps = cfg.policy.online_steps
     async_prefetch = cfg.policy.async_prefetch
+    ingestion_in_separate_process = use_ingestion_process(cfg)
 
     # Initialize logging for multiprocessing
     if not use_threads(cfg):
@@ -326,16 +361,17 @@ def add_actor_information_and_train(
 
     log_training_info(cfg=cfg, policy=policy)
 
-    replay_buffer = initialize_replay_buffer(cfg, device, storage_device)
+    if replay_buffer is None:
+        replay_buffer = initialize_replay_buffer(cfg, device, storage_device)
     batch_size = cfg.batch_size
-    offline_replay_buffer = None
 
     if cfg.dataset is not None:
-        offline_replay_buffer = initialize_offline_replay_buffer(
-            cfg=cfg,
-            device=device,
-            storage_device=storage_device,
-        )
+        if offline_replay_buffer is None:
+            offline_replay_buffer = initialize_offline_replay_buffer(
+                cfg=cfg,
+                device=device,
+                storage_device=storage_device,
+            )
         batch_size: int = batch_size // 2  # We will sample from both replay buffer
 
     logging.info("Starting learner thread")
@@ -351,6 +387,11 @@ def add_actor_information_and_train(
     online_iterator = None
     offline_iterator = None
 
+    # Throughput of the optimization loop, measured over each logging window
+    log_window_start_time = None
+    log_window_start_step = optimization_step
+    log_window_ingestion_time = 0.0
+
     # NOTE: THIS IS THE MAIN LOOP OF THE LEARNER
     while True:
         # Exit the training loop if shutdown is requested
@@ -359,14 +400,16 @@ def add_actor_information_and_train(
             break
 
         # Process all available transitions to the replay buffer, send by the actor server
-        process_transitions(
-            transition_queue=transition_queue,
-            replay_buffer=replay_buffer,
-            offline_replay_buffer=offline_replay_buffer,
-            device=device,
-            dataset_repo_id=dataset_repo_id,
-            shutdown_event=shutdown_event,
-        )
+        if not ingestion_in_separate_process:
+            ingestion_start_time = time.perf_counter()
+            process_transitions(
+                transition_queue=transition_queue,
+                replay_buffer=replay_buffer,
+                offline_replay_buffer=offline_replay_buffer,
+                dataset_repo_id=dataset_repo_id,
+                shutdown_event=shutdown_event,
+            )
+            log_window_ingestion_time += time.perf_counter() - ingestion_start_time
 
         # Process all available interaction messages sent by the actor server
         interaction_message = process_interaction_messages(
@@ -381,15 +424,22 @@ def add_actor_information_and_train(
             continue
 
         if online_iterator is None:
+            # Compile the image augmentation for every batch size before training starts
+            replay_buffer.warmup_image_augmentation(batch_size=batch_size)
             online_iterator = replay_buffer.get_iterator(
                 batch_size=batch_size, async_prefetch=async_prefetch, queue_size=2
             )
 
         if offline_replay_buffer is not None and offline_iterator is None:
+            offline_replay_buffer.warmup_image_augmentation(batch_size=batch_size)
             offline_iterator = offline_replay_buffer.get_iterator(
                 batch_size=batch_size, async_prefetch=async_prefetch, queue_size=2
             )
 
+        if log_window_start_time is None:
+            log_window_start_time = time.perf_counter()
+            log_window_ingestion_time = 0.0
+
         time_for_one_optimization_step = time.time()
         for _ in range(utd_ratio - 1):
             # Sample from the iterators
@@ -563,6 +613,25 @@ def add_actor_information_and_train(
                 training_infos["offline_replay_buffer_size"] = len(offline_replay_buffer)
             training_infos["Optimization step"] = optimization_step
 
+            # Optimization throughput over the window, comparable between the inline and split ingestion
+            log_window_duration = time.perf_counter() - log_window_start_time
+            if optimization_step > log_window_start_step:
+                training_infos["Optimization steps/s"] = (
+                    optimization_step - log_window_start_step
+                ) / log_window_duration
+                training_infos["Transition ingestion time ratio"] = (
+                    log_window_ingestion_time / log_window_duration
+                )
+                training_infos["Ingestion process"] = int(ingestion_in_separate_process)
+                logging.info(
+                    f"[LEARNER] Optimization steps/s: {training_infos['Optimization steps/s']:.2f} "
+                    f"(ingestion: {'process' if ingestion_in_separate_process else 'inline'}, "
+                    f"time spent ingesting: {training_infos['Transition ingestion time ratio']:.1%})"
+                )
+            log_window_start_time = time.perf_counter()
+            log_window_start_step = optimization_step
+            log_window_ingestion_time = 0.0
+
             # Log training metrics
             if wandb_logger:
                 wandb_logger.log_dict(d=training_infos, mode="train", custom_step_key="Optimization step")
@@ -610,18 +679,25 @@ def start_learner(
     interaction_message_queue: Queue,
     shutdown_event: any,  # Event,
     cfg: TrainRLServerPipelineConfig,
+    replay_buffer: SharedMemoryReplayBuffer | None = None,
+    offline_replay_buffer: SharedMemoryReplayBuffer | None = None,
 ):
     """
     Start the learner server for training.
     It will receive transitions and interaction messages from the actor server,
     and send policy parameters to the actor server.
 
+    When shared-memory replay buffers are given, this process also ingests the received transitions
+    into them, so that the training process never has to.
+
     Args:
         parameters_queue: Queue for sending policy parameters to the actor
         transition_queue: Queue for receiving transitions from the actor
         interaction_message_queue: Queue for receiving interaction messages from the actor
         shutdown_event: Event to signal shutdown
         cfg: Training configuration
+        replay_buffer: Shared-memory online replay buffer to ingest transitions into
+        offline_replay_buffer: Shared-memory offline replay buffer for intervention transitions
     """
     if not use_threads(cfg):
         # Create a process-specific log file
@@ -646,10 +722,12 @@ def start_learner(
         transition_queue=transition_queue,
         interaction_message_queue=interaction_message_queue,
         queue_get_timeout=cfg.policy.actor_learner_config.queue_get_timeout,
+        transitions_queue_size_per_actor=cfg.policy.actor_learner_config.transitions_queue_size_per_actor,
     )
 
+    # Every actor keeps one streaming call per worker open
     server = grpc.server(
-        ThreadPoolExecutor(max_workers=MAX_WORKERS),
+        ThreadPoolExecutor(max_workers=MAX_WORKERS * cfg.policy.actor_learner_config.max_actors),
         options=[
             ("grpc.max_receive_message_length", MAX_MESSAGE_SIZE),
             ("grpc.max_send_message_length", MAX_MESSAGE_SIZE),
@@ -668,7 +746,16 @@ def start_learner(
     server.start()
     logging.info("[LEARNER] gRPC server started")
 
-    shutdown_event.wait()
+    if replay_buffer is not None:
+        ingest_transitions_until_shutdown(
+            transition_queue=transition_queue,
+            replay_buffer=replay_buffer,
+            offline_replay_buffer=offline_replay_buffer,
+            dataset_repo_id=cfg.dataset.repo_id if cfg.dataset is not None else None,
+            shutdown_event=shutdown_event,
+        )
+    else:
+        shutdown_event.wait()
     logging.info("[LEARNER] Stopping gRPC server...")
     server.stop(SHUTDOWN_TIMEOUT)
     logging.info("[LEARNER] gRPC server stopped")
@@ -933,7 +1020,7 @@ def log_training_info(cfg: TrainRLServerPipelineConfig, policy: nn.Module) -> No
 
 
 def initialize_replay_buffer(
-    cfg: TrainRLServerPipelineConfig, device: str, storage_device: str
+    cfg: TrainRLServerPipelineConfig, device: str, storage_device: str, shared_memory: bool = False
 ) -> ReplayBuffer:
     """
     Initialize a replay buffer, either empty or from a dataset if resuming.
@@ -942,18 +1029,23 @@ def initialize_replay_buffer(
         cfg (TrainRLServerPipelineConfig): Training configuration
         device (str): Device to store tensors on
         storage_device (str): Device for storage optimization
+        shared_memory (bool): If True, create a `SharedMemoryReplayBuffer`, so it can be filled from another
+            process
 
     Returns:
         ReplayBuffer: Initialized replay buffer
     """
+    buffer_cls = SharedMemoryReplayBuffer if shared_memory else ReplayBuffer
+
     if not cfg.resume:
-        return ReplayBuffer(
+        replay_buffer = buffer_cls(
             capacity=cfg.policy.online_buffer_capacity,
             device=device,
             state_keys=cfg.policy.input_features.keys(),
             storage_device=storage_device,
             optimize_memory=True,
         )
+        return replay_buffer
 
     logging.info("Resume training load the online dataset")
     dataset_path = os.path.join(cfg.output_dir, "dataset")
@@ -966,19 +1058,21 @@ def initialize_replay_buffer(
         repo_id=repo_id,
         root=dataset_path,
     )
-    return ReplayBuffer.from_lerobot_dataset(
+    replay_buffer = buffer_cls.from_lerobot_dataset(
         lerobot_dataset=dataset,
         capacity=cfg.policy.online_buffer_capacity,
         device=device,
         state_keys=cfg.policy.input_features.keys(),
         optimize_memory=True,
     )
+    return replay_buffer
 
 
 def initialize_offline_replay_buffer(
     cfg: TrainRLServerPipelineConfig,
     device: str,
     storage_device: str,
+    shared_memory: bool = False,
 ) -> ReplayBuffer:
     """
     Initialize an offline replay buffer from a dataset.
@@ -987,6 +1081,7 @@ def initialize_offline_replay_buffer(
         cfg (TrainRLServerPipelineConfig): Training configuration
         device (str): Device to store tensors on
         storage_device (str): Device for storage optimization
+        shared_memory (bool): If True, create a `SharedMemoryReplayBuffer`
 
     Returns:
         ReplayBuffer: Initialized offline replay buffer
@@ -1003,7 +1098,8 @@ def initialize_offline_replay_buffer(
         )
 
     logging.info("Convert to a offline replay buffer")
-    offline_replay_buffer = ReplayBuffer.from_lerobot_dataset(
+    buffer_cls = SharedMemoryReplayBuffer if shared_memory else ReplayBuffer
+    offline_replay_buffer = buffer_cls.from_lerobot_dataset(
         offline_dataset,
         device=device,
         state_keys=cfg.policy.input_features.keys(),
@@ -1048,6 +1144,10 @@ def use_threads(cfg: TrainRLServerPipelineConfig) -> bool:
     return cfg.policy.concurrency.learner == "threads"
 
 
+def use_ingestion_process(cfg: TrainRLServerPipelineConfig) -> bool:
+    return cfg.policy.concurrency.learner_ingestion == "process"
+
+
 def check_nan_in_transition(
     observations: torch.Tensor,
     actions: torch.Tensor,
@@ -1094,6 +1194,58 @@ def check_nan_in_transition(
     return nan_detected
 
 
+def check_nan_in_batch_transition(
+    observations: dict[str, torch.Tensor],
+    actions: torch.Tensor,
+    next_state: dict[str, torch.Tensor],
+) -> torch.Tensor:
+    """
+    Vectorized counterpart of `check_nan_in_transition` for a chunk of stacked transitions.
+
+    A single reduction is performed per key over the whole chunk, instead of one per transition.
+
+    Args:
+        observations: Dictionary of batched observation tensors of shape (N, ...)
+        actions: Batched action tensor of shape (N, ...)
+        next_state: Dictionary of batched next state tensors of shape (N, ...)
+
+    Returns:
+        torch.Tensor: Boolean mask of shape (N,), True for transitions containing NaN values
+    """
+    num_transitions = actions.shape[0]
+    nan_mask = torch.zeros(num_transitions, dtype=torch.bool, device=actions.device)
+
+    named_tensors = [(f"observations[{key}]", tensor) for key, tensor in observations.items()]
+    named_tensors += [(f"next_state[{key}]", tensor) for key, tensor in next_state.items()]
+    named_tensors.append(("actions", actions))
+
+    for name, tensor in named_tensors:
+        key_nan_mask = torch.isnan(tensor.reshape(num_transitions, -1)).any(dim=1)
+        if key_nan_mask.any():
+            logging.error(f"{name} contains NaN values")
+            nan_mask |= key_nan_mask.to(nan_mask.device)
+
+    return nan_mask
+
+
+def index_batch_transition(batch: BatchTransition, index: torch.Tensor) -> BatchTransition:
+    """Select a subset of a batched transition along its first dimension."""
+    complementary_info = batch.get("complementary_info")
+    return BatchTransition(
+        state={key: val[index] for key, val in batch["state"].items()},
+        action=batch[ACTION][index],
+        reward=batch["reward"][index],
+        next_state={key: val[index] for key, val in batch["next_state"].items()},
+        done=batch["done"][index],
+        truncated=batch["truncated"][index],
+        complementary_info=(
+            {key: val[index] for key, val in complementary_info.items()}
+            if complementary_info is not None
+            else None
+        ),
+    )
+
+
 def push_actor_policy_to_queue(parameters_queue: Queue, policy: nn.Module):
     logging.debug("[LEARNER] Pushing actor policy to the queue")
 
@@ -1130,43 +1282,106 @@ def process_transitions(
     transition_queue: Queue,
     replay_buffer: ReplayBuffer,
     offline_replay_buffer: ReplayBuffer,
-    device: str,
     dataset_repo_id: str | None,
     shutdown_event: any,
 ):
     """Process all available transitions from the queue.
 
+    Each message received from the actor is a chunk of transitions. The chunk is stacked into batched
+    tensors, checked for NaN values in a vectorized way and written into the replay buffer with
+    `ReplayBuffer.add_batch`, so ingestion costs a handful of tensor operations per chunk instead of
+    several small copies per transition and key. Transitions are copied straight to the buffer storage
+    device, the sampling device is only used when batches are drawn.
+
     Args:
         transition_queue: Queue for receiving transitions from the actor
         replay_buffer: Replay buffer to add transitions to
         offline_replay_buffer: Offline replay buffer to add transitions to
-        device: Device to move transitions to
         dataset_repo_id: Repository ID for dataset
         shutdown_event: Event to signal shutdown
+
+    Returns:
+        int: The number of transitions added to the online replay buffer
     """
+    num_added = 0
     while not transition_queue.empty() and not shutdown_event.is_set():
         transition_list = transition_queue.get()
         transition_list = bytes_to_transitions(buffer=transition_list)
+        if len(transition_list) == 0:
+            continue
+
+        batch = stack_transitions(transition_list)
+
+        # Skip transitions with NaN values
+        nan_mask = check_nan_in_batch_transition(
+            observations=batch["state"],
+            actions=batch[ACTION],
+            next_state=batch["next_state"],
+        )
+        if nan_mask.any():
+            logging.warning(f"[LEARNER] NaN detected in {int(nan_mask.sum())} transition(s), skipping")
+            batch = index_batch_transition(batch, ~nan_mask)
+
+        replay_buffer.add_batch(**batch)
+        num_added += batch[ACTION].shape[0]
+
+        # Add to offline buffer if it's an intervention
+        complementary_info = batch.get("complementary_info") or {}
+        if dataset_repo_id is not None and TeleopEvents.IS_INTERVENTION in complementary_info:
+            intervention_mask = complementary_info[TeleopEvents.IS_INTERVENTION].bool()
+            if intervention_mask.any():
+                offline_replay_buffer.add_batch(**index_batch_transition(batch, intervention_mask))
+
+    return num_added
+
+
+def ingest_transitions_until_shutdown(
+    transition_queue: Queue,
+    replay_buffer: ReplayBuffer,
+    offline_replay_buffer: ReplayBuffer | None,
+    dataset_repo_id: str | None,
+    shutdown_event: any,
+):
+    """Dedicated ingestion loop, writing received transitions into shared-memory replay buffers.
+
+    It runs in the communication process when `concurrency.learner_ingestion="process"`, so that the
+    training process spends its time on gradient steps only.
+
+    Args:
+        transition_queue: Queue for receiving transitions from the actor
+        replay_buffer: Shared-memory replay buffer to add transitions to
+        offline_replay_buffer: Shared-memory offline replay buffer to add intervention transitions to
+        dataset_repo_id: Repository ID for dataset
+        shutdown_event: Event to signal shutdown
+    """
+    logging.info("[LEARNER] Starting transitions ingestion loop")
+    num_ingested = 0
+    last_log_time = time.perf_counter()
+
+    while not shutdown_event.is_set():
+        num_added = process_transitions(
+            transition_queue=transition_queue,
+            replay_buffer=replay_buffer,
+            offline_replay_buffer=offline_replay_buffer,
+            dataset_repo_id=dataset_repo_id,
+            shutdown_event=shutdown_event,
+        )
+        num_ingested += num_added
+
+        elapsed = time.perf_counter() - last_log_time
+        if elapsed > INGESTION_LOG_INTERVAL_S:
+            logging.info(
+                f"[LEARNER] Ingestion rate [transitions/s]: {num_ingested / elapsed:.1f}, "
+                f"replay buffer size: {len(replay_buffer)}"
+            )
+            num_ingested = 0
+            last_log_time = time.perf_counter()
+
+        # Nothing was waiting in the queue, avoid spinning on it
+        if num_added == 0:
+            shutdown_event.wait(INGESTION_IDLE_WAIT_S)
 
-        for transition in transition_list:
-            transition = move_transition_to_device(transition=transition, device=device)
-
-            # Skip transitions with NaN values
-            if check_nan_in_transition(
-                observations=transition["state"],
-                actions=transition[ACTION],
-                next_state=transition["next_state"],
-            ):
-                logging.warning("[LEARNER] NaN detected in transition, skipping")
-                continue
-
-            replay_buffer.add(**transition)
-
-            # Add to offline buffer if it's an intervention
-            if dataset_repo_id is not None and transition.get("complementary_info", {}).get(
-                TeleopEvents.IS_INTERVENTION
-            ):
-                offline_replay_buffer.add(**transition)
+    logging.info("[LEARNER] Transitions ingestion loop stopped")
 
 
 def process_interaction_messages(
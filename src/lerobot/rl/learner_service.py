@@ -16,7 +16,11 @@
 # limitations under the License.
 
 import logging
+import queue
+import threading
 import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from multiprocessing import Event, Queue
 
 from lerobot.rl.queue import get_last_item_from_queue
@@ -26,12 +30,100 @@ from lerobot.transport.utils import receive_bytes_in_chunks, send_bytes_in_chunk
 MAX_WORKERS = 3  # Stream parameters, send transitions and interactions
 SHUTDOWN_TIMEOUT = 10
 
+# Actors identify themselves with this gRPC metadata key (keys must be lowercase)
+ACTOR_ID_METADATA_KEY = "actor-id"
+DEFAULT_ACTOR_ID = "default"
+ACTOR_STATS_LOG_INTERVAL_S = 30.0
+
+
+def get_actor_id(context) -> str:
+    """Read the actor ID from the metadata of a gRPC call, actors that don't send one share `DEFAULT_ACTOR_ID`."""
+    for key, value in context.invocation_metadata() or ():
+        if key == ACTOR_ID_METADATA_KEY:
+            return value
+    return DEFAULT_ACTOR_ID
+
+
+@dataclass
+class ActorStats:
+    """Throughput counters of a single actor, as seen by the learner."""
+
+    transition_messages: int = 0
+    transition_bytes: int = 0
+    parameters_pushes: int = 0
+    backpressure_time: float = 0.0
+    first_message_time: float | None = None
+    last_message_time: float | None = None
+
+    def to_dict(self) -> dict[str, float]:
+        elapsed = 0.0
+        if self.first_message_time is not None and self.last_message_time is not None:
+            elapsed = self.last_message_time - self.first_message_time
+
+        return {
+            "Transition messages": self.transition_messages,
+            "Transition messages/s": self.transition_messages / elapsed if elapsed > 0 else 0.0,
+            "Transitions MB/s": self.transition_bytes / 1024 / 1024 / elapsed if elapsed > 0 else 0.0,
+            "Parameters pushes": self.parameters_pushes,
+            "Backpressure time [s]": self.backpressure_time,
+        }
+
+
+@dataclass
+class ActorConnection:
+    """
+    State kept by the learner for one actor: a bounded queue of received transition messages and its stats.
+
+    `put` is handed to `receive_bytes_in_chunks` in place of a queue. When the actor queue is full, it blocks
+    the gRPC handler of that actor, which in turn slows its stream down through gRPC flow control, while
+    the other actors keep streaming.
+    """
+
+    actor_id: str
+    queue_size: int
+    shutdown_event: Event  # type: ignore
+    on_put: Callable[[], None]
+    poll_timeout: float = 0.1
+    transitions: queue.Queue = field(init=False)
+    stats: ActorStats = field(default_factory=ActorStats)
+
+    def __post_init__(self):
+        self.transitions = queue.Queue(maxsize=self.queue_size)
+
+    def put(self, message: bytes):
+        blocked_since = time.perf_counter()
+        while True:
+            try:
+                self.transitions.put(message, timeout=self.poll_timeout)
+                break
+            except queue.Full:
+                if self.shutdown_event.is_set():
+                    logging.warning(f"[LEARNER] Dropping transitions from actor {self.actor_id} on shutdown")
+                    return
+
+        now = time.time()
+        self.stats.backpressure_time += time.perf_counter() - blocked_since
+        self.stats.transition_messages += 1
+        self.stats.transition_bytes += len(message)
+        if self.stats.first_message_time is None:
+            self.stats.first_message_time = now
+        self.stats.last_message_time = now
+
+        self.on_put()
+
 
 class LearnerService(services_pb2_grpc.LearnerServiceServicer):
     """
     Implementation of the LearnerService gRPC service
     This service is used to send parameters to the Actor and receive transitions and interactions from the Actor
     check transport.proto for the gRPC service definition
+
+    Several actors can connect to the same learner, they identify themselves with the `actor-id` metadata:
+    - Transitions of each actor go to a bounded per-actor queue. A fan-in thread forwards them to the learner
+      `transition_queue` in a round-robin fashion, so every actor gets the same share of the ingestion, and
+      stops forwarding while the learner has a backlog of unprocessed messages.
+    - Parameters are taken once from `parameters_queue`, split in chunks once, and the same chunks are
+      streamed to every actor.
     """
 
     def __init__(
@@ -42,6 +134,7 @@ class LearnerService(services_pb2_grpc.LearnerServiceServicer):
         transition_queue: Queue,
         interaction_message_queue: Queue,
         queue_get_timeout: float = 0.001,
+        transitions_queue_size_per_actor: int = 8,
     ):
         self.shutdown_event = shutdown_event
         self.parameters_queue = parameters_queue
@@ -49,12 +142,161 @@ class LearnerService(services_pb2_grpc.LearnerServiceServicer):
         self.transition_queue = transition_queue
         self.interaction_message_queue = interaction_message_queue
         self.queue_get_timeout = queue_get_timeout
+        self.transitions_queue_size_per_actor = transitions_queue_size_per_actor
+
+        # Connected actors and the round-robin fan-in of their transitions
+        self._actors: dict[str, ActorConnection] = {}
+        self._actors_lock = threading.Lock()
+        self._fan_in_lock = threading.Lock()
+        self._transitions_available = threading.Event()
+        self._fan_in_thread: threading.Thread | None = None
+
+        # Latest parameters, shared by every StreamParameters call. A single stream at a time reads the queue,
+        # the others wait on the condition for the version it publishes.
+        self._parameters_queue_lock = threading.Lock()
+        self._parameters_condition = threading.Condition()
+        self._parameters_version = 0
+        self._parameters_messages: list[services_pb2.Parameters] = []
+
+    def register_actor(self, actor_id: str) -> ActorConnection:
+        """Return the connection state of an actor, creating it on its first call."""
+        with self._actors_lock:
+            if actor_id not in self._actors:
+                logging.info(f"[LEARNER] New actor connected: {actor_id}")
+                self._actors[actor_id] = ActorConnection(
+                    actor_id=actor_id,
+                    queue_size=self.transitions_queue_size_per_actor,
+                    shutdown_event=self.shutdown_event,
+                    on_put=self._transitions_available.set,
+                    poll_timeout=self.queue_get_timeout,
+                )
+            return self._actors[actor_id]
+
+    def get_actor_stats(self) -> dict[str, dict[str, float]]:
+        """Per-actor throughput statistics, keyed by actor ID."""
+        with self._actors_lock:
+            actors = list(self._actors.values())
+        return {
+            actor.actor_id: {**actor.stats.to_dict(), "Queued messages": actor.transitions.qsize()}
+            for actor in actors
+        }
+
+    def fan_in_transitions(self) -> int:
+        """
+        Forward queued transition messages to the learner, taking one message per actor in turn.
+
+        Forwarding stops while the learner holds more unprocessed messages than the per-actor queue size
+        times the number of actors, which leaves the backlog in the per-actor queues and lets their
+        backpressure act.
+
+        Returns:
+            int: The number of forwarded messages.
+        """
+        with self._actors_lock:
+            actors = list(self._actors.values())
+        max_pending = self.transitions_queue_size_per_actor * max(1, len(actors))
+
+        num_forwarded = 0
+        with self._fan_in_lock:
+            while True:
+                forwarded_this_round = 0
+                for actor in actors:
+                    if self._pending_transition_messages() >= max_pending:
+                        return num_forwarded
+                    try:
+                        message = actor.transitions.get_nowait()
+                    except queue.Empty:
+                        continue
+                    self.transition_queue.put(message)
+                    forwarded_this_round += 1
+
+                num_forwarded += forwarded_this_round
+                if forwarded_this_round == 0:
+                    return num_forwarded
+
+    def _flush_actor_transitions(self, actor: ActorConnection):
+        """Forward everything left in the queue of an actor, regardless of the learner backlog."""
+        with self._fan_in_lock:
+            while True:
+                try:
+                    self.transition_queue.put(actor.transitions.get_nowait())
+                except queue.Empty:
+                    return
+
+    def _pending_transition_messages(self) -> int:
+        try:
+            return self.transition_queue.qsize()
+        except NotImplementedError:
+            # `qsize` is not implemented on macOS, don't limit the backlog there
+            return 0
+
+    def _fan_in_loop(self):
+        last_stats_log_time = time.perf_counter()
+        while not self.shutdown_event.is_set():
+            self._transitions_available.wait(timeout=self.queue_get_timeout)
+            self._transitions_available.clear()
+            self.fan_in_transitions()
+
+            if time.perf_counter() - last_stats_log_time > ACTOR_STATS_LOG_INTERVAL_S:
+                for actor_id, stats in self.get_actor_stats().items():
+                    logging.info(f"[LEARNER] Actor {actor_id} stats: {stats}")
+                last_stats_log_time = time.perf_counter()
+
+    def _ensure_fan_in_thread(self):
+        with self._fan_in_lock:
+            if self._fan_in_thread is None:
+                self._fan_in_thread = threading.Thread(target=self._fan_in_loop, daemon=True)
+                self._fan_in_thread.start()
+
+    def _get_parameters_newer_than(self, version: int) -> tuple[int, list[services_pb2.Parameters]] | None:
+        """
+        Return the latest parameters if they are newer than `version`, None otherwise.
+
+        The first stream that finds new parameters in the queue splits them in chunks, the other streams reuse
+        the same chunks, so the parameters are never serialized twice. Only the stream reading the queue
+        blocks on it, a stream behind on parameters gets the cached chunks right away.
+        """
+        is_reader = self._parameters_queue_lock.acquire(blocking=False)
+        if is_reader:
+            try:
+                with self._parameters_condition:
+                    behind = self._parameters_version > version
+                buffer = get_last_item_from_queue(
+                    self.parameters_queue, block=not behind, timeout=self.queue_get_timeout
+                )
+                if buffer is not None:
+                    messages = list(
+                        send_bytes_in_chunks(
+                            buffer,
+                            services_pb2.Parameters,
+                            log_prefix="[LEARNER] Sending parameters",
+                            silent=True,
+                        )
+                    )
+                    with self._parameters_condition:
+                        self._parameters_version += 1
+                        self._parameters_messages = messages
+                        self._parameters_condition.notify_all()
+            finally:
+                self._parameters_queue_lock.release()
+
+        with self._parameters_condition:
+            # Another stream is reading the queue, wait for the parameters it may find
+            self._parameters_condition.wait_for(
+                lambda: self._parameters_version > version,
+                timeout=0 if is_reader else self.queue_get_timeout,
+            )
+            if self._parameters_version <= version:
+                return None
+            return self._parameters_version, self._parameters_messages
 
     def StreamParameters(self, request, context):  # noqa: N802
         # TODO: authorize the request
-        logging.info("[LEARNER] Received request to stream parameters from the Actor")
+        actor = self.register_actor(get_actor_id(context))
+        logging.info(f"[LEARNER] Received request to stream parameters from the Actor {actor.actor_id}")
 
         last_push_time = 0
+        sent_version = 0
 
         while not self.shutdown_event.is_set():
             time_since_last_push = time.time() - last_push_time
@@ -64,39 +306,39 @@ class LearnerService(services_pb2_grpc.LearnerServiceServicer):
                 # and it's checked in the while loop
                 continue
 
-            logging.info("[LEARNER] Push parameters to the Actor")
-            buffer = get_last_item_from_queue(
-                self.parameters_queue, block=True, timeout=self.queue_get_timeout
-            )
+            logging.info(f"[LEARNER] Push parameters to the Actor {actor.actor_id}")
+            latest_parameters = self._get_parameters_newer_than(sent_version)
 
-            if buffer is None:
+            if latest_parameters is None:
                 continue
 
-            yield from send_bytes_in_chunks(
-                buffer,
-                services_pb2.Parameters,
-                log_prefix="[LEARNER] Sending parameters",
-                silent=True,
-            )
+            sent_version, messages = latest_parameters
+            yield from messages
 
             last_push_time = time.time()
-            logging.info("[LEARNER] Parameters sent")
+            actor.stats.parameters_pushes += 1
+            logging.info(f"[LEARNER] Parameters sent to the Actor {actor.actor_id}")
 
         logging.info("[LEARNER] Stream parameters finished")
         return services_pb2.Empty()
 
-    def SendTransitions(self, request_iterator, _context):  # noqa: N802
+    def SendTransitions(self, request_iterator, context):  # noqa: N802
         # TODO: authorize the request
-        logging.info("[LEARNER] Received request to receive transitions from the Actor")
+        actor = self.register_actor(get_actor_id(context))
+        logging.info(f"[LEARNER] Received request to receive transitions from the Actor {actor.actor_id}")
+        self._ensure_fan_in_thread()
 
         receive_bytes_in_chunks(
             request_iterator,
-            self.transition_queue,
+            actor,
             self.shutdown_event,
-            log_prefix="[LEARNER] transitions",
+            log_prefix=f"[LEARNER] transitions {actor.actor_id}",
         )
 
-        logging.debug("[LEARNER] Finished receiving transitions")
+        # Nothing of this actor should stay behind once its stream is closed
+        self._flush_actor_transitions(actor)
+
+        logging.debug(f"[LEARNER] Finished receiving transitions from the Actor {actor.actor_id}")
         return services_pb2.Empty()
 
     def SendInteractions(self, request_iterator, _context):  # noqa: N802
@@ -145,6 +145,7 @@ class HopeJrHand(Robot):
         self.calibration = RangeFinderGUI(self.bus, fingers).run()
         for motor in self.inverted_motors:
             self.calibration[motor].drive_mode = 1
+        self.bus.calibration = self.calibration
         self._save_calibration()
         print("Calibration saved to", self.calibration_fpath)
 
@@ -18,6 +18,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 import numpy as np
+import torch
 
 from lerobot.configs.types import FeatureType, PipelineFeatureType, PolicyFeature
 from lerobot.model.kinematics import RobotKinematics
@@ -27,11 +28,50 @@ from lerobot.processor import (
     ProcessorStep,
     ProcessorStepRegistry,
     RobotAction,
+    RobotActionBatch,
     RobotActionProcessorStep,
     TransitionKey,
 )
 from lerobot.utils.rotation import Rotation
 
+EE_POSE_KEYS = ["ee.x", "ee.y", "ee.z", "ee.wx", "ee.wy", "ee.wz"]
+
+
+def _batched_joint_positions(
+    observation: dict[str, Any] | None, batch_size: int, motor_names: list[str] | None = None
+) -> np.ndarray:
+    """
+    Returns the `(B, n)` joint positions of a batch of robots, from the `(B,)` `.pos` entries of their
+    observation, in the order of the observation like for a single robot.
+    """
+    columns = []
+    for key, value in (observation or {}).items():
+        if not isinstance(key, str) or not key.endswith(".pos"):
+            continue
+        if motor_names is not None and key.removesuffix(".pos") not in motor_names:
+            continue
+        if isinstance(value, torch.Tensor):
+            value = value.detach().cpu().numpy()
+        columns.append(np.broadcast_to(np.asarray(value, dtype=float).reshape(-1), (batch_size,)))
+    if not columns:
+        raise ValueError("Joints observation is require for computing robot kinematics")
+    return np.stack(columns, axis=1)
+
+
+def _pose_to_columns(poses: np.ndarray) -> np.ndarray:
+    """Returns the `(B, 6)` position and rotation vector of `(B, 4, 4)` poses."""
+    rotvecs = [Rotation.from_matrix(pose[:3, :3]).as_rotvec() for pose in poses]
+    return np.concatenate([poses[:, :3, 3], np.reshape(rotvecs, (-1, 3))], axis=1)
+
+
+def _columns_to_pose(columns: np.ndarray) -> np.ndarray:
+    """Returns the `(B, 4, 4)` poses of `(B, 6)` positions and rotation vectors."""
+    poses = np.tile(np.eye(4), (len(columns), 1, 1))
+    for pose, (x, y, z, wx, wy, wz) in zip(poses, columns, strict=True):
+        pose[:3, :3] = Rotation.from_rotvec([wx, wy, wz]).as_matrix()
+        pose[:3, 3] = [x, y, z]
+    return poses
+
 
 @ProcessorStepRegistry.register("ee_reference_and_delta")
 @dataclass
@@ -152,6 +192,69 @@ class EEReferenceAndDelta(RobotActionProcessorStep):
         self._prev_enabled = enabled
         return action
 
+    def batched_action(self, action: RobotActionBatch) -> RobotActionBatch:
+        # Per-robot state: the reference and disabled command poses are NaN until set
+        batch_size = action.batch_size
+        if not isinstance(self._prev_enabled, np.ndarray) or len(self._prev_enabled) != batch_size:
+            self._prev_enabled = np.zeros(batch_size, dtype=bool)
+            self.reference_ee_pose = np.full((batch_size, 4, 4), np.nan)
+            self._command_when_disabled = np.full((batch_size, 4, 4), np.nan)
+
+        complementary_data = self.transition.get(TransitionKey.COMPLEMENTARY_DATA) or {}
+        if self.use_ik_solution and "IK_solution" in complementary_data:
+            q_raw = np.asarray(complementary_data["IK_solution"], dtype=float).reshape(batch_size, -1)
+        else:
+            q_raw = _batched_joint_positions(
+                self.transition.get(TransitionKey.OBSERVATION), batch_size, self.motor_names
+            )
+
+        # Current poses from FK on measured joints, one robot at a time
+        t_curr = np.stack([self.kinematics.forward_kinematics(q) for q in q_raw])
+
+        command = action.columns(
+            ["enabled", "target_x", "target_y", "target_z", "target_wx", "target_wy", "target_wz"]
+        )
+        command = command.detach().cpu().numpy().astype(float)
+        enabled = command[:, 0] != 0
+
+        ref = t_curr
+        if self.use_latched_reference:
+            # Latched reference mode: latch reference at the rising edge
+            latch = enabled & (~self._prev_enabled | np.isnan(self.reference_ee_pose).any(axis=(1, 2)))
+            self.reference_ee_pose[latch] = t_curr[latch]
+            ref = np.where(enabled[:, None, None], self.reference_ee_pose, t_curr)
+
+        step_sizes = [self.end_effector_step_sizes[axis] for axis in ("x", "y", "z")]
+        r_abs = _columns_to_pose(np.concatenate([np.zeros((batch_size, 3)), command[:, 4:]], axis=1))
+        desired = np.tile(np.eye(4), (batch_size, 1, 1))
+        desired[:, :3, :3] = ref[:, :3, :3] @ r_abs[:, :3, :3]
+        desired[:, :3, 3] = ref[:, :3, 3] + command[:, 1:4] * step_sizes
+
+        # While disabled, keep sending the same command to avoid drift, or the current FK pose if there was
+        # no enabled command yet
+        never_commanded = np.isnan(self._command_when_disabled).any(axis=(1, 2))
+        self._command_when_disabled[~enabled & never_commanded] = t_curr[~enabled & never_commanded]
+        self._command_when_disabled[enabled] = desired[enabled]
+        desired[~enabled] = self._command_when_disabled[~enabled]
+
+        self._prev_enabled = enabled
+        pose = torch.as_tensor(_pose_to_columns(desired)).to(action.values)
+        columns = dict(zip(EE_POSE_KEYS, pose.unbind(dim=1), strict=True))
+        columns["ee.gripper_vel"] = action["gripper_vel"]
+        return action.with_columns(
+            columns,
+            drop=[
+                "enabled",
+                "target_x",
+                "target_y",
+                "target_z",
+                "target_wx",
+                "target_wy",
+                "target_wz",
+                "gripper_vel",
+            ],
+        )
+
     def reset(self):
         """Resets the internal state of the processor."""
         self._prev_enabled = False
@@ -198,7 +301,7 @@ class EEBoundsAndSafety(RobotActionProcessorStep):
 
     end_effector_bounds: dict
     max_ee_step_m: float = 0.05
-    _last_pos: np.ndarray | None = field(default=None, init=False, repr=False)
+    _last_pos: np.ndarray | torch.Tensor | None = field(default=None, init=False, repr=False)
 
     def action(self, action: RobotAction) -> RobotAction:
         x = action["ee.x"]
@@ -238,6 +341,22 @@ class EEBoundsAndSafety(RobotActionProcessorStep):
         action["ee.wz"] = float(twist[2])
         return action
 
+    def batched_action(self, action: RobotActionBatch) -> RobotActionBatch:
+        pos = action.columns(EE_POSE_KEYS[:3])
+        bounds = {name: torch.as_tensor(self.end_effector_bounds[name]).to(pos) for name in ("min", "max")}
+
+        # Clip positions
+        pos = torch.clamp(pos, bounds["min"], bounds["max"])
+
+        # Check for jumps in position
+        if isinstance(self._last_pos, torch.Tensor) and self._last_pos.shape == pos.shape:
+            n = torch.linalg.vector_norm(pos - self._last_pos, dim=1).max().item()
+            if n > self.max_ee_step_m:
+                raise ValueError(f"EE jump {n:.3f}m > {self.max_ee_step_m}m")
+
+        self._last_pos = pos
+        return action.with_columns(dict(zip(EE_POSE_KEYS[:3], pos.unbind(dim=1), strict=True)))
+
     def reset(self):
         """Resets the last known position and orientation."""
         self._last_pos = None
@@ -319,6 +438,26 @@ class InverseKinematicsEEToJoints(RobotActionProcessorStep):
 
         return action
 
+    def batched_action(self, action: RobotActionBatch) -> RobotActionBatch:
+        batch_size = action.batch_size
+        q_raw = _batched_joint_positions(self.transition.get(TransitionKey.OBSERVATION), batch_size)
+        if self.initial_guess_current_joints or self.q_curr is None or self.q_curr.shape != q_raw.shape:
+            self.q_curr = q_raw
+
+        # Inverse kinematics one robot at a time, from the desired 4x4 transforms
+        t_des = _columns_to_pose(action.columns(EE_POSE_KEYS).detach().cpu().numpy().astype(float))
+        q_target = np.stack(
+            [self.kinematics.inverse_kinematics(q, t) for q, t in zip(self.q_curr, t_des, strict=True)]
+        )
+        self.q_curr = q_target
+
+        q_target = torch.as_tensor(q_target).to(action.values)
+        columns = {
+            f"{name}.pos": action["ee.gripper_pos"] if name == "gripper" else q_target[:, i]
+            for i, name in enumerate(self.motor_names)
+        }
+        return action.with_columns(columns, drop=[*EE_POSE_KEYS, "ee.gripper_pos"])
+
     def transform_features(
         self, features: dict[PipelineFeatureType, dict[str, PolicyFeature]]
     ) -> dict[PipelineFeatureType, dict[str, PolicyFeature]]:
@@ -389,6 +528,22 @@ class GripperVelocityToJoint(RobotActionProcessorStep):
 
         return action
 
+    def batched_action(self, action: RobotActionBatch) -> RobotActionBatch:
+        observation = self.transition.get(TransitionKey.OBSERVATION) or {}
+        joint_keys = [key for key in observation if isinstance(key, str) and key.endswith(".pos")]
+        if not joint_keys:
+            raise ValueError("Joints observation is require for computing robot kinematics")
+
+        gripper_vel = action["ee.gripper_vel"]
+        if self.discrete_gripper:
+            gripper_vel = (gripper_vel - 1) * self.clip_max
+
+        # TODO: This assumes gripper is the last specified joint in the robot
+        q_gripper = torch.as_tensor(observation[joint_keys[-1]]).to(gripper_vel)
+        gripper_pos = q_gripper + gripper_vel * float(self.speed_factor)
+        gripper_pos = torch.clamp(gripper_pos, self.clip_min, self.clip_max)
+        return action.with_columns({"ee.gripper_pos": gripper_pos}, drop=["ee.gripper_vel"])
+
     def transform_features(
         self, features: dict[PipelineFeatureType, dict[str, PolicyFeature]]
     ) -> dict[PipelineFeatureType, dict[str, PolicyFeature]]:
@@ -474,6 +629,15 @@ class ForwardKinematicsJointsToEEAction(RobotActionProcessorStep):
     def action(self, action: RobotAction) -> RobotAction:
         return compute_forward_kinematics_joints_to_ee(action, self.kinematics, self.motor_names)
 
+    def batched_action(self, action: RobotActionBatch) -> RobotActionBatch:
+        joint_keys = [f"{n}.pos" for n in self.motor_names]
+        q = action.columns(joint_keys).detach().cpu().numpy().astype(float)
+        t = np.stack([self.kinematics.forward_kinematics(q_i) for q_i in q])
+        pose = torch.as_tensor(_pose_to_columns(t)).to(action.values)
+        columns = dict(zip(EE_POSE_KEYS, pose.unbind(dim=1), strict=True))
+        columns["ee.gripper_pos"] = action["gripper.pos"]
+        return action.with_columns(columns, drop=joint_keys)
+
     def transform_features(
         self, features: dict[PipelineFeatureType, dict[str, PolicyFeature]]
     ) -> dict[PipelineFeatureType, dict[str, PolicyFeature]]:
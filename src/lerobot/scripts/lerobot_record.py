@@ -471,6 +471,9 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
                     "rename_observations_processor": {"rename_map": cfg.dataset.rename_map},
                 },
             )
+            # Fewer copies of the transitions in the control loop
+            preprocessor.freeze()
+            postprocessor.freeze()
 
         robot.connect()
         if teleop is not None:
@@ -0,0 +1,155 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import torch
+
+from lerobot.async_inference.action_buffer import ActionRingBuffer
+from lerobot.async_inference.helpers import TimedAction, TimedActionChunk
+
+
+def _make_chunk(timestep: int, chunk_size: int, action_dim: int = 4, value: float | None = None):
+    if value is None:
+        actions = torch.arange(timestep, timestep + chunk_size, dtype=torch.float32)[:, None]
+        actions = actions.expand(chunk_size, action_dim).clone()
+    else:
+        actions = torch.full((chunk_size, action_dim), value)
+    return TimedActionChunk(timestamp=timestep * 0.1, timestep=timestep, actions=actions, dt=0.1)
+
+
+def _drain(buffer: ActionRingBuffer) -> list[TimedAction]:
+    actions = []
+    while (timed_action := buffer.get()) is not None:
+        actions.append(timed_action)
+    return actions
+
+
+def test_invalid_capacity():
+    with pytest.raises(ValueError):
+        ActionRingBuffer(capacity=0)
+
+
+def test_get_from_empty_buffer():
+    buffer = ActionRingBuffer()
+    assert buffer.empty()
+    assert buffer.get() is None
+
+
+def test_merge_then_pop_in_order():
+    buffer = ActionRingBuffer(capacity=8)
+    buffer.merge(_make_chunk(timestep=0, chunk_size=5), latest_timestep=-1)
+
+    assert buffer.qsize() == 5
+    assert buffer.timesteps() == [0, 1, 2, 3, 4]
+
+    actions = _drain(buffer)
+    assert [action.get_timestep() for action in actions] == [0, 1, 2, 3, 4]
+    assert [action.get_timestamp() for action in actions] == pytest.approx([0.0, 0.1, 0.2, 0.3, 0.4])
+    for action in actions:
+        assert torch.equal(action.get_action(), torch.full((4,), float(action.get_timestep())))
+    assert buffer.empty()
+
+
+def test_merge_discards_stale_actions():
+    buffer = ActionRingBuffer(capacity=8)
+    buffer.merge(_make_chunk(timestep=3, chunk_size=5), latest_timestep=4)
+    assert buffer.timesteps() == [5, 6, 7]
+
+    # Every action of the chunk was already performed
+    buffer.merge(_make_chunk(timestep=0, chunk_size=3), latest_timestep=4)
+    assert buffer.empty()
+
+
+def test_merge_discards_actions_already_popped():
+    buffer = ActionRingBuffer(capacity=8)
+    buffer.merge(_make_chunk(timestep=0, chunk_size=4), latest_timestep=-1)
+    buffer.get()
+    buffer.get()
+
+    # The caller did not see the last popped action yet, the buffer still skips it
+    buffer.merge(_make_chunk(timestep=0, chunk_size=6), latest_timestep=-1)
+    assert buffer.timesteps() == [2, 3, 4, 5]
+
+
+def test_merge_aggregates_overlap_only():
+    buffer = ActionRingBuffer(capacity=8)
+    buffer.merge(_make_chunk(timestep=5, chunk_size=2, value=10.0), latest_timestep=4)
+    buffer.merge(
+        _make_chunk(timestep=3, chunk_size=5, value=1.0),
+        latest_timestep=4,
+        aggregate_fn=lambda old, new: 0.3 * old + 0.7 * new,
+    )
+
+    actions = _drain(buffer)
+    assert [action.get_timestep() for action in actions] == [5, 6, 7]
+    torch.testing.assert_close(actions[0].get_action(), torch.full((4,), 3.7))
+    torch.testing.assert_close(actions[1].get_action(), torch.full((4,), 3.7))
+    torch.testing.assert_close(actions[2].get_action(), torch.full((4,), 1.0))
+
+
+def test_merge_wraps_around_the_ring():
+    buffer = ActionRingBuffer(capacity=4)
+    timestep = 0
+    for _ in range(5):
+        buffer.merge(_make_chunk(timestep=timestep, chunk_size=4, value=1.0), latest_timestep=timestep - 1)
+        buffer.get()
+        buffer.get()
+        timestep += 2
+
+    # Timesteps 10, 11 are buffered, timesteps 12, 13 reuse the slots of 8, 9 and must not be aggregated
+    buffer.merge(
+        _make_chunk(timestep=10, chunk_size=4, value=3.0),
+        latest_timestep=9,
+        aggregate_fn=lambda old, new: old + new,
+    )
+    actions = _drain(buffer)
+    assert [action.get_timestep() for action in actions] == [10, 11, 12, 13]
+    assert [action.get_action()[0].item() for action in actions] == [4.0, 4.0, 3.0, 3.0]
+
+
+def test_merge_grows_capacity():
+    buffer = ActionRingBuffer(capacity=4)
+    buffer.merge(_make_chunk(timestep=0, chunk_size=3, value=2.0), latest_timestep=-1)
+    buffer.merge(
+        _make_chunk(timestep=1, chunk_size=10, value=1.0),
+        latest_timestep=0,
+        aggregate_fn=lambda old, new: old + new,
+    )
+
+    assert buffer.capacity >= 9
+    actions = _drain(buffer)
+    assert [action.get_timestep() for action in actions] == list(range(1, 11))
+    assert [action.get_action()[0].item() for action in actions] == [3.0, 3.0] + [1.0] * 8
+
+
+def test_merge_list_of_timed_actions():
+    """Older servers send lists of `TimedAction`s"""
+    buffer = ActionRingBuffer()
+    buffer.merge(list(_make_chunk(timestep=2, chunk_size=3)), latest_timestep=-1)
+
+    actions = _drain(buffer)
+    assert [action.get_timestep() for action in actions] == [2, 3, 4]
+    assert [action.get_timestamp() for action in actions] == pytest.approx([0.2, 0.3, 0.4])
+
+    buffer.merge([], latest_timestep=-1)
+    assert buffer.empty()
+
+
+def test_popped_actions_do_not_share_storage():
+    buffer = ActionRingBuffer(capacity=2)
+    buffer.merge(_make_chunk(timestep=0, chunk_size=2, value=1.0), latest_timestep=-1)
+    action = buffer.get()
+    buffer.merge(_make_chunk(timestep=2, chunk_size=2, value=5.0), latest_timestep=0)
+
+    assert torch.equal(action.get_action(), torch.ones(4))
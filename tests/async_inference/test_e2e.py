@@ -43,9 +43,15 @@ pytest.importorskip("grpc")
 # -----------------------------------------------------------------------------
 
 
-def test_async_inference_e2e(monkeypatch):
-    """Tests the full asynchronous inference pipeline."""
+@pytest.mark.parametrize(
+    "use_action_streaming, shared_memory_transport", [(True, False), (False, False), (True, True)]
+)
+def test_async_inference_e2e(monkeypatch, use_action_streaming, shared_memory_transport):
+    """Tests the full asynchronous inference pipeline, with streamed and polled actions, over gRPC or
+    shared memory."""
     # Import grpc-dependent modules inside the test function
+    import pickle  # nosec
+
     import grpc
 
     from lerobot.async_inference.configs import PolicyServerConfig, RobotClientConfig
@@ -85,7 +91,9 @@ def test_async_inference_e2e(monkeypatch):
     # ------------------------------------------------------------------
     # 1. Create PolicyServer instance with mock policy
     # ------------------------------------------------------------------
-    policy_server_config = PolicyServerConfig(host="localhost", port=9999)
+    policy_server_config = PolicyServerConfig(
+        host="localhost", port=9999, shared_memory_transport=shared_memory_transport
+    )
     policy_server = PolicyServer(policy_server_config)
     # Replace the real policy with our fast, deterministic stub.
     policy_server.policy = MockPolicy()
@@ -116,12 +124,15 @@ def test_async_inference_e2e(monkeypatch):
 
     # Bypass potentially heavy model loading inside SendPolicyInstructions
     def _fake_send_policy_instructions(self, request, context):  # noqa: N802
-        return services_pb2.Empty()
+        policy_specs = pickle.loads(request.data)  # nosec
+        self._attach_shared_memory(self._get_session(context.peer()), policy_specs.shared_memory)
+        return services_pb2.PolicyFeatures()
 
     monkeypatch.setattr(PolicyServer, "SendPolicyInstructions", _fake_send_policy_instructions, raising=True)
 
     # Build gRPC server running a PolicyServer
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="policy_server"))
+    # The action stream keeps a worker busy for the whole session
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="policy_server"))
     services_pb2_grpc.add_AsyncInferenceServicer_to_server(policy_server, server)
 
     # Use the host/port specified in the fixture's config
@@ -139,10 +150,13 @@ def test_async_inference_e2e(monkeypatch):
         policy_type="test",
         pretrained_name_or_path="test",
         actions_per_chunk=20,
+        use_action_streaming=use_action_streaming,
+        shared_memory_transport=shared_memory_transport,
     )
 
     client = RobotClient(client_config)
     assert client.start(), "Client failed initial handshake with the server"
+    assert (client.observation_ring is not None) == shared_memory_transport
 
     # Track action chunks received without modifying RobotClient
     action_chunks_received = {"count": 0}
@@ -167,7 +181,10 @@ def test_async_inference_e2e(monkeypatch):
     server.wait_for_termination(timeout=5)
 
     assert action_chunks_received["count"] > 0, "Client did not receive any action chunks"
-    assert len(policy_server._predicted_timesteps) > 0, "Server did not record any predicted timesteps"
+    predicted_timesteps = [session.predicted_timesteps for session in policy_server.sessions.values()]
+    assert any(len(timesteps) > 0 for timesteps in predicted_timesteps), (
+        "Server did not record any predicted timesteps"
+    )
 
     # ------------------------------------------------------------------
     # 4. Stop the system
@@ -0,0 +1,168 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pickle
+
+import cv2
+import numpy as np
+import pytest
+import torch
+
+from lerobot.async_inference.encoding import (
+    ACTION_CHUNK_MAGIC,
+    OBSERVATION_MAGIC,
+    decode_action_chunk,
+    decode_observation,
+    encode_action_chunk,
+    encode_observation,
+    resize_observation_images,
+)
+from lerobot.async_inference.helpers import TimedAction, TimedActionChunk, TimedObservation
+
+
+def _make_camera_frame(height: int = 96, width: int = 128) -> np.ndarray:
+    """Smooth RGB frame, compressible like a real camera frame"""
+    rng = np.random.default_rng(0)
+    coarse = rng.integers(0, 256, size=(6, 8, 3), dtype=np.uint8)
+    return cv2.resize(coarse, (width, height), interpolation=cv2.INTER_CUBIC)
+
+
+def _make_timed_observation() -> TimedObservation:
+    return TimedObservation(
+        timestamp=123.456,
+        timestep=7,
+        observation={
+            "shoulder.pos": 1.5,
+            "elbow.pos": np.float32(-2.25),
+            "gripper.pos": torch.tensor(0.5),
+            "task": "pick the cube",
+            "laptop": _make_camera_frame(),
+            "depth": np.arange(12, dtype=np.uint16).reshape(3, 4),
+        },
+        must_go=True,
+    )
+
+
+def test_encode_decode_raw_roundtrip():
+    observation = _make_timed_observation()
+
+    data = encode_observation(observation)
+    decoded = decode_observation(data)
+
+    assert data.startswith(OBSERVATION_MAGIC)
+    assert decoded.get_timestamp() == observation.get_timestamp()
+    assert decoded.get_timestep() == observation.get_timestep()
+    assert decoded.must_go
+
+    raw = decoded.get_observation()
+    assert raw["shoulder.pos"] == 1.5
+    assert raw["elbow.pos"] == -2.25
+    assert raw["gripper.pos"] == 0.5
+    assert raw["task"] == "pick the cube"
+    np.testing.assert_array_equal(raw["laptop"], observation.get_observation()["laptop"])
+    np.testing.assert_array_equal(raw["depth"], observation.get_observation()["depth"])
+    assert raw["depth"].dtype == np.uint16
+    # Decoded arrays are writable copies
+    assert raw["laptop"].flags.writeable
+
+
+@pytest.mark.parametrize("image_codec", ["jpeg", "webp"])
+def test_encode_decode_compressed_images(image_codec):
+    observation = _make_timed_observation()
+    frame = observation.get_observation()["laptop"]
+
+    raw_size = len(encode_observation(observation, "raw"))
+    data = encode_observation(observation, image_codec, image_quality=90)
+    decoded = decode_observation(data).get_observation()
+
+    assert len(data) < raw_size
+    assert decoded["laptop"].shape == frame.shape
+    assert decoded["laptop"].dtype == np.uint8
+    # Lossy, but the channel order is preserved and the error stays small
+    assert np.abs(decoded["laptop"].astype(int) - frame.astype(int)).mean() < 4
+    # Only color camera frames are compressed
+    np.testing.assert_array_equal(decoded["depth"], observation.get_observation()["depth"])
+
+
+def test_image_quality_trades_size():
+    observation = _make_timed_observation()
+    observation.observation["laptop"] = np.random.default_rng(0).integers(
+        0, 256, (96, 128, 3), dtype=np.uint8
+    )
+
+    low_quality = encode_observation(observation, "jpeg", image_quality=10)
+    high_quality = encode_observation(observation, "jpeg", image_quality=95)
+
+    assert len(low_quality) < len(high_quality)
+
+
+def test_decode_pickled_observation():
+    """Observations of older clients are pickled `TimedObservation`s"""
+    observation = _make_timed_observation()
+
+    decoded = decode_observation(pickle.dumps(observation))
+
+    assert decoded.get_timestep() == observation.get_timestep()
+    assert decoded.get_observation()["task"] == "pick the cube"
+
+
+def test_encode_observation_invalid_inputs():
+    observation = _make_timed_observation()
+    with pytest.raises(ValueError, match="Unknown image codec"):
+        encode_observation(observation, "png")
+
+    observation.observation["unsupported"] = {"nested": 1}
+    with pytest.raises(TypeError, match="unsupported"):
+        encode_observation(observation)
+
+
+def test_resize_observation_images():
+    raw_observation = {
+        "shoulder.pos": 1.0,
+        "laptop": _make_camera_frame(480, 640),
+        "phone": _make_camera_frame(),
+    }
+
+    resized = resize_observation_images(raw_observation, {"laptop": (96, 128), "wrist": (96, 128)})
+
+    assert resized["laptop"].shape == (96, 128, 3)
+    assert resized["phone"] is raw_observation["phone"]
+    assert resized["shoulder.pos"] == 1.0
+    # The input observation is left untouched
+    assert raw_observation["laptop"].shape == (480, 640, 3)
+
+
+@pytest.mark.parametrize("dtype", [torch.float32, torch.float64, torch.bfloat16])
+def test_encode_decode_action_chunk(dtype):
+    actions = torch.randn(50, 6).to(dtype)
+    chunk = TimedActionChunk(timestamp=123.456, timestep=7, actions=actions, dt=1 / 30)
+
+    data = encode_action_chunk(chunk)
+    decoded = decode_action_chunk(data)
+
+    assert data.startswith(ACTION_CHUNK_MAGIC)
+    assert decoded.get_timestamp() == chunk.get_timestamp()
+    assert decoded.get_timestep() == chunk.get_timestep()
+    assert decoded.dt == chunk.dt
+    # NumPy has no bfloat16, those chunks are sent as float32
+    torch.testing.assert_close(decoded.get_actions(), actions.float() if dtype == torch.bfloat16 else actions)
+
+
+def test_decode_pickled_action_chunk():
+    """Action chunks of older servers are pickled lists of `TimedAction`s"""
+    timed_actions = [TimedAction(timestamp=1.0 + i, timestep=i, action=torch.ones(6)) for i in range(3)]
+
+    decoded = decode_action_chunk(pickle.dumps(timed_actions))
+
+    assert [action.get_timestep() for action in decoded] == [0, 1, 2]
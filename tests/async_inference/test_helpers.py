@@ -17,11 +17,13 @@ import pickle
 import time
 
 import numpy as np
+import pytest
 import torch
 
 from lerobot.async_inference.helpers import (
     FPSTracker,
     TimedAction,
+    TimedActionChunk,
     TimedObservation,
     observations_similar,
     prepare_image,
@@ -113,6 +115,22 @@ def test_timed_action_getters():
     assert ta.get_timestep() == 0
 
 
+def test_timed_action_chunk_expands_lazily():
+    """TimedActionChunk yields one TimedAction per row, with consecutive timesteps and timestamps."""
+    ts = time.time()
+    actions = torch.arange(12, dtype=torch.float32).reshape(4, 3)
+    chunk = TimedActionChunk(timestamp=ts, timestep=10, actions=actions, dt=0.1)
+
+    assert len(chunk) == 4
+    assert [ta.get_timestep() for ta in chunk] == [10, 11, 12, 13]
+    assert math.isclose(chunk[2].get_timestamp(), ts + 0.2, rel_tol=0, abs_tol=1e-6)
+    torch.testing.assert_close(chunk[-1].get_action(), actions[3])
+    # Actions are views of the chunk tensor
+    assert chunk[1].get_action().data_ptr() == actions[1].data_ptr()
+    with pytest.raises(IndexError):
+        chunk[4]
+
+
 def test_timed_observation_getters():
     """TimedObservation stores & returns timestamp, dict and timestep."""
     ts = time.time()
@@ -298,6 +316,15 @@ def test_resize_robot_observation_image():
     assert resized.max() <= 255
 
 
+def test_resize_robot_observation_image_already_resized():
+    """Images already resized by the client are only transposed to (C, H, W)."""
+    original_image = torch.randint(0, 256, size=(224, 224, 3), dtype=torch.uint8)
+
+    resized = resize_robot_observation_image(original_image, (3, 224, 224))
+
+    assert torch.equal(resized, original_image.permute(2, 0, 1))
+
+
 def test_prepare_raw_observation():
     """Test the preparation of raw robot observation to lerobot format."""
     robot_obs = _create_mock_robot_observation()
@@ -0,0 +1,110 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+from lerobot.async_inference.configs import PolicyServerConfig
+from lerobot.async_inference.observation_filter import (
+    ObservationFilter,
+    StateObservationFilter,
+    ThumbnailObservationFilter,
+    make_observation_filter,
+)
+from lerobot.utils.constants import OBS_IMAGES, OBS_STATE
+
+LEROBOT_FEATURES = {
+    OBS_STATE: {"dtype": "float32", "shape": [2], "names": ["shoulder", "elbow"]},
+    f"{OBS_IMAGES}.laptop": {
+        "dtype": "image",
+        "shape": [96, 128, 3],
+        "names": ["height", "width", "channels"],
+    },
+}
+
+
+def _make_raw_observation(state: float = 0.0, image: np.ndarray | None = None) -> dict:
+    if image is None:
+        image = np.full((96, 128, 3), 100, dtype=np.uint8)
+    return {"shoulder": state, "elbow": state, "laptop": image, "task": "pick the cube"}
+
+
+def test_base_filter_never_similar():
+    observation_filter = ObservationFilter()
+    features = observation_filter.extract(_make_raw_observation(), LEROBOT_FEATURES)
+    assert not observation_filter.similar(features, features)
+
+
+def test_state_filter():
+    observation_filter = StateObservationFilter(state_atol=1.0)
+    reference = observation_filter.extract(_make_raw_observation(0.0), LEROBOT_FEATURES)
+
+    assert observation_filter.similar(
+        observation_filter.extract(_make_raw_observation(0.5), LEROBOT_FEATURES), reference
+    )
+    assert not observation_filter.similar(
+        observation_filter.extract(_make_raw_observation(1.0), LEROBOT_FEATURES), reference
+    )
+
+
+def test_thumbnail_filter_ignores_sensor_noise():
+    rng = np.random.default_rng(0)
+    observation_filter = ThumbnailObservationFilter(state_atol=1.0, image_atol=2.0, thumbnail_size=8)
+    image = np.full((96, 128, 3), 100, dtype=np.uint8)
+    noisy_image = (image + rng.integers(-5, 6, size=image.shape)).astype(np.uint8)
+
+    reference = observation_filter.extract(_make_raw_observation(image=image), LEROBOT_FEATURES)
+    features = observation_filter.extract(_make_raw_observation(image=noisy_image), LEROBOT_FEATURES)
+
+    assert features.thumbnails["laptop"].shape == (8, 8, 3)
+    assert observation_filter.similar(features, reference)
+
+
+def test_thumbnail_filter_detects_scene_change():
+    observation_filter = ThumbnailObservationFilter(state_atol=1.0, image_atol=2.0, thumbnail_size=8)
+    image = np.full((96, 128, 3), 100, dtype=np.uint8)
+    moved_image = image.copy()
+    moved_image[:48, :64] = 200  # an object entered a quarter of the frame
+
+    reference = observation_filter.extract(_make_raw_observation(image=image), LEROBOT_FEATURES)
+    features = observation_filter.extract(_make_raw_observation(image=moved_image), LEROBOT_FEATURES)
+
+    # Same joint state, yet the scene changed
+    assert not observation_filter.similar(features, reference)
+
+
+def test_thumbnail_filter_requires_similar_state():
+    observation_filter = ThumbnailObservationFilter(state_atol=1.0)
+    reference = observation_filter.extract(_make_raw_observation(0.0), LEROBOT_FEATURES)
+    features = observation_filter.extract(_make_raw_observation(2.0), LEROBOT_FEATURES)
+
+    assert not observation_filter.similar(features, reference)
+
+
+@pytest.mark.parametrize(
+    "name, filter_class",
+    [
+        ("none", ObservationFilter),
+        ("state", StateObservationFilter),
+        ("thumbnail", ThumbnailObservationFilter),
+    ],
+)
+def test_make_observation_filter(name, filter_class):
+    config = PolicyServerConfig(observation_filter=name, thumbnail_size=4)
+    assert type(make_observation_filter(config)) is filter_class
+
+
+def test_invalid_observation_filter():
+    with pytest.raises(ValueError):
+        PolicyServerConfig(observation_filter="perceptual_hash")
@@ -0,0 +1,155 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from types import SimpleNamespace
+
+import pytest
+import torch
+
+from lerobot.async_inference import policy_registry
+from lerobot.async_inference.policy_registry import (
+    PolicyRegistry,
+    make_dummy_observation,
+    make_policy_key,
+)
+from lerobot.configs.types import FeatureType, PolicyFeature
+from lerobot.processor import DataProcessorPipeline
+from lerobot.utils.constants import OBS_IMAGES, OBS_STATE
+
+IMAGE_FEATURES = {f"{OBS_IMAGES}.laptop": PolicyFeature(type=FeatureType.VISUAL, shape=(3, 32, 32))}
+LEROBOT_FEATURES = {
+    OBS_STATE: {"dtype": "float32", "shape": [6], "names": [f"joint{i}" for i in range(6)]},
+    f"{OBS_IMAGES}.laptop": {
+        "dtype": "image",
+        "shape": [48, 64, 3],
+        "names": ["height", "width", "channels"],
+    },
+}
+
+
+def make_passthrough_pipeline() -> DataProcessorPipeline:
+    return DataProcessorPipeline(to_transition=lambda data: data, to_output=lambda transition: transition)
+
+
+class FakePolicy(torch.nn.Module):
+    """Policy with `size` float32 parameters, recording the observations it is called with"""
+
+    loads: list[str] = []
+
+    def __init__(self, size: int):
+        super().__init__()
+        self.weights = torch.nn.Parameter(torch.zeros(size))
+        self.config = SimpleNamespace(
+            image_features=IMAGE_FEATURES,
+            input_features={
+                OBS_STATE: PolicyFeature(type=FeatureType.STATE, shape=(6,)),
+                **IMAGE_FEATURES,
+            },
+        )
+        self.observations = []
+        self.num_resets = 0
+
+    @classmethod
+    def from_pretrained(cls, pretrained_name_or_path: str):
+        cls.loads.append(pretrained_name_or_path)
+        # 1 MB per unit of the trailing number of the name
+        return cls(size=int(pretrained_name_or_path.rsplit("_", 1)[-1]) * 256 * 1024)
+
+    def predict_action_chunk(self, observation):
+        self.observations.append(observation)
+        return torch.zeros(1, 10, 6)
+
+    def reset(self):
+        self.num_resets += 1
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    FakePolicy.loads = []
+    monkeypatch.setattr(policy_registry, "get_policy_class", lambda policy_type: FakePolicy)
+    monkeypatch.setattr(
+        policy_registry,
+        "make_pre_post_processors",
+        lambda config, **kwargs: (make_passthrough_pipeline(), make_passthrough_pipeline()),
+    )
+    return PolicyRegistry(max_memory_gb=3 / 1024, warmup_iterations=2)
+
+
+def test_get_loads_and_warms_up_once(registry):
+    loaded = registry.get("act", "policy_1", "cpu", lerobot_features=LEROBOT_FEATURES)
+
+    assert FakePolicy.loads == ["policy_1"]
+    assert loaded.memory_bytes == 1024**2
+    assert loaded.load_time >= 0 and loaded.warmup_time > 0
+    # Warmup observations are shaped like the ones of the robot, resized for the policy
+    assert len(loaded.policy.observations) == 2
+    assert loaded.policy.observations[0][OBS_STATE].shape == (1, 6)
+    assert loaded.policy.observations[0][f"{OBS_IMAGES}.laptop"].shape == (1, 3, 32, 32)
+    assert loaded.policy.num_resets == 1
+
+    assert registry.get("act", "policy_1", "cpu", lerobot_features=LEROBOT_FEATURES) is loaded
+    assert FakePolicy.loads == ["policy_1"]
+    assert len(loaded.policy.observations) == 2
+    assert registry.get_stats()["policy_1@cpu"]["hits"] == 1
+
+
+def test_key_includes_device_and_rename_map(registry):
+    registry.get("act", "policy_1", "cpu")
+    registry.get("act", "policy_1", "cpu", rename_map={"a": "b"})
+
+    assert FakePolicy.loads == ["policy_1", "policy_1"]
+    assert make_policy_key("act", "policy_1", "cpu", {"a": "b", "c": "d"}) == make_policy_key(
+        "act", "policy_1", "cpu", {"c": "d", "a": "b"}
+    )
+
+
+def test_key_normalizes_device():
+    assert make_policy_key("act", "policy_1", "cuda") == make_policy_key("act", "policy_1", "cuda:0")
+    assert make_policy_key("act", "policy_1", torch.device("cpu")) == make_policy_key(
+        "act", "policy_1", "cpu"
+    )
+    assert make_policy_key("act", "policy_1", "cuda:0") != make_policy_key("act", "policy_1", "cuda:1")
+
+
+def test_lru_eviction_over_memory_budget(registry):
+    registry.get("act", "policy_1", "cpu")
+    registry.get("act", "policy_2", "cpu")
+    # Using policy_1 again makes policy_2 the least recently used
+    registry.get("act", "policy_1", "cpu")
+    registry.get("act", "policy_2", "cpu")
+    registry.get("act", "policy_1", "cpu")
+    assert registry.memory_bytes == 3 * 1024**2
+
+    registry.get("act", "policy_1b_1", "cpu")
+
+    assert make_policy_key("act", "policy_2", "cpu") not in registry
+    assert make_policy_key("act", "policy_1", "cpu") in registry
+    assert make_policy_key("act", "policy_1b_1", "cpu") in registry
+    assert registry.memory_bytes <= 3 * 1024**2
+
+
+def test_policy_over_budget_stays_resident(registry):
+    registry.get("act", "policy_1", "cpu")
+    registry.get("act", "policy_8", "cpu")
+
+    assert len(registry) == 1
+    assert make_policy_key("act", "policy_8", "cpu") in registry
+
+
+def test_dummy_observation_from_policy_features():
+    observation = make_dummy_observation(FakePolicy(size=1))
+
+    assert observation[OBS_STATE].shape == (1, 6)
+    assert observation[f"{OBS_IMAGES}.laptop"].shape == (1, 3, 32, 32)
+    assert observation["task"] == ""
@@ -88,6 +88,12 @@ def policy_server():
     return server
 
 
+@pytest.fixture
+def session(policy_server):
+    """State of a single client connected to the `policy_server`."""
+    return policy_server._get_session("client")
+
+
 # -----------------------------------------------------------------------------
 # Helper utilities for tests
 # -----------------------------------------------------------------------------
@@ -122,8 +128,8 @@ def test_time_action_chunk(policy_server):
     """Verify that `_time_action_chunk` assigns correct timestamps and timesteps."""
     start_ts = time.time()
     start_t = 10
-    # A chunk of 3 action tensors.
-    action_tensors = [torch.randn(6) for _ in range(3)]
+    # A chunk of 3 actions.
+    action_tensors = torch.randn(3, 6)
 
     timed_actions = policy_server._time_action_chunk(start_ts, action_tensors, start_t)
 
@@ -140,56 +146,258 @@ def test_time_action_chunk(policy_server):
         assert abs(ta.get_timestamp() - expected_ts) < 1e-6
 
 
-def test_maybe_enqueue_observation_must_go(policy_server):
+def test_maybe_enqueue_observation_must_go(policy_server, session):
     """An observation with `must_go=True` is always enqueued."""
     obs = _make_obs(torch.zeros(6), must_go=True)
-    assert policy_server._enqueue_observation(obs) is True
-    assert policy_server.observation_queue.qsize() == 1
-    assert policy_server.observation_queue.get_nowait() is obs
+    assert policy_server._enqueue_observation(session, obs) is True
+    assert session.observation_queue.qsize() == 1
+    assert session.observation_queue.get_nowait() is obs
 
 
-def test_maybe_enqueue_observation_dissimilar(policy_server):
+def test_maybe_enqueue_observation_dissimilar(policy_server, session):
     """A dissimilar observation (not `must_go`) is enqueued."""
     # Set a last predicted observation.
-    policy_server.last_processed_obs = _make_obs(torch.zeros(6))
+    session.last_processed_obs = _make_obs(torch.zeros(6))
     # Create a new, dissimilar observation.
     new_obs = _make_obs(torch.ones(6) * 5)  # High norm difference
 
-    assert policy_server._enqueue_observation(new_obs) is True
-    assert policy_server.observation_queue.qsize() == 1
+    assert policy_server._enqueue_observation(session, new_obs) is True
+    assert session.observation_queue.qsize() == 1
 
 
-def test_maybe_enqueue_observation_is_skipped(policy_server):
+def test_maybe_enqueue_observation_is_skipped(policy_server, session):
     """A similar observation (not `must_go`) is skipped."""
     # Set a last predicted observation.
-    policy_server.last_processed_obs = _make_obs(torch.zeros(6))
+    session.last_processed_obs = _make_obs(torch.zeros(6))
     # Create a new, very similar observation.
     new_obs = _make_obs(torch.zeros(6) + 1e-4)
 
-    assert policy_server._enqueue_observation(new_obs) is False
-    assert policy_server.observation_queue.empty() is True
+    assert policy_server._enqueue_observation(session, new_obs) is False
+    assert session.observation_queue.empty() is True
+
+
+def test_enqueue_observation_is_per_client(policy_server, session):
+    """The observations of a client don't replace or filter the observations of another client."""
+    other_session = policy_server._get_session("other_client")
+    session.last_processed_obs = _make_obs(torch.zeros(6))
+
+    obs = _make_obs(torch.zeros(6) + 1e-4)
+    assert policy_server._enqueue_observation(session, obs) is False
+    # Same observation, but nothing was processed yet for the other client
+    assert policy_server._enqueue_observation(other_session, obs) is True
+    assert session.observation_queue.empty() is True
+    assert other_session.observation_queue.qsize() == 1
+
+
+def test_enqueue_observation_caches_features_and_counts_skips(monkeypatch, policy_server, session):
+    """Filter features are extracted once per observation, and skips are reported in the stats."""
+    extracted = []
+    original_extract = policy_server.observation_filter.extract
+
+    def counting_extract(raw_observation, lerobot_features):
+        extracted.append(raw_observation)
+        return original_extract(raw_observation, lerobot_features)
+
+    monkeypatch.setattr(policy_server.observation_filter, "extract", counting_extract)
+
+    policy_server.preprocessor = lambda obs: obs
+    policy_server.postprocessor = lambda tensor: tensor
+    policy_server._get_action_chunk = lambda observation: torch.zeros(1, policy_server.actions_per_chunk, 6)
+
+    first_obs = _make_obs(torch.zeros(6), timestep=0, must_go=True)
+    assert policy_server._enqueue_observation(session, first_obs) is True
+    # Processing the observation makes its cached features the reference
+    policy_server._predict_action_chunks([(session, session.observation_queue.get_nowait())])
+    assert session.last_processed_features[0] is first_obs
+
+    for timestep in range(1, 4):
+        assert (
+            policy_server._enqueue_observation(session, _make_obs(torch.zeros(6), timestep=timestep)) is False
+        )
+    assert policy_server._enqueue_observation(session, _make_obs(torch.ones(6) * 5, timestep=4)) is True
 
+    # One extraction per received observation, the reference is never converted again
+    assert len(extracted) == 5
 
-def test_obs_sanity_checks(policy_server):
+    stats = policy_server.get_stats()["observation_filter"][session.client_id]
+    assert stats["received"] == 5
+    assert stats["skipped_similar"] == 3
+    assert stats["skipped_predicted"] == 0
+    assert stats["skip_rate"] == pytest.approx(0.6)
+
+
+def test_obs_sanity_checks(policy_server, session):
     """Unit-test the private `_obs_sanity_checks` helper."""
     prev = _make_obs(torch.zeros(6), timestep=0)
 
     # Case 1 – timestep already predicted
-    policy_server._predicted_timesteps.add(1)
+    session.predicted_timesteps.add(1)
     obs_same_ts = _make_obs(torch.ones(6), timestep=1)
-    assert policy_server._obs_sanity_checks(obs_same_ts, prev) is False
+    assert policy_server._obs_sanity_checks(session, obs_same_ts, prev) is False
 
     # Case 2 – observation too similar
-    policy_server._predicted_timesteps.clear()
+    session.predicted_timesteps.clear()
     obs_similar = _make_obs(torch.zeros(6) + 1e-4, timestep=2)
-    assert policy_server._obs_sanity_checks(obs_similar, prev) is False
+    assert policy_server._obs_sanity_checks(session, obs_similar, prev) is False
 
     # Case 3 – genuinely new & dissimilar observation passes
     obs_ok = _make_obs(torch.ones(6) * 5, timestep=3)
-    assert policy_server._obs_sanity_checks(obs_ok, prev) is True
+    assert policy_server._obs_sanity_checks(session, obs_ok, prev) is True
+
+
+class _FakeContext:
+    """gRPC servicer context of the calls of a client, disconnected with `disconnect`."""
+
+    def __init__(self, peer: str):
+        self._peer = peer
+        self._callbacks = []
+        self.active = True
+
+    def peer(self) -> str:
+        return self._peer
+
+    def is_active(self) -> bool:
+        return self.active
+
+    def add_callback(self, callback) -> bool:
+        self._callbacks.append(callback)
+        return True
+
+    def disconnect(self):
+        self.active = False
+        for callback in self._callbacks:
+            callback()
 
+    def abort(self, code, details: str):
+        self.aborted = code
+        raise RuntimeError(details)
 
-def test_predict_action_chunk(monkeypatch, policy_server):
+
+def _send_policy_instructions(policy_server, context, pretrained_name_or_path: str, shared_memory=None):
+    import pickle  # nosec
+    from types import SimpleNamespace
+
+    from lerobot.async_inference.helpers import RemotePolicyConfig
+
+    specs = RemotePolicyConfig(
+        policy_type="act",
+        pretrained_name_or_path=pretrained_name_or_path,
+        lerobot_features=policy_server.lerobot_features,
+        actions_per_chunk=20,
+        shared_memory=shared_memory,
+    )
+    policy_server.SendPolicyInstructions(SimpleNamespace(data=pickle.dumps(specs)), context)
+
+
+@pytest.fixture
+def registry_server(monkeypatch, policy_server):
+    """`policy_server` without a loaded policy, loading a `MockPolicy` for every policy instructions."""
+    from lerobot.async_inference.policy_registry import LoadedPolicy
+
+    def _get(pretrained_name_or_path, **kwargs):
+        policy = MockPolicy()
+        policy.name = pretrained_name_or_path
+        return LoadedPolicy(policy, lambda obs: obs, lambda action: action, memory_bytes=0, load_time=0.0)
+
+    monkeypatch.setattr(
+        policy_server.policy_registry, "get", lambda **kwargs: _get(kwargs.pop("pretrained_name_or_path"))
+    )
+    policy_server.policy = None
+    return policy_server
+
+
+def test_reconnected_client_can_switch_policy(registry_server):
+    """A client reconnecting from a new address is not refused a new policy because of its old session."""
+    first_context = _FakeContext("ipv4:127.0.0.1:50001")
+    registry_server.Ready(None, first_context)
+    _send_policy_instructions(registry_server, first_context, "policy_a")
+    # The action stream ends when the client disconnects
+    stream_context = _FakeContext(first_context.peer())
+    stream = registry_server.StreamActions(None, stream_context)
+    stream_context.active = False
+    assert list(stream) == []
+    stream_context.disconnect()
+    assert registry_server.sessions == {}
+
+    second_context = _FakeContext("ipv4:127.0.0.1:50002")
+    registry_server.Ready(None, second_context)
+    _send_policy_instructions(registry_server, second_context, "policy_b")
+
+    assert registry_server.policy.name == "policy_b"
+    assert list(registry_server.sessions) == [second_context.peer()]
+
+
+def test_shared_memory_survives_the_end_of_the_action_stream(registry_server):
+    """The rings are attached again when a client keeps sending observations after its stream ended."""
+    import grpc
+
+    from lerobot.async_inference.encoding import encode_observation
+    from lerobot.async_inference.shared_memory import (
+        SharedMemoryRing,
+        SharedMemorySpec,
+        encode_shared_memory_reference,
+        to_shared_memory,
+    )
+    from lerobot.transport import services_pb2  # type: ignore
+    from lerobot.transport.utils import send_bytes_in_chunks
+
+    registry_server.config.shared_memory_transport = True
+    observation_ring = SharedMemoryRing.create(num_slots=2, slot_size=1024**2)
+    action_ring = SharedMemoryRing.create(num_slots=2, slot_size=1024**2)
+    spec = SharedMemorySpec(observation_ring.name, action_ring.name, num_slots=2, slot_size=1024**2)
+
+    context = _FakeContext("ipv4:127.0.0.1:50001")
+    registry_server.Ready(None, context)
+    _send_policy_instructions(registry_server, context, "policy_a", shared_memory=spec)
+
+    def send_observation(reference: bytes):
+        registry_server.SendObservations(send_bytes_in_chunks(reference, services_pb2.Observation), context)
+
+    try:
+        stream_context = _FakeContext(context.peer())
+        stream = registry_server.StreamActions(None, stream_context)
+        stream_context.active = False
+        assert list(stream) == []
+        stream_context.disconnect()
+        assert registry_server.sessions == {}
+
+        send_observation(to_shared_memory(observation_ring, encode_observation(_make_obs(torch.ones(6), 1))))
+        session = registry_server.sessions[context.peer()]
+        assert session.observation_ring is not None
+        assert session.observation_queue.get_nowait().get_timestep() == 1
+
+        # The client is gone along with its rings, its observations can't be read anymore
+        registry_server._drop_session(context.peer(), session)
+        observation_ring.close()
+        action_ring.close()
+        with pytest.raises(RuntimeError, match="no shared memory is attached"):
+            send_observation(encode_shared_memory_reference(1))
+        assert context.aborted == grpc.StatusCode.FAILED_PRECONDITION
+    finally:
+        observation_ring.close()
+        action_ring.close()
+
+
+def test_policy_switch_refused_only_with_active_clients(registry_server):
+    """Clients share the policy while they are connected, polling clients time out after `client_timeout_s`."""
+    first_context = _FakeContext("ipv4:127.0.0.1:50001")
+    registry_server.Ready(None, first_context)
+    _send_policy_instructions(registry_server, first_context, "policy_a")
+
+    second_context = _FakeContext("ipv4:127.0.0.1:50002")
+    registry_server.Ready(None, second_context)
+    with pytest.raises(ValueError, match="different policy"):
+        _send_policy_instructions(registry_server, second_context, "policy_b")
+
+    # The first client stopped polling for actions
+    registry_server.sessions[first_context.peer()].last_seen -= registry_server.config.client_timeout_s + 1
+    _send_policy_instructions(registry_server, second_context, "policy_b")
+
+    assert registry_server.policy.name == "policy_b"
+    assert list(registry_server.sessions) == [second_context.peer()]
+
+
+def test_predict_action_chunk(monkeypatch, policy_server, session):
     """End-to-end test of `_predict_action_chunk` with a stubbed _get_action_chunk."""
     # Import only when needed
     from lerobot.async_inference.policy_server import PolicyServer
@@ -209,7 +417,7 @@ def test_predict_action_chunk(monkeypatch, policy_server):
     monkeypatch.setattr(PolicyServer, "_get_action_chunk", _fake_get_action_chunk, raising=True)
 
     obs = _make_obs(torch.zeros(6), timestep=5)
-    timed_actions = policy_server._predict_action_chunk(obs)
+    timed_actions = policy_server._predict_action_chunk(session, obs)
 
     assert len(timed_actions) == actions_per_chunk
     assert [ta.get_timestep() for ta in timed_actions] == list(range(5, 5 + actions_per_chunk))
@@ -217,3 +425,185 @@ def test_predict_action_chunk(monkeypatch, policy_server):
     for i, ta in enumerate(timed_actions):
         expected_ts = obs.get_timestamp() + i * policy_server.config.environment_dt
         assert abs(ta.get_timestamp() - expected_ts) < 1e-6
+
+
+def test_predict_action_chunks_batches_clients(policy_server):
+    """Observations of several clients go through the policy in one call, and each gets its own chunk."""
+    policy_server.policy_type = "act"
+    policy_server.preprocessor = lambda obs: obs
+    policy_server.postprocessor = lambda tensor: tensor
+    batch_sizes = []
+
+    def _get_action_chunk(observation):
+        batch_size = len(observation[OBS_STATE])
+        batch_sizes.append(batch_size)
+        # Every action of a chunk is filled with the first joint of the state
+        return observation[OBS_STATE][:, :1].unsqueeze(1).expand(-1, policy_server.actions_per_chunk, 6)
+
+    policy_server._get_action_chunk = _get_action_chunk
+
+    requests = [
+        (policy_server._get_session(f"client_{i}"), _make_obs(torch.full((6,), float(i)), timestep=10 * i))
+        for i in range(3)
+    ]
+    action_chunks = policy_server._predict_action_chunks(requests)
+
+    assert batch_sizes == [3]
+    assert len(action_chunks) == 3
+    for i, ((session, obs), chunk) in enumerate(zip(requests, action_chunks, strict=True)):
+        assert session.last_processed_obs is obs
+        assert [ta.get_timestep() for ta in chunk] == list(range(10 * i, 10 * i + 20))
+        for ta in chunk:
+            assert ta.get_action().shape == (6,)
+            assert torch.all(ta.get_action() == i)
+
+
+def test_predict_action_chunks_groups_observations_by_shape(policy_server):
+    """Observations whose tensors can't be concatenated, e.g. tokens of different lengths, are run apart."""
+    from lerobot.utils.constants import OBS_LANGUAGE_TOKENS
+
+    policy_server.preprocessor = lambda obs: {
+        **obs,
+        OBS_LANGUAGE_TOKENS: torch.ones(1, 4 if obs[OBS_STATE][0, 0] < 2 else 7, dtype=torch.long),
+    }
+    policy_server.postprocessor = lambda tensor: tensor
+    batch_sizes = []
+
+    def _get_action_chunk(observation):
+        batch_sizes.append(len(observation[OBS_STATE]))
+        return observation[OBS_STATE][:, :1].unsqueeze(1).expand(-1, policy_server.actions_per_chunk, 6)
+
+    policy_server._get_action_chunk = _get_action_chunk
+
+    requests = [
+        (policy_server._get_session(f"client_{i}"), _make_obs(torch.full((6,), float(i)), timestep=i))
+        for i in range(3)
+    ]
+    action_chunks = policy_server._predict_action_chunks(requests)
+
+    assert batch_sizes == [2, 1]
+    for i, chunk in enumerate(action_chunks):
+        assert all(torch.all(ta.get_action() == i) for ta in chunk)
+
+
+def test_predict_action_chunks_keeps_policy_state_per_client(policy_server):
+    """Policies keeping state between calls run every client apart, with the state of that client."""
+    from collections import deque
+
+    class StatefulPolicy(MockPolicy):
+        def reset(self):
+            self._queues = {OBS_STATE: deque(maxlen=2)}
+
+        def predict_action_chunk(self, observation):
+            self._queues[OBS_STATE].append(observation[OBS_STATE])
+            # Every action of a chunk is filled with the number of observations of the client
+            return torch.full((len(observation[OBS_STATE]), 20, 6), float(len(self._queues[OBS_STATE])))
+
+    policy_server.policy = StatefulPolicy()
+    policy_server.policy.reset()
+    policy_server.preprocessor = lambda obs: obs
+    policy_server.postprocessor = lambda tensor: tensor
+
+    sessions = [policy_server._get_session(f"client_{i}") for i in range(2)]
+    first_chunks = policy_server._predict_action_chunks(
+        [(session, _make_obs(torch.zeros(6), timestep=0)) for session in sessions]
+    )
+    second_chunks = policy_server._predict_action_chunks(
+        [(sessions[0], _make_obs(torch.zeros(6), timestep=1))]
+    )
+
+    assert [torch.all(chunk[0].get_action() == 1) for chunk in first_chunks] == [True, True]
+    assert torch.all(second_chunks[0][0].get_action() == 2)
+    assert len(sessions[1].policy_state[1][OBS_STATE]) == 1
+
+
+@pytest.mark.parametrize("batch_size", [1, 3])
+def test_postprocess_whole_chunk_matches_per_action(policy_server, batch_size):
+    """Unnormalizing the whole chunk at once gives the same actions as unnormalizing every action."""
+    from lerobot.configs.types import FeatureType, NormalizationMode
+    from lerobot.processor import PolicyProcessorPipeline, UnnormalizerProcessorStep
+    from lerobot.processor.converters import policy_action_to_transition, transition_to_policy_action
+    from lerobot.utils.constants import ACTION
+
+    policy_server.preprocessor = lambda obs: obs
+    policy_server.postprocessor = PolicyProcessorPipeline(
+        steps=[
+            UnnormalizerProcessorStep(
+                features={ACTION: PolicyFeature(type=FeatureType.ACTION, shape=(6,))},
+                norm_map={FeatureType.ACTION: NormalizationMode.MEAN_STD},
+                stats={ACTION: {"mean": torch.arange(6.0), "std": torch.full((6,), 2.0)}},
+            )
+        ],
+        to_transition=policy_action_to_transition,
+        to_output=transition_to_policy_action,
+    )
+    normalized_chunk = torch.randn(batch_size, policy_server.actions_per_chunk, 6)
+    policy_server._get_action_chunk = lambda observation: normalized_chunk
+
+    requests = [
+        (policy_server._get_session(f"client_{i}"), _make_obs(torch.zeros(6), timestep=i))
+        for i in range(batch_size)
+    ]
+    policy_server.config.postprocess_whole_chunk = True
+    whole_chunks = policy_server._predict_action_chunks(requests)
+    policy_server.config.postprocess_whole_chunk = False
+    per_action_chunks = policy_server._predict_action_chunks(requests)
+
+    for i, (whole, per_action) in enumerate(zip(whole_chunks, per_action_chunks, strict=True)):
+        torch.testing.assert_close(whole.get_actions(), normalized_chunk[i] * 2.0 + torch.arange(6.0))
+        torch.testing.assert_close(whole.get_actions(), per_action.get_actions())
+
+
+def test_dynamic_batcher_collects_within_max_wait():
+    """Requests submitted within the max-wait window are processed together."""
+    from lerobot.async_inference.batching import DynamicBatcher
+
+    processed_batches = []
+
+    def process_batch(payloads):
+        processed_batches.append(list(payloads))
+        return [payload * 2 for payload in payloads]
+
+    batcher = DynamicBatcher(process_batch, max_batch_size=3, max_wait_s=0.2)
+    futures = [batcher.submit(f"client_{i}", i) for i in range(4)]
+    results = [future.result(timeout=5) for future in futures]
+    batcher.stop()
+
+    assert results == [0, 2, 4, 6]
+    assert processed_batches == [[0, 1, 2], [3]]
+
+    stats = batcher.get_stats()
+    assert stats["batch_size_histogram"] == {1: 1, 3: 1}
+    assert set(stats["client_latency"]) == {f"client_{i}" for i in range(4)}
+    assert all(metrics["count"] == 1 for metrics in stats["client_latency"].values())
+
+
+def test_dynamic_batcher_propagates_errors():
+    """A failing batch fails the requests of every client in it."""
+    from lerobot.async_inference.batching import DynamicBatcher
+
+    def process_batch(payloads):
+        raise RuntimeError("inference failed")
+
+    batcher = DynamicBatcher(process_batch, max_batch_size=2, max_wait_s=0.0)
+    future = batcher.submit("client", 0)
+
+    with pytest.raises(RuntimeError, match="inference failed"):
+        future.result(timeout=5)
+    batcher.stop()
+
+
+def test_concatenate_observations():
+    from lerobot.async_inference.batching import concatenate_observations
+
+    observations = [
+        {OBS_STATE: torch.full((1, 6), float(i)), "task": [f"task {i}"], "robot_type": "dummy_robot"}
+        for i in range(3)
+    ]
+
+    batch = concatenate_observations(observations)
+
+    assert batch[OBS_STATE].shape == (3, 6)
+    assert torch.equal(batch[OBS_STATE][:, 0], torch.tensor([0.0, 1.0, 2.0]))
+    assert batch["task"] == ["task 0", "task 1", "task 2"]
+    assert batch["robot_type"] == "dummy_robot"
@@ -19,8 +19,8 @@ no real hardware is accessed. Only the queue-update mechanism is verified.
 
 from __future__ import annotations
 
+import pickle
 import time
-from queue import Queue
 
 import pytest
 import torch
@@ -84,6 +84,14 @@ def _make_actions(start_ts: float, start_t: int, count: int):
     return actions
 
 
+def _drain(action_queue):
+    """Pop every action left in the client action queue."""
+    actions = []
+    while (timed_action := action_queue.get()) is not None:
+        actions.append(timed_action)
+    return actions
+
+
 # -----------------------------------------------------------------------------
 # Tests
 # -----------------------------------------------------------------------------
@@ -101,7 +109,7 @@ def test_update_action_queue_discards_stale(robot_client):
     robot_client._aggregate_action_queues(incoming)
 
     # Extract timesteps from queue
-    resulting_timesteps = [a.get_timestep() for a in robot_client.action_queue.queue]
+    resulting_timesteps = [a.get_timestep() for a in _drain(robot_client.action_queue)]
 
     assert resulting_timesteps == [5, 6, 7]
 
@@ -137,8 +145,7 @@ def test_aggregate_action_queues_combines_actions_in_overlap(
         for a in current_actions
     ]
 
-    for a in current_actions:
-        robot_client.action_queue.put(a)
+    robot_client.action_queue.merge(current_actions, latest_timestep=4)
 
     # Incoming chunk contains timesteps 3..7 -> expect 5,6,7 kept.
     incoming = _make_actions(start_ts=time.time(), start_t=3, count=5)  # 3,4,5,6,7
@@ -152,7 +159,7 @@ def test_aggregate_action_queues_combines_actions_in_overlap(
 
     queue_overlap_actions = []
     queue_non_overlap_actions = []
-    for a in robot_client.action_queue.queue:
+    for a in _drain(robot_client.action_queue):
         if a.get_timestep() in overlap_timesteps:
             queue_overlap_actions.append(a)
         elif a.get_timestep() in nonoverlap_timesteps:
@@ -183,15 +190,14 @@ def test_aggregate_action_queues_combines_actions_in_overlap(
 )
 def test_ready_to_send_observation(robot_client, chunk_size: int, queue_len: int, expected: bool):
     """Validate `_ready_to_send_observation` ratio logic for various sizes."""
+    from lerobot.async_inference.action_buffer import ActionRingBuffer
 
     robot_client.action_chunk_size = chunk_size
 
     # Clear any existing actions then fill with `queue_len` dummy entries ----
-    robot_client.action_queue = Queue()
-
+    robot_client.action_queue = ActionRingBuffer()
     dummy_actions = _make_actions(start_ts=time.time(), start_t=0, count=queue_len)
-    for act in dummy_actions:
-        robot_client.action_queue.put(act)
+    robot_client.action_queue.merge(dummy_actions, latest_timestep=-1)
 
     assert robot_client._ready_to_send_observation() is expected
 
@@ -216,18 +222,84 @@ def test_ready_to_send_observation(robot_client, chunk_size: int, queue_len: int
 )
 def test_ready_to_send_observation_with_varying_threshold(robot_client, g_threshold: float, expected: bool):
     """Validate `_ready_to_send_observation` with fixed sizes and varying `g`."""
+    from lerobot.async_inference.action_buffer import ActionRingBuffer
+
     # Fixed sizes for this test: ratio = 6 / 10 = 0.6
     chunk_size = 10
     queue_len = 6
 
     robot_client.action_chunk_size = chunk_size
     # This is the parameter we are testing
-    robot_client._chunk_size_threshold = g_threshold
+    robot_client.scheduler.chunk_size_threshold = g_threshold
 
     # Fill queue with dummy actions
-    robot_client.action_queue = Queue()
+    robot_client.action_queue = ActionRingBuffer()
     dummy_actions = _make_actions(start_ts=time.time(), start_t=0, count=queue_len)
-    for act in dummy_actions:
-        robot_client.action_queue.put(act)
+    robot_client.action_queue.merge(dummy_actions, latest_timestep=-1)
 
     assert robot_client._ready_to_send_observation() is expected
+
+
+def test_ready_to_send_observation_uses_threshold_by_default(robot_client):
+    """Without opting in to adaptive scheduling, measured latencies don't change when observations are sent."""
+    from lerobot.async_inference.action_buffer import ActionRingBuffer
+
+    robot_client.action_chunk_size = 20
+    # A round trip of a single control step would only send observations once the queue is almost empty
+    robot_client.scheduler.record_chunk(observation_timestamp=0.0, receive_timestamp=0.01, server_time=0.0)
+
+    robot_client.action_queue = ActionRingBuffer()
+    robot_client.action_queue.merge(
+        _make_actions(start_ts=time.time(), start_t=0, count=10), latest_timestep=-1
+    )
+
+    assert not robot_client.config.adaptive_chunk_scheduling
+    assert robot_client._ready_to_send_observation()
+
+
+def test_get_image_sizes(robot_client):
+    """The client resizes its camera images to the resolution of the policy image features."""
+    from lerobot.configs.types import FeatureType, PolicyFeature
+    from lerobot.transport import services_pb2  # type: ignore
+
+    robot_client.lerobot_features = {
+        "observation.images.laptop": {"dtype": "image", "shape": (480, 640, 3)},
+    }
+    policy_image_features = {
+        "observation.images.laptop": PolicyFeature(type=FeatureType.VISUAL, shape=(3, 96, 128)),
+        # Not a camera of the robot
+        "observation.images.phone": PolicyFeature(type=FeatureType.VISUAL, shape=(3, 64, 64)),
+    }
+
+    policy_features = services_pb2.PolicyFeatures(data=pickle.dumps(policy_image_features))
+
+    assert robot_client._get_image_sizes(policy_features) == {"laptop": (96, 128)}
+    # Servers that do not send the policy features
+    assert robot_client._get_image_sizes(services_pb2.PolicyFeatures()) == {}
+
+
+def test_send_observation_falls_back_to_grpc_when_server_lost_shared_memory(robot_client):
+    """A server that can't read the shared memory anymore gets the next observations over gRPC."""
+    import grpc
+
+    from lerobot.async_inference.helpers import TimedObservation
+    from lerobot.async_inference.shared_memory import SharedMemoryRing
+
+    class _FailedPrecondition(grpc.RpcError):
+        def code(self):
+            return grpc.StatusCode.FAILED_PRECONDITION
+
+    class _Stub:
+        def SendObservations(self, request_iterator):  # noqa: N802
+            list(request_iterator)
+            raise _FailedPrecondition()
+
+    robot_client.observation_ring = SharedMemoryRing.create(num_slots=2, slot_size=1024)
+    robot_client.action_ring = SharedMemoryRing.create(num_slots=2, slot_size=1024)
+    robot_client.stub = _Stub()
+
+    obs = TimedObservation(observation={"joint1": 0.0}, timestamp=time.time(), timestep=0)
+    assert not robot_client.send_observation(obs)
+    assert robot_client.observation_ring is None
+    assert robot_client.action_ring is None
+    assert robot_client.policy_config.shared_memory is None
@@ -0,0 +1,96 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from lerobot.async_inference.scheduling import AdaptiveChunkScheduler, UnderrunTracker
+
+
+def test_underrun_tracker_ignores_startup():
+    tracker = UnderrunTracker()
+    for step in range(5):
+        tracker.record_step(False, step * 0.1)
+
+    assert tracker.calculate_underrun_metrics() == {
+        "underrun_count": 0,
+        "idle_time_s": 0.0,
+        "idle_fraction": 0.0,
+    }
+
+
+def test_underrun_tracker_counts_underruns_and_idle_time():
+    tracker = UnderrunTracker()
+    # 0.0-0.2 performing, 0.3-0.4 idle, 0.5 performing, 0.6-0.9 idle (still idle at the end)
+    performed = [True, True, True, False, False, True, False, False, False, False]
+    for step, action_performed in enumerate(performed):
+        tracker.record_step(action_performed, step * 0.1)
+
+    metrics = tracker.calculate_underrun_metrics()
+    assert metrics["underrun_count"] == 2
+    assert metrics["idle_time_s"] == pytest.approx(0.2 + 0.3)
+    assert metrics["idle_fraction"] == pytest.approx(0.5 / 0.9)
+
+
+def test_scheduler_falls_back_to_threshold_without_measurements():
+    scheduler = AdaptiveChunkScheduler(environment_dt=0.1, chunk_size_threshold=0.5)
+
+    assert scheduler.ready_to_send(queue_size=10, chunk_size=20)
+    assert not scheduler.ready_to_send(queue_size=11, chunk_size=20)
+
+
+def test_scheduler_sends_just_early_enough():
+    scheduler = AdaptiveChunkScheduler(environment_dt=0.1, latency_quantile=1.0, margin_steps=1)
+    for round_trip in (0.2, 0.3, 0.25):
+        scheduler.record_chunk(
+            observation_timestamp=10.0, receive_timestamp=10.0 + round_trip, server_time=0.1
+        )
+
+    # The slowest chunk took 3 control steps, plus one step of margin
+    assert scheduler.lead_steps == 4
+    assert scheduler.ready_to_send(queue_size=4, chunk_size=20)
+    assert not scheduler.ready_to_send(queue_size=5, chunk_size=20)
+
+    metrics = scheduler.get_metrics()
+    assert metrics["round_trip_latency"]["max_ms"] == pytest.approx(300)
+    assert metrics["server_latency"]["max_ms"] == pytest.approx(100)
+    assert metrics["network_latency"]["max_ms"] == pytest.approx(200)
+
+
+def test_scheduler_tracks_latency_drift():
+    scheduler = AdaptiveChunkScheduler(
+        environment_dt=0.1, latency_quantile=0.5, margin_steps=0, window_size=3
+    )
+    for _ in range(3):
+        scheduler.record_chunk(observation_timestamp=0.0, receive_timestamp=0.2, server_time=0.0)
+    assert scheduler.lead_steps == 2
+
+    # Inference slows down, older measurements leave the window
+    for _ in range(3):
+        scheduler.record_chunk(observation_timestamp=0.0, receive_timestamp=0.8, server_time=0.0)
+    assert scheduler.lead_steps == 8
+
+
+def test_scheduler_latency_never_exceeds_chunk():
+    scheduler = AdaptiveChunkScheduler(environment_dt=0.1)
+    scheduler.record_chunk(observation_timestamp=0.0, receive_timestamp=5.0, server_time=0.0)
+
+    assert scheduler.ready_to_send(queue_size=20, chunk_size=20)
+
+
+def test_scheduler_not_adaptive():
+    scheduler = AdaptiveChunkScheduler(environment_dt=0.1, chunk_size_threshold=0.5, adaptive=False)
+    scheduler.record_chunk(observation_timestamp=0.0, receive_timestamp=0.2, server_time=0.0)
+
+    assert scheduler.ready_to_send(queue_size=10, chunk_size=20)
+    assert not scheduler.ready_to_send(queue_size=3 + 8, chunk_size=20)
@@ -0,0 +1,107 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from multiprocessing.shared_memory import SharedMemory
+
+import pytest
+
+from lerobot.async_inference.shared_memory import (
+    SharedMemoryRing,
+    decode_shared_memory_reference,
+    encode_shared_memory_reference,
+    from_shared_memory,
+    to_shared_memory,
+)
+
+
+@pytest.fixture
+def ring():
+    ring = SharedMemoryRing.create(num_slots=2, slot_size=16)
+    yield ring
+    ring.close()
+
+
+def test_write_and_read_across_attachments(ring):
+    consumer = SharedMemoryRing.attach(ring.name, num_slots=2, slot_size=16)
+    assert ring.attached
+
+    sequence_number = ring.write(b"observation")
+    assert consumer.read(sequence_number) == b"observation"
+
+    consumer.close()
+    # Closing the consumer leaves the segment to its owner
+    assert ring.read(sequence_number) == b"observation"
+
+
+def test_overwritten_message_is_not_returned(ring):
+    first = ring.write(b"first")
+    ring.write(b"second")
+    assert ring.read(first) == b"first"
+
+    third = ring.write(b"third")
+    assert ring.read(first) is None
+    assert ring.read(third) == b"third"
+
+
+def test_message_larger_than_slot(ring):
+    message = b"x" * 17
+    assert ring.write(message) is None
+    # Sent inline instead of a reference
+    assert to_shared_memory(ring, message) == message
+    assert from_shared_memory(ring, message) == message
+
+
+def test_references(ring):
+    reference = to_shared_memory(ring, b"actions")
+
+    assert decode_shared_memory_reference(reference) == 0
+    assert decode_shared_memory_reference(encode_shared_memory_reference(7)) == 7
+    assert decode_shared_memory_reference(b"LRAC" + bytes(8)) is None
+    assert from_shared_memory(ring, reference) == b"actions"
+    assert to_shared_memory(None, b"actions") == b"actions"
+    with pytest.raises(ValueError):
+        from_shared_memory(None, reference)
+
+
+def test_not_attached_until_the_other_end_attaches(ring):
+    assert not ring.attached
+    with pytest.raises(ValueError):
+        SharedMemoryRing.attach(ring.name, num_slots=4, slot_size=16)
+    assert not ring.attached
+
+
+def test_owner_frees_the_segment(ring):
+    name = ring.name
+    ring.close()
+
+    assert ring.write(b"observation") is None
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=name)
+
+
+def test_attach_refuses_other_segments():
+    with pytest.raises(ValueError, match="not the name"):
+        SharedMemoryRing.attach("psm_other", num_slots=2, slot_size=16)
+
+    # Named like a ring, but not laid out like one
+    segment = SharedMemory(
+        name="lerobot_0123456789abcdef", create=True, size=SharedMemoryRing.segment_size(2, 16)
+    )
+    try:
+        with pytest.raises(ValueError, match="not a ring"):
+            SharedMemoryRing.attach(segment.name, num_slots=2, slot_size=16)
+        assert not any(segment.buf)
+    finally:
+        segment.close()
+        segment.unlink()
@@ -17,10 +17,12 @@
 import re
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 
 from lerobot.motors.motors_bus import (
     Motor,
+    MotorCalibration,
     MotorNormMode,
     assert_same_address,
     get_address,
@@ -356,3 +358,106 @@ def test_sync_write_by_value_dict(data_name, ids_values, dummy_motors):
     mock__encode_sign.assert_called_once_with(data_name, ids_values)
     if data_name in bus.normalized_data:
         mock__unnormalize.assert_called_once_with(ids_values)
+
+
+class DriveModeMockMotorsBus(MockMotorsBus):
+    apply_drive_mode = True
+
+
+@pytest.fixture
+def calibrated_bus(dummy_motors) -> DriveModeMockMotorsBus:
+    motors = {**dummy_motors, "dummy_4": Motor(4, "model_1", MotorNormMode.DEGREES)}
+    calibration = {
+        "dummy_1": MotorCalibration(id=1, drive_mode=0, homing_offset=0, range_min=1000, range_max=3000),
+        "dummy_2": MotorCalibration(id=2, drive_mode=1, homing_offset=0, range_min=1000, range_max=3000),
+        "dummy_3": MotorCalibration(id=3, drive_mode=1, homing_offset=0, range_min=0, range_max=4000),
+        "dummy_4": MotorCalibration(id=4, drive_mode=0, homing_offset=0, range_min=0, range_max=4094),
+    }
+    bus = DriveModeMockMotorsBus("/dev/dummy-port", motors)
+    bus.calibration = calibration
+    return bus
+
+
+def test__normalize(calibrated_bus):
+    normalized = calibrated_bus._normalize({1: 2500, 2: 2500, 3: 1000, 4: 6142})
+    # Raw values are bounded by the calibration range, except in degrees
+    assert normalized == {1: 50.0, 2: -50.0, 3: 75.0, 4: 360.0}
+    assert calibrated_bus._normalize({1: 0, 4: 2047}) == {1: -100.0, 4: 0.0}
+
+
+def test__unnormalize(calibrated_bus):
+    unnormalized = calibrated_bus._unnormalize({1: 50.0, 2: -50.0, 3: 75.0, 4: 180.0})
+    assert unnormalized == {1: 2500, 2: 2500, 3: 1000, 4: 4094}
+    assert all(type(value) is int for value in unnormalized.values())
+    assert calibrated_bus._unnormalize({1: 150.0, 3: -10.0}) == {1: 3000, 3: 4000}
+
+
+def test__normalize_invalid_calibration(calibrated_bus):
+    calibrated_bus.calibration = {
+        **calibrated_bus.calibration,
+        "dummy_2": MotorCalibration(id=2, drive_mode=0, homing_offset=0, range_min=1000, range_max=1000),
+    }
+    assert calibrated_bus._normalize({1: 2000}) == {1: 0.0}
+    with pytest.raises(ValueError, match="min and max are equal"):
+        calibrated_bus._normalize({1: 2000, 2: 2000})
+
+
+def test__unnormalize_non_finite(calibrated_bus):
+    with pytest.raises(ValueError, match="non-finite"):
+        calibrated_bus._unnormalize({4: float("inf")})
+
+
+def test__normalize_after_calibration_change(calibrated_bus):
+    assert calibrated_bus._normalize({1: 2000}) == {1: 0.0}
+    calibrated_bus.calibration = {
+        **calibrated_bus.calibration,
+        "dummy_1": MotorCalibration(id=1, drive_mode=0, homing_offset=0, range_min=2000, range_max=4000),
+    }
+    assert calibrated_bus._normalize({1: 2000}) == {1: -100.0}
+
+
+def test_sync_read_array(calibrated_bus):
+    calibrated_bus.connect(handshake=False)
+    ids_values = {4: 6142, 1: 2500, 2: 2500}
+
+    with (
+        patch.object(MockMotorsBus, "_sync_read", return_value=(ids_values, 0)),
+        patch.object(MockMotorsBus, "_decode_sign", return_value=ids_values),
+    ):
+        values = calibrated_bus.sync_read_array("Present_Position", ["dummy_4", "dummy_1", "dummy_2"])
+        raw_values = calibrated_bus.sync_read_array(
+            "Present_Position", ["dummy_4", "dummy_1"], normalize=False
+        )
+
+    np.testing.assert_array_equal(values, [360.0, 50.0, -50.0])
+    assert values.dtype == np.float64
+    np.testing.assert_array_equal(raw_values, [6142, 2500])
+    assert raw_values.dtype == np.int64
+
+
+def test_sync_write_array(calibrated_bus):
+    calibrated_bus.connect(handshake=False)
+    addr, length = DUMMY_CTRL_TABLE_2["Goal_Position"]
+    ids_values = {1: 2500, 2: 2500}
+
+    with (
+        patch.object(MockMotorsBus, "_sync_write", return_value=0) as mock__sync_write,
+        patch.object(MockMotorsBus, "_encode_sign", return_value=ids_values) as mock__encode_sign,
+    ):
+        calibrated_bus.sync_write_array("Goal_Position", np.array([50.0, -50.0]), ["dummy_1", "dummy_2"])
+
+    mock__encode_sign.assert_called_once_with("Goal_Position", ids_values)
+    mock__sync_write.assert_called_once_with(
+        addr,
+        length,
+        ids_values,
+        num_retry=1,
+        raise_on_error=True,
+        err_msg=f"Failed to sync write 'Goal_Position' with {ids_values=} after 2 tries.",
+    )
+
+
+def test_sync_write_array_wrong_shape(calibrated_bus):
+    calibrated_bus.connect(handshake=False)
+    with pytest.raises(ValueError, match="Expected 2 values"):
+        calibrated_bus.sync_write_array("Goal_Position", np.zeros(3), ["dummy_1", "dummy_2"])
@@ -167,12 +167,27 @@ def test_actor_learner_config():
     assert config.learner_host == "127.0.0.1"
     assert config.learner_port == 50051
     assert config.policy_parameters_push_frequency == 4
+    assert config.actor_id is None
+    assert config.max_actors == 1
+    assert config.transitions_queue_size_per_actor == 8
 
 
 def test_concurrency_config():
     config = ConcurrencyConfig()
     assert config.actor == "threads"
     assert config.learner == "threads"
+    assert config.learner_ingestion == "inline"
+
+
+def test_concurrency_config_ingestion_process_requires_learner_processes():
+    config = ConcurrencyConfig(learner="processes", learner_ingestion="process")
+    assert config.learner_ingestion == "process"
+
+    with pytest.raises(ValueError, match="requires learner='processes'"):
+        ConcurrencyConfig(learner="threads", learner_ingestion="process")
+
+    with pytest.raises(ValueError, match="learner_ingestion must be"):
+        ConcurrencyConfig(learner_ingestion="threads")
 
 
 def test_sac_config_custom_initialization():
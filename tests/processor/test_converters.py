@@ -307,3 +307,32 @@ def test_transition_to_batch_without_index_fields():
     assert "task" in batch
     assert "index" not in batch
     assert "task_index" not in batch
+
+
+def test_conversions_share_memory():
+    """Test that the conversions don't copy the tensors and arrays that need no conversion."""
+    tensor = torch.randn(3)
+    assert to_tensor(tensor) is tensor
+    assert to_tensor(tensor, dtype=None, device="cpu") is tensor
+    array = np.arange(3, dtype=np.float32)
+    assert to_tensor(array).data_ptr() == array.__array_interface__["data"][0]
+    # Dtype and device conversions copy once
+    assert to_tensor(array.astype(np.float64), dtype=torch.float32).dtype == torch.float32
+
+    batch = {
+        OBS_STATE: torch.randn(1, 7),
+        ACTION: torch.randn(1, 4),
+        "action_is_pad": torch.zeros(1, 4, dtype=torch.bool),
+        "stats_id": ["robot_a"],
+        "task": ["pick_cube"],
+    }
+    transition = batch_to_transition(batch)
+    assert transition[TransitionKey.OBSERVATION][OBS_STATE] is batch[OBS_STATE]
+    assert transition[TransitionKey.ACTION] is batch[ACTION]
+    assert transition[TransitionKey.COMPLEMENTARY_DATA] == {
+        "action_is_pad": batch["action_is_pad"],
+        "stats_id": ["robot_a"],
+        "task": ["pick_cube"],
+    }
+    roundtrip = transition_to_batch(transition)
+    assert all(roundtrip[key] is value for key, value in batch.items())
@@ -13,6 +13,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import copy
 import tempfile
 
 import pytest
@@ -1156,3 +1157,63 @@ def test_mps_serialization():
     # Test load_state_dict (should be no-op)
     processor.load_state_dict({})
     assert processor.device == "mps"
+
+
+def test_pinned_staging_serialization():
+    """Test that pinned staging is saved with the config, and that steps using it can be copied."""
+    processor = DeviceProcessorStep(device="cpu", pinned_staging=True)
+    assert processor.get_config() == {"device": "cpu", "float_dtype": None, "pinned_staging": True}
+
+    copied_processor = copy.deepcopy(processor)
+    assert copied_processor.pinned_staging
+    # Without a CUDA target, tensors go through the per-tensor path
+    transition = create_transition(observation={OBS_STATE: torch.randn(4)}, action=torch.randn(2))
+    result = copied_processor(transition)
+    torch.testing.assert_close(
+        result[TransitionKey.OBSERVATION][OBS_STATE], transition[TransitionKey.OBSERVATION][OBS_STATE]
+    )
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="CUDA not available")
+@pytest.mark.parametrize("float_dtype", [None, "float16", "float64"])
+def test_pinned_staging_matches_per_tensor_copies(float_dtype):
+    """Test that packing the tensors in a pinned staging buffer gives the same outputs as copying them one by one."""
+    processor = DeviceProcessorStep(device="cuda", float_dtype=float_dtype)
+    staged_processor = DeviceProcessorStep(device="cuda", float_dtype=float_dtype, pinned_staging=True)
+
+    for _ in range(3):
+        transition = create_transition(
+            observation={
+                OBS_STATE: torch.randn(7),
+                OBS_IMAGE: torch.rand(3, 48, 64).permute(0, 2, 1),  # Not contiguous
+                "observation.mask": torch.tensor([True, False, True]),
+                "observation.empty": torch.empty(0, 3),
+                "observation.on_device": torch.randn(2, device="cuda"),
+                "observation.metadata": "not a tensor",
+            },
+            action=torch.randn(1, 6),
+            reward=torch.tensor(1.0),
+            complementary_data={"index": torch.tensor([3], dtype=torch.int64)},
+        )
+        expected = processor(transition)
+        result = staged_processor(transition)
+
+        for key in (
+            TransitionKey.OBSERVATION,
+            TransitionKey.ACTION,
+            TransitionKey.REWARD,
+            TransitionKey.COMPLEMENTARY_DATA,
+        ):
+            expected_value, value = expected[key], result[key]
+            if isinstance(expected_value, dict):
+                assert expected_value.keys() == value.keys()
+                for name in expected_value:
+                    if isinstance(expected_value[name], torch.Tensor):
+                        assert value[name].device == expected_value[name].device
+                        assert value[name].dtype == expected_value[name].dtype
+                        torch.testing.assert_close(value[name], expected_value[name])
+                    else:
+                        assert value[name] == expected_value[name]
+            else:
+                assert value.dtype == expected_value.dtype
+                torch.testing.assert_close(value, expected_value)
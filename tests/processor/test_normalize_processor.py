@@ -23,12 +23,20 @@ from lerobot.configs.types import FeatureType, NormalizationMode, PolicyFeature
 from lerobot.processor import (
     DataProcessorPipeline,
     IdentityProcessorStep,
+    NormalizationStatsRegistry,
     NormalizerProcessorStep,
     TransitionKey,
     UnnormalizerProcessorStep,
     hotswap_stats,
+    select_stats,
+)
+from lerobot.processor.converters import (
+    batch_to_transition,
+    create_transition,
+    identity_transition,
+    to_tensor,
+    transition_to_batch,
 )
-from lerobot.processor.converters import create_transition, identity_transition, to_tensor
 from lerobot.utils.constants import ACTION, OBS_IMAGE, OBS_STATE, OBS_STR
 from lerobot.utils.utils import auto_select_torch_device
 
@@ -2128,3 +2136,212 @@ def test_stats_reconstruction_after_load_state_dict():
         new_result[TransitionKey.OBSERVATION][OBS_STATE],
     )
     torch.testing.assert_close(original_result[TransitionKey.ACTION], new_result[TransitionKey.ACTION])
+
+
+@pytest.mark.parametrize(
+    "norm_mode, low_name, high_name",
+    [
+        (NormalizationMode.MIN_MAX, "min", "max"),
+        (NormalizationMode.QUANTILES, "q01", "q99"),
+        (NormalizationMode.QUANTILE10, "q10", "q90"),
+    ],
+)
+def test_affine_transform_matches_range_formulas(norm_mode, low_name, high_name):
+    """Test that the cached scale and offset reproduce the reference formulas, including a zero range."""
+    low = torch.tensor([-1.0, 0.0, 0.5])
+    high = torch.tensor([2.0, 4.0, 0.5])
+    stats = {OBS_STATE: {low_name: low.numpy(), high_name: high.numpy()}}
+    features = {OBS_STATE: PolicyFeature(type=FeatureType.STATE, shape=(3,))}
+    norm_map = {FeatureType.STATE: norm_mode}
+    normalizer = NormalizerProcessorStep(features=features, norm_map=norm_map, stats=stats)
+    unnormalizer = UnnormalizerProcessorStep(features=features, norm_map=norm_map, stats=stats)
+
+    state = torch.randn(4, 3)
+    denom = torch.where(high == low, torch.tensor(normalizer.eps), high - low)
+    normalized = normalizer(create_transition(observation={OBS_STATE: state}))[TransitionKey.OBSERVATION]
+    torch.testing.assert_close(normalized[OBS_STATE], 2 * (state - low) / denom - 1)
+
+    unnormalized = unnormalizer(create_transition(observation={OBS_STATE: state}))[TransitionKey.OBSERVATION]
+    torch.testing.assert_close(unnormalized[OBS_STATE], (state + 1) / 2 * denom + low)
+
+
+def test_affine_cache_follows_stats_updates():
+    """Test that the cached scale and offset are recomputed when the stats are moved, reloaded or swapped."""
+    features = {ACTION: PolicyFeature(type=FeatureType.ACTION, shape=(2,))}
+    norm_map = {FeatureType.ACTION: NormalizationMode.MEAN_STD}
+    normalizer = NormalizerProcessorStep(
+        features=features,
+        norm_map=norm_map,
+        stats={ACTION: {"mean": np.array([1.0, 2.0]), "std": np.array([2.0, 4.0])}},
+    )
+    action = torch.tensor([3.0, 6.0])
+
+    def normalize(step):
+        return step(create_transition(action=action))[TransitionKey.ACTION]
+
+    torch.testing.assert_close(normalize(normalizer), torch.tensor([1.0, 1.0]))
+    # Cached across calls
+    cached = normalizer._affine_cache[(ACTION, NormalizationMode.MEAN_STD, False)]
+    normalize(normalizer)
+    assert normalizer._affine_cache[(ACTION, NormalizationMode.MEAN_STD, False)] is cached
+
+    loaded = NormalizerProcessorStep(features=features, norm_map=norm_map)
+    loaded.load_state_dict(normalizer.state_dict())
+    torch.testing.assert_close(normalize(loaded), torch.tensor([1.0, 1.0]))
+    loaded.load_state_dict({f"{ACTION}.mean": torch.tensor([0.0, 0.0]), f"{ACTION}.std": torch.ones(2)})
+    torch.testing.assert_close(normalize(loaded), action)
+
+    new_stats = {ACTION: {"mean": np.array([3.0, 6.0]), "std": np.array([1.0, 1.0])}}
+    swapped = hotswap_stats(DataProcessorPipeline([normalizer]), new_stats).steps[0]
+    torch.testing.assert_close(normalize(swapped), torch.tensor([0.0, 0.0]))
+    # The original step keeps its stats
+    torch.testing.assert_close(normalize(normalizer), torch.tensor([1.0, 1.0]))
+
+    bfloat16_action = normalizer(create_transition(action=action.to(torch.bfloat16)))[TransitionKey.ACTION]
+    assert bfloat16_action.dtype == torch.bfloat16
+    torch.testing.assert_close(bfloat16_action, torch.ones(2, dtype=torch.bfloat16))
+
+
+@pytest.fixture
+def stats_registry():
+    return NormalizationStatsRegistry(
+        {
+            "robot_a": {
+                OBS_STATE: {"mean": np.array([1.0, 2.0]), "std": np.array([2.0, 2.0])},
+                ACTION: {"mean": np.array([0.0, 1.0, 2.0]), "std": np.array([1.0, 2.0, 4.0])},
+            },
+            "robot_b": {
+                OBS_STATE: {"mean": np.array([-1.0, 0.0]), "std": np.array([0.5, 1.0])},
+            },
+        }
+    )
+
+
+def test_stats_registry_selects_stats_by_id(stats_registry):
+    """Test that the registry stats are selected per transition, without copying or moving them."""
+    features = {
+        OBS_STATE: PolicyFeature(FeatureType.STATE, (2,)),
+        ACTION: PolicyFeature(FeatureType.ACTION, (3,)),
+    }
+    norm_map = {FeatureType.STATE: NormalizationMode.MEAN_STD, FeatureType.ACTION: NormalizationMode.MEAN_STD}
+    own_stats = {OBS_STATE: {"mean": np.zeros(2), "std": np.ones(2)}}
+    normalizer = NormalizerProcessorStep(
+        features=features, norm_map=norm_map, stats=own_stats, stats_registry=stats_registry
+    )
+    pipeline = DataProcessorPipeline(
+        [normalizer], to_transition=batch_to_transition, to_output=transition_to_batch
+    )
+    state, action = torch.tensor([3.0, 4.0]), torch.tensor([1.0, 1.0, 1.0])
+    registry_tensors = stats_registry.get("robot_a")[OBS_STATE]["mean"]
+
+    result = pipeline({OBS_STATE: state, ACTION: action, "stats_id": "robot_a"})
+    torch.testing.assert_close(result[OBS_STATE], torch.tensor([1.0, 1.0]))
+    torch.testing.assert_close(result[ACTION], torch.tensor([1.0, 0.0, -0.25]))
+    result = pipeline({OBS_STATE: state, ACTION: action, "stats_id": "robot_b"})
+    torch.testing.assert_close(result[OBS_STATE], torch.tensor([8.0, 4.0]))
+    # Features without stats for the id are left unchanged, as with the step's own stats
+    torch.testing.assert_close(result[ACTION], action)
+
+    # Without an id, the selected stats are used, or the step's own stats if none are
+    torch.testing.assert_close(pipeline({OBS_STATE: state})[OBS_STATE], state)
+    select_stats(pipeline, "robot_b")
+    assert normalizer.stats_id == "robot_b"
+    torch.testing.assert_close(pipeline({OBS_STATE: state})[OBS_STATE], torch.tensor([8.0, 4.0]))
+    with pytest.raises(KeyError, match="robot_c"):
+        select_stats(pipeline, "robot_c")
+    with pytest.raises(KeyError, match="robot_c"):
+        pipeline({OBS_STATE: state, "stats_id": "robot_c"})
+
+    # The registry stats are neither converted to the dtype of the inputs nor copied with the pipeline
+    bfloat16_state = pipeline({OBS_STATE: state.to(torch.bfloat16), "stats_id": "robot_a"})[OBS_STATE]
+    assert bfloat16_state.dtype == torch.bfloat16
+    assert stats_registry.get("robot_a")[OBS_STATE]["mean"] is registry_tensors
+    assert hotswap_stats(pipeline, own_stats).steps[0].stats_registry is stats_registry
+    assert "stats_registry" not in normalizer.get_config()
+
+    # Registering new stats for an id replaces the cached parameters
+    stats_registry.register("robot_b", {OBS_STATE: {"mean": np.array([3.0, 4.0]), "std": np.ones(2)}})
+    torch.testing.assert_close(pipeline({OBS_STATE: state})[OBS_STATE], torch.zeros(2))
+
+
+@pytest.mark.parametrize(
+    "norm_mode", [NormalizationMode.MEAN_STD, NormalizationMode.MIN_MAX, NormalizationMode.QUANTILES]
+)
+def test_stats_registry_mixed_batch(norm_mode):
+    """Test that a batch mixing stats ids is (un)normalized like each of its samples on its own."""
+    stats = {
+        stats_id: {
+            key: {
+                "mean": torch.randn(dim),
+                "std": torch.rand(dim) + 0.5,
+                "min": torch.rand(dim) - 1.5,
+                "max": torch.rand(dim) + 0.5,
+                "q01": torch.rand(dim) - 1.0,
+                "q99": torch.rand(dim) + 1.0,
+            }
+            for key, dim in ((OBS_STATE, 2), (ACTION, 3))
+        }
+        for stats_id in ("robot_a", "robot_b")
+    }
+    # Only the state is normalized with the stats of the last id
+    stats["robot_c"] = {OBS_STATE: stats["robot_a"][OBS_STATE]}
+    registry = NormalizationStatsRegistry(stats)
+    features = {
+        OBS_STATE: PolicyFeature(FeatureType.STATE, (2,)),
+        ACTION: PolicyFeature(FeatureType.ACTION, (3,)),
+    }
+    norm_map = {FeatureType.STATE: norm_mode, FeatureType.ACTION: norm_mode}
+    normalizer = NormalizerProcessorStep(features=features, norm_map=norm_map, stats_registry=registry)
+    unnormalizer = UnnormalizerProcessorStep(features=features, norm_map=norm_map, stats_registry=registry)
+
+    stats_ids = ["robot_b", "robot_a", "robot_c", "robot_b"]
+    # An action chunk per sample, the per-sample stats are broadcast over its steps
+    state, action = torch.randn(4, 2), torch.randn(4, 5, 3)
+    transition = create_transition(
+        observation={OBS_STATE: state}, action=action, complementary_data={"stats_id": stats_ids}
+    )
+    normalized = normalizer(transition)
+
+    for i, stats_id in enumerate(stats_ids):
+        expected = normalizer(
+            create_transition(
+                observation={OBS_STATE: state[i]}, action=action[i], complementary_data={"stats_id": stats_id}
+            )
+        )
+        torch.testing.assert_close(
+            normalized[TransitionKey.OBSERVATION][OBS_STATE][i],
+            expected[TransitionKey.OBSERVATION][OBS_STATE],
+        )
+        torch.testing.assert_close(normalized[TransitionKey.ACTION][i], expected[TransitionKey.ACTION])
+    torch.testing.assert_close(normalized[TransitionKey.ACTION][2], action[2])
+
+    roundtrip = unnormalizer(normalized)
+    torch.testing.assert_close(roundtrip[TransitionKey.OBSERVATION][OBS_STATE], state)
+    torch.testing.assert_close(roundtrip[TransitionKey.ACTION], action)
+
+    with pytest.raises(ValueError, match="batch dimension"):
+        normalizer(
+            create_transition(observation={OBS_STATE: state[:3]}, complementary_data={"stats_id": stats_ids})
+        )
+
+
+def test_stats_registry_gathers_shuffled_batches_from_one_cache_entry(stats_registry):
+    """Test that batches mixing the same ids in any order share their stacked parameters."""
+    params = [
+        stats_registry.gather_affine_params(
+            stats_ids, OBS_STATE, NormalizationMode.MEAN_STD, False, 1e-8, torch.float32
+        )
+        for stats_ids in (["robot_a", "robot_b", "robot_a"], ["robot_b", "robot_a"], ["robot_b"] * 2)
+    ]
+
+    stacked_keys = [key for key in stats_registry._affine_cache if isinstance(key[0], tuple)]
+    assert [key[0] for key in stacked_keys] == [("robot_a", "robot_b"), ("robot_b",)]
+    scale_a, _ = stats_registry.affine_params(
+        "robot_a", OBS_STATE, NormalizationMode.MEAN_STD, False, 1e-8, torch.float32
+    )
+    scale_b, _ = stats_registry.affine_params(
+        "robot_b", OBS_STATE, NormalizationMode.MEAN_STD, False, 1e-8, torch.float32
+    )
+    torch.testing.assert_close(params[0][0], torch.stack([scale_a, scale_b, scale_a]))
+    torch.testing.assert_close(params[1][0], torch.stack([scale_b, scale_a]))
+    torch.testing.assert_close(params[2][0], torch.stack([scale_b, scale_b]))
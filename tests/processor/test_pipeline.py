@@ -21,17 +21,23 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pytest
 import torch
 import torch.nn as nn
 
-from lerobot.configs.types import FeatureType, PipelineFeatureType, PolicyFeature
+from lerobot.configs.types import FeatureType, NormalizationMode, PipelineFeatureType, PolicyFeature
 from lerobot.datasets.pipeline_features import aggregate_pipeline_dataset_features
 from lerobot.processor import (
+    AddBatchDimensionProcessorStep,
     DataProcessorPipeline,
+    DeviceProcessorStep,
     EnvTransition,
+    NormalizerProcessorStep,
+    ObservationProcessorStep,
     ProcessorStep,
     ProcessorStepRegistry,
+    RenameObservationsProcessorStep,
     TransitionKey,
 )
 from lerobot.processor.converters import create_transition, identity_transition
@@ -2198,3 +2204,209 @@ def test_initial_camera_not_overridden_by_step_image():
     key = f"{OBS_IMAGES}.front"
     assert key in out
     assert out[key]["shape"] == (240, 320, 3)  # from the step, not from initial
+
+
+def _make_fusable_pipeline() -> DataProcessorPipeline:
+    features = {
+        OBS_STATE: PolicyFeature(type=FeatureType.STATE, shape=(2,)),
+        ACTION: PolicyFeature(type=FeatureType.ACTION, shape=(2,)),
+    }
+    stats = {
+        OBS_STATE: {"mean": torch.tensor([1.0, -1.0]), "std": torch.tensor([2.0, 0.5])},
+        ACTION: {"min": torch.tensor([0.0, 0.0]), "max": torch.tensor([1.0, 4.0])},
+    }
+    norm_map = {FeatureType.STATE: NormalizationMode.MEAN_STD, FeatureType.ACTION: NormalizationMode.MIN_MAX}
+    return DataProcessorPipeline(
+        [
+            RenameObservationsProcessorStep(rename_map={"state": OBS_STATE}),
+            AddBatchDimensionProcessorStep(),
+            DeviceProcessorStep(device="cpu", float_dtype="float64"),
+            NormalizerProcessorStep(features=features, norm_map=norm_map, stats=stats),
+            MockStep("not_fusable"),
+            AddBatchDimensionProcessorStep(),
+        ],
+        to_transition=identity_transition,
+        to_output=identity_transition,
+    )
+
+
+def test_freeze_fuses_in_place_steps():
+    """Test that a frozen pipeline fuses consecutive in-place steps and returns the same outputs."""
+    pipeline = _make_fusable_pipeline()
+    frozen_pipeline = _make_fusable_pipeline().freeze()
+
+    assert frozen_pipeline.is_frozen
+    # The 4 steps before the mock step are fused, the last one is alone
+    assert [len(getattr(step, "steps", [step])) for step in frozen_pipeline._frozen_steps] == [4, 1, 1]
+
+    observation = {"state": torch.tensor([3.0, 0.0])}
+    transition = create_transition(observation=observation, action=torch.tensor([0.5, 1.0]))
+    expected = pipeline(transition)
+    result = frozen_pipeline(transition)
+
+    # The input transition is left untouched
+    assert transition[TransitionKey.OBSERVATION] is observation
+    assert list(observation) == ["state"]
+    assert result.keys() == expected.keys()
+    torch.testing.assert_close(result[TransitionKey.OBSERVATION], expected[TransitionKey.OBSERVATION])
+    torch.testing.assert_close(result[TransitionKey.ACTION], expected[TransitionKey.ACTION])
+    assert result[TransitionKey.ACTION].dtype == torch.float64
+    assert result[TransitionKey.COMPLEMENTARY_DATA] == expected[TransitionKey.COMPLEMENTARY_DATA]
+
+    assert not frozen_pipeline.unfreeze().is_frozen
+
+
+def test_freeze_does_not_fuse_steps_overriding_call():
+    """Test that a step overriding `__call__` without `process_in_place` is never fused."""
+
+    class DoubleStateStep(ObservationProcessorStep):
+        def observation(self, observation):
+            return observation
+
+        def __call__(self, transition: EnvTransition) -> EnvTransition:
+            new_transition = transition.copy()
+            new_transition[TransitionKey.OBSERVATION] = {
+                key: value * 2 for key, value in transition[TransitionKey.OBSERVATION].items()
+            }
+            return new_transition
+
+        def transform_features(self, features):
+            return features
+
+    pipeline = DataProcessorPipeline(
+        [RenameObservationsProcessorStep(rename_map={}), DoubleStateStep()],
+        to_transition=identity_transition,
+        to_output=identity_transition,
+    ).freeze()
+
+    assert pipeline._frozen_steps == pipeline.steps
+    result = pipeline(create_transition(observation={OBS_STATE: torch.tensor([1.0])}))
+    torch.testing.assert_close(result[TransitionKey.OBSERVATION][OBS_STATE], torch.tensor([2.0]))
+
+
+def test_frozen_pipeline_runs_hooks_for_every_step():
+    """Test that hooks registered on a frozen pipeline still see every step."""
+    pipeline = _make_fusable_pipeline().freeze()
+    calls = []
+    pipeline.register_after_step_hook(lambda idx, transition: calls.append(idx))
+
+    transition = create_transition(
+        observation={"state": torch.tensor([3.0, 0.0])}, action=torch.tensor([0.5, 1.0])
+    )
+    result = pipeline(transition)
+
+    assert calls == list(range(len(pipeline)))
+    torch.testing.assert_close(result, _make_fusable_pipeline()(transition))
+
+
+def test_save_and_load_consolidated_state():
+    """Test that the states of all the steps can be saved in a single file."""
+    step1 = MockStepWithTensorState(name="norm1", window_size=5)
+    step2 = MockStepWithTensorState(name="norm2", window_size=10)
+    pipeline = DataProcessorPipeline([step1, RegisteredMockStep(), step2])
+    for i in range(7):
+        pipeline(create_transition(reward=float(i)))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pipeline.save_pretrained(tmp_dir, consolidate_state=True)
+
+        assert [f.name for f in Path(tmp_dir).glob("*.safetensors")] == [
+            "dataprocessorpipeline_state.safetensors"
+        ]
+        with open(Path(tmp_dir) / "dataprocessorpipeline.json") as f:
+            config = json.load(f)
+        assert [step.get("state_prefix") for step in config["steps"]] == ["step_0.", None, "step_2."]
+
+        loaded_pipeline = DataProcessorPipeline.from_pretrained(
+            tmp_dir, config_filename="dataprocessorpipeline.json"
+        )
+
+    for step, loaded_step in zip(pipeline.steps, loaded_pipeline.steps, strict=True):
+        for key, tensor in step.state_dict().items():
+            torch.testing.assert_close(loaded_step.state_dict()[key], tensor)
+
+
+def test_manifest_features_reused_after_load(monkeypatch):
+    """Test that features computed before saving are reused by the loaded pipeline."""
+    pipeline = DataProcessorPipeline([RenameObservationsProcessorStep(rename_map={"state": OBS_STATE})])
+    initial_features = {
+        PipelineFeatureType.OBSERVATION: {"state": PolicyFeature(type=FeatureType.STATE, shape=(2,))},
+        PipelineFeatureType.ACTION: {"joint.pos": float, "camera": (480, 640, 3)},
+    }
+    expected = pipeline.transform_features(initial_features)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pipeline.save_pretrained(tmp_dir)
+        with open(Path(tmp_dir) / "dataprocessorpipeline.json") as f:
+            manifest = json.load(f)["manifest"]
+        assert manifest["version"] == 1
+        assert len(manifest["features"]) == 1
+
+        loaded_pipeline = DataProcessorPipeline.from_pretrained(
+            tmp_dir, config_filename="dataprocessorpipeline.json"
+        )
+        overridden_pipeline = DataProcessorPipeline.from_pretrained(
+            tmp_dir,
+            config_filename="dataprocessorpipeline.json",
+            overrides={"rename_observations_processor": {"rename_map": {}}},
+        )
+
+    def fail(self, features):
+        raise AssertionError("The features of the manifest should be reused")
+
+    with monkeypatch.context() as m:
+        m.setattr(RenameObservationsProcessorStep, "transform_features", fail)
+        assert loaded_pipeline.transform_features(initial_features) == expected
+
+    # Overrides change the features, which are recomputed
+    assert overridden_pipeline.transform_features(initial_features) == initial_features
+    # Changing the configuration of a step after loading also invalidates them
+    loaded_pipeline.steps[0].rename_map = {}
+    assert loaded_pipeline.transform_features(initial_features) == initial_features
+
+
+def test_manifest_with_numpy_shapes():
+    """Test that shapes holding numpy integers don't break saving the pipeline."""
+    pipeline = DataProcessorPipeline(
+        [RenameObservationsProcessorStep(rename_map={}), AddBatchDimensionProcessorStep()]
+    )
+    pipeline.transform_features(
+        {PipelineFeatureType.OBSERVATION: {OBS_STATE: PolicyFeature(FeatureType.STATE, (np.int64(3),))}}
+    )
+    # Dimensions that are not integers can't go in the manifest
+    pipeline.transform_features(
+        {PipelineFeatureType.OBSERVATION: {OBS_STATE: PolicyFeature(FeatureType.STATE, (3.5,))}}
+    )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pipeline.save_pretrained(tmp_dir)
+        with open(Path(tmp_dir) / "dataprocessorpipeline.json") as f:
+            manifest = json.load(f)["manifest"]
+
+    assert len(manifest["features"]) == 1
+    assert manifest["features"][0]["input"]["OBSERVATION"][OBS_STATE]["policy_feature"]["shape"] == [3]
+
+
+def test_manifest_of_newer_version_is_ignored():
+    """Test that pipelines saved with a newer manifest still load, recomputing their features."""
+    pipeline = DataProcessorPipeline([RenameObservationsProcessorStep(rename_map={"state": OBS_STATE})])
+    initial_features = {PipelineFeatureType.OBSERVATION: {"state": float}}
+    pipeline.transform_features(initial_features)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pipeline.save_pretrained(tmp_dir)
+        config_path = Path(tmp_dir) / "dataprocessorpipeline.json"
+        with open(config_path) as f:
+            config = json.load(f)
+        config["manifest"]["version"] += 1
+        config["manifest"]["features"][0]["output"] = {"OBSERVATION": {}}
+        with open(config_path, "w") as f:
+            json.dump(config, f)
+
+        loaded_pipeline = DataProcessorPipeline.from_pretrained(
+            tmp_dir, config_filename="dataprocessorpipeline.json"
+        )
+
+    assert loaded_pipeline.transform_features(initial_features) == {
+        PipelineFeatureType.OBSERVATION: {OBS_STATE: float}
+    }
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from copy import deepcopy
+
+import pytest
+import torch
+
+from lerobot.processor import (
+    AddBatchDimensionProcessorStep,
+    DataProcessorPipeline,
+    DeviceProcessorStep,
+    ProcessorProfiler,
+    RenameObservationsProcessorStep,
+    profiler as profiler_module,
+)
+from lerobot.processor.converters import create_transition, identity_transition
+from lerobot.utils.constants import OBS_STATE
+
+
+def make_pipeline() -> DataProcessorPipeline:
+    return DataProcessorPipeline(
+        [
+            RenameObservationsProcessorStep(rename_map={"state": OBS_STATE}),
+            AddBatchDimensionProcessorStep(),
+            DeviceProcessorStep(device="cpu", float_dtype="float64"),
+        ],
+        name="preprocessor",
+        to_transition=identity_transition,
+        to_output=identity_transition,
+    )
+
+
+def make_transition():
+    return create_transition(observation={"state": torch.zeros(4)}, action=torch.zeros(2))
+
+
+def test_records_every_step():
+    profiler = ProcessorProfiler()
+    pipeline = profiler.attach(make_pipeline().freeze())
+    for _ in range(5):
+        pipeline(make_transition())
+
+    summary = profiler.summary()["preprocessor"]
+    assert list(summary) == [
+        "0.RenameObservationsProcessorStep",
+        "1.AddBatchDimensionProcessorStep",
+        "2.DeviceProcessorStep",
+        "total",
+    ]
+    assert all(metrics["count"] == 5 for metrics in summary.values())
+
+    rename = summary["0.RenameObservationsProcessorStep"]
+    assert rename["mean_bytes_in"] == rename["mean_bytes_out"] == 4 * 4 + 2 * 4
+    # Renaming and adding a batch dimension reuse the memory of the tensors
+    assert rename["mean_allocations"] == 0
+    assert summary["1.AddBatchDimensionProcessorStep"]["mean_allocations"] == 0
+    # Casting to float64 allocates the state and the action again
+    device = summary["2.DeviceProcessorStep"]
+    assert device["mean_allocations"] == 2
+    assert device["mean_bytes_out"] == 2 * device["mean_bytes_in"]
+    assert summary["total"]["mean_ms"] >= device["mean_ms"]
+    assert "mean_bytes_in" not in summary["total"]
+
+
+def test_attach_and_detach():
+    profiler = ProcessorProfiler()
+    pipeline = make_pipeline()
+    profiler.attach(pipeline)
+    profiler.attach(pipeline)
+    assert len(pipeline.before_step_hooks) == len(pipeline.after_step_hooks) == 1
+
+    # Copies of the pipeline report to the same profiler
+    deepcopy(pipeline)(make_transition())
+    assert profiler.summary()["preprocessor"]["total"]["count"] == 1
+
+    profiler.detach(pipeline)
+    pipeline(make_transition())
+    assert not pipeline.before_step_hooks and not pipeline.after_step_hooks
+    assert profiler.summary()["preprocessor"]["total"]["count"] == 1
+
+    profiler.reset()
+    assert profiler.summary() == {}
+
+
+def test_export(tmp_path):
+    profiler = ProcessorProfiler()
+    pipeline = profiler.attach(make_pipeline())
+    pipeline(make_transition())
+
+    table = profiler.format_table().splitlines()
+    assert len(table) == 1 + len(pipeline) + 1
+    assert table[-1].split()[:3] == ["preprocessor", "total", "1"]
+
+    path = tmp_path / "profile.json"
+    profiler.save_json(path)
+    with open(path) as f:
+        assert json.load(f) == profiler.summary()
+
+
+@pytest.mark.parametrize("value, enabled", [("", False), ("0", False), ("1", True), ("profile.json", True)])
+def test_session_profiler_enabled_by_environment(monkeypatch, value, enabled):
+    monkeypatch.setattr(profiler_module, "_session_profiler", None)
+    monkeypatch.setattr(profiler_module.atexit, "register", lambda *args: None)
+    monkeypatch.setenv(profiler_module.PROFILE_ENV, value)
+
+    pipeline = make_pipeline()
+    assert bool(pipeline.after_step_hooks) == enabled
+    if enabled:
+        # Shared by all the pipelines of the process
+        assert profiler_module.get_session_profiler() is pipeline.after_step_hooks[0].profiler
+        assert len(pipeline[:2].after_step_hooks) == 1
@@ -0,0 +1,252 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+import torch
+
+from lerobot.processor import (
+    DataProcessorPipeline,
+    PolicyActionToRobotActionProcessorStep,
+    RobotActionBatch,
+    RobotActionProcessorStep,
+    RobotActionToPolicyActionProcessorStep,
+    TransitionKey,
+)
+from lerobot.processor.converters import create_transition, identity_transition
+from lerobot.processor.delta_action_processor import (
+    MapDeltaActionToRobotActionStep,
+    MapTensorToDeltaActionDictStep,
+)
+from lerobot.robots.so_follower.robot_kinematic_processor import (
+    EEBoundsAndSafety,
+    EEReferenceAndDelta,
+    ForwardKinematicsJointsToEEAction,
+    GripperVelocityToJoint,
+    InverseKinematicsEEToJoints,
+)
+from lerobot.utils.rotation import Rotation
+
+MOTOR_NAMES = ["shoulder_pan", "shoulder_lift", "elbow_flex", "wrist_flex", "wrist_roll", "gripper"]
+
+
+class MockKinematics:
+    """Kinematics mapping the first three joints to the position and the next three to the rotation."""
+
+    def forward_kinematics(self, joint_pos: np.ndarray) -> np.ndarray:
+        pose = np.eye(4)
+        pose[:3, :3] = Rotation.from_rotvec(joint_pos[3:6] * 0.01).as_matrix()
+        pose[:3, 3] = joint_pos[:3] * 0.01
+        return pose
+
+    def inverse_kinematics(self, current_joint_pos: np.ndarray, desired_ee_pose: np.ndarray) -> np.ndarray:
+        joint_pos = np.array(current_joint_pos, dtype=float)
+        joint_pos[:3] = desired_ee_pose[:3, 3] / 0.01
+        joint_pos[3:6] = Rotation.from_matrix(desired_ee_pose[:3, :3]).as_rotvec() / 0.01
+        return joint_pos
+
+
+def make_ee_steps():
+    kinematics = MockKinematics()
+    return [
+        MapDeltaActionToRobotActionStep(),
+        EEReferenceAndDelta(
+            kinematics=kinematics,
+            end_effector_step_sizes={"x": 0.01, "y": 0.01, "z": 0.01},
+            motor_names=MOTOR_NAMES,
+            use_latched_reference=True,
+        ),
+        EEBoundsAndSafety(end_effector_bounds={"min": [-0.5] * 3, "max": [0.5] * 3}, max_ee_step_m=10.0),
+        GripperVelocityToJoint(speed_factor=5.0),
+        InverseKinematicsEEToJoints(kinematics=kinematics, motor_names=MOTOR_NAMES),
+    ]
+
+
+def assert_actions_close(actions: list[dict], batch: RobotActionBatch):
+    batch_actions = batch.to_dicts()
+    assert len(actions) == len(batch_actions)
+    for action, batch_action in zip(actions, batch_actions, strict=True):
+        assert list(action) == list(batch_action)
+        for key, value in action.items():
+            assert float(value) == pytest.approx(batch_action[key], abs=1e-6), key
+
+
+def test_from_dicts_and_to_dicts_round_trip():
+    actions = [{"a.pos": 1.0, "b.pos": 2.0}, {"b.pos": 4.0, "a.pos": 3.0}]
+    batch = RobotActionBatch.from_dicts(actions)
+
+    assert batch.keys == ("a.pos", "b.pos")
+    assert batch.batch_size == 2
+    torch.testing.assert_close(batch.values, torch.tensor([[1.0, 2.0], [3.0, 4.0]]))
+    assert batch.to_dicts() == [{"a.pos": 1.0, "b.pos": 2.0}, {"a.pos": 3.0, "b.pos": 4.0}]
+
+    single = RobotActionBatch.from_dicts({"a.pos": 1.0, "b.pos": True}, keys=["b.pos", "a.pos"])
+    assert single.to_dicts() == [{"b.pos": 1.0, "a.pos": 1.0}]
+
+
+def test_invalid_batches():
+    with pytest.raises(ValueError, match="should be of shape"):
+        RobotActionBatch(["a", "b"], torch.zeros(2, 3))
+    with pytest.raises(ValueError, match="should be unique"):
+        RobotActionBatch(["a", "a"], torch.zeros(2, 2))
+    with pytest.raises(KeyError, match="available keys"):
+        RobotActionBatch(["a"], torch.zeros(2, 1))["b"]
+
+
+def test_columns_are_views_when_contiguous():
+    batch = RobotActionBatch(["a", "b", "c"], torch.arange(6.0).reshape(2, 3))
+
+    assert batch["b"].data_ptr() == batch.values[:, 1].data_ptr()
+    assert batch.columns(["b", "c"]).data_ptr() == batch.values[:, 1:].data_ptr()
+    torch.testing.assert_close(batch.columns(["c", "a"]), torch.tensor([[2.0, 0.0], [5.0, 3.0]]))
+
+
+def test_with_columns():
+    batch = RobotActionBatch(["a", "b", "c"], torch.arange(6.0).reshape(2, 3))
+
+    new_batch = batch.with_columns({"b": torch.tensor([10.0, 20.0]), "d": torch.ones(2, 1)}, drop=["a"])
+
+    assert new_batch.keys == ("b", "c", "d")
+    torch.testing.assert_close(new_batch.values, torch.tensor([[10.0, 2.0, 1.0], [20.0, 5.0, 1.0]]))
+    # The input batch is not modified
+    torch.testing.assert_close(batch.values, torch.arange(6.0).reshape(2, 3))
+    assert batch.with_columns(drop=["a", "b", "c"]).values.shape == (2, 0)
+
+
+def test_policy_robot_bridge_batch_round_trip():
+    motor_names = ["joint1", "joint2", "joint3"]
+    to_robot = PolicyActionToRobotActionProcessorStep(motor_names=motor_names)
+    to_policy = RobotActionToPolicyActionProcessorStep(motor_names=motor_names)
+    policy_action = torch.randn(8, 3)
+
+    robot_action = to_robot.action(policy_action)
+
+    assert isinstance(robot_action, RobotActionBatch)
+    assert robot_action.keys == ("joint1.pos", "joint2.pos", "joint3.pos")
+    torch.testing.assert_close(to_policy.action(robot_action), policy_action)
+
+
+def test_robot_action_step_without_batch_support():
+    class ScaleStep(RobotActionProcessorStep):
+        def action(self, action):
+            return {key: value * 2 for key, value in action.items()}
+
+        def transform_features(self, features):
+            return features
+
+    pipeline = DataProcessorPipeline(
+        [ScaleStep()], to_transition=identity_transition, to_output=identity_transition
+    )
+    batch = RobotActionBatch(["a.pos", "b.pos"], torch.zeros(2, 2))
+
+    with pytest.raises(ValueError, match="RobotActionBatch.to_dicts"):
+        pipeline(create_transition(action=batch))
+
+
+def test_tensor_to_delta_action_batch():
+    step = MapTensorToDeltaActionDictStep()
+    action = torch.tensor([[0.1, 0.2, 0.3, 1.0], [0.4, 0.5, 0.6, 2.0]])
+
+    batch = step.action(action)
+
+    assert isinstance(batch, RobotActionBatch)
+    assert batch.keys == ("delta_x", "delta_y", "delta_z", "gripper")
+    torch.testing.assert_close(batch.values, action)
+    # A single row keeps the single robot dict
+    assert step.action(action[:1]) == pytest.approx(
+        {"delta_x": 0.1, "delta_y": 0.2, "delta_z": 0.3, "gripper": 1.0}
+    )
+
+
+def test_delta_action_to_robot_action_matches_dicts():
+    step = MapDeltaActionToRobotActionStep(position_scale=2.0)
+    actions = [
+        {"delta_x": 0.1, "delta_y": -0.2, "delta_z": 0.05, "gripper": 2.0},
+        {"delta_x": 0.0, "delta_y": 0.0, "delta_z": 0.0, "gripper": 1.0},
+    ]
+
+    batch = step(create_transition(action=RobotActionBatch.from_dicts(actions)))[TransitionKey.ACTION]
+
+    assert_actions_close([step.action(dict(action)) for action in actions], batch)
+
+
+def test_ee_pipeline_batch_matches_per_robot_pipelines():
+    batch_size = 4
+    rng = np.random.default_rng(0)
+    robot_steps = [make_ee_steps() for _ in range(batch_size)]
+    batch_steps = make_ee_steps()
+
+    for t in range(4):
+        observation = {f"{name}.pos": rng.normal(size=batch_size) * 10 for name in MOTOR_NAMES}
+        actions = [
+            {
+                "delta_x": rng.normal(),
+                "delta_y": rng.normal(),
+                "delta_z": rng.normal(),
+                "gripper": float(rng.integers(0, 3)),
+            }
+            for _ in range(batch_size)
+        ]
+        if t == 2:
+            # A disabled robot keeps its last command
+            actions[1] = {"delta_x": 0.0, "delta_y": 0.0, "delta_z": 0.0, "gripper": 1.0}
+
+        expected = []
+        for i, steps in enumerate(robot_steps):
+            transition = create_transition(
+                observation={key: float(value[i]) for key, value in observation.items()},
+                action=dict(actions[i]),
+            )
+            for step in steps:
+                transition = step(transition)
+            expected.append(transition[TransitionKey.ACTION])
+
+        transition = create_transition(
+            observation={key: torch.as_tensor(value) for key, value in observation.items()},
+            action=RobotActionBatch.from_dicts(actions, dtype=torch.float64),
+        )
+        for step in batch_steps:
+            transition = step(transition)
+
+        assert_actions_close(expected, transition[TransitionKey.ACTION])
+
+
+def test_forward_kinematics_batch_matches_dicts():
+    step = ForwardKinematicsJointsToEEAction(kinematics=MockKinematics(), motor_names=MOTOR_NAMES)
+    rng = np.random.default_rng(0)
+    actions = [{f"{name}.pos": float(rng.normal()) for name in MOTOR_NAMES} for _ in range(3)]
+
+    batch = step(create_transition(action=RobotActionBatch.from_dicts(actions, dtype=torch.float64)))
+
+    expected = [step(create_transition(action=dict(action)))[TransitionKey.ACTION] for action in actions]
+    assert_actions_close(expected, batch[TransitionKey.ACTION])
+
+
+def test_ee_bounds_batch_clips_and_checks_jumps():
+    step = EEBoundsAndSafety(end_effector_bounds={"min": [-1.0] * 3, "max": [1.0] * 3}, max_ee_step_m=0.5)
+    keys = ["ee.x", "ee.y", "ee.z", "ee.wx", "ee.wy", "ee.wz", "ee.gripper_pos"]
+    values = torch.tensor([[2.0, 0.0, -3.0, 0.1, 0.2, 0.3, 1.0], [0.1, 0.2, 0.3, 0.0, 0.0, 0.0, 2.0]])
+
+    batch = step(create_transition(action=RobotActionBatch(keys, values)))[TransitionKey.ACTION]
+
+    torch.testing.assert_close(
+        batch.columns(["ee.x", "ee.y", "ee.z"]), torch.tensor([[1.0, 0.0, -1.0], [0.1, 0.2, 0.3]])
+    )
+    torch.testing.assert_close(batch.columns(keys[3:]), values[:, 3:])
+
+    values[1, 0] = 0.9
+    with pytest.raises(ValueError, match="EE jump"):
+        step(create_transition(action=RobotActionBatch(keys, values)))
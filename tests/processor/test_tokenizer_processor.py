@@ -1038,3 +1038,61 @@ def test_simulated_accelerate_scenario():
     # MockTokenizer squeezes single-item batches, so shape is (max_length,) not (1, max_length)
     assert tokens.shape == (10,)  # MockTokenizer behavior for single string in list
     assert attention_mask.shape == (10,)
+
+
+@require_package("transformers")
+def test_tokenization_cache():
+    """Test that the tokens of each task string are cached and reused across batches."""
+
+    class CountingMockTokenizer(MockTokenizer):
+        def __init__(self):
+            super().__init__(vocab_size=100)
+            self.tokenized = []
+
+        def __call__(self, text, **kwargs):
+            self.tokenized.extend([text] if isinstance(text, str) else text)
+            result = super().__call__(text, **kwargs)
+            # Batched like the transformers tokenizers
+            return {k: v.unsqueeze(0) if v.dim() == 1 else v for k, v in result.items()}
+
+    tokenizer = CountingMockTokenizer()
+    processor = TokenizerProcessorStep(tokenizer=tokenizer, max_length=8, cache_size=2)
+    uncached_processor = TokenizerProcessorStep(tokenizer=MockTokenizer(vocab_size=100), max_length=8)
+
+    def tokenize(step, task):
+        transition = create_transition(observation={}, complementary_data={"task": task})
+        observation = step(transition)[TransitionKey.OBSERVATION]
+        return observation[f"{OBS_LANGUAGE}.tokens"], observation[f"{OBS_LANGUAGE}.attention_mask"]
+
+    tasks = ["pick the cube", "place the cube", "pick the cube"]
+    tokens, attention_mask = tokenize(processor, tasks)
+    expected_tokens, expected_attention_mask = tokenize(uncached_processor, tasks)
+    torch.testing.assert_close(tokens, expected_tokens)
+    torch.testing.assert_close(attention_mask, expected_attention_mask)
+    assert tokenizer.tokenized == ["pick the cube", "place the cube"]
+
+    # No tokenizer work for known tasks, and the cache is not modified through the outputs
+    tokens.zero_()
+    single_tokens, _ = tokenize(processor, "place the cube")
+    assert tokenizer.tokenized == ["pick the cube", "place the cube"]
+    assert single_tokens.shape == (1, 8)
+    torch.testing.assert_close(single_tokens[0], expected_tokens[1])
+
+    # The least recently used task is evicted
+    tokenize(processor, "stack the cubes")
+    tokenize(processor, "pick the cube")
+    assert tokenizer.tokenized == ["pick the cube", "place the cube", "stack the cubes", "pick the cube"]
+
+    # Tokens of "longest" padding depend on the batch, they are never cached
+    processor.padding = "longest"
+    tokenize(processor, "stack the cubes")
+    assert tokenizer.tokenized[-1] == "stack the cubes"
+
+    # Without truncation tasks may not share a length, the batch goes through the tokenizer at once
+    processor.padding = "max_length"
+    processor.truncation = False
+    num_tokenized = len(tokenizer.tokenized)
+    num_cached = len(processor._token_cache)
+    tokenize(processor, ["stack the cubes", "open the drawer"])
+    assert tokenizer.tokenized[num_tokenized:] == ["stack the cubes", "open the drawer"]
+    assert len(processor._token_cache) == num_cached
@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gymnasium as gym
+import numpy as np
+import pytest
+import torch
+
+from lerobot.envs.configs import HILSerlRobotEnvConfig
+from lerobot.processor import TransitionKey, create_transition
+from lerobot.rl.gym_manipulator import (
+    index_vector_env_data,
+    make_processors,
+    make_robot_vector_env,
+    step_vector_env_and_process_transitions,
+)
+from lerobot.utils.constants import OBS_STATE
+
+
+class CountingEnv(gym.Env):
+    """Env whose state is the number of steps since the reset, ending after `episode_length` steps."""
+
+    def __init__(self, episode_length: int):
+        self.observation_space = gym.spaces.Dict(
+            {"agent_pos": gym.spaces.Box(low=0, high=100, shape=(3,), dtype=np.float32)}
+        )
+        self.action_space = gym.spaces.Box(low=-1, high=1, shape=(2,), dtype=np.float32)
+        self.episode_length = episode_length
+        self.steps = 0
+
+    def reset(self, seed=None, options=None):
+        super().reset(seed=seed)
+        self.steps = 0
+        return {"agent_pos": np.zeros(3, dtype=np.float32)}, {}
+
+    def step(self, action):
+        assert action.shape == (2,)
+        self.steps += 1
+        observation = {"agent_pos": np.full(3, self.steps, dtype=np.float32)}
+        return observation, 1.0, self.steps >= self.episode_length, False, {"steps": self.steps}
+
+
+class EndEpisodeAfter:
+    """Action processor wrapper ending the episode after `num_steps` steps, like an intervention success."""
+
+    def __init__(self, action_processor, num_steps: int):
+        self.action_processor = action_processor
+        self.num_steps = num_steps
+        self.steps = 0
+
+    def __call__(self, transition):
+        transition = self.action_processor(transition)
+        self.steps += 1
+        if self.steps >= self.num_steps:
+            transition[TransitionKey.DONE] = True
+        return transition
+
+    def reset(self):
+        self.steps = 0
+        self.action_processor.reset()
+
+
+def make_vector_env_and_processors(episode_lengths: list[int]):
+    env = gym.vector.SyncVectorEnv(
+        [lambda length=length: CountingEnv(length) for length in episode_lengths],
+        autoreset_mode=gym.vector.AutoresetMode.SAME_STEP,
+    )
+    cfg = HILSerlRobotEnvConfig(name="gym_hil")
+    processors = [make_processors(env, None, cfg, "cpu") for _ in episode_lengths]
+    env_processors = [env_processor for env_processor, _ in processors]
+    action_processors = [action_processor for _, action_processor in processors]
+
+    obs, info = env.reset()
+    transitions = [
+        env_processors[i](
+            create_transition(observation=index_vector_env_data(obs, i), info=index_vector_env_data(info, i))
+        )
+        for i in range(len(episode_lengths))
+    ]
+    return env, env_processors, action_processors, transitions
+
+
+def test_index_vector_env_data():
+    data = {
+        "pos": np.array([[0, 1], [2, 3]]),
+        "success": np.array([True, False]),
+        "_success": np.array([False, True]),
+        "final_info": {"steps": np.array([4, 0]), "_steps": np.array([True, False])},
+        "_final_info": np.array([True, False]),
+    }
+
+    env_0 = index_vector_env_data(data, 0)
+    env_1 = index_vector_env_data(data, 1)
+
+    assert set(env_0) == {"pos", "final_info"}
+    np.testing.assert_array_equal(env_0["pos"], [0, 1])
+    assert env_0["final_info"] == {"steps": 4}
+    assert set(env_1) == {"pos", "success"}
+    np.testing.assert_array_equal(env_1["pos"], [2, 3])
+    assert not env_1["success"]
+
+
+def test_step_vector_env_splits_transitions_per_env():
+    env, env_processors, action_processors, transitions = make_vector_env_and_processors([2, 3])
+
+    for step in range(1, 4):
+        new_transitions, reset_transitions = step_vector_env_and_process_transitions(
+            env=env,
+            transitions=transitions,
+            actions=torch.zeros(2, 2),
+            env_processors=env_processors,
+            action_processors=action_processors,
+        )
+        for i, (new_transition, reset_transition) in enumerate(
+            zip(new_transitions, reset_transitions, strict=True)
+        ):
+            episode_step = step if i == 1 else (step - 1) % 2 + 1
+            episode_ended = episode_step == [2, 3][i]
+
+            # The next state is the last observation of the episode, not the observation after the reset
+            expected_state = torch.full((1, 3), float(episode_step))
+            torch.testing.assert_close(new_transition[TransitionKey.OBSERVATION][OBS_STATE], expected_state)
+            assert new_transition[TransitionKey.REWARD] == 1.0
+            assert new_transition[TransitionKey.DONE] == episode_ended
+            assert new_transition[TransitionKey.INFO]["steps"] == episode_step
+            assert new_transition[TransitionKey.COMPLEMENTARY_DATA]["teleop_action"].shape == (1, 2)
+
+            if episode_ended:
+                torch.testing.assert_close(
+                    reset_transition[TransitionKey.OBSERVATION][OBS_STATE], torch.zeros(1, 3)
+                )
+            else:
+                assert reset_transition is None
+
+        transitions = [
+            new if reset is None else reset
+            for new, reset in zip(new_transitions, reset_transitions, strict=True)
+        ]
+
+    env.close()
+
+
+def test_step_vector_env_resets_episodes_ended_by_processor():
+    env, env_processors, action_processors, transitions = make_vector_env_and_processors([10, 10])
+    action_processors[0] = EndEpisodeAfter(action_processors[0], num_steps=1)
+
+    new_transitions, reset_transitions = step_vector_env_and_process_transitions(
+        env=env,
+        transitions=transitions,
+        actions=torch.zeros(2, 2),
+        env_processors=env_processors,
+        action_processors=action_processors,
+    )
+
+    assert new_transitions[0][TransitionKey.DONE]
+    assert not new_transitions[1][TransitionKey.DONE]
+    assert reset_transitions[1] is None
+    torch.testing.assert_close(reset_transitions[0][TransitionKey.OBSERVATION][OBS_STATE], torch.zeros(1, 3))
+    assert env.envs[0].steps == 0
+    assert env.envs[1].steps == 1
+
+    env.close()
+
+
+def test_make_robot_vector_env_requires_simulation():
+    with pytest.raises(ValueError, match="Only the gym_hil simulation can be vectorized"):
+        make_robot_vector_env(HILSerlRobotEnvConfig(num_envs=2))
@@ -30,7 +30,7 @@ def learner_service_stub():
     transitions_queue = Queue()
     interactions_queue = Queue()
     seconds_between_pushes = 1
-    client, channel, server = create_learner_service_stub(
+    client, channel, server, _, _ = create_learner_service_stub(
         shutdown_event, parameters_queue, transitions_queue, interactions_queue, seconds_between_pushes
     )
 
@@ -47,6 +47,7 @@ def create_learner_service_stub(
     interactions_queue: Queue,
     seconds_between_pushes: int,
     queue_get_timeout: float = 0.1,
+    max_workers: int = 4,
 ):
     import grpc
 
@@ -65,14 +66,14 @@ def create_learner_service_stub(
     )
 
     # Create a gRPC server and add our servicer to it.
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers))
     services_pb2_grpc.add_LearnerServiceServicer_to_server(servicer, server)
     port = server.add_insecure_port("[::]:0")  # bind to a free port chosen by OS
     server.start()  # start the server (non-blocking call):contentReference[oaicite:1]{index=1}
 
     # Create a client channel and stub connected to the server's port.
     channel = grpc.insecure_channel(f"localhost:{port}")
-    return services_pb2_grpc.LearnerServiceStub(channel), channel, server
+    return services_pb2_grpc.LearnerServiceStub(channel), channel, server, servicer, port
 
 
 @require_package("grpc")
@@ -102,7 +103,7 @@ def test_send_interactions():
     transitions_queue = Queue()
     interactions_queue = Queue()
     seconds_between_pushes = 1
-    client, channel, server = create_learner_service_stub(
+    client, channel, server, _, _ = create_learner_service_stub(
         shutdown_event, parameters_queue, transitions_queue, interactions_queue, seconds_between_pushes
     )
 
@@ -147,7 +148,7 @@ def test_send_transitions():
     interactions_queue = Queue()
     seconds_between_pushes = 1
 
-    client, channel, server = create_learner_service_stub(
+    client, channel, server, _, _ = create_learner_service_stub(
         shutdown_event, parameters_queue, transitions_queue, interactions_queue, seconds_between_pushes
     )
 
@@ -193,7 +194,7 @@ def test_send_transitions_empty_stream():
     interactions_queue = Queue()
     seconds_between_pushes = 1
 
-    client, channel, server = create_learner_service_stub(
+    client, channel, server, _, _ = create_learner_service_stub(
         shutdown_event, parameters_queue, transitions_queue, interactions_queue, seconds_between_pushes
     )
 
@@ -223,7 +224,7 @@ def test_stream_parameters():
     interactions_queue = Queue()
     seconds_between_pushes = 0.2  # Short delay for testing
 
-    client, channel, server = create_learner_service_stub(
+    client, channel, server, _, _ = create_learner_service_stub(
         shutdown_event, parameters_queue, transitions_queue, interactions_queue, seconds_between_pushes
     )
 
@@ -280,7 +281,7 @@ def test_stream_parameters_with_shutdown():
     seconds_between_pushes = 0.1
     queue_get_timeout = 0.001
 
-    client, channel, server = create_learner_service_stub(
+    client, channel, server, _, _ = create_learner_service_stub(
         shutdown_event,
         parameters_queue,
         transitions_queue,
@@ -335,7 +336,7 @@ def test_stream_parameters_waits_and_retries_on_empty_queue():
     seconds_between_pushes = 0.05
     queue_get_timeout = 0.01
 
-    client, channel, server = create_learner_service_stub(
+    client, channel, server, _, _ = create_learner_service_stub(
         shutdown_event,
         parameters_queue,
         transitions_queue,
@@ -372,3 +373,180 @@ def test_stream_parameters_waits_and_retries_on_empty_queue():
     close_learner_service_stub(channel, server)
 
     assert received_params == [b"param_after_wait", b"param_after_wait_2"]
+
+
+@require_package("grpc")
+@pytest.mark.timeout(10)  # force cross-platform watchdog
+def test_stale_stream_does_not_wait_for_up_to_date_stream():
+    from lerobot.rl.learner_service import LearnerService
+
+    parameters_queue = Queue()
+    queue_get_timeout = 2
+    servicer = LearnerService(
+        shutdown_event=Event(),
+        parameters_queue=parameters_queue,
+        seconds_between_pushes=1,
+        transition_queue=Queue(),
+        interaction_message_queue=Queue(),
+        queue_get_timeout=queue_get_timeout,
+    )
+    parameters_queue.put(b"parameters")
+    version, _ = servicer._get_parameters_newer_than(0)
+
+    # A stream that has the latest parameters waits for the next ones on the queue
+    up_to_date_stream = threading.Thread(target=servicer._get_parameters_newer_than, args=(version,))
+    up_to_date_stream.start()
+    time.sleep(0.1)
+
+    # A newly connected stream gets the latest parameters without waiting for the queue timeout
+    start = time.perf_counter()
+    stale_version, messages = servicer._get_parameters_newer_than(0)
+    assert time.perf_counter() - start < queue_get_timeout / 2
+    assert stale_version == version
+    assert b"".join(message.data for message in messages) == b"parameters"
+
+    up_to_date_stream.join()
+
+
+def simulated_actor(port: int, actor_id: str, num_messages: int, received_parameters: Queue):
+    """Actor process: receives one parameters push, then streams `num_messages` transition messages."""
+    import grpc
+
+    from lerobot.rl.learner_service import ACTOR_ID_METADATA_KEY
+    from lerobot.transport import services_pb2, services_pb2_grpc
+
+    channel = grpc.insecure_channel(f"localhost:{port}")
+    stub = services_pb2_grpc.LearnerServiceStub(channel)
+    metadata = ((ACTOR_ID_METADATA_KEY, actor_id),)
+
+    parameters_stream = stub.StreamParameters(services_pb2.Empty(), metadata=metadata)
+    received_parameters.put((actor_id, next(parameters_stream).data))
+    parameters_stream.cancel()
+
+    def transitions_stream():
+        for i in range(num_messages):
+            yield services_pb2.Transition(
+                transfer_state=services_pb2.TransferState.TRANSFER_END, data=f"{actor_id}/{i}".encode()
+            )
+
+    stub.SendTransitions(transitions_stream(), metadata=metadata)
+    channel.close()
+
+
+@require_package("grpc")
+@pytest.mark.timeout(60)  # force cross-platform watchdog
+def test_multiple_actors_fan_in():
+    import multiprocessing
+
+    num_actors = 3
+    num_messages = 5
+
+    shutdown_event = Event()
+    parameters_queue = Queue()
+    transitions_queue = Queue()
+    interactions_queue = Queue()
+
+    client, channel, server, servicer, port = create_learner_service_stub(
+        shutdown_event,
+        parameters_queue,
+        transitions_queue,
+        interactions_queue,
+        seconds_between_pushes=0.05,
+        queue_get_timeout=0.05,
+        max_workers=3 * num_actors,
+    )
+    parameters_queue.put(b"parameters")
+
+    ctx = multiprocessing.get_context("spawn")
+    received_parameters = ctx.Queue()
+    actor_ids = [f"actor_{i}" for i in range(num_actors)]
+    actors = [
+        ctx.Process(target=simulated_actor, args=(port, actor_id, num_messages, received_parameters))
+        for actor_id in actor_ids
+    ]
+    for actor in actors:
+        actor.start()
+    for actor in actors:
+        actor.join(timeout=50)
+        assert actor.exitcode == 0
+
+    shutdown_event.set()
+    close_learner_service_stub(channel, server)
+
+    # The parameters were taken once from the queue and broadcast to every actor
+    parameters = sorted(received_parameters.get(timeout=1) for _ in actor_ids)
+    assert parameters == [(actor_id, b"parameters") for actor_id in actor_ids]
+
+    transitions = []
+    while not transitions_queue.empty():
+        transitions.append(transitions_queue.get().decode())
+
+    assert len(transitions) == num_actors * num_messages
+    for actor_id in actor_ids:
+        # Messages of one actor keep their order
+        actor_messages = [t for t in transitions if t.startswith(f"{actor_id}/")]
+        assert actor_messages == [f"{actor_id}/{i}" for i in range(num_messages)]
+
+    stats = servicer.get_actor_stats()
+    assert set(stats) == set(actor_ids)
+    for actor_id in actor_ids:
+        assert stats[actor_id]["Transition messages"] == num_messages
+        assert stats[actor_id]["Queued messages"] == 0
+
+
+@require_package("grpc")
+def test_fan_in_transitions_round_robin():
+    from lerobot.rl.learner_service import LearnerService
+
+    transitions_queue = Queue()
+    servicer = LearnerService(
+        shutdown_event=Event(),
+        parameters_queue=Queue(),
+        seconds_between_pushes=1,
+        transition_queue=transitions_queue,
+        interaction_message_queue=Queue(),
+        transitions_queue_size_per_actor=4,
+    )
+
+    fast_actor = servicer.register_actor("fast")
+    slow_actor = servicer.register_actor("slow")
+    for i in range(3):
+        fast_actor.put(f"fast/{i}".encode())
+    slow_actor.put(b"slow/0")
+
+    assert servicer.fan_in_transitions() == 4
+
+    forwarded = [transitions_queue.get(timeout=1) for _ in range(4)]
+    assert forwarded == [b"fast/0", b"slow/0", b"fast/1", b"fast/2"]
+
+
+@require_package("grpc")
+@pytest.mark.timeout(5)  # force cross-platform watchdog
+def test_actor_queue_backpressure():
+    from lerobot.rl.learner_service import LearnerService
+
+    transitions_queue = Queue()
+    servicer = LearnerService(
+        shutdown_event=Event(),
+        parameters_queue=Queue(),
+        seconds_between_pushes=1,
+        transition_queue=transitions_queue,
+        interaction_message_queue=Queue(),
+        queue_get_timeout=0.01,
+        transitions_queue_size_per_actor=2,
+    )
+    actor = servicer.register_actor("actor")
+    actor.put(b"0")
+    actor.put(b"1")
+
+    # The actor queue is full, the next put blocks until the fan-in makes room
+    blocked_put = threading.Thread(target=actor.put, args=(b"2",))
+    blocked_put.start()
+    time.sleep(0.1)
+    assert blocked_put.is_alive()
+
+    servicer.fan_in_transitions()
+    blocked_put.join(timeout=1)
+    assert not blocked_put.is_alive()
+    assert actor.stats.transition_messages == 3
+    assert actor.stats.backpressure_time > 0.05
@@ -14,15 +14,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pickle
 import sys
+import time
 from collections.abc import Callable
 
 import pytest
 import torch
+import torch.multiprocessing as mp
 
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
-from lerobot.rl.buffer import BatchTransition, ReplayBuffer, random_crop_vectorized
+from lerobot.rl.augmentation import DrQAugmentation, shift_images
+from lerobot.rl.buffer import (
+    BatchTransition,
+    ReplayBuffer,
+    SharedMemoryReplayBuffer,
+    random_crop_vectorized,
+    stack_transitions,
+)
 from lerobot.utils.constants import ACTION, DONE, OBS_IMAGE, OBS_STATE, OBS_STR, REWARD
+from lerobot.utils.transition import Transition
 from tests.fixtures.constants import DUMMY_REPO_ID
 
 
@@ -236,6 +247,86 @@ def test_add_over_capacity():
     assert replay_buffer.truncateds[0], "Truncated should be True for the first transition."
 
 
+def create_dummy_transitions(num_transitions: int) -> list[Transition]:
+    transitions = []
+    for i in range(num_transitions):
+        transitions.append(
+            Transition(
+                state=create_dummy_state(),
+                action=create_dummy_action(),
+                reward=float(i),
+                next_state=create_dummy_state(),
+                done=i % 3 == 0,
+                truncated=False,
+                complementary_info={"discrete_penalty": torch.tensor([float(i)])},
+            )
+        )
+    return transitions
+
+
+def assert_buffers_equal(left: ReplayBuffer, right: ReplayBuffer):
+    assert left.position == right.position
+    assert left.size == right.size
+
+    # Storage is allocated with torch.empty, only compare the filled slots
+    filled = slice(0, left.size)
+    for key in left.states:
+        assert torch.equal(left.states[key][filled], right.states[key][filled])
+        assert torch.equal(left.next_states[key][filled], right.next_states[key][filled])
+    assert torch.equal(left.actions[filled], right.actions[filled])
+    assert torch.equal(left.rewards[filled], right.rewards[filled])
+    assert torch.equal(left.dones[filled], right.dones[filled])
+    assert torch.equal(left.truncateds[filled], right.truncateds[filled])
+    for key in left.complementary_info_keys:
+        assert torch.equal(left.complementary_info[key][filled], right.complementary_info[key][filled])
+
+
+def test_stack_transitions():
+    transitions = create_dummy_transitions(4)
+    batch = stack_transitions(transitions)
+
+    assert batch["state"][OBS_IMAGE].shape == (4, 3, 84, 84)
+    assert batch["state"][OBS_STATE].shape == (4, 10)
+    assert batch[ACTION].shape == (4, 4)
+    assert torch.equal(batch["reward"], torch.tensor([0.0, 1.0, 2.0, 3.0]))
+    assert torch.equal(batch["done"], torch.tensor([True, False, False, True]))
+    assert batch["complementary_info"]["discrete_penalty"].shape == (4,)
+
+    with pytest.raises(ValueError, match="Cannot stack an empty list of transitions."):
+        stack_transitions([])
+
+
+@pytest.mark.parametrize("chunk_sizes", [[4], [3, 3], [7, 6], [25], [9, 1, 4]])
+def test_add_batch_matches_sequential_add(chunk_sizes):
+    transitions = create_dummy_transitions(sum(chunk_sizes))
+
+    sequential_buffer = create_empty_replay_buffer()
+    for transition in transitions:
+        sequential_buffer.add(**transition)
+
+    batched_buffer = create_empty_replay_buffer()
+    start = 0
+    for chunk_size in chunk_sizes:
+        batched_buffer.add_batch(**stack_transitions(transitions[start : start + chunk_size]))
+        start += chunk_size
+
+    assert_buffers_equal(sequential_buffer, batched_buffer)
+
+
+def test_add_batch_with_memory_optimization():
+    transitions = create_dummy_transitions(12)
+
+    sequential_buffer = create_empty_replay_buffer(optimize_memory=True)
+    for transition in transitions:
+        sequential_buffer.add(**transition)
+
+    batched_buffer = create_empty_replay_buffer(optimize_memory=True)
+    batched_buffer.add_batch(**stack_transitions(transitions))
+
+    assert_buffers_equal(sequential_buffer, batched_buffer)
+    assert batched_buffer.next_states is batched_buffer.states
+
+
 def test_sample_from_empty_buffer(replay_buffer):
     with pytest.raises(RuntimeError, match="Cannot sample from an empty buffer"):
         replay_buffer.sample(1)
@@ -614,6 +705,86 @@ def test_random_crop_vectorized_invalid_size():
         random_crop_vectorized(images, (10, 10))
 
 
+def test_shift_images_matches_pad_and_crop():
+    pad = 4
+    images = torch.rand(5, 3, 12, 10)
+    row_shifts = torch.tensor([-4, -1, 0, 2, 4])
+    col_shifts = torch.tensor([3, 0, -4, 4, -2])
+
+    shifted = shift_images(images, row_shifts=row_shifts, col_shifts=col_shifts)
+
+    padded = torch.nn.functional.pad(images, (pad, pad, pad, pad), mode="replicate")
+    for i in range(images.shape[0]):
+        top, left = row_shifts[i] + pad, col_shifts[i] + pad
+        torch.testing.assert_close(shifted[i], padded[i, :, top : top + 12, left : left + 10])
+
+
+@pytest.mark.parametrize("batch_size", [1, 7, 8, 9, 20])
+def test_drq_augmentation_bucketing(batch_size):
+    augmentation = DrQAugmentation(pad=2, use_torch_compile=False, min_bucket_size=8)
+    calls = []
+
+    def record_batch_size(images):
+        calls.append(images.shape[0])
+        return images
+
+    augmentation._function = record_batch_size
+    images = torch.arange(batch_size, dtype=torch.float32).view(batch_size, 1, 1, 1).expand(-1, 3, 4, 4)
+
+    augmented = augmentation(images)
+
+    torch.testing.assert_close(augmented, images)
+    assert calls == [max(8, 1 << (batch_size - 1).bit_length())]
+
+
+def test_drq_augmentation_warmup_adds_full_batch_bucket():
+    augmentation = DrQAugmentation(pad=2, use_torch_compile=False, min_bucket_size=8)
+
+    warmup_time = augmentation.warmup(image_shape=(3, 16, 16), max_batch_size=24)
+
+    assert warmup_time >= 0
+    assert augmentation.bucket_size(24) == 24
+    assert augmentation.bucket_size(17) == 24
+    assert augmentation.bucket_size(16) == 16
+    assert augmentation.bucket_size(3) == 8
+    assert augmentation.bucket_size(25) == 32
+
+
+def test_drq_augmentation_shifts_images():
+    augmentation = DrQAugmentation(pad=2, use_torch_compile=False, min_bucket_size=4)
+    # Constant images stay constant, whatever the shift
+    images = torch.arange(3, dtype=torch.float32).view(3, 1, 1, 1).expand(-1, 3, 16, 16)
+
+    augmented = augmentation(images)
+
+    assert augmented.shape == images.shape
+    torch.testing.assert_close(augmented, images)
+
+
+def test_drq_augmentation_is_picklable():
+    augmentation = DrQAugmentation(pad=2)
+    augmentation.bucket_sizes.add(12)
+    _ = augmentation.function
+
+    restored = pickle.loads(pickle.dumps(augmentation))
+
+    assert restored.pad == 2
+    assert restored.bucket_sizes == {12}
+    assert restored._function is None
+
+
+def test_replay_buffer_warmup_image_augmentation(dummy_state, dummy_action):
+    replay_buffer = create_empty_replay_buffer(
+        use_drq=True, image_augmentation_function=DrQAugmentation(use_torch_compile=False)
+    )
+    replay_buffer.add(dummy_state, dummy_action, 1.0, dummy_state, False, False)
+
+    replay_buffer.warmup_image_augmentation(batch_size=10)
+
+    # One image key, state and next state images are augmented together
+    assert replay_buffer.image_augmentation_function.bucket_sizes == {20}
+
+
 def _populate_buffer_for_async_test(capacity: int = 10) -> ReplayBuffer:
     """Create a small buffer with deterministic 3×128×128 images and 11-D state."""
     buffer = ReplayBuffer(
@@ -679,3 +850,80 @@ def test_async_iterator_multiple_iterations():
 
     # Ensure iterator can be disposed without blocking
     del iterator
+
+
+def _fill_shared_buffer(buffer: SharedMemoryReplayBuffer, num_transitions: int):
+    buffer.add_batch(**stack_transitions(create_dummy_transitions(num_transitions)))
+
+
+def create_shared_replay_buffer(capacity: int = 10) -> SharedMemoryReplayBuffer:
+    buffer = SharedMemoryReplayBuffer(capacity, "cpu", state_dims(), use_drq=False)
+    buffer.allocate_storage(
+        state_shapes={OBS_IMAGE: (3, 84, 84), OBS_STATE: (10,)},
+        action_shape=(4,),
+        complementary_info_shapes={"discrete_penalty": ()},
+    )
+    return buffer
+
+
+def test_shared_memory_buffer_requires_cpu_storage():
+    with pytest.raises(ValueError, match="only supports CPU storage"):
+        SharedMemoryReplayBuffer(10, "cpu", state_dims(), storage_device="meta")
+
+
+def test_shared_memory_buffer_allocate_storage():
+    buffer = create_shared_replay_buffer()
+
+    assert buffer.initialized
+    assert len(buffer) == 0
+    assert buffer.states[OBS_IMAGE].is_shared()
+    assert buffer.actions.is_shared()
+    assert buffer.complementary_info["discrete_penalty"].shape == (10,)
+
+    with pytest.raises(RuntimeError, match="already allocated"):
+        buffer.allocate_storage(state_shapes={OBS_STATE: (10,)}, action_shape=(4,))
+
+
+def test_shared_memory_buffer_is_filled_from_another_process():
+    buffer = create_shared_replay_buffer()
+
+    process = mp.Process(target=_fill_shared_buffer, args=(buffer, 13))
+    process.start()
+    process.join(timeout=60)
+    assert process.exitcode == 0
+
+    assert len(buffer) == 10
+    assert buffer.position == 3
+    assert not torch.isnan(buffer.rewards).any()
+    # Rewards are the transition indices, the 3 oldest ones have been overwritten
+    assert set(buffer.rewards.tolist()) == set(map(float, range(3, 13)))
+
+    batch = buffer.sample(4)
+    assert batch["state"][OBS_IMAGE].shape == (4, 3, 84, 84)
+
+
+def _fill_shared_buffer_and_wait(buffer: SharedMemoryReplayBuffer, num_transitions: int, done):
+    _fill_shared_buffer(buffer, num_transitions)
+    # The storage is handed over while this process is alive
+    done.wait(timeout=60)
+
+
+def test_shared_memory_buffer_storage_is_allocated_by_the_writer():
+    buffer = SharedMemoryReplayBuffer(10, "cpu", state_dims(), use_drq=False)
+    done = mp.Event()
+
+    process = mp.Process(target=_fill_shared_buffer_and_wait, args=(buffer, 4, done))
+    process.start()
+    try:
+        while len(buffer) == 0 and process.is_alive():
+            time.sleep(0.01)
+
+        assert buffer.initialized
+        assert buffer.states[OBS_IMAGE].shape == (10, 3, 84, 84)
+        assert buffer.complementary_info["discrete_penalty"].shape == (10,)
+        assert buffer.rewards[:4].tolist() == [0.0, 1.0, 2.0, 3.0]
+        assert buffer.sample(2)["state"][OBS_STATE].shape == (2, 10)
+    finally:
+        done.set()
+        process.join(timeout=60)
+    assert process.exitcode == 0